@@ -40,6 +40,7 @@ class PackageTester:
         targets_import = "import mlrun.datastore.targets"
         redis_import = "import redis"
         mlflow_import = "import mlflow"
+        polars_import = "import polars"
 
         self._extras_tests_data = {
             "": {"import_test_command": f"{basic_import}"},
@@ -65,6 +66,7 @@ class PackageTester:
                 "import_test_command": f"{basic_import}; {google_cloud_storage_import}"
             },
             "[redis]": {"import_test_command": f"{basic_import}; {redis_import}"},
+            "[polars]": {"import_test_command": f"{basic_import}; {polars_import}"},
             # TODO: this won't actually fail if the requirement is missing
             "[kafka]": {"import_test_command": f"{basic_import}; {targets_import}"},
             "[complete]": {
@@ -76,6 +76,8 @@ def extra_requirements() -> dict[str, list[str]]:
             "distributed~=2023.9.0",
         ],
         "alibaba-oss": ["ossfs==2023.12.0", "oss2==2.18.1"],
+        # used by the polars feature set engine
+        "polars": ["polars>=0.20, <0.21"],
     }
 
     # see above why we are excluding google-cloud
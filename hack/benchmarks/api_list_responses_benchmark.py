@@ -0,0 +1,81 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import statistics
+import time
+
+import orjson
+import requests
+
+# This benchmark depends on MLRUN_DBPATH env var being set to the url of a running API, and on BENCHMARK_PROJECT
+# being set to a project that already has a meaningful amount of runs and artifacts
+
+api_url = os.environ["MLRUN_DBPATH"].rstrip("/")
+project = os.environ["BENCHMARK_PROJECT"]
+num_requests = 10
+
+endpoints = {
+    "list_runs": f"{api_url}/api/v1/projects/{project}/runs",
+    "list_artifacts": f"{api_url}/api/v2/projects/{project}/artifacts",
+}
+
+
+def measure(url, encoding):
+    latencies = []
+    wire_size = 0
+    for _ in range(num_requests):
+        start = time.perf_counter()
+        # stream so the raw (possibly compressed) body size can be measured before it is decoded
+        response = requests.get(
+            url,
+            params={"iter": True},
+            headers={"Accept-Encoding": encoding},
+            stream=True,
+        )
+        raw_body = response.raw.read(decode_content=False)
+        latencies.append(time.perf_counter() - start)
+        wire_size = len(raw_body)
+        response.raise_for_status()
+    return statistics.median(latencies), wire_size
+
+
+def measure_decoding(url):
+    content = requests.get(url, params={"iter": True}).content
+    timings = {}
+    for name, loads in [("json", json.loads), ("orjson", orjson.loads)]:
+        start = time.perf_counter()
+        for _ in range(num_requests):
+            loads(content)
+        timings[name] = (time.perf_counter() - start) / num_requests
+    return len(content), timings
+
+
+for endpoint_name, endpoint_url in endpoints.items():
+    print(f"{endpoint_name}:")
+    for encoding in ["identity", "gzip"]:
+        latency, wire_size = measure(endpoint_url, encoding)
+        print(
+            f"  {encoding:<8} - median latency: {latency * 1000:.1f}ms, "
+            f"bytes on the wire: {wire_size}"
+        )
+    payload_size, decoding_timings = measure_decoding(endpoint_url)
+    print(
+        f"  decoding {payload_size} bytes - "
+        + ", ".join(
+            f"{name}: {timing * 1000:.1f}ms"
+            for name, timing in decoding_timings.items()
+        )
+    )
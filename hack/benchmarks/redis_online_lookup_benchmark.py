@@ -0,0 +1,79 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import time
+
+from storey.redis_driver import RedisDriver
+
+from mlrun.datastore.redis import RedisOnlineDriver, get_redis_client
+
+# This benchmark depends on MLRUN_REDIS__URL env var being set to the url of a running (local) Redis server,
+# it writes BENCHMARK_KEYS keys (with features and an aggregation state) under the benchmark table and deletes them
+
+redis_url = os.environ["MLRUN_REDIS__URL"]
+num_keys = int(os.environ.get("BENCHMARK_KEYS", 10000))
+container, table_path = "benchmark", "/redis-online-lookup/"
+
+
+def populate(driver):
+    pipeline = driver.redis.pipeline(transaction=False)
+    for i in range(num_keys):
+        key = driver._make_key(container, table_path, f"id{i}")
+        fields = {f"feature{j}": i * j for j in range(20)}
+        fields.update(
+            {
+                "\x01aggr_value_sum_a": "1.0,2.0,3.0,4.0",
+                "\x01aggr_value_sum_b": "0.0,0.0,0.0,0.0",
+                "\x01mtaggr_value_a": "1704067200000",
+                "\x01mtaggr_value_b": "1704081600000",
+            }
+        )
+        pipeline.hset(driver._static_data_key(key), mapping=fields)
+    pipeline.execute()
+
+
+def cleanup(driver):
+    pipeline = driver.redis.pipeline(transaction=False)
+    for i in range(num_keys):
+        key = driver._make_key(container, table_path, f"id{i}")
+        pipeline.delete(driver._static_data_key(key))
+    pipeline.execute()
+
+
+async def lookup(driver, keys):
+    for key in keys:
+        await driver._load_aggregates_by_key(container, table_path, key)
+
+
+def measure(name, driver, prefetch=False):
+    keys = [f"id{i}" for i in range(num_keys)]
+    start = time.perf_counter()
+    if prefetch:
+        driver.prefetch(container, table_path, keys)
+    asyncio.run(lookup(driver, keys))
+    seconds = time.perf_counter() - start
+    print(f"{name:<28} - {num_keys / seconds:,.0f} lookups/sec")
+
+
+storey_driver = RedisDriver(redis_client=get_redis_client(redis_url), key_prefix="/")
+online_driver = RedisOnlineDriver(redis_url=redis_url, key_prefix="/")
+populate(online_driver)
+try:
+    measure("storey driver (per key)", storey_driver)
+    measure("online driver (per key)", online_driver)
+    measure("online driver (prefetched)", online_driver, prefetch=True)
+finally:
+    cleanup(online_driver)
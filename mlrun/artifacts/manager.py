@@ -11,12 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 import pathlib
 import typing
 from os.path import exists, isdir
 from urllib.parse import urlparse
 
 import mlrun.config
+import mlrun.errors
 from mlrun.utils.helpers import (
     get_local_file_schema,
     template_artifact_path,
@@ -126,6 +128,48 @@ class ArtifactManager:
         self.input_artifacts = {}
         self.artifacts = {}
 
+        # artifacts waiting to be stored in the db, while db writes are coalesced
+        self._pending_db_artifacts: typing.Optional[dict[str, list[dict]]] = None
+
+    @contextlib.contextmanager
+    def coalesce_db_writes(self):
+        """
+        Defer the db writes of the artifacts logged within the context, and store them all together once it exits,
+        in a single request per project instead of a request per artifact.
+        Nested contexts are flushed by the outermost one.
+        If the context fails, the artifacts logged before the failure are still stored (as they would have been
+        without coalescing), and a failure to store them is logged without masking the original error.
+        """
+        if self._pending_db_artifacts is not None:
+            yield
+            return
+
+        self._pending_db_artifacts = {}
+        try:
+            yield
+        except BaseException:
+            self._flush_pending_db_artifacts(raise_on_error=False)
+            raise
+        self._flush_pending_db_artifacts()
+
+    def _flush_pending_db_artifacts(self, raise_on_error: bool = True):
+        pending_db_artifacts, self._pending_db_artifacts = (
+            self._pending_db_artifacts,
+            None,
+        )
+        for project, artifacts in pending_db_artifacts.items():
+            try:
+                self.artifact_db.store_artifacts(artifacts, project=project)
+            except Exception as exc:
+                if raise_on_error:
+                    raise
+                logger.warning(
+                    "Failed to store the coalesced artifacts",
+                    project=project,
+                    keys=[artifact["key"] for artifact in artifacts],
+                    exc=mlrun.errors.err_to_str(exc),
+                )
+
     @staticmethod
     def ensure_artifact_source_file_exists(item, path, body):
         # If the body exists, the source path does not have to exists.
@@ -339,6 +383,17 @@ class ArtifactManager:
             item.updated = None
             if sources:
                 item.sources = [{"name": k, "path": str(v)} for k, v in sources.items()]
+            if self._pending_db_artifacts is not None:
+                self._pending_db_artifacts.setdefault(project, []).append(
+                    {
+                        "key": key,
+                        "artifact": item.to_dict(),
+                        "iter": item.iter,
+                        "tag": tag or item.tag,
+                        "tree": item.tree,
+                    }
+                )
+                return
             self.artifact_db.store_artifact(
                 key,
                 item.to_dict(),
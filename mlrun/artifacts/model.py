@@ -541,7 +541,7 @@ def _get_src_path(model_spec: ModelArtifact, filename):
     return filename
 
 
-def get_model(model_dir, suffix=""):
+def get_model(model_dir, suffix="", download: bool = True):
     """return model file, model spec object, and list of extra data items
 
     this function will get the model file, metadata, and extra data
@@ -559,6 +559,8 @@ def get_model(model_dir, suffix=""):
 
     :param model_dir:       model dir or artifact path (store://..) or DataItem
     :param suffix:          model filename suffix (when using a dir)
+    :param download:        download a remote model file to a local temp file, when False the remote model file
+                            url is returned (e.g. to be downloaded into a cache)
 
     :returns: model filename, model artifact object, extra data dict
 
@@ -607,7 +609,7 @@ def get_model(model_dir, suffix=""):
         raise ValueError(f"cant resolve model file for {model_dir} suffix{suffix}")
 
     obj = mlrun.datastore.store_manager.object(url=model_file)
-    if obj.kind == "file":
+    if obj.kind == "file" or not download:
         return model_file, model_spec, extra_dataitems
 
     temp_path = tempfile.NamedTemporaryFile(suffix=suffix, delete=False).name
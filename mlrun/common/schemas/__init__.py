@@ -33,6 +33,8 @@ from .artifact import (
     ArtifactMetadata,
     ArtifactsFormat,
     ArtifactSpec,
+    ArtifactToStore,
+    StoreArtifactsRequest,
 )
 from .auth import (
     AuthInfo,
@@ -63,6 +65,7 @@ from .constants import (
     FeatureStorePartitionByField,
     HeaderNames,
     LogsCollectorMode,
+    MediaTypes,
     OrderType,
     PatchMode,
     RunPartitionByField,
@@ -153,7 +156,7 @@ from .notification import (
     SetNotificationRequest,
 )
 from .object import ObjectKind, ObjectMetadata, ObjectSpec, ObjectStatus
-from .pagination import PaginationInfo
+from .pagination import PageCursor, PaginationInfo
 from .pipeline import PipelinesFormat, PipelinesOutput, PipelinesPagination
 from .project import (
     IguazioProject,
@@ -171,7 +174,7 @@ from .project import (
     ProjectSummary,
 )
 from .regex import RegexMatchModes
-from .runs import RunIdentifier
+from .runs import RunIdentifier, RunUpdate, UpdateRunsRequest
 from .runtime_resource import (
     GroupedByJobRuntimeResourcesOutput,
     GroupedByProjectRuntimeResourcesOutput,
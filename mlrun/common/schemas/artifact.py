@@ -93,3 +93,15 @@ class Artifact(pydantic.BaseModel):
     metadata: ArtifactMetadata
     spec: ArtifactSpec
     status: ObjectStatus
+
+
+class ArtifactToStore(pydantic.BaseModel):
+    key: str
+    artifact: Artifact
+    iter: typing.Optional[int]
+    tag: typing.Optional[str]
+    tree: typing.Optional[str]
+
+
+class StoreArtifactsRequest(pydantic.BaseModel):
+    artifacts: list[ArtifactToStore]
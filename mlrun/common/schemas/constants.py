@@ -106,6 +106,11 @@ class HeaderNames:
     ui_clear_cache = f"{headers_prefix}ui-clear-cache"
 
 
+class MediaTypes:
+    # newline delimited JSON, used for streaming bulk exports one object per line
+    ndjson = "application/x-ndjson"
+
+
 class FeatureStorePartitionByField(mlrun.common.types.StrEnum):
     name = "name"  # Supported for feature-store objects
 
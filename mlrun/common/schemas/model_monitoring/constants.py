@@ -81,6 +81,9 @@ class EventFieldType:
     DRIFT_DETECTED_THRESHOLD = "drift_detected_threshold"
     POSSIBLE_DRIFT_THRESHOLD = "possible_drift_threshold"
     SAMPLE_PARQUET_PATH = "sample_parquet_path"
+    # Columnar batch events (see mlrun.mlconf.model_endpoint_monitoring.stream_columnar_batches)
+    BATCH_SIZE = "batch_size"
+    TOTAL_LATENCY = "total_latency"
 
 
 class FeatureSetFeatures(MonitoringStrEnum):
@@ -193,15 +196,20 @@ class PrometheusMetric:
     PREDICTIONS_TOTAL = "predictions_total"
     MODEL_LATENCY_SECONDS = "model_latency_seconds"
     INCOME_FEATURES = "income_features"
+    INCOME_FEATURES_RANGE = "income_features_range"
     ERRORS_TOTAL = "errors_total"
     DRIFT_METRICS = "drift_metrics"
     DRIFT_STATUS = "drift_status"
+    GRAPH_STEP_LATENCY_SECONDS = "graph_step_latency_seconds"
+    GRAPH_STEP_ERRORS_TOTAL = "graph_step_errors_total"
+    GRAPH_QUEUE_WAIT_SECONDS = "graph_queue_wait_seconds"
 
 
 class PrometheusEndpoints(MonitoringStrEnum):
     MODEL_MONITORING_METRICS = "/model-monitoring-metrics"
     MONITORING_BATCH_METRICS = "/monitoring-batch-metrics"
     MONITORING_DRIFT_STATUS = "/monitoring-drift-status"
+    SERVING_GRAPH_METRICS = "/serving-graph-metrics"
 
 
 class MonitoringFunctionNames(MonitoringStrEnum):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import typing
 
 import pydantic
@@ -24,3 +25,14 @@ class PaginationInfo(pydantic.BaseModel):
     page: typing.Optional[int]
     page_size: typing.Optional[int] = pydantic.Field(alias="page-size")
     page_token: typing.Optional[str] = pydantic.Field(alias="page-token")
+
+
+class PageCursor(pydantic.BaseModel):
+    """
+    Position of the last record of a retrieved page (its sort value and id), kept with the pagination token so the
+    next page can be seeked to on the sort columns instead of skipping over all the previous pages with an offset.
+    """
+
+    page: int = 0
+    last_sort_value: typing.Optional[datetime.datetime] = None
+    last_id: typing.Optional[int] = None
@@ -107,12 +107,12 @@ class ProjectOwner(pydantic.BaseModel):
 
 class ProjectSummary(pydantic.BaseModel):
     name: str
-    files_count: int
-    feature_sets_count: int
-    models_count: int
-    runs_failed_recent_count: int
-    runs_running_count: int
-    schedules_count: int
+    files_count: int = 0
+    feature_sets_count: int = 0
+    models_count: int = 0
+    runs_failed_recent_count: int = 0
+    runs_running_count: int = 0
+    schedules_count: int = 0
     pipelines_running_count: typing.Optional[int] = None
 
 
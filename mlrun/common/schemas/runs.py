@@ -21,3 +21,13 @@ class RunIdentifier(pydantic.BaseModel):
     kind: typing.Literal["run"] = "run"
     uid: typing.Optional[str]
     iter: typing.Optional[int]
+
+
+class RunUpdate(pydantic.BaseModel):
+    uid: str
+    iter: int = 0
+    updates: dict
+
+
+class UpdateRunsRequest(pydantic.BaseModel):
+    runs: list[RunUpdate]
@@ -138,12 +138,83 @@ default_config = {
             "max_preview_columns": 100,
         },
     },
+    # the execution context buffers the run updates committed while it runs (e.g. by log_result(commit=True)) and
+    # writes them to the db in a single update, with the first update after the interval (in seconds) since the last
+    # write passes or once the number of buffered updates reaches the maximum. state changes and the end of the run
+    # are always written immediately, setting the interval to 0 writes every update immediately
+    "run_updates_buffer": {
+        "flush_interval": 5,
+        "max_pending_updates": 100,
+    },
+    "serving": {
+        # max number of threads (per graph) running the concurrent branches of synchronous flows with branches
+        "sync_flow_max_workers": 16,
+        # max number of threads initializing (and loading) the models of a router in parallel, 1 to init in sequence
+        "router_init_max_workers": 8,
+        # resolve the per event decisions of graph steps (context injection, input/result paths, operation
+        # dispatch, ..) once when the graph is initialized, instead of on every event
+        "compiled_graph": True,
+        # http client shared by the remote steps (RemoteStep, BatchHttpRequests) of the serving function
+        "remote": {
+            # max open connections (0 for unlimited) and max open connections to the same host (0 for unlimited)
+            "max_connections": 100,
+            "max_connections_per_host": 0,
+            # max concurrent requests, 0 for unlimited
+            "max_concurrency": 0,
+            "keepalive_timeout": 30,
+            # seconds after which a slow request is hedged (sent again, using the first response), 0 to disable
+            "hedge_after": 0,
+            "circuit_breaker": {
+                # consecutive failures (of a host) which open the circuit, 0 to disable (the default, as an open
+                # circuit fails all the requests to the host until the reset timeout passes)
+                "failure_threshold": 0,
+                # seconds after which an open circuit lets a trial request through
+                "reset_timeout": 10,
+            },
+        },
+        "instrumentation": {
+            # per step latency histograms, error counters and queue wait times (requires prometheus_client),
+            # exposed by the serving function on the /serving-graph-metrics path
+            "enabled": False,
+            # fraction of the events whose step latencies are observed (errors are always counted)
+            "sample_rate": 1.0,
+            "tracing": {
+                # opentelemetry spans of the graph steps (requires opentelemetry-api, the spans are exported by the
+                # configured tracer provider)
+                "enabled": False,
+                # fraction of the events which are traced
+                "sample_rate": 0.01,
+            },
+        },
+        "model_cache": {
+            # download the remote model files once per pod into a local cache dir (shared by the workers) instead
+            # of a private temp file per worker
+            "enabled": False,
+            # the local cache dir, empty for a dir under the system temp dir
+            "path": "",
+            # max size of the cache dir, the least recently used model files are removed when it grows over it,
+            # 0 for unlimited
+            "max_size_mb": 10240,
+            # load the models on their first request instead of when the serving function starts
+            "lazy_load": False,
+            # run the model warmup() method after it is loaded
+            "warmup": True,
+        },
+    },
     # FIXME: Adding these defaults here so we won't need to patch the "installing component" (provazio-controller) to
     #  configure this values on field systems, for newer system this will be configured correctly
     "v3io_api": "http://v3io-webapi:8081",
     "redis": {
         "url": "",
         "type": "standalone",  # deprecated.
+        # size of the connection pool of each redis client (per node in cluster mode), shared by the concurrent
+        # online feature store reads and writes
+        "max_connections": 50,
+        # number of keys read in each pipeline when the online feature service prefetches the features of many
+        # entity rows
+        "read_batch_size": 1000,
+        # seconds after which the prefetched (and not read) features are dropped and read again from redis
+        "prefetch_ttl_secs": 10,
     },
     "sql": {
         "url": "",
@@ -288,11 +359,21 @@ default_config = {
         "state": "online",
         "retry_api_call_on_exception": "enabled",
         "http_connection_timeout_keep_alive": 11,
+        "response_compression": {
+            # enabled / disabled, when enabled responses are gzip compressed for clients that accept it
+            "mode": "enabled",
+            # smaller responses (in bytes) are not worth compressing
+            "minimum_size": 1024,
+            # 1-9, higher levels barely reduce the size of json payloads further while costing a lot more cpu
+            "level": 5,
+        },
         # http client used by httpdb
         "http": {
             # when True, the client will verify the server's TLS
             # set to False for backwards compatibility.
             "verify": False,
+            # max number of connections kept by the async client, shared by all its concurrent requests
+            "async_connection_pool_size": 32,
         },
         "db": {
             "commit_retry_timeout": 30,
@@ -423,7 +504,10 @@ default_config = {
             "followers": "",
             # This is used as the interval for the sync loop both when mlrun is leader and follower
             "periodic_sync_interval": "1 minute",
-            "counters_cache_ttl": "2 minutes",
+            # interval for the periodic (chief only) refresh of the projects summaries (resources counters), the
+            # summaries are stored in the DB and served from there, so this controls how fresh they are. refreshing
+            # recalculates the counters of all projects (including listing their running pipelines), so keep it long
+            "summaries_refresh_interval": "2 minutes",
             "project_owners_cache_ttl": "30 seconds",
             # access key to be used when the leader is iguazio and polling is done from it
             "iguazio_access_key": "",
@@ -484,6 +568,8 @@ default_config = {
         },
         "pagination": {
             "default_page_size": 20,
+            # number of records retrieved at a time for streaming bulk exports (e.g. of runs)
+            "export_batch_size": 500,
             "pagination_cache": {
                 "interval": 60,
                 "ttl": 3600,
@@ -511,6 +597,37 @@ default_config = {
         "default_http_sink_app": "http://nuclio-{project}-{application_name}.{namespace}.svc.cluster.local:8080",
         "parquet_batching_max_events": 10_000,
         "parquet_batching_timeout_secs": timedelta(minutes=1).total_seconds(),
+        # When enabled, each model server request passes through the monitoring stream graph as a single columnar
+        # batch (shared metadata and a features / predictions array) instead of an event per prediction
+        "stream_columnar_batches": False,
+        # Model endpoint records cache of the monitoring stream, the records are read again after ttl_secs and the
+        # least recently used records are evicted above max_size, all the project endpoints are listed on startup
+        # when prefetch is enabled
+        "endpoint_cache": {"ttl_secs": 300, "max_size": 10_000, "prefetch": True},
+        # The monitoring stream Prometheus metrics are aggregated per endpoint and written once per window, metrics
+        # of endpoints above max_endpoints and of features above max_features (per endpoint) are dropped. Endpoints
+        # without events for endpoint_idle_secs are evicted with their metrics (0 to keep them). The latency
+        # histogram buckets are in microseconds (as the model server latency)
+        "prometheus": {
+            "window_secs": 10,
+            "max_endpoints": 1000,
+            "endpoint_idle_secs": 3600,
+            "max_features": 50,
+            "latency_buckets": [
+                1_000,
+                5_000,
+                10_000,
+                25_000,
+                50_000,
+                100_000,
+                250_000,
+                500_000,
+                1_000_000,
+                2_500_000,
+                5_000_000,
+                10_000_000,
+            ],
+        },
         # See mlrun.model_monitoring.db.stores.ObjectStoreFactory for available options
         "store_type": "v3io-nosql",
         "endpoint_store_connection": "",
@@ -557,6 +674,14 @@ default_config = {
         "default_targets": "parquet,nosql",
         "default_job_image": "mlrun/mlrun",
         "flush_interval": None,
+        # batched multi-key writes of dataframes to the online (nosql) targets, used by the pandas engine and by
+        # storey ingestion with overwrite=True (feature sets without aggregations)
+        "bulk_load": {
+            "enabled": True,
+            "batch_size": 1000,
+            "parallelism": 4,
+            "progress_interval_secs": 10,
+        },
     },
     "ui": {
         "projects_prefix": "projects",  # The UI link prefix for projects
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+from typing import Optional
 from urllib.parse import urlparse
 
 import redis
 import redis.cluster
+from storey.dtypes import RedisError
+from storey.redis_driver import RedisDriver
 
 import mlrun
 
@@ -62,14 +66,7 @@ class RedisStore(DataStore):
     @property
     def redis(self):
         if self._redis is None:
-            try:
-                self._redis = redis.cluster.RedisCluster.from_url(
-                    self._redis_url, decode_responses=True
-                )
-            except redis.cluster.RedisClusterException:
-                self._redis = redis.Redis.from_url(
-                    self._redis_url, decode_responses=True
-                )
+            self._redis = get_redis_client(self._redis_url)
 
         return self._redis
 
@@ -167,3 +164,194 @@ class RedisStore(DataStore):
     @property
     def spark_url(self):
         return ""
+
+
+def get_redis_client(url: str):
+    """create a redis cluster client for the url (or a standalone client if the server is not a cluster), with a
+    connection pool of mlrun.mlconf.redis.max_connections connections"""
+    kwargs = {"decode_responses": True}
+    max_connections = int(mlrun.mlconf.redis.max_connections or 0)
+    if max_connections:
+        kwargs["max_connections"] = max_connections
+    try:
+        return redis.cluster.RedisCluster.from_url(url, **kwargs)
+    except redis.cluster.RedisClusterException:
+        return redis.Redis.from_url(url, **kwargs)
+
+
+class RedisOnlineDriver(RedisDriver):
+    """
+    storey Redis driver of the online feature store tables (same key layout as the storey RedisDriver)
+
+    the features and aggregations of a key are stored in a single hash, which is read with a single HGETALL
+    (instead of scanning the features and the aggregations and reading the time of each aggregation).
+    the hashes of many keys can be prefetched in pipelines (see :py:meth:`prefetch`), the following reads of
+    these keys are served from the prefetched hashes until they are released (see :py:meth:`release`) or expire
+
+    :param redis_url:    redis server url
+    :param key_prefix:   prefix of the redis keys
+    :param redis_client: redis client, created on first use (from the url) if not provided
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        key_prefix: Optional[str] = None,
+        redis_client=None,
+    ):
+        super().__init__(
+            redis_client=redis_client, key_prefix=key_prefix, redis_url=redis_url
+        )
+        # redis key -> (prefetch time, hash), shared by the concurrent readers of the driver
+        self._prefetched = {}
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = get_redis_client(self._redis_url)
+        return self._redis
+
+    def prefetch(self, container: str, table_path: str, keys: list) -> int:
+        """read the hashes of the keys in pipelines of mlrun.mlconf.redis.read_batch_size keys
+
+        each prefetched hash serves a single following read of its key, the hashes which were not read are
+        dropped when the keys are released or after mlrun.mlconf.redis.prefetch_ttl_secs seconds
+
+        :param container:   table container
+        :param table_path:  table path (in the container)
+        :param keys:        table keys (stringified storey keys)
+
+        :return: number of prefetched keys
+        """
+        redis_keys = list(
+            dict.fromkeys(
+                self._static_data_key(self._make_key(container, table_path, key))
+                for key in keys
+            )
+        )
+        batch_size = int(mlrun.mlconf.redis.read_batch_size or 0) or len(redis_keys)
+        prefetched = 0
+        for start in range(0, len(redis_keys), batch_size):
+            batch = redis_keys[start : start + batch_size]
+            pipeline = self.redis.pipeline(transaction=False)
+            for redis_key in batch:
+                pipeline.hgetall(redis_key)
+            try:
+                values = pipeline.execute()
+            except redis.ResponseError as exc:
+                raise RedisError(
+                    f"Failed to prefetch {len(batch)} keys. Response error was: {exc}"
+                ) from exc
+            # merged with the hashes prefetched by the concurrent readers
+            prefetch_time = time.monotonic()
+            self._prefetched.update(
+                (redis_key, (prefetch_time, hash_values))
+                for redis_key, hash_values in zip(batch, values)
+            )
+            prefetched += len(batch)
+        return prefetched
+
+    def release(self, container: str, table_path: str, keys: list):
+        """drop the prefetched hashes of the keys which were not read (see :py:meth:`prefetch`)
+
+        :param container:   table container
+        :param table_path:  table path (in the container)
+        :param keys:        table keys (stringified storey keys)
+        """
+        for key in keys:
+            self._prefetched.pop(
+                self._static_data_key(self._make_key(container, table_path, key)), None
+            )
+
+    def _pop_prefetched(self, redis_key: str) -> Optional[dict]:
+        prefetched = self._prefetched.pop(redis_key, None)
+        if prefetched is None:
+            return None
+        prefetch_time, values = prefetched
+        if time.monotonic() - prefetch_time > float(
+            mlrun.mlconf.redis.prefetch_ttl_secs
+        ):
+            return None
+        return values
+
+    async def _get_hash(self, redis_key: str) -> dict:
+        values = self._pop_prefetched(redis_key)
+        if values is not None:
+            return values
+        try:
+            return await self.asyncify(self.redis.hgetall)(redis_key)
+        except redis.ResponseError as exc:
+            raise RedisError(
+                f"Failed to get key {redis_key}. Response error was: {exc}"
+            ) from exc
+
+    def _to_additional_data(self, values: dict) -> dict:
+        return {
+            self.convert_to_str(name): self.convert_redis_value_to_python_obj(value)
+            for name, value in values.items()
+            if not self.convert_to_str(name).startswith(self.INTERFNAL_FIELD_PREFIX)
+        }
+
+    def _to_aggregations(self, redis_key: str, values: dict) -> dict:
+        """the storey aggregations format of the aggregation fields of the hash, see
+        RedisDriver._load_aggregates_by_key"""
+        aggregations = {}
+        prefix = self.AGGREGATION_ATTRIBUTE_PREFIX
+        for name, value in values.items():
+            name = self.convert_to_str(name)
+            if not name.startswith(prefix):
+                continue
+            # "<feature>_<aggregation>_<a|b>", its time is stored in "<time prefix><feature>_<a|b>"
+            aggr_key = name[len(prefix) :]
+            feature_and_aggr_name = aggr_key[:-2]
+            feature_name = feature_and_aggr_name[: feature_and_aggr_name.rindex("_")]
+            time_attr = (
+                f"{self.AGGREGATION_TIME_ATTRIBUTE_PREFIX}{feature_name}{aggr_key[-2:]}"
+            )
+            time_val = self.convert_to_str(values.get(time_attr))
+            try:
+                time_in_millis = int(time_val)
+            except TypeError as exc:
+                raise RedisError(
+                    f"Invalid associated time attribute: {redis_key}:{time_attr} -> {time_val}"
+                ) from exc
+            aggregation = aggregations.setdefault(feature_and_aggr_name, {})
+            aggregation[time_in_millis] = [
+                float(self.convert_redis_value_to_python_obj(item))
+                for item in self.convert_to_str(value).split(",")
+            ]
+            aggregation[time_attr] = time_in_millis
+        return aggregations
+
+    async def _get_all_fields(self, redis_key: str):
+        return self._to_additional_data(await self._get_hash(redis_key))
+
+    async def _get_specific_fields(self, redis_key: str, attributes: list[str]):
+        attributes = [
+            name
+            for name in attributes
+            if not name.startswith(self.INTERFNAL_FIELD_PREFIX)
+        ]
+        values = self._pop_prefetched(redis_key)
+        if values is not None:
+            values = [values.get(name) for name in attributes]
+        else:
+            try:
+                values = await self.asyncify(self.redis.hmget)(redis_key, attributes)
+            except redis.ResponseError as exc:
+                raise RedisError(
+                    f"Failed to get key {redis_key}. Response error was: {exc}"
+                ) from exc
+        return {
+            name: self.convert_redis_value_to_python_obj(value)
+            for name, value in zip(attributes, values)
+            if value is not None
+        }
+
+    async def _load_aggregates_by_key(self, container, table_path, key):
+        redis_key = self._static_data_key(self._make_key(container, table_path, key))
+        values = await self._get_hash(redis_key)
+        # storey expects None when there are no aggregations or additional data
+        aggregations = self._to_aggregations(redis_key, values)
+        additional_data = self._to_additional_data(values)
+        return aggregations or None, additional_data or None
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import ast
+import concurrent.futures
 import datetime
+import json
+import math
 import os
 import random
 import sys
+import threading
 import time
 import warnings
 from collections import Counter
@@ -23,6 +27,7 @@ from copy import copy
 from typing import Any, Optional, Union
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 from mergedeep import merge
 
@@ -141,14 +146,14 @@ def validate_target_paths_for_engine(
         if parquet - in case of partitioned it must be a directory,
                      else can be both single file or directory
 
-    pandas:
+    pandas (and polars):
         if source contains chunksize attribute - path must be a directory
         else if parquet - if partitioned(=True) - path must be a directory
         else - path must be a single file
 
 
     :param targets:       list of data target objects
-    :param engine:        name of the processing engine (storey, pandas, or spark), defaults to storey
+    :param engine:        name of the processing engine (storey, pandas, spark, or polars), defaults to storey
     :param source:        source dataframe or other sources (e.g. parquet source see:
                           :py:class:`~mlrun.datastore.ParquetSource` and other classes in
                           mlrun.datastore with suffix Source)
@@ -164,7 +169,7 @@ def validate_target_paths_for_engine(
                 raise mlrun.errors.MLRunInvalidArgumentError(
                     f"spark CSV/Parquet targets must be directories, got path:'{target.path}'"
                 )
-            elif engine == "pandas":
+            elif engine in ["pandas", "polars"]:
                 # check if source is DataSource (not DataFrame) and if contains chunk size
                 if isinstance(source, DataSource) and source.attributes.get(
                     "chunksize"
@@ -387,6 +392,7 @@ class BaseStoreTarget(DataTargetBase):
     support_spark = False
     support_storey = False
     support_append = False
+    support_arrow = False
 
     def __init__(
         self,
@@ -531,6 +537,9 @@ class BaseStoreTarget(DataTargetBase):
             except Exception as exc:
                 raise RuntimeError("Failed to write Dask Dataframe") from exc
         else:
+            is_arrow = _is_arrow_table(df)
+            if is_arrow and not self.support_arrow:
+                df, is_arrow = _arrow_table_to_df(df, key_column), False
             store, path_in_store, target_path = self._get_store_and_path()
             target_path = generate_path_with_chunk(self, chunk_id, target_path)
             file_system = store.filesystem
@@ -552,7 +561,7 @@ class BaseStoreTarget(DataTargetBase):
                 if timestamp_key and (
                     self.partitioned or self.time_partitioning_granularity
                 ):
-                    target_df = df.copy(deep=False)
+                    target_df = df if is_arrow else df.copy(deep=False)
                     time_partitioning_granularity = self.time_partitioning_granularity
                     if not time_partitioning_granularity and self.partitioned:
                         time_partitioning_granularity = (
@@ -566,9 +575,14 @@ class BaseStoreTarget(DataTargetBase):
                         ("minute", "%M"),
                     ]:
                         partition_cols.append(unit)
-                        target_df[unit] = pd.DatetimeIndex(
-                            target_df[timestamp_key]
-                        ).format(date_format=fmt)
+                        if is_arrow:
+                            target_df = target_df.append_column(
+                                unit, _format_arrow_timestamps(df[timestamp_key], fmt)
+                            )
+                        else:
+                            target_df[unit] = pd.DatetimeIndex(
+                                target_df[timestamp_key]
+                            ).format(date_format=fmt)
                         if unit == time_partitioning_granularity:
                             break
                 # Partitioning will be performed on timestamp_key and then on self.partition_cols
@@ -581,7 +595,8 @@ class BaseStoreTarget(DataTargetBase):
             else:
                 storage_options = storage_options or self.storage_options
 
-            self._write_dataframe(
+            write = self._write_arrow_table if is_arrow else self._write_dataframe
+            write(
                 target_df,
                 storage_options,
                 target_path,
@@ -597,6 +612,13 @@ class BaseStoreTarget(DataTargetBase):
     def _write_dataframe(df, storage_options, target_path, partition_cols, **kwargs):
         raise NotImplementedError()
 
+    @staticmethod
+    def _write_arrow_table(
+        table, storage_options, target_path, partition_cols, **kwargs
+    ):
+        # implemented by the targets which support arrow (support_arrow = True)
+        raise NotImplementedError()
+
     def set_secrets(self, secrets):
         self._secrets = secrets
 
@@ -768,6 +790,7 @@ class ParquetTarget(BaseStoreTarget):
     support_storey = True
     support_dask = True
     support_append = True
+    support_arrow = True
 
     def __init__(
         self,
@@ -826,6 +849,30 @@ class ParquetTarget(BaseStoreTarget):
             **kwargs,
         )
 
+    @staticmethod
+    def _write_arrow_table(
+        table, storage_options, target_path, partition_cols, **kwargs
+    ):
+        import fsspec
+        import pyarrow.parquet
+
+        file_system, path = fsspec.core.url_to_fs(
+            target_path, **(storage_options or {})
+        )
+        # version set for pyspark compatibility (see mlrun.utils.helpers.to_parquet)
+        kwargs.setdefault("version", "2.4")
+        if partition_cols:
+            pyarrow.parquet.write_to_dataset(
+                table,
+                path,
+                partition_cols=partition_cols,
+                filesystem=file_system,
+                **kwargs,
+            )
+        else:
+            with file_system.open(path, "wb") as file:
+                pyarrow.parquet.write_table(table, file, **kwargs)
+
     def add_writer_step(
         self,
         graph,
@@ -1034,6 +1081,7 @@ class CSVTarget(BaseStoreTarget):
     is_offline = True
     support_spark = True
     support_storey = True
+    support_arrow = True
 
     @staticmethod
     def _write_dataframe(df, storage_options, target_path, partition_cols, **kwargs):
@@ -1042,6 +1090,16 @@ class CSVTarget(BaseStoreTarget):
             kwargs["index"] = kwargs.get("index", False)
         df.to_csv(target_path, storage_options=storage_options, **kwargs)
 
+    @staticmethod
+    def _write_arrow_table(
+        table, storage_options, target_path, partition_cols, **kwargs
+    ):
+        import fsspec
+        import pyarrow.csv
+
+        with fsspec.open(target_path, "wb", **(storage_options or {})) as file:
+            pyarrow.csv.write_csv(table, file, **kwargs)
+
     def add_writer_step(
         self,
         graph,
@@ -1290,26 +1348,78 @@ class NoSqlBaseTarget(BaseStoreTarget):
                 options, df, "overwrite", write_format=write_format
             )
         else:
+            if _is_arrow_table(df):
+                df = _arrow_table_to_df(df, key_column)
             # To prevent modification of the original dataframe and make sure
             # that the last event of a key is the one being persisted
             if len(df.index.names) and df.index.names[0] is not None:
                 df = df.groupby(df.index.names).last()
             else:
                 df = df.copy(deep=False)
-            access_key = self._get_credential("V3IO_ACCESS_KEY")
+            self.bulk_load(df, key_column=key_column, **kwargs)
 
-            store, path_in_store, target_path = self._get_store_and_path()
-            storage_options = store.get_storage_options()
-            access_key = storage_options.get("v3io_access_key", access_key)
+    def bulk_load(
+        self,
+        df: pd.DataFrame,
+        key_column=None,
+        batch_size: int = None,
+        parallelism: int = None,
+        **kwargs,
+    ) -> dict:
+        """write a dataframe (a row per key) to the online target with batched multi-key writes
 
-            _, path_with_container = parse_path(target_path)
-            container, path = split_path(path_with_container)
+        The dataframe is split into batches which are written by a pool of threads, the progress and throughput
+        are logged every ``mlrun.mlconf.feature_store.bulk_load.progress_interval_secs`` seconds.
 
-            frames_client = get_frames_client(
-                token=access_key, address=config.v3io_framesd, container=container
-            )
+        :param df:          dataframe to write, indexed by the entities (or with the key columns)
+        :param key_column:  key column names (when the entities are not the dataframe index)
+        :param batch_size:  number of rows per batch (defaults to mlconf.feature_store.bulk_load.batch_size)
+        :param parallelism: number of concurrent batch writers (defaults to mlconf.feature_store.bulk_load.parallelism)
+        :return: the load statistics (rows, batches, seconds, rows_per_second)
+        """
+        settings = config.feature_store.bulk_load
+        batch_size = int(batch_size or settings.batch_size)
+        parallelism = int(parallelism or settings.parallelism)
+        write_batch = self._get_batch_writer(key_column, **kwargs)
+        progress = _BulkLoadProgress(
+            self.get_target_path(),
+            total=len(df),
+            interval=float(settings.progress_interval_secs),
+        )
+        batches = (
+            df.iloc[start : start + batch_size]
+            for start in range(0, len(df), batch_size)
+        )
+        if parallelism > 1:
+            with concurrent.futures.ThreadPoolExecutor(parallelism) as executor:
+                for rows in executor.map(write_batch, batches):
+                    progress.update(rows)
+        else:
+            for batch in batches:
+                progress.update(write_batch(batch))
+        return progress.done()
 
-            frames_client.write("kv", path, df, index_cols=key_column, **kwargs)
+    def _get_batch_writer(self, key_column, **kwargs):
+        """return a (thread safe) function which writes a batch of rows and returns the number of written rows"""
+        access_key = self._get_credential("V3IO_ACCESS_KEY")
+
+        store, path_in_store, target_path = self._get_store_and_path()
+        storage_options = store.get_storage_options()
+        access_key = storage_options.get("v3io_access_key", access_key)
+
+        _, path_with_container = parse_path(target_path)
+        container, path = split_path(path_with_container)
+        clients = threading.local()
+
+        def write_batch(batch: pd.DataFrame) -> int:
+            if not hasattr(clients, "frames"):
+                clients.frames = get_frames_client(
+                    token=access_key, address=config.v3io_framesd, container=container
+                )
+            clients.frames.write("kv", path, batch, index_cols=key_column, **kwargs)
+            return len(batch)
+
+        return write_batch
 
 
 class NoSqlTarget(NoSqlBaseTarget):
@@ -1457,16 +1567,48 @@ class RedisNoSqlTarget(NoSqlBaseTarget):
 
     def get_table_object(self):
         from storey import Table
-        from storey.redis_driver import RedisDriver
+
+        from .redis import RedisOnlineDriver
 
         endpoint, uri = self._get_server_endpoint()
 
         return Table(
             uri,
-            RedisDriver(redis_url=endpoint, key_prefix="/"),
+            RedisOnlineDriver(redis_url=endpoint, key_prefix="/"),
             flush_interval_secs=mlrun.mlconf.feature_store.flush_interval,
         )
 
+    def _get_batch_writer(self, key_column, **kwargs):
+        from storey.utils import stringify_key
+
+        from .redis import get_redis_client
+
+        endpoint, uri = self._get_server_endpoint()
+        client = get_redis_client(endpoint)
+        # the storey RedisDriver layout (with the "/" key prefix), a hash of the feature values per key
+        table_prefix = "{/" + uri.lstrip("/") + ":"
+
+        def write_batch(batch: pd.DataFrame) -> int:
+            if key_column and batch.index.names[0] is None:
+                batch = batch.set_index(key_column)
+            columns = list(batch.columns)
+            pipeline = client.pipeline(transaction=False)
+            for key, *values in batch.itertuples(name=None):
+                key = list(key) if isinstance(key, tuple) else key
+                mapping = {
+                    column: _to_redis_value(value)
+                    for column, value in zip(columns, values)
+                    if value is not None and value is not pd.NaT
+                }
+                if mapping:
+                    pipeline.hset(
+                        f"{table_prefix}{stringify_key(key)}}}:static", mapping=mapping
+                    )
+            pipeline.execute()
+            return len(batch)
+
+        return write_batch
+
     def get_spark_options(self, key_column=None, timestamp_key=None, overwrite=True):
         endpoint, uri = self._get_server_endpoint()
         parsed_endpoint = urlparse(endpoint)
@@ -1703,6 +1845,8 @@ class TSDBTarget(BaseStoreTarget):
         self, df, key_column=None, timestamp_key=None, chunk_id=0, **kwargs
     ):
         access_key = self._secrets.get("V3IO_ACCESS_KEY", os.getenv("V3IO_ACCESS_KEY"))
+        if _is_arrow_table(df):
+            df = df.to_pandas()
 
         new_index = []
         if timestamp_key:
@@ -2046,6 +2190,8 @@ class SQLTarget(BaseStoreTarget):
             if create_according_to_data:
                 # todo : create according to first row.
                 pass
+            if _is_arrow_table(df):
+                df = _arrow_table_to_df(df, key_column)
             df.to_sql(table_name, connection, if_exists=if_exists)
 
     def _parse_url(self):
@@ -2169,6 +2315,89 @@ def _get_target_path(driver, resource, run_id_mode=False):
     return f"{data_prefix}/{kind_prefix}/{name}{suffix}"
 
 
+def _to_redis_value(value) -> str:
+    """encode a feature value like the storey redis (lua) writer, so the storey RedisDriver decodes it on read"""
+    from storey.redis_driver import RedisDriver
+
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, str):
+        return value
+    if isinstance(value, datetime.datetime):
+        return f"{RedisDriver.DATETIME_FIELD_PREFIX}{value.timestamp()}"
+    if isinstance(value, datetime.timedelta):
+        return f"{RedisDriver.TIMEDELTA_FIELD_PREFIX}{value.total_seconds()}"
+    if isinstance(value, float):
+        if math.isinf(value) or math.isnan(value):
+            # stored as "inf", "-inf" and "nan"
+            return str(value)
+        if value % 1 == 0:
+            # whole numbers are stored as integers
+            return str(int(value))
+    return json.dumps(value)
+
+
+class _BulkLoadProgress:
+    """log the progress and throughput of a bulk load"""
+
+    def __init__(self, target_path: str, total: int, interval: float = 10):
+        self.target_path = target_path
+        self.total = total
+        self.interval = interval
+        self.rows = 0
+        self.batches = 0
+        self._start = self._last_log = time.monotonic()
+
+    def update(self, rows: int):
+        self.rows += rows
+        self.batches += 1
+        now = time.monotonic()
+        if now - self._last_log >= self.interval:
+            self._last_log = now
+            logger.info(
+                "Bulk loading online target",
+                target_path=self.target_path,
+                rows=self.rows,
+                total=self.total,
+                rows_per_second=round(self.rows / (now - self._start)),
+            )
+
+    def done(self) -> dict:
+        seconds = time.monotonic() - self._start
+        stats = {
+            "rows": self.rows,
+            "batches": self.batches,
+            "seconds": seconds,
+            "rows_per_second": self.rows / seconds if seconds else 0.0,
+        }
+        logger.info("Bulk loaded online target", target_path=self.target_path, **stats)
+        return stats
+
+
+def _is_arrow_table(df) -> bool:
+    import pyarrow
+
+    return isinstance(df, pyarrow.Table)
+
+
+def _arrow_table_to_df(table, key_column=None) -> pd.DataFrame:
+    """convert an Arrow table (the polars engine output) to a pandas dataframe indexed by the key columns (as the
+    pandas engine dataframes)"""
+    df = table.to_pandas()
+    if key_column:
+        df = df.set_index(key_column)
+    return df
+
+
+def _format_arrow_timestamps(column, fmt: str):
+    import pyarrow
+    import pyarrow.compute
+
+    if not pyarrow.types.is_timestamp(column.type):
+        column = pyarrow.compute.cast(column, pyarrow.timestamp("ns"))
+    return pyarrow.compute.strftime(column, format=fmt)
+
+
 def generate_path_with_chunk(target, chunk_id, path):
     if path is None:
         return ""
@@ -0,0 +1,284 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import enum
+import ssl
+import typing
+
+import aiohttp
+import orjson
+
+import mlrun.common.schemas
+import mlrun.errors
+import mlrun.utils
+from mlrun.config import config
+from mlrun.errors import err_to_str
+from mlrun.utils import logger
+
+from .httpdb import HTTPRunDB
+
+
+class AsyncHTTPRunDB:
+    """Asynchronous client of the MLRun API, for issuing many run and artifact operations concurrently.
+
+    The client reuses the address and credentials of the given :py:class:`~mlrun.db.httpdb.HTTPRunDB`, and all its
+    requests share a single pool of connections, so awaiting many of them together (e.g. with ``asyncio.gather``)
+    doesn't wait on each round trip in turn::
+
+        async with AsyncHTTPRunDB(mlrun.get_run_db()) as db:
+            artifacts = await asyncio.gather(
+                *[db.read_artifact(key, project=project) for key in keys]
+            )
+    """
+
+    def __init__(self, run_db: HTTPRunDB):
+        self._run_db = run_db
+        self._session: typing.Optional[mlrun.utils.AsyncClientWithRetry] = None
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        json=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.Optional[typing.Any]:
+        """Perform a direct REST API call on the :py:mod:`mlrun` API server.
+
+        :param method: REST method (POST, GET, PUT...)
+        :param path: Path to endpoint executed, for example ``"projects"``
+        :param error: Error to return if API invocation fails
+        :param params: Rest parameters, passed as a dictionary: ``{"<param-name>": <"param-value">}``
+        :param json: JSON payload to be passed in the call
+        :param headers: REST headers, passed as a dictionary: ``{"<header-name>": "<header-value>"}``
+        :param timeout: API call timeout
+        :param version: API version to use, None (the default) will mean to use the default value from config,
+         for un-versioned api set an empty string.
+
+        :return: The decoded JSON body of the response, None if the response has no body
+        """
+        await self._ensure_session()
+        url = self._run_db.get_base_api_url(path, version)
+        kw = {
+            key: value
+            for key, value in (
+                ("params", self._resolve_params(params)),
+                ("json", json),
+                ("headers", headers),
+            )
+            if value is not None
+        }
+        self._run_db._enrich_request_kwargs_with_auth_and_versions(kw)
+        if "auth" in kw:
+            kw["auth"] = aiohttp.BasicAuth(*kw["auth"])
+
+        try:
+            response = await self._session.request(
+                method,
+                url,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                ssl=self._resolve_ssl(),
+                **kw,
+            )
+            content = await response.read()
+        except aiohttp.ClientError as exc:
+            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
+            raise mlrun.errors.MLRunRuntimeError(error) from exc
+
+        if not response.ok:
+            error_details = ""
+            try:
+                error_details = orjson.loads(content).get("detail", {})
+            except Exception:
+                pass
+            if error_details:
+                error_details = f"details: {error_details}"
+                error = f"{error} {error_details}" if error else error_details
+            mlrun.errors.raise_for_status(response, error)
+
+        return orjson.loads(content) if content else None
+
+    async def read_run(self, uid, project="", iter=0):
+        """Read the details of a stored run from the DB.
+
+        :param uid: The run's unique ID.
+        :param project: Project name.
+        :param iter: Iteration within a specific execution.
+        """
+        path = self._run_db._path_of("runs", project, uid)
+        error = f"get run {project}/{uid}"
+        response = await self.api_call("GET", path, error, params={"iter": iter})
+        return response["data"]
+
+    async def update_run(self, updates: dict, uid, project="", iter=0, timeout=45):
+        """Update the details of a stored run in the DB."""
+        path = self._run_db._path_of("runs", project, uid)
+        error = f"update run {project}/{uid}"
+        await self.api_call(
+            "PATCH", path, error, params={"iter": iter}, json=updates, timeout=timeout
+        )
+
+    async def update_runs(self, runs_updates: list[dict], project="", timeout=45):
+        """
+        Update the details of multiple stored runs in the DB, in a single request.
+
+        :param runs_updates: List of the updates to apply, each a dictionary with the ``uid`` of the run, its
+            ``iter`` (defaults to 0) and the ``updates`` dictionary to apply to it.
+        :param project: Project that the runs belong to.
+        :param timeout: API call timeout.
+        """
+        project = project or config.default_project
+        error = f"update runs {project}"
+        await self.api_call(
+            "PATCH",
+            f"projects/{project}/runs",
+            error,
+            json={"runs": runs_updates},
+            timeout=timeout,
+        )
+
+    async def read_artifact(
+        self, key, tag=None, iter=None, project="", tree=None, uid=None
+    ):
+        """Read an artifact, identified by its key, tag, tree and iteration.
+
+        :param key: Identifying key of the artifact.
+        :param tag: Tag of the artifact.
+        :param iter: The iteration which generated this artifact (where ``iter=0`` means the root iteration).
+        :param project: Project that the artifact belongs to.
+        :param tree: The tree which generated this artifact.
+        :param uid: A unique ID for this specific version of the artifact (the uid that was generated in the backend)
+        """
+        project = project or config.default_project
+        error = f"read artifact {project}/{key}"
+        params = {
+            "format": mlrun.common.schemas.ArtifactsFormat.full.value,
+            "tag": tag or "latest",
+            "tree": tree,
+            "uid": uid,
+        }
+        if iter:
+            params["iter"] = str(iter)
+        return await self.api_call(
+            "GET",
+            f"projects/{project}/artifacts/{key}",
+            error,
+            params=params,
+            version="v2",
+        )
+
+    async def store_artifact(
+        self, key, artifact, iter=None, tag=None, project="", tree=None
+    ):
+        """Store an artifact in the DB.
+
+        :param key: Identifying key of the artifact.
+        :param artifact: The :py:class:`~mlrun.artifacts.Artifact` to store.
+        :param iter: The task iteration which generated this artifact.
+        :param tag: Tag of the artifact.
+        :param project: Project that the artifact belongs to.
+        :param tree: The tree (producer id) which generated this artifact.
+        """
+        project = project or config.default_project
+        error = f"store artifact {project}/{key}"
+        params = {}
+        if iter:
+            params["iter"] = str(iter)
+        if tag:
+            params["tag"] = tag
+        if tree:
+            params["tree"] = tree
+        await self.api_call(
+            "PUT",
+            f"projects/{project}/artifacts/{key}",
+            error,
+            params=params,
+            json=self._to_dict(artifact),
+            version="v2",
+        )
+
+    async def store_artifacts(self, artifacts: list[dict], project=""):
+        """Store multiple artifacts in the DB, in a single request.
+
+        :param artifacts: List of the artifacts to store, each a dictionary with the ``key`` and ``artifact`` to store,
+            and optionally its ``iter``, ``tag`` and ``tree``.
+        :param project: Project that the artifacts belong to.
+        """
+        project = project or config.default_project
+        error = f"store artifacts {project}"
+        await self.api_call(
+            "PUT",
+            f"projects/{project}/artifacts",
+            error,
+            json={
+                "artifacts": [
+                    {**artifact, "artifact": self._to_dict(artifact["artifact"])}
+                    for artifact in artifacts
+                ]
+            },
+            version="v2",
+        )
+
+    async def _ensure_session(self):
+        if not self._session:
+            self._session = mlrun.utils.AsyncClientWithRetry(
+                raise_for_status=False,
+                retry_on_exception=config.httpdb.retry_api_call_on_exception
+                == mlrun.common.schemas.HTTPSessionRetryMode.enabled.value,
+                connector=aiohttp.TCPConnector(
+                    limit=int(config.httpdb.http.async_connection_pool_size)
+                ),
+                # serialize like the sync client, which handles values the standard json encoder does not
+                json_serialize=mlrun.utils.dict_to_json,
+                logger=logger,
+            )
+
+    @staticmethod
+    def _resolve_params(params: typing.Optional[dict]) -> typing.Optional[dict]:
+        if params is None:
+            return None
+
+        # unlike requests, aiohttp doesn't drop None values nor converts the rest of the values to strings
+        return {
+            key: str(value.value if isinstance(value, enum.Enum) else value)
+            for key, value in params.items()
+            if value is not None
+        }
+
+    @staticmethod
+    def _resolve_ssl() -> typing.Union[bool, ssl.SSLContext]:
+        verify = config.httpdb.http.verify
+        if isinstance(verify, str):
+            # path to a CA bundle, like in requests
+            return ssl.create_default_context(cafile=verify)
+        return bool(verify)
+
+    @staticmethod
+    def _to_dict(artifact) -> dict:
+        to_dict = getattr(artifact, "to_dict", None)
+        return to_dict() if to_dict else artifact
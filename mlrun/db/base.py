@@ -14,6 +14,7 @@
 
 import datetime
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Optional, Union
 
 import mlrun.common.schemas
@@ -47,6 +48,22 @@ class RunDBInterface(ABC):
     def update_run(self, updates: dict, uid, project="", iter=0):
         pass
 
+    def update_runs(self, runs_updates: list[dict], project=""):
+        """
+        Update the details of multiple stored runs.
+
+        :param runs_updates: List of the updates to apply, each a dictionary with the ``uid`` of the run, its
+            ``iter`` (defaults to 0) and the ``updates`` dictionary to apply to it.
+        :param project: Project that the runs belong to.
+        """
+        for run_updates in runs_updates:
+            self.update_run(
+                run_updates["updates"],
+                run_updates["uid"],
+                project=project,
+                iter=run_updates.get("iter", 0),
+            )
+
     @abstractmethod
     def abort_run(self, uid, project="", iter=0, timeout=45, status_text=""):
         pass
@@ -81,6 +98,40 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    def export_runs(
+        self,
+        name: Optional[str] = None,
+        uid: Optional[Union[str, list[str]]] = None,
+        project: Optional[str] = None,
+        labels: Optional[Union[str, list[str]]] = None,
+        state: Optional[str] = None,
+        iter: bool = False,
+        start_time_from: datetime.datetime = None,
+        start_time_to: datetime.datetime = None,
+        last_update_time_from: datetime.datetime = None,
+        last_update_time_to: datetime.datetime = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        Export runs in bulk, yielding the runs one by one.
+        DBs which can stream the runs should override this, by default the runs are listed and then yielded.
+        """
+        yield from (
+            self.list_runs(
+                name=name,
+                uid=uid,
+                project=project,
+                labels=labels,
+                state=state,
+                iter=iter,
+                start_time_from=start_time_from,
+                start_time_to=start_time_to,
+                last_update_time_from=last_update_time_from,
+                last_update_time_to=last_update_time_to,
+            )
+            or []
+        )
+
     @abstractmethod
     def del_run(self, uid, project="", iter=0):
         pass
@@ -95,6 +146,24 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    def store_artifacts(self, artifacts: list[dict], project=""):
+        """
+        Store multiple artifacts in the DB.
+
+        :param artifacts: List of the artifacts to store, each a dictionary with the ``key`` and ``artifact`` to store,
+            and optionally its ``iter``, ``tag`` and ``tree``.
+        :param project: Project that the artifacts belong to.
+        """
+        for artifact in artifacts:
+            self.store_artifact(
+                artifact["key"],
+                artifact["artifact"],
+                iter=artifact.get("iter"),
+                tag=artifact.get("tag", ""),
+                project=project,
+                tree=artifact.get("tree"),
+            )
+
     @abstractmethod
     def read_artifact(self, key, tag="", iter=None, project="", tree=None, uid=None):
         pass
@@ -116,6 +185,37 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    def export_artifacts(
+        self,
+        name="",
+        project="",
+        tag="",
+        labels=None,
+        iter: int = None,
+        best_iteration: bool = False,
+        kind: str = None,
+        category: Union[str, mlrun.common.schemas.ArtifactCategories] = None,
+        tree: str = None,
+    ) -> Iterator[dict]:
+        """
+        Export artifacts in bulk, yielding the artifacts one by one.
+        DBs which can stream the artifacts should override this, by default the artifacts are listed and then yielded.
+        """
+        yield from (
+            self.list_artifacts(
+                name=name,
+                project=project,
+                tag=tag,
+                labels=labels,
+                iter=iter,
+                best_iteration=best_iteration,
+                kind=kind,
+                category=category,
+                tree=tree,
+            )
+            or []
+        )
+
     @abstractmethod
     def del_artifact(self, key, tag="", project="", tree=None, uid=None):
         pass
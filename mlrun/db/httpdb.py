@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import enum
 import http
 import re
@@ -27,6 +28,7 @@ from typing import Optional, Union
 from urllib.parse import urlparse
 
 import kfp
+import orjson
 import requests
 import semver
 
@@ -184,6 +186,8 @@ class HTTPRunDB(RunDBInterface):
         headers=None,
         timeout=45,
         version=None,
+        session: typing.Optional[requests.Session] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Perform a direct REST API call on the :py:mod:`mlrun` API server.
 
@@ -201,6 +205,10 @@ class HTTPRunDB(RunDBInterface):
         :param timeout: API call timeout
         :param version: API version to use, None (the default) will mean to use the default value from config,
          for un-versioned api set an empty string.
+        :param session: Session to send the request with, defaults to the client's session. Sessions are not
+         thread-safe, so requests sent from another thread should use their own session.
+        :param stream: Whether to stream the response body instead of downloading it immediately (the caller is
+         responsible for consuming or closing the response).
 
         :return: `requests.Response` HTTP response object
         """
@@ -216,29 +224,7 @@ class HTTPRunDB(RunDBInterface):
             if value is not None
         }
 
-        if self.user:
-            kw["auth"] = (self.user, self.password)
-        elif self.token:
-            # Iguazio auth doesn't support passing token through bearer, so use cookie instead
-            if mlrun.platforms.iguazio.is_iguazio_session(self.token):
-                session_cookie = f'j:{{"sid": "{self.token}"}}'
-                cookies = {
-                    "session": session_cookie,
-                }
-                kw["cookies"] = cookies
-            else:
-                if "Authorization" not in kw.setdefault("headers", {}):
-                    kw["headers"].update({"Authorization": "Bearer " + self.token})
-
-        if mlrun.common.schemas.HeaderNames.client_version not in kw.setdefault(
-            "headers", {}
-        ):
-            kw["headers"].update(
-                {
-                    mlrun.common.schemas.HeaderNames.client_version: self.client_version,
-                    mlrun.common.schemas.HeaderNames.python_version: self.python_version,
-                }
-            )
+        self._enrich_request_kwargs_with_auth_and_versions(kw)
 
         # requests no longer supports header values to be enum (https://github.com/psf/requests/pull/6154)
         # convert to strings. Do the same for params for niceness
@@ -249,16 +235,17 @@ class HTTPRunDB(RunDBInterface):
                         dict_[key] = dict_[key].value
 
         # if the method is POST, we need to update the session with the appropriate retry policy
-        if not self.session or method == "POST":
+        if not session and (not self.session or method == "POST"):
             retry_on_post = self._is_retry_on_post_allowed(method, path)
             self.session = self._init_session(retry_on_post)
 
         try:
-            response = self.session.request(
+            response = (session or self.session).request(
                 method,
                 url,
                 timeout=timeout,
                 verify=config.httpdb.http.verify,
+                stream=stream,
                 **kw,
             )
         except requests.RequestException as exc:
@@ -283,6 +270,34 @@ class HTTPRunDB(RunDBInterface):
 
         return response
 
+    def _enrich_request_kwargs_with_auth_and_versions(self, kw: dict):
+        """
+        Add the credentials and the client versions to the kwargs of a request (in the `requests` library format)
+        """
+        if self.user:
+            kw["auth"] = (self.user, self.password)
+        elif self.token:
+            # Iguazio auth doesn't support passing token through bearer, so use cookie instead
+            if mlrun.platforms.iguazio.is_iguazio_session(self.token):
+                session_cookie = f'j:{{"sid": "{self.token}"}}'
+                cookies = {
+                    "session": session_cookie,
+                }
+                kw["cookies"] = cookies
+            else:
+                if "Authorization" not in kw.setdefault("headers", {}):
+                    kw["headers"].update({"Authorization": "Bearer " + self.token})
+
+        if mlrun.common.schemas.HeaderNames.client_version not in kw.setdefault(
+            "headers", {}
+        ):
+            kw["headers"].update(
+                {
+                    mlrun.common.schemas.HeaderNames.client_version: self.client_version,
+                    mlrun.common.schemas.HeaderNames.python_version: self.python_version,
+                }
+            )
+
     def paginated_api_call(
         self,
         method,
@@ -296,10 +311,12 @@ class HTTPRunDB(RunDBInterface):
         version=None,
     ) -> typing.Generator[requests.Response, None, None]:
         """
-        Calls the api with pagination, yielding each page of the response
+        Calls the api with pagination, yielding each page of the response.
+        While the caller processes a page, the next one is already being fetched in the background (using a separate
+        session, as the caller may use the client while processing the page).
         """
 
-        def _api_call(_params):
+        def _api_call(_params, session=None):
             return self.api_call(
                 method=method,
                 path=path,
@@ -310,28 +327,73 @@ class HTTPRunDB(RunDBInterface):
                 headers=headers,
                 timeout=timeout,
                 version=version,
+                session=session,
             )
 
         first_page_params = deepcopy(params) or {}
         first_page_params["page"] = 1
         first_page_params["page-size"] = config.httpdb.pagination.default_page_size
         response = _api_call(first_page_params)
-        page_token = response.json().get("pagination", {}).get("page-token")
+        page_token = (
+            orjson.loads(response.content).get("pagination", {}).get("page-token")
+        )
         if not page_token:
             yield response
             return
 
         params_with_page_token = deepcopy(params) or {}
         params_with_page_token["page-token"] = page_token
-        while page_token:
-            yield response
-            try:
-                response = _api_call(params_with_page_token)
-            except mlrun.errors.MLRunNotFoundError:
-                # pagination token expired
-                break
+        # a single worker, as the pages of a token must be requested one after the other
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        prefetch_session = self._init_session()
+        next_response_future = None
+        try:
+            while page_token:
+                next_response_future = executor.submit(
+                    _api_call, params_with_page_token, prefetch_session
+                )
+                yield response
+                try:
+                    response = next_response_future.result()
+                except mlrun.errors.MLRunNotFoundError:
+                    # pagination token expired
+                    break
 
-            page_token = response.json().get("pagination", {}).get("page-token", None)
+                page_token = (
+                    orjson.loads(response.content)
+                    .get("pagination", {})
+                    .get("page-token", None)
+                )
+        finally:
+            # when the caller stops iterating, don't request pages which weren't requested yet. a page which is
+            # already being requested can't be aborted, so its session is closed once the request is done
+            executor.shutdown(wait=False, cancel_futures=True)
+            if next_response_future and not next_response_future.done():
+                next_response_future.add_done_callback(
+                    lambda _: prefetch_session.close()
+                )
+            else:
+                prefetch_session.close()
+
+    def _stream_ndjson(
+        self, method, path, error=None, params=None, version=None
+    ) -> typing.Iterator[dict]:
+        """
+        Calls the api requesting a newline delimited JSON response, and yields the objects as their lines are received
+        """
+        response = self.api_call(
+            method,
+            path,
+            error,
+            params=params,
+            headers={"Accept": mlrun.common.schemas.MediaTypes.ndjson},
+            version=version,
+            stream=True,
+        )
+        with response:
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
 
     @staticmethod
     def process_paginated_responses(
@@ -342,7 +404,8 @@ class HTTPRunDB(RunDBInterface):
         """
         data = []
         for response in responses:
-            data.extend(response.json().get(key, []))
+            # orjson decodes large listings considerably faster than the standard json module
+            data.extend(orjson.loads(response.content).get(key, []))
         return data
 
     def _init_session(self, retry_on_post: bool = False):
@@ -677,6 +740,21 @@ class HTTPRunDB(RunDBInterface):
         body = _as_json(updates)
         self.api_call("PATCH", path, error, params=params, body=body, timeout=timeout)
 
+    def update_runs(self, runs_updates: list[dict], project="", timeout=45):
+        """
+        Update the details of multiple stored runs in the DB, in a single request.
+
+        :param runs_updates: List of the updates to apply, each a dictionary with the ``uid`` of the run, its
+            ``iter`` (defaults to 0) and the ``updates`` dictionary to apply to it.
+        :param project: Project that the runs belong to.
+        :param timeout: API call timeout.
+        """
+        project = project or config.default_project
+        path = f"projects/{project}/runs"
+        error = f"update runs {project}"
+        body = _as_json({"runs": runs_updates})
+        self.api_call("PATCH", path, error, body=body, timeout=timeout)
+
     def abort_run(self, uid, project="", iter=0, timeout=45, status_text=""):
         """
         Abort a running run - will remove the run's runtime resources and mark its state as aborted.
@@ -804,6 +882,99 @@ class HTTPRunDB(RunDBInterface):
                 "using the `with_notifications` flag."
             )
 
+        params = self._generate_list_runs_params(
+            name=name,
+            uid=uid,
+            labels=labels,
+            state=state,
+            sort=sort,
+            last=last,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+            partition_by=partition_by,
+            rows_per_partition=rows_per_partition,
+            partition_sort_by=partition_sort_by,
+            partition_order=partition_order,
+            max_partitions=max_partitions,
+            with_notifications=with_notifications,
+        )
+        error = "list runs"
+        _path = self._path_of("runs", project)
+        responses = self.paginated_api_call("GET", _path, error, params=params)
+        return RunList(self.process_paginated_responses(responses, "runs"))
+
+    def export_runs(
+        self,
+        name: Optional[str] = None,
+        uid: Optional[Union[str, list[str]]] = None,
+        project: Optional[str] = None,
+        labels: Optional[Union[str, list[str]]] = None,
+        state: Optional[str] = None,
+        iter: bool = False,
+        start_time_from: Optional[datetime] = None,
+        start_time_to: Optional[datetime] = None,
+        last_update_time_from: Optional[datetime] = None,
+        last_update_time_to: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+    ) -> typing.Iterator[dict]:
+        """
+        Export runs in bulk, yielding the runs one by one while they are streamed from the API (as newline delimited
+        JSON), so the whole listing is never held in memory. The runs are filtered like in :py:func:`~list_runs`.
+        As in the listings, NaN and Inf float values (e.g. in the run results) are exported as None.
+
+        Example::
+
+            with open("runs.ndjson", "w") as file:
+                for run in db.export_runs(project="iris", iter=True):
+                    file.write(json.dumps(run) + "\n")
+
+        :param batch_size: Number of runs the API retrieves from the DB at a time, defaults to
+            ``mlrun.mlconf.httpdb.pagination.export_batch_size``.
+        """
+        project = project or config.default_project
+        params = self._generate_list_runs_params(
+            name=name,
+            uid=uid,
+            labels=labels,
+            state=state,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+        )
+        params["page-size"] = batch_size or config.httpdb.pagination.export_batch_size
+        yield from self._stream_ndjson(
+            "GET", self._path_of("runs", project), "export runs", params=params
+        )
+
+    def _generate_list_runs_params(
+        self,
+        name: Optional[str] = None,
+        uid: Optional[Union[str, list[str]]] = None,
+        labels: Optional[Union[str, list[str]]] = None,
+        state: Optional[str] = None,
+        sort: bool = True,
+        last: int = 0,
+        iter: bool = False,
+        start_time_from: Optional[datetime] = None,
+        start_time_to: Optional[datetime] = None,
+        last_update_time_from: Optional[datetime] = None,
+        last_update_time_to: Optional[datetime] = None,
+        partition_by: Optional[
+            Union[mlrun.common.schemas.RunPartitionByField, str]
+        ] = None,
+        rows_per_partition: int = 1,
+        partition_sort_by: Optional[Union[mlrun.common.schemas.SortField, str]] = None,
+        partition_order: Union[
+            mlrun.common.schemas.OrderType, str
+        ] = mlrun.common.schemas.OrderType.desc,
+        max_partitions: int = 0,
+        with_notifications: bool = False,
+    ) -> dict:
         if last:
             # TODO: Remove this in 1.8.0
             warnings.warn(
@@ -855,10 +1026,7 @@ class HTTPRunDB(RunDBInterface):
                     max_partitions,
                 )
             )
-        error = "list runs"
-        _path = self._path_of("runs", project)
-        responses = self.paginated_api_call("GET", _path, error, params=params)
-        return RunList(self.process_paginated_responses(responses, "runs"))
+        return params
 
     def del_runs(self, name=None, project=None, labels=None, state=None, days_ago=0):
         """Delete a group of runs identified by the parameters of the function.
@@ -936,6 +1104,19 @@ class HTTPRunDB(RunDBInterface):
             "PUT", endpoint_path, error, body=body, params=params, version="v2"
         )
 
+    def store_artifacts(self, artifacts: list[dict], project=""):
+        """Store multiple artifacts in the DB, in a single request.
+
+        :param artifacts: List of the artifacts to store, each a dictionary with the ``key`` and ``artifact`` to store,
+            and optionally its ``iter``, ``tag`` and ``tree``.
+        :param project: Project that the artifacts belong to.
+        """
+        project = project or config.default_project
+        endpoint_path = f"projects/{project}/artifacts"
+        error = f"store artifacts {project}"
+        body = _as_json({"artifacts": artifacts})
+        self.api_call("PUT", endpoint_path, error, body=body, version="v2")
+
     def read_artifact(
         self,
         key,
@@ -1057,10 +1238,51 @@ class HTTPRunDB(RunDBInterface):
         error = "list artifacts"
         endpoint_path = f"projects/{project}/artifacts"
         resp = self.api_call("GET", endpoint_path, error, params=params, version="v2")
-        values = ArtifactList(resp.json()["artifacts"])
+        values = ArtifactList(orjson.loads(resp.content)["artifacts"])
         values.tag = tag
         return values
 
+    def export_artifacts(
+        self,
+        name=None,
+        project=None,
+        tag=None,
+        labels: Optional[Union[dict[str, str], list[str]]] = None,
+        iter: int = None,
+        best_iteration: bool = False,
+        kind: str = None,
+        category: Union[str, mlrun.common.schemas.ArtifactCategories] = None,
+        tree: str = None,
+    ) -> typing.Iterator[dict]:
+        """
+        Export artifacts in bulk, yielding the artifacts one by one while they are streamed from the API (as newline
+        delimited JSON). The artifacts are filtered like in :py:func:`~list_artifacts`.
+        """
+        project = project or config.default_project
+
+        labels = labels or []
+        if isinstance(labels, dict):
+            labels = [f"{key}={value}" for key, value in labels.items()]
+
+        params = {
+            "name": name,
+            "tag": tag,
+            "label": labels,
+            "iter": iter,
+            "best-iteration": best_iteration,
+            "kind": kind,
+            "category": category,
+            "tree": tree,
+            "format": mlrun.common.schemas.ArtifactsFormat.full.value,
+        }
+        yield from self._stream_ndjson(
+            "GET",
+            f"projects/{project}/artifacts",
+            "export artifacts",
+            params=params,
+            version="v2",
+        )
+
     def del_artifacts(
         self, name=None, project=None, tag=None, labels=None, days_ago=0, tree=None
     ):
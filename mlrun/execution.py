@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import os
+import threading
+import time
 import uuid
+import weakref
 from copy import deepcopy
 from typing import Union
 
@@ -111,6 +115,11 @@ class MLClientCtx:
         self._project_object = None
         self._allow_empty_resources = None
 
+        # number of committed run updates which were not yet written to the db, see _update_run()
+        self._pending_run_updates = 0
+        self._last_run_updates_flush = time.monotonic()
+        self._run_updates_lock = threading.RLock()
+
     def __enter__(self):
         return self
 
@@ -268,14 +277,31 @@ class MLClientCtx:
         if not self._children:
             return
         if commit_children:
-            for child in self._children:
-                child.commit(completed=completed)
+            self._commit_children(completed=completed)
         results = [child.to_dict() for child in self._children]
         summary, df = mlrun.runtimes.utils.results_to_iter(results, None, self)
         task = results[best_run - 1] if best_run else None
         self.log_iteration_results(best_run, summary, task)
         mlrun.runtimes.utils.log_iter_artifacts(self, df, summary[0])
 
+    def _commit_children(self, completed=True):
+        """Commit all the child runs to the db in a single bulk update (instead of a commit per child)"""
+        runs_updates = []
+        for child in self._children:
+            child._set_commit_state(completed=completed)
+            child._last_update = now_date()
+            child._commit = ""
+            child._merge_tmpfile()
+            runs_updates.append(
+                {
+                    "uid": child._uid,
+                    "iter": child._iteration,
+                    "updates": child._pop_run_updates(child._get_updates()),
+                }
+            )
+        if self._rundb:
+            self._rundb.update_runs(runs_updates, project=self.project)
+
     def mark_as_best(self):
         """mark a child as the best iteration result, see .get_child_context()"""
         if not self._parent or not self._iteration:
@@ -531,7 +557,11 @@ class MLClientCtx:
 
         :param key:    Result key
         :param value:  Result value
-        :param commit: Commit (write to DB now vs wait for the end of the run)
+        :param commit: Commit the result to the DB (otherwise it is written at the end of the run). Committed
+                       results are buffered and written together with the other buffered run updates, by the first
+                       update after ``mlrun.mlconf.run_updates_buffer.flush_interval`` seconds or once
+                       ``max_pending_updates`` updates are buffered, whichever comes first (and on state changes,
+                       commit() and exit), so results logged in a loop don't cost a DB write each
         """
         self._results[str(key)] = _cast_result(value)
         self._update_run(commit=commit)
@@ -544,7 +574,8 @@ class MLClientCtx:
             context.log_results({"accuracy": 0.85, "loss": 0.2})
 
         :param results:  Key/value dict or results
-        :param commit:   Commit (write to DB now vs wait for the end of the run)
+        :param commit:   Commit the results to the DB (otherwise they are written at the end of the run), the
+                         results are buffered like in :py:func:`~log_result`
         """
         if not isinstance(results, dict):
             raise MLRunInvalidArgumentError("Results must be in the form of dict")
@@ -580,6 +611,20 @@ class MLClientCtx:
         if commit:
             self._update_run(commit=True)
 
+    def coalesce_artifacts_db_writes(self):
+        """Context manager which defers storing the artifacts logged within it in the DB, and stores them all in a
+        single request once it exits (instead of a request per artifact)
+
+        example::
+
+            with context.coalesce_artifacts_db_writes():
+                for epoch in range(epochs):
+                    context.log_artifact(
+                        f"checkpoint-{epoch}", local_path=f"checkpoint-{epoch}.pt"
+                    )
+        """
+        return self._artifacts_manager.coalesce_db_writes()
+
     def log_artifact(
         self,
         item,
@@ -846,27 +891,30 @@ class MLClientCtx:
         :param message:   Commit message to save in the run
         :param completed: Mark run as completed
         """
-        # Changing state to completed is allowed only when the execution is in running state
-        if self._state != "running":
-            completed = False
-
-        if message:
-            self._annotations["message"] = message
-        if completed:
-            self._state = "completed"
+        self._set_commit_state(message, completed)
 
         if self._parent:
             self._parent.update_child_iterations()
             self._parent._last_update = now_date()
-            self._parent._update_run(commit=True, message=message)
+            self._parent._update_run(commit=True, message=message, flush=True)
 
         if self._children:
             self.update_child_iterations(commit_children=True, completed=completed)
         self._last_update = now_date()
-        self._update_run(commit=True, message=message)
+        self._update_run(commit=True, message=message, flush=True)
         if completed and not self.iteration:
             mlrun.runtimes.utils.global_context.set(None)
 
+    def _set_commit_state(self, message: str = "", completed=False):
+        # Changing state to completed is allowed only when the execution is in running state
+        if self._state != "running":
+            completed = False
+
+        if message:
+            self._annotations["message"] = message
+        if completed:
+            self._state = "completed"
+
     def set_state(self, execution_state: str = None, error: str = None, commit=True):
         """
         Modify and store the execution state or mark an error and update the run state accordingly.
@@ -895,10 +943,9 @@ class MLClientCtx:
             updates["status.state"] = execution_state
         self._last_update = now_date()
 
-        if self._rundb and commit:
-            self._rundb.update_run(
-                updates, self._uid, self.project, iter=self._iteration
-            )
+        if commit:
+            # state transitions are written immediately, together with any buffered run updates
+            self._flush_run_updates(updates)
 
     def set_hostname(self, host: str):
         """Update the hostname, for internal use"""
@@ -999,20 +1046,66 @@ class MLClientCtx:
         # Single worker is always the logging worker:
         return True
 
-    def _update_run(self, commit=False, message=""):
+    def _update_run(self, commit=False, message="", flush=False):
         """
         Update the required fields in the run object instead of overwriting existing values with empty ones
 
+        The tmpfile is always updated immediately, while committed changes are buffered and written to the DB in a
+        single update by the first update which finds the buffer past its time or size threshold (see
+        ``mlrun.mlconf.run_updates_buffer``), on state changes, on commit() and at exit.
+
         :param commit:  Commit the changes to the DB if autocommit is not set or update the tmpfile alone
         :param message: Commit message
+        :param flush:   Write the committed changes to the DB immediately instead of buffering them
         """
         self._merge_tmpfile()
         if commit or self._autocommit:
-            self._commit = message
-            if self._rundb:
-                self._rundb.update_run(
-                    self._get_updates(), self._uid, self.project, iter=self._iteration
-                )
+            with self._run_updates_lock:
+                self._commit = message
+                if not self._pending_run_updates:
+                    # make sure buffered updates are not lost if the execution ends without committing them
+                    _contexts_with_pending_run_updates.add(self)
+                self._pending_run_updates += 1
+                if flush or self._run_updates_buffer_exceeded():
+                    self._flush_run_updates()
+
+    def _run_updates_buffer_exceeded(self) -> bool:
+        buffer_config = mlrun.mlconf.run_updates_buffer
+        return self._pending_run_updates >= int(
+            buffer_config.max_pending_updates
+        ) or time.monotonic() - self._last_run_updates_flush >= float(
+            buffer_config.flush_interval
+        )
+
+    def _flush_run_updates(self, updates: dict = None):
+        """Write the buffered run updates to the DB, merged with the given updates into a single update
+
+        The updates are always written on the caller's thread (the db client session is not thread safe), and are
+        buffered again if the write fails so the next flush (or the flush at exit) retries them
+        """
+        with self._run_updates_lock:
+            pending_run_updates = self._pending_run_updates
+            updates = self._pop_run_updates(updates)
+            if updates and self._rundb:
+                try:
+                    self._rundb.update_run(
+                        updates, self._uid, self.project, iter=self._iteration
+                    )
+                except Exception:
+                    if pending_run_updates:
+                        self._pending_run_updates = pending_run_updates
+                        _contexts_with_pending_run_updates.add(self)
+                    raise
+
+    def _pop_run_updates(self, updates: dict = None) -> dict:
+        """Pop the buffered run updates, merged with the given updates into a single update"""
+        with self._run_updates_lock:
+            if self._pending_run_updates:
+                _contexts_with_pending_run_updates.discard(self)
+                updates = {**self._get_updates(), **(updates or {})}
+                self._pending_run_updates = 0
+            self._last_run_updates_flush = time.monotonic()
+            return updates
 
     def _get_updates(self):
         def set_if_not_none(_struct, key, val):
@@ -1123,3 +1216,20 @@ def _cast_result(value):
     if isinstance(value, np.ndarray):
         return value.tolist()
     return str(value)
+
+
+# contexts with buffered run updates, held weakly so contexts which are no longer used are not kept alive until exit
+_contexts_with_pending_run_updates: "weakref.WeakSet[MLClientCtx]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_run_updates():
+    for context in list(_contexts_with_pending_run_updates):
+        try:
+            context._flush_run_updates()
+        except Exception as exc:
+            logger.warning(
+                "Failed to flush the buffered run updates",
+                uid=context.uid,
+                exc=mlrun.errors.err_to_str(exc),
+            )
@@ -29,6 +29,7 @@ from ..datastore.sources import BaseSourceDriver, StreamSource
 from ..datastore.store_resources import parse_store_uri
 from ..datastore.targets import (
     BaseStoreTarget,
+    TargetTypes,
     get_default_prefix_for_source,
     get_target_driver,
     kind_to_driver,
@@ -58,11 +59,14 @@ from .feature_vector import (
 )
 from .ingestion import (
     context_to_ingestion_params,
+    entities_to_index,
     init_featureset_graph,
     run_ingestion_job,
     run_spark_graph,
 )
 from .retrieval import RemoteVectorResponse, get_merger, run_merge_job
+from .steps import get_engine, to_lazy_frame
+from .tiles import write_tiles
 
 _v3iofs = None
 spark_transform_handler = "transform"
@@ -724,8 +728,12 @@ def _ingest(
     infer_stats = InferOptions.get_common_options(
         infer_options, InferOptions.all_stats()
     )
+    with_tiles = featureset.spec.tiles and any(
+        getattr(target, "kind", target) == TargetTypes.parquet
+        for target in targets_to_ingest
+    )
     # Check if dataframe is already calculated (for feature set graph):
-    calculate_df = return_df or infer_stats != InferOptions.Null
+    calculate_df = return_df or infer_stats != InferOptions.Null or with_tiles
     featureset.save()
 
     df = init_featureset_graph(
@@ -734,6 +742,7 @@ def _ingest(
         namespace,
         targets=targets_to_ingest,
         return_df=calculate_df,
+        bulk_load=overwrite and mlrun.mlconf.feature_store.bulk_load.enabled,
     )
     if not InferOptions.get_common_options(
         infer_stats, InferOptions.Index
@@ -742,6 +751,9 @@ def _ingest(
 
     _infer_from_static_df(df, featureset, options=infer_stats)
 
+    if with_tiles and df is not None:
+        write_tiles(featureset, df, overwrite=overwrite)
+
     if isinstance(source, DataSource):
         for target in featureset.status.targets:
             if (
@@ -1178,6 +1190,11 @@ def _infer_from_static_df(
     sample_size=None,
 ):
     """infer feature-set schema & stats from static dataframe (without pipeline)"""
+    if get_engine(df) == "polars":
+        # the polars engine results (and sources) are inferred as pandas dataframes
+        df = to_lazy_frame(df).collect().to_pandas()
+        if featureset.spec.entities:
+            df = entities_to_index(featureset, df)
     if hasattr(df, "to_dataframe"):
         if hasattr(df, "time_field"):
             time_field = df.time_field or featureset.spec.timestamp_key
@@ -87,6 +87,7 @@ class FeatureSetSpec(ModelObj):
         engine=None,
         output_path=None,
         passthrough=None,
+        tiles=None,
     ):
         """Feature set spec object, defines the feature-set's configuration.
 
@@ -103,10 +104,11 @@ class FeatureSetSpec(ModelObj):
         :param targets: list of data targets
         :param graph: the processing graph
         :param function: MLRun runtime to execute the feature-set in
-        :param engine: name of the processing engine (storey, pandas, or spark), defaults to storey
+        :param engine: name of the processing engine (storey, pandas, spark, or polars), defaults to storey
         :param output_path: default location where to store results (defaults to MLRun's artifact path)
         :param passthrough: if true, ingest will skip offline targets, and get_offline_features will
                read directly from source
+        :param tiles: pre-aggregated offline tiles settings (see :py:meth:`FeatureSet.set_tiles`), None if disabled
         """
         self._features: ObjectList = None
         self._entities: ObjectList = None
@@ -133,6 +135,7 @@ class FeatureSetSpec(ModelObj):
         self.engine = engine
         self.output_path = output_path or mlconf.artifact_path
         self.passthrough = passthrough
+        self.tiles = tiles
         self.with_default_targets = True
 
     @property
@@ -182,18 +185,20 @@ class FeatureSetSpec(ModelObj):
 
     @property
     def engine(self) -> str:
-        """feature set processing engine (storey, pandas, spark)"""
+        """feature set processing engine (storey, pandas, spark, polars)"""
         return self._engine
 
     @engine.setter
     def engine(self, engine: str):
-        engine_list = ["pandas", "spark", "storey"]
+        engine_list = ["pandas", "spark", "storey", "polars"]
         engine = engine if engine else "storey"
         if engine not in engine_list:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"engine must be one of {','.join(engine_list)}"
             )
-        self.graph.engine = "sync" if engine and engine in ["pandas", "spark"] else None
+        self.graph.engine = (
+            "sync" if engine and engine in ["pandas", "spark", "polars"] else None
+        )
         self._engine = engine
 
     @property
@@ -205,7 +210,9 @@ class FeatureSetSpec(ModelObj):
     def graph(self, graph):
         self._graph = self._verify_dict(graph, "graph", RootFlowStep)
         self._graph.engine = (
-            "sync" if self.engine and self.engine in ["pandas", "spark"] else None
+            "sync"
+            if self.engine and self.engine in ["pandas", "spark", "polars"]
+            else None
         )
 
     @property
@@ -347,7 +354,10 @@ class FeatureSet(ModelObj):
         :param description:   text description
         :param entities:      list of entity (index key) names or :py:class:`~mlrun.features.FeatureSet.Entity`
         :param timestamp_key: timestamp column name
-        :param engine:        name of the processing engine (storey, pandas, or spark), defaults to storey
+        :param engine:        name of the processing engine (storey, pandas, spark, or polars), defaults to storey.
+                              The polars engine (requires ``mlrun[polars]``) runs the graph steps as a lazy,
+                              multi-threaded query, accepts Arrow tables and polars dataframes as the source, and
+                              ingestion returns an Arrow table
         :param label_column:  name of the label column (the one holding the target (y) values)
         :param relations:     dictionary that indicates all the relations this feature set
                               have with another feature sets. The format of this dictionary is
@@ -850,6 +860,66 @@ class FeatureSet(ModelObj):
 
         return step
 
+    def set_tiles(self, period: str = None, enabled: bool = True):
+        """write pre-aggregated tiles of the feature set aggregations next to the offline (parquet) target
+
+        A tile holds the partial aggregates (count, sum, sum of squares, min, max, first, last) of an aggregated
+        column for one entity over one period. The aggregations over any window which is a multiple of the period
+        are computed by combining tiles (see :py:meth:`get_window_aggregates`), and `get_offline_features` reads the
+        tiles (instead of the raw offline target) when all the requested features of the feature set are aggregations.
+
+        example::
+
+            ticks.add_aggregation("price", ["avg", "max"], ["1h", "1d"], "10m")
+            ticks.set_tiles()
+            ticks.ingest(df)
+            weekly = ticks.get_window_aggregates(windows=["7d"])
+
+        :param period:  optional, the tile period, e.g. '10m' (defaults to the smallest aggregation period), must
+                        divide every aggregation window
+        :param enabled: set to False to stop writing the tiles
+        """
+        from .tiles import get_aggregations, get_tiles_period
+
+        if not enabled:
+            self.spec.tiles = None
+            return
+        if self.spec.engine and self.spec.engine != "storey":
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Tiles are only supported with the storey engine"
+            )
+        if not self.spec.timestamp_key:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Tiles require a feature set timestamp key"
+            )
+        aggregations = get_aggregations(self)
+        if aggregations:
+            # aggregations added later are validated when the tiles are written
+            get_tiles_period(aggregations, period)
+        self.spec.tiles = {"period": period}
+
+    def get_window_aggregates(
+        self, windows=None, columns=None, start_time=None, end_time=None
+    ) -> pd.DataFrame:
+        """compute the feature set aggregations from the pre-aggregated tiles (see :py:meth:`set_tiles`)
+
+        :param windows:    optional, windows to compute for all the aggregations, can be any multiple of the tile
+                           period (e.g. '7d' for 1h tiles), defaults to the windows of each aggregation
+        :param columns:    optional, aggregated features to return, e.g. ["price_avg_7d"] (defaults to all)
+        :param start_time: optional, return the window values which end at or after this time
+        :param end_time:   optional, return the window values which end at or before this time
+        :return: DataFrame with the entities, the timestamp key (the end of each window) and the aggregated features
+        """
+        from .tiles import read_window_aggregates
+
+        return read_window_aggregates(
+            self,
+            windows=windows,
+            columns=columns,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
     def get_stats_table(self):
         """get feature statistics table (as dataframe)"""
         if self.status.stats:
@@ -909,6 +909,7 @@ class OnlineVectorService:
         index_columns,
         impute_policy: dict = None,
         requested_columns: list[str] = None,
+        prefetch_tables: list[tuple] = None,
     ):
         self.vector = vector
         self.impute_policy = impute_policy or {}
@@ -917,6 +918,8 @@ class OnlineVectorService:
         self._index_columns = index_columns
         self._impute_values = {}
         self._requested_columns = requested_columns
+        # (table, entity row key columns) of the tables which read the keys of all the rows at once
+        self._prefetch_tables = prefetch_tables or []
 
     def __enter__(self):
         return self
@@ -1016,11 +1019,17 @@ class OnlineVectorService:
                 for item in entity_rows
             ]
 
-        for row in entity_rows:
-            futures.append(self._controller.emit(row, return_awaitable_result=True))
-
-        for future in futures:
-            result = future.await_result()
+        prefetched = self._prefetch(entity_rows)
+        try:
+            for row in entity_rows:
+                futures.append(self._controller.emit(row, return_awaitable_result=True))
+            responses = [future.await_result() for future in futures]
+        finally:
+            # the hashes which were not read are not served to the following calls
+            for table, keys in prefetched:
+                table._storage.release(table._container, table._table_path, keys)
+
+        for result in responses:
             data = result.body
             if data:
                 actual_columns = data.keys()
@@ -1058,6 +1067,23 @@ class OnlineVectorService:
 
         return results
 
+    def _prefetch(self, entity_rows: list[dict]) -> list[tuple]:
+        """read the features of all the entity rows (in pipelines) before the rows are emitted, instead of a read
+        per row and feature set, returns the (table, keys) to release once the rows are processed"""
+        from storey.utils import stringify_key
+
+        prefetched = []
+        for table, key_columns in self._prefetch_tables:
+            keys = []
+            for row in entity_rows:
+                key = [row.get(column) for column in key_columns]
+                if None not in key:
+                    keys.append(stringify_key(key))
+            if keys:
+                table._storage.prefetch(table._container, table._table_path, keys)
+                prefetched.append((table, keys))
+        return prefetched
+
     def close(self):
         """terminate the async loop"""
         self._controller.terminate()
@@ -19,8 +19,10 @@ import pandas as pd
 import mlrun
 from mlrun.datastore.sources import get_source_from_dict, get_source_step
 from mlrun.datastore.targets import (
+    NoSqlBaseTarget,
     add_target_steps,
     get_target_driver,
+    kind_to_driver,
     validate_target_list,
     validate_target_placement,
 )
@@ -31,7 +33,9 @@ from ..runtimes import RuntimeKinds
 from ..runtimes.function_reference import FunctionReference
 from ..serving.server import MockEvent, create_graph_server
 from ..utils import logger, normalize_name
+from . import tiles
 from .feature_set import FeatureSet
+from .steps import get_engine, to_lazy_frame
 
 
 def init_featureset_graph(
@@ -42,6 +46,7 @@ def init_featureset_graph(
     return_df=True,
     verbose=False,
     rows_limit=None,
+    bulk_load=False,
 ):
     """create storey ingestion graph/DAG from feature set object"""
 
@@ -54,6 +59,10 @@ def init_featureset_graph(
     server.init_states(context=None, namespace=namespace, resource_cache=cache)
 
     if graph.engine != "sync":
+        bulk_targets = _get_bulk_load_targets(featureset, targets) if bulk_load else []
+        if bulk_targets:
+            bulk_ids = {id(target) for target in bulk_targets}
+            targets = [target for target in targets if id(target) not in bulk_ids]
         # todo: support rows_limit it storey sources
         _add_data_steps(
             graph,
@@ -61,11 +70,13 @@ def init_featureset_graph(
             featureset,
             targets=targets,
             source=source,
-            return_df=return_df,
+            return_df=return_df or bool(bulk_targets),
             context=server.context,
         )
         server.init_object(namespace)
-        return graph.wait_for_completion()
+        df = graph.wait_for_completion()
+        _bulk_load_targets(featureset, bulk_targets, df)
+        return df
     else:
         # for initialize all the validators of the feature set
         cache.cache_resource(featureset.uri, featureset, True)
@@ -80,11 +91,13 @@ def init_featureset_graph(
             chunks = source.to_dataframe()
         else:
             chunks = [source.to_dataframe()]
-    elif not hasattr(source, "to_csv"):
+    elif not hasattr(source, "to_csv") and get_engine(source) != "polars":
         raise mlrun.errors.MLRunInvalidArgumentError("illegal source")
     else:
         chunks = [source]
 
+    polars_engine = featureset.spec.engine == "polars"
+
     entity_columns = list(featureset.spec.entities.keys())
     key_fields = entity_columns if entity_columns else None
 
@@ -95,12 +108,21 @@ def init_featureset_graph(
     if featureset.spec.passthrough:
         targets = [target for target in targets if not target.is_offline]
     for chunk in chunks:
+        if polars_engine:
+            # the steps build a lazy query which is executed (multi-threaded) once per chunk, the entities are
+            # kept as columns (the result is an Arrow table)
+            chunk = to_lazy_frame(chunk)
+        elif get_engine(chunk) == "polars":
+            # Arrow tables and polars dataframes are processed as pandas dataframes by the other engines
+            chunk = to_lazy_frame(chunk).collect().to_pandas()
         event = MockEvent(body=chunk)
         if len(featureset.spec.entities) and isinstance(event.body, pd.DataFrame):
             # set the entities to be the indexes of the df
             event.body = entities_to_index(featureset, event.body)
 
         df = server.run(event, get_body=True)
+        if polars_engine and df is not None:
+            df = to_lazy_frame(df).collect().to_arrow()
         if df is not None:
             for i, target in enumerate(targets):
                 size = target.write_dataframe(
@@ -122,10 +144,47 @@ def init_featureset_graph(
         if verbose:
             logger.info(f"wrote target: {target_status}")
 
+    if polars_engine:
+        import pyarrow
+
+        result_table = pyarrow.concat_tables(result_dfs)
+        return result_table.slice(0, rows_limit) if rows_limit else result_table
     result_df = pd.concat(result_dfs)
     return result_df.head(rows_limit)
 
 
+def _get_bulk_load_targets(featureset, targets):
+    """the online targets which are written with bulk loads instead of the storey (per event) writer step"""
+    # the aggregations state is kept (and written) by the storey table of the online target
+    if tiles.get_aggregations(featureset):
+        return []
+    return [
+        target
+        for target in targets
+        if issubclass(kind_to_driver[target.kind], NoSqlBaseTarget)
+        and not target.after_step
+        and not getattr(target, "columns", None)
+    ]
+
+
+def _bulk_load_targets(featureset, targets, df):
+    if df is None or not len(targets):
+        return
+    key_columns = list(featureset.spec.entities.keys())
+    # the same columns as the storey writer step (the features, without the timestamp)
+    df = entities_to_index(featureset, df)
+    columns = [
+        feature.name
+        for feature in featureset.spec.features
+        if feature.name in df.columns
+    ] or [column for column in df.columns if column != featureset.spec.timestamp_key]
+    df = df[columns]
+    for target in targets:
+        driver = get_target_driver(target, featureset)
+        driver.write_dataframe(df, key_column=key_columns)
+        driver.update_resource_status("ready")
+
+
 def featureset_initializer(server):
     """graph server hook to initialize feature set ingestion graph/DAG"""
 
@@ -16,6 +16,7 @@ import re
 
 import pandas as pd
 
+from .. import tiles
 from .base import BaseMerger
 
 
@@ -115,6 +116,13 @@ class LocalFeatureMerger(BaseMerger):
         end_time=None,
         time_column=None,
     ):
+        if tiles.can_read_from_tiles(feature_set, column_names, time_column):
+            return tiles.read_window_aggregates(
+                feature_set,
+                columns=column_names,
+                start_time=start_time,
+                end_time=end_time,
+            )
         df = feature_set.to_dataframe(
             columns=column_names,
             start_time=start_time,
@@ -50,6 +50,9 @@ class StoreyFeatureMerger(BaseMerger):
         entity_keys = []
         del_columns = []
         end_aliases = {}
+        # the entity row columns of the keys of each feature set (when its keys are not read from other feature sets)
+        row_key_columns = {}
+        row_columns = None
         for step in join_graph.steps:
             name = step.right_feature_set_name
             feature_set = feature_set_objects[name]
@@ -79,7 +82,18 @@ class StoreyFeatureMerger(BaseMerger):
                     if k != v and v in save_column
                 }
             )
+            if row_columns is None:
+                row_columns = {key: key for key in entity_keys}
             mapping = {k: v for k, v in zip(step.left_keys, entity_list) if k != v}
+            for k, v in mapping.items():
+                if k in row_columns:
+                    row_columns[v] = row_columns.pop(k)
+                else:
+                    row_columns.pop(v, None)
+            if all(key in row_columns for key in entity_list):
+                row_key_columns[name] = [row_columns[key] for key in entity_list]
+            for column in column_names:
+                row_columns.pop(column, None)
             if mapping:
                 next = next.to(
                     "storey.Rename",
@@ -120,7 +134,7 @@ class StoreyFeatureMerger(BaseMerger):
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "the graph doesnt have an explicit final step to respond on"
             )
-        return graph, all_columns, entity_keys
+        return graph, all_columns, entity_keys, row_key_columns
 
     def init_online_vector_service(
         self, entity_keys, fixed_window_type, update_stats=False
@@ -141,6 +155,7 @@ class StoreyFeatureMerger(BaseMerger):
             graph,
             requested_columns,
             entity_keys,
+            row_key_columns,
         ) = self._generate_online_feature_vector_graph(
             entity_keys,
             feature_set_fields,
@@ -151,13 +166,18 @@ class StoreyFeatureMerger(BaseMerger):
         server = create_graph_server(graph=graph, parameters={})
 
         cache = ResourceCache()
-        for featureset in feature_set_objects.values():
+        prefetch_tables = []
+        for name, featureset in feature_set_objects.items():
             driver = get_online_target(featureset)
             if not driver:
                 raise mlrun.errors.MLRunInvalidArgumentError(
                     f"resource {featureset.uri} does not have an online data target"
                 )
-            cache.cache_table(featureset.uri, driver.get_table_object())
+            table = driver.get_table_object()
+            cache.cache_table(featureset.uri, table)
+            # the features of all the entity rows are read at once from the stores which support it (redis)
+            if name in row_key_columns and hasattr(table._storage, "prefetch"):
+                prefetch_tables.append((table, row_key_columns[name]))
 
         server.init_states(context=None, namespace=None, resource_cache=cache)
         server.init_object(None)
@@ -168,6 +188,7 @@ class StoreyFeatureMerger(BaseMerger):
             entity_keys,
             impute_policy=self.impute_policy,
             requested_columns=requested_columns,
+            prefetch_tables=prefetch_tables,
         )
         service.initialize()
 
@@ -0,0 +1,390 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pre-aggregated (tiled) offline store of the feature set window aggregations
+
+A tile holds the partial aggregates (count, sum, sum of squares, min, max, first, last) of an aggregated column for one
+entity over one fixed period. The tiles are written next to the offline (parquet) target when ingesting a feature set
+with tiles enabled (see :py:meth:`~mlrun.feature_store.FeatureSet.set_tiles`), and any window which is a multiple of the
+tile period is computed by combining ``window / period`` tiles instead of scanning the raw events.
+
+The timestamp of a tile is the end of its period, so a window value is available (e.g. in an as-of join) only after
+all its events occurred. This matches the storey sliding windows, where the window of an event is made of the
+``window / period`` periods which end with the period of the event.
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+import mlrun.errors
+
+from ..datastore.targets import ParquetTarget, get_offline_target
+
+# the partial aggregates needed to compute each operation from the tiles
+_operation_partials = {
+    "count": ["count"],
+    "sum": ["sum"],
+    "sqr": ["sqr"],
+    "max": ["max"],
+    "min": ["min"],
+    "first": ["first"],
+    "last": ["last"],
+    "avg": ["sum", "count"],
+    "stdvar": ["sum", "count", "sqr"],
+    "stddev": ["sum", "count", "sqr"],
+}
+
+# how partial aggregates of the same entity and period are merged (e.g. when appending tiles)
+_partial_reducers = {
+    "count": "sum",
+    "sum": "sum",
+    "sqr": "sum",
+    "max": "max",
+    "min": "min",
+    "first": "first",
+    "last": "last",
+}
+
+
+def get_aggregations(featureset) -> list[dict]:
+    """the aggregations (FeatureAggregation dicts) of all the feature set aggregation steps"""
+    aggregations = []
+    for step in (featureset.spec.graph.steps or {}).values():
+        class_args = getattr(step, "class_args", None) or {}
+        aggregations.extend(class_args.get("aggregates", []))
+    return aggregations
+
+
+def get_tiles_period(aggregations: list[dict], period: str = None) -> pd.Timedelta:
+    """the tile period, defaults to the smallest aggregation period (or window, for fixed windows)
+
+    The period must divide every aggregation window, so each window is made of whole tiles.
+    """
+    if not aggregations:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            "tiles require at least one aggregation"
+        )
+    if period:
+        period = pd.Timedelta(period)
+    else:
+        period = min(
+            pd.Timedelta(
+                aggregation["period"] or min(aggregation["windows"], key=pd.Timedelta)
+            )
+            for aggregation in aggregations
+        )
+    if period <= pd.Timedelta(0):
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"The tiles period must be positive, got {period}"
+        )
+    for aggregation in aggregations:
+        for window in aggregation["windows"]:
+            if pd.Timedelta(window) % period:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"The tiles period {period} must divide window {window} of aggregation {aggregation['name']}"
+                )
+    return period
+
+
+def get_tiles_path(featureset) -> typing.Optional[str]:
+    """the tiles parquet path, next to the offline (parquet) target"""
+    target = get_offline_target(featureset)
+    if not target or target.kind != ParquetTarget.kind:
+        return None
+    path = featureset.get_target_path().rstrip("/")
+    if path.endswith(".parquet") or path.endswith(".pq"):
+        path = path[: path.rindex(".")]
+    return f"{path}-tiles.parquet"
+
+
+def can_read_from_tiles(
+    featureset, columns: list[str], time_column: str = None
+) -> bool:
+    """whether the requested feature set columns are all aggregations which can be computed from its tiles"""
+    if not featureset.spec.tiles or not columns:
+        return False
+    if time_column and time_column != featureset.spec.timestamp_key:
+        return False
+    aggregated = {
+        f"{aggregation['name']}_{operation}_{window}"
+        for aggregation in get_aggregations(featureset)
+        for operation in aggregation["operations"]
+        for window in aggregation["windows"]
+    }
+    return set(columns).issubset(aggregated) and bool(get_tiles_path(featureset))
+
+
+def _partials(aggregations: list[dict]) -> dict[str, list[str]]:
+    """aggregation name -> the partial aggregates its tiles hold"""
+    result = {}
+    for aggregation in aggregations:
+        partials = result.setdefault(aggregation["name"], [])
+        for operation in aggregation["operations"]:
+            if operation not in _operation_partials:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"Aggregation operation {operation} can not be computed from tiles, "
+                    f"supported operations: {list(_operation_partials)}"
+                )
+            partials.extend(
+                partial
+                for partial in _operation_partials[operation]
+                if partial not in partials
+            )
+    return result
+
+
+def build_tiles(
+    df: pd.DataFrame,
+    aggregations: list[dict],
+    entities: list[str],
+    timestamp_key: str,
+    period: typing.Union[str, pd.Timedelta],
+) -> pd.DataFrame:
+    """compute the tiles (partial aggregates per entity and period) of raw events
+
+    :param df:            raw events (the aggregated columns, entities and timestamp)
+    :param aggregations:  FeatureAggregation dicts (see :py:func:`get_aggregations`)
+    :param entities:      entity (key) column names
+    :param timestamp_key: timestamp column name
+    :param period:        tile period, e.g. '1h'
+    :return: tiles dataframe with the entities, the timestamp (end of the tile period) and a
+             ``<aggregation name>_<partial>`` column per partial aggregate
+    """
+    if df.index.names[0]:
+        df = df.reset_index()
+    period = pd.Timedelta(period)
+    times = pd.to_datetime(df[timestamp_key])
+    # a stable sort, so first/last follow the event order within the same timestamp
+    order = np.argsort(times.values, kind="stable")
+    values = df[entities].iloc[order].reset_index(drop=True)
+    values[timestamp_key] = (times.dt.floor(period) + period).iloc[order].values
+
+    named_aggregations = {}
+    for aggregation in aggregations:
+        name, column = aggregation["name"], aggregation["column"]
+        source = df[column].iloc[order].reset_index(drop=True).astype("float64")
+        for partial in _partials([aggregation])[name]:
+            if f"{name}_{partial}" in named_aggregations:
+                continue
+            source_column = f"_{name}_{column}"
+            if partial == "sqr":
+                source_column = f"_{name}_{column}_sqr"
+                values[source_column] = source**2
+            else:
+                values[source_column] = source
+            func = "sum" if partial == "sqr" else partial
+            named_aggregations[f"{name}_{partial}"] = (source_column, func)
+
+    tiles = values.groupby(entities + [timestamp_key], sort=True).agg(
+        **named_aggregations
+    )
+    return tiles.reset_index()
+
+
+def merge_tiles(
+    tiles: list[pd.DataFrame], entities: list[str], timestamp_key: str
+) -> pd.DataFrame:
+    """merge tiles dataframes (in time order), combining the tiles of the same entity and period"""
+    tiles = pd.concat(
+        [df.assign(**{timestamp_key: _to_ns(df[timestamp_key])}) for df in tiles],
+        ignore_index=True,
+    )
+    keys = entities + [timestamp_key]
+    reducers = {
+        column: _partial_reducers[column.rsplit("_", 1)[1]]
+        for column in tiles.columns
+        if column not in keys
+    }
+    return tiles.groupby(keys, sort=True).agg(reducers).reset_index()
+
+
+def combine_tiles(
+    tiles: pd.DataFrame,
+    aggregations: list[dict],
+    entities: list[str],
+    timestamp_key: str,
+    period: typing.Union[str, pd.Timedelta],
+    windows: list[str] = None,
+) -> pd.DataFrame:
+    """compute window aggregations from tiles
+
+    :param tiles:         tiles dataframe (see :py:func:`build_tiles`)
+    :param aggregations:  FeatureAggregation dicts (see :py:func:`get_aggregations`)
+    :param entities:      entity (key) column names
+    :param timestamp_key: timestamp column name
+    :param period:        the tiles period
+    :param windows:       optional, windows to compute for all the aggregations (any multiple of the tile period),
+                          defaults to the windows of each aggregation
+    :return: dataframe with the entities, the timestamp (end of the window) and a
+             ``<aggregation name>_<operation>_<window>`` column per aggregated feature (a row per tile)
+    """
+    period = pd.Timedelta(period)
+    tiles = tiles.sort_values(entities + [timestamp_key], ignore_index=True)
+    tiles[timestamp_key] = _to_ns(tiles[timestamp_key])
+    result = tiles[entities + [timestamp_key]].copy()
+    by_entity = tiles.groupby(entities, sort=False)
+
+    for aggregation in aggregations:
+        name = aggregation["name"]
+        for window in windows or aggregation["windows"]:
+            window_size = pd.Timedelta(window)
+            if window_size < period or window_size % period:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"Window {window} of aggregation {name} must be a multiple of the tiles period {period}"
+                )
+            rolled = {}
+            for partial in _partials([aggregation])[name]:
+                column = f"{name}_{partial}"
+                if partial == "last":
+                    # the tile of the row is the last tile of its window
+                    rolled[partial] = tiles[column]
+                elif partial == "first":
+                    rolled[partial] = _first_in_window(
+                        tiles, column, entities, timestamp_key, window_size
+                    )
+                else:
+                    func = _partial_reducers[partial]
+                    rolled[partial] = _roll(
+                        tiles, by_entity, column, timestamp_key, window_size, func
+                    )
+            for operation in aggregation["operations"]:
+                result[f"{name}_{operation}_{window}"] = _finalize(operation, rolled)
+    return result
+
+
+def _to_ns(times: pd.Series) -> pd.Series:
+    times = pd.to_datetime(times)
+    if hasattr(times.dt, "as_unit"):
+        # parquet timestamps may be read in a coarser unit than the window offsets (pandas>=2)
+        times = times.dt.as_unit("ns")
+    return times
+
+
+def _roll(tiles, by_entity, column, timestamp_key, window_size, func) -> pd.Series:
+    # the tiles which end in (end - window, end], i.e. the events in [end - window, end)
+    rolling = by_entity.rolling(window_size, on=timestamp_key, min_periods=1)[column]
+    # the tiles are sorted by the entities, so the groups keep the tiles order
+    return pd.Series(getattr(rolling, func)().values, index=tiles.index)
+
+
+def _first_in_window(tiles, column, entities, timestamp_key, window_size) -> pd.Series:
+    # the first value of the earliest tile which ends after the start of the window
+    starts = tiles[entities].copy()
+    starts[timestamp_key] = tiles[timestamp_key] - window_size
+    starts["_row"] = tiles.index
+    merged = pd.merge_asof(
+        starts.sort_values(timestamp_key),
+        tiles[entities + [timestamp_key, column]].sort_values(timestamp_key),
+        on=timestamp_key,
+        by=entities,
+        direction="forward",
+        allow_exact_matches=False,
+    )
+    return pd.Series(merged[column].values, index=merged["_row"].values).sort_index()
+
+
+def _finalize(operation: str, rolled: dict[str, pd.Series]) -> pd.Series:
+    if operation in ("count", "sum", "sqr", "min", "max", "first", "last"):
+        return rolled[operation]
+    count, total = rolled["count"], rolled["sum"]
+    if operation == "avg":
+        return total / count.where(count > 0)
+    # the sample variance, as in the storey stdvar/stddev aggregations
+    variance = (count * rolled["sqr"] - total**2) / (count * (count - 1)).where(
+        count > 1
+    )
+    variance = variance.clip(lower=0)
+    return variance if operation == "stdvar" else np.sqrt(variance)
+
+
+def write_tiles(featureset, df: pd.DataFrame, overwrite: bool = True):
+    """compute the tiles of ingested events and write them next to the feature set offline target
+
+    :param featureset: the feature set (with tiles enabled)
+    :param df:         the ingested events (with the aggregated columns)
+    :param overwrite:  replace the existing tiles, otherwise the tiles are merged with the existing tiles
+    :return: the tiles path, or None if the feature set has no parquet offline target
+    """
+    path = get_tiles_path(featureset)
+    if not path:
+        return None
+    aggregations = get_aggregations(featureset)
+    entities = list(featureset.spec.entities.keys())
+    timestamp_key = featureset.spec.timestamp_key
+    period = get_tiles_period(aggregations, featureset.spec.tiles.get("period"))
+    tiles = build_tiles(df, aggregations, entities, timestamp_key, period)
+
+    target = ParquetTarget(name="tiles", path=path)
+    if not overwrite:
+        try:
+            existing = target.as_df()
+        except FileNotFoundError:
+            existing = None
+        if existing is not None:
+            tiles = merge_tiles([existing, tiles], entities, timestamp_key)
+    target.write_dataframe(tiles)
+    return path
+
+
+def read_window_aggregates(
+    featureset,
+    windows: list[str] = None,
+    columns: list[str] = None,
+    start_time=None,
+    end_time=None,
+) -> pd.DataFrame:
+    """read the feature set window aggregations from its tiles
+
+    :param featureset: the feature set (with tiles enabled, and ingested)
+    :param windows:    optional, windows to compute for all the aggregations (any multiple of the tile period),
+                       defaults to the windows of each aggregation
+    :param columns:    optional, aggregated features to return (defaults to all)
+    :param start_time: optional, return the window values which end at or after this time
+    :param end_time:   optional, return the window values which end at or before this time
+    :return: dataframe with the entities, the timestamp (end of the window) and the aggregated features
+    """
+    path = get_tiles_path(featureset) if featureset.spec.tiles else None
+    if not path:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Feature set {featureset.metadata.name} has no tiles, "
+            "enable them with set_tiles() and ingest with a parquet target"
+        )
+    aggregations = get_aggregations(featureset)
+    entities = list(featureset.spec.entities.keys())
+    timestamp_key = featureset.spec.timestamp_key
+    period = get_tiles_period(aggregations, featureset.spec.tiles.get("period"))
+
+    tiles_start_time = None
+    if start_time is not None:
+        # read the tiles of the window which ends at start time
+        max_window = max(
+            pd.Timedelta(window)
+            for aggregation in aggregations
+            for window in windows or aggregation["windows"]
+        )
+        tiles_start_time = pd.Timestamp(start_time) - max_window
+    tiles = ParquetTarget(name="tiles", path=path).as_df(
+        start_time=tiles_start_time,
+        end_time=end_time,
+        time_column=timestamp_key,
+    )
+    result = combine_tiles(
+        tiles, aggregations, entities, timestamp_key, period, windows=windows
+    )
+    if start_time is not None:
+        result = result[result[timestamp_key] >= pd.Timestamp(start_time)]
+    if columns:
+        result = result[entities + [timestamp_key] + list(columns)]
+    return result.reset_index(drop=True)
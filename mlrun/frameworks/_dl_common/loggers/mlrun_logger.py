@@ -12,8 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import atexit
+import contextlib
+import functools
 import itertools
-from typing import Union
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Union
 
 import numpy as np
 import plotly.graph_objects as go
@@ -27,6 +33,139 @@ from ..utils import DLTypes
 from .logger import Logger
 
 
+class _BackgroundArtifactsLogger:
+    """
+    Generates and logs artifacts to a MLRun context in background threads, keeping the logging off the training loop.
+    Artifacts are coalesced by key - if an artifact is submitted again before its previous version was logged, only the
+    latest version is logged. Artifacts of different keys are generated in parallel, while the versions of the same key
+    are logged in order. The context is not thread safe, so the artifacts are logged to it one at a time while holding
+    the 'context_lock', which the owner of the logger should hold as well when using the context. Artifacts which were
+    not flushed (for example when the training failed) are flushed at exit.
+    """
+
+    def __init__(self, context: mlrun.MLClientCtx, max_pending: int, workers: int):
+        """
+        Initialize the background logger.
+
+        :param context:     MLRun context to log to.
+        :param max_pending: Max number of artifacts waiting to be logged, submitting more artifacts blocks until some
+                            were logged.
+        :param workers:     Number of threads generating and uploading the artifacts.
+        """
+        self._context = context
+        self._max_pending = max_pending
+        self._workers = workers
+
+        self._executor = None  # type: ThreadPoolExecutor
+        self._condition = threading.Condition()
+        # The artifacts waiting to be logged by their key and the keys being logged:
+        self._pending = {}  # type: Dict[str, Tuple[Callable[[], Artifact], dict]]
+        self._in_flight = set()
+        self._logged = {}  # type: Dict[str, Artifact]
+        self._error = None  # type: Exception
+
+        # Serializes the access to the context:
+        self.context_lock = threading.RLock()
+
+    def submit(self, key: str, generate_artifact: Callable[[], Artifact], **kwargs):
+        """
+        Submit an artifact to be generated and logged in the background.
+
+        :param key:               The artifact key.
+        :param generate_artifact: A function generating the artifact.
+        :param kwargs:            Additional keyword arguments to pass to the context's 'log_artifact'.
+        """
+        with self._condition:
+            while key not in self._pending and len(self._pending) >= self._max_pending:
+                self._condition.wait()
+            self._pending[key] = (generate_artifact, kwargs)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix="mlrun-logger"
+                )
+                _unflushed_loggers.add(self)
+            self._schedule(key)
+
+    def flush(self) -> dict[str, Artifact]:
+        """
+        Wait for all the submitted artifacts to be logged.
+
+        :return: The logged artifacts by their key.
+
+        :raise Exception: The first error raised while generating or logging an artifact.
+        """
+        with self._condition:
+            while self._in_flight:
+                self._condition.wait()
+            # Artifacts which could not be scheduled (the interpreter is shutting down) are logged by this thread:
+            pending, self._pending = self._pending, {}
+            executor, self._executor = self._executor, None
+            _unflushed_loggers.discard(self)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for key, (generate_artifact, kwargs) in pending.items():
+            self._log(key, generate_artifact, kwargs)
+        with self._condition:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return self._logged
+
+    def _schedule(self, key: str):
+        # Must be called while holding the condition, a key is logged by a single thread at a time:
+        if key in self._in_flight or key not in self._pending or self._executor is None:
+            return
+        generate_artifact, kwargs = self._pending.pop(key)
+        try:
+            self._executor.submit(self._log, key, generate_artifact, kwargs)
+        except RuntimeError:
+            # The interpreter is shutting down, the artifact is logged when flushed:
+            self._pending[key] = (generate_artifact, kwargs)
+            return
+        self._in_flight.add(key)
+        self._condition.notify_all()
+
+    def _log(self, key: str, generate_artifact: Callable[[], Artifact], kwargs: dict):
+        artifact = None
+        try:
+            artifact = generate_artifact()
+            with self.context_lock:
+                self._context.log_artifact(artifact, local_path=artifact.key, **kwargs)
+        except Exception as exception:
+            mlrun.utils.logger.warning(
+                "Failed to log artifact in the background",
+                key=key,
+                error=mlrun.errors.err_to_str(exception),
+            )
+            artifact = None
+            with self._condition:
+                self._error = self._error or exception
+        finally:
+            with self._condition:
+                if artifact is not None:
+                    self._logged[key] = artifact
+                self._in_flight.discard(key)
+                # Log the newer version of the artifact if it was submitted meanwhile:
+                self._schedule(key)
+                self._condition.notify_all()
+
+
+# The background loggers with artifacts which were not flushed yet, held weakly so they are not kept alive until exit:
+_unflushed_loggers: "weakref.WeakSet[_BackgroundArtifactsLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_background_loggers():
+    for background_logger in list(_unflushed_loggers):
+        try:
+            background_logger.flush()
+        except Exception as exception:
+            mlrun.utils.logger.warning(
+                "Failed to flush the artifacts logged in the background",
+                error=mlrun.errors.err_to_str(exception),
+            )
+
+
 class MLRunLogger(Logger):
     """
     MLRun logger is logging the information collected during training / evaluation of the base logger and logging it to
@@ -56,18 +195,44 @@ class MLRunLogger(Logger):
     def __init__(
         self,
         context: mlrun.MLClientCtx,
+        background_logging: bool = True,
+        max_pending_artifacts: int = 64,
+        logging_workers: int = 4,
     ):
         """
         Initialize the MLRun logging interface to work with the given context.
 
-        :param context:              MLRun context to log to. The context parameters can be logged as static
-                                     hyperparameters.
+        :param context:               MLRun context to log to. The context parameters can be logged as static
+                                      hyperparameters.
+        :param background_logging:    Whether to generate and log the epochs artifacts (charts) in background threads,
+                                      so the training loop does not wait for them. The artifacts are flushed when the
+                                      run is logged. Default: True.
+        :param max_pending_artifacts: Max number of artifacts waiting to be logged in the background, the training
+                                      loop is blocked when it is exceeded. Default: 64.
+        :param logging_workers:       Number of background threads generating and uploading the artifacts in
+                                      parallel. Default: 4.
         """
         super().__init__(context=context)
 
         # Prepare the artifacts collection:
         self._artifacts = {}  # type: Dict[str, Artifact]
 
+        # Prepare the background artifacts logger:
+        self._background_logger = (
+            _BackgroundArtifactsLogger(
+                context=context,
+                max_pending=max_pending_artifacts,
+                workers=logging_workers,
+            )
+            if background_logging
+            else None
+        )
+        self._context_lock = (
+            self._background_logger.context_lock
+            if background_logging
+            else contextlib.nullcontext()
+        )
+
     def log_epoch_to_context(
         self,
         epoch: int,
@@ -92,22 +257,23 @@ class MLRunLogger(Logger):
         :param epoch: The epoch number that has just ended.
         """
         # Log the collected hyperparameters and values as results (the most recent value collected (-1 index)):
-        for static_parameter, value in self._static_hyperparameters.items():
-            self._context.log_result(static_parameter, value)
-        if self._mode == LoggingMode.TRAINING:
-            for dynamic_parameter, values in self._dynamic_hyperparameters.items():
-                self._context.log_result(dynamic_parameter, values[-1])
-            for metric, results in self._training_summaries.items():
+        with self._context_lock:
+            for static_parameter, value in self._static_hyperparameters.items():
+                self._context.log_result(static_parameter, value)
+            if self._mode == LoggingMode.TRAINING:
+                for dynamic_parameter, values in self._dynamic_hyperparameters.items():
+                    self._context.log_result(dynamic_parameter, values[-1])
+                for metric, results in self._training_summaries.items():
+                    self._context.log_result(
+                        f"{self._Loops.TRAINING}_{metric}", results[-1]
+                    )
+            for metric, results in self._validation_summaries.items():
                 self._context.log_result(
-                    f"{self._Loops.TRAINING}_{metric}", results[-1]
+                    f"{self._Loops.EVALUATION}_{metric}"
+                    if self._mode == LoggingMode.EVALUATION
+                    else f"{self._Loops.VALIDATION}_{metric}",
+                    results[-1],
                 )
-        for metric, results in self._validation_summaries.items():
-            self._context.log_result(
-                f"{self._Loops.EVALUATION}_{metric}"
-                if self._mode == LoggingMode.EVALUATION
-                else f"{self._Loops.VALIDATION}_{metric}",
-                results[-1],
-            )
 
         # Log the epochs metrics results as chart artifacts:
         loops = (
@@ -122,6 +288,24 @@ class MLRunLogger(Logger):
         )
         for loop, metrics_dictionary in zip(loops, metrics_dictionaries):
             for metric_name in metrics_dictionary:
+                if self._background_logging:
+                    # Generate and log the artifact in the background from a copy of the results (as they are still
+                    # being collected), an artifact which was not logged yet is replaced by the newer one:
+                    epochs_results = [
+                        list(epoch_results)
+                        for epoch_results in metrics_dictionary[metric_name]
+                    ]
+                    self._background_logger.submit(
+                        key=f"{loop}_{metric_name}",
+                        generate_artifact=functools.partial(
+                            self._generate_metric_results_artifact,
+                            loop=loop,
+                            name=metric_name,
+                            epochs_results=epochs_results,
+                        ),
+                        artifact_path=self._context.artifact_path,
+                    )
+                    continue
                 # Create the plotly artifact:
                 artifact = self._generate_metric_results_artifact(
                     loop=loop,
@@ -138,7 +322,8 @@ class MLRunLogger(Logger):
                 self._artifacts[artifact.key.split(".")[0]] = artifact
 
         # Commit and commit children for MLRun flag bug:
-        self._context.commit(completed=False)
+        with self._context_lock:
+            self._context.commit(completed=False)
 
     def log_run(
         self,
@@ -167,7 +352,8 @@ class MLRunLogger(Logger):
         :param parameters:    Parameters to log with the model.
         :param extra_data:    Extra data to log with the model.
         """
-        # If in training mode, log the summaries and hyperparameters artifacts:
+        # If in training mode, log the summaries and hyperparameters artifacts (the artifacts of the epochs may still
+        # be logged in the background):
         if self._mode == LoggingMode.TRAINING:
             # Create chart artifacts for summaries:
             for metric_name in self._training_summaries:
@@ -180,10 +366,11 @@ class MLRunLogger(Logger):
                     ),
                 )
                 # Log the artifact:
-                self._context.log_artifact(
-                    artifact,
-                    local_path=artifact.key,
-                )
+                with self._context_lock:
+                    self._context.log_artifact(
+                        artifact,
+                        local_path=artifact.key,
+                    )
                 # Collect it for later adding it to the model logging as extra data:
                 self._artifacts[artifact.key.split(".")[0]] = artifact
             # Create chart artifacts for dynamic hyperparameters:
@@ -194,13 +381,17 @@ class MLRunLogger(Logger):
                     values=self._dynamic_hyperparameters[parameter_name],
                 )
                 # Log the artifact:
-                self._context.log_artifact(
-                    artifact,
-                    local_path=artifact.key,
-                )
+                with self._context_lock:
+                    self._context.log_artifact(
+                        artifact,
+                        local_path=artifact.key,
+                    )
                 # Collect it for later adding it to the model logging as extra data:
                 self._artifacts[artifact.key.split(".")[0]] = artifact
 
+        # Wait for the artifacts logged in the background:
+        self.flush()
+
         # Get the final metrics summary:
         metrics = self._generate_metrics_summary()
 
@@ -227,6 +418,21 @@ class MLRunLogger(Logger):
         # Commit to update the changes, so they will be available in the MLRun UI:
         self._context.commit(completed=False)
 
+    def flush(self):
+        """
+        Wait for the artifacts logged in the background to be logged, collecting them to be logged with the model.
+
+        :raise Exception: The first error raised while logging an artifact in the background.
+        """
+        if not self._background_logging:
+            return
+        for key, artifact in self._background_logger.flush().items():
+            self._artifacts[key] = artifact
+
+    @property
+    def _background_logging(self) -> bool:
+        return self._background_logger is not None
+
     def _generate_metrics_summary(self) -> dict[str, float]:
         """
         Generate a metrics summary to log along the model.
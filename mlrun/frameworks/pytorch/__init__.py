@@ -52,6 +52,7 @@ def train(
     tensorboard_directory: str = None,
     mlrun_callback_kwargs: dict[str, Any] = None,
     tensorboard_callback_kwargs: dict[str, Any] = None,
+    metrics_sync_frequency: int = 1,
     context: mlrun.MLClientCtx = None,
 ) -> PyTorchModelHandler:
     """
@@ -138,6 +139,9 @@ def train(
     :param tensorboard_callback_kwargs: Key word arguments for the tensorboard callback. For further information see
                                         the documentation of the class 'TensorboardLoggingCallback'. Note that both
                                         'context' and 'auto_log' parameters are already given here.
+    :param metrics_sync_frequency:      Per how many batches to copy the loss and metrics values from the device (e.g.
+                                        GPU) to the host, accumulating them on the device in between. Default: 1 -
+                                        every batch.
     :param context:                     The context to use for the logs.
 
     :return: A model handler with the provided model and parameters.
@@ -195,6 +199,7 @@ def train(
         callbacks=callbacks_list,
         use_cuda=use_cuda,
         use_horovod=use_horovod,
+        metrics_sync_frequency=metrics_sync_frequency,
     )
 
     return handler
@@ -216,6 +221,7 @@ def evaluate(
     custom_objects_map: Union[dict[str, Union[str, list[str]]], str] = None,
     custom_objects_directory: str = None,
     mlrun_callback_kwargs: dict[str, Any] = None,
+    metrics_sync_frequency: int = 1,
     context: mlrun.MLClientCtx = None,
 ) -> tuple[PyTorchModelHandler, list[PyTorchTypes.MetricValueType]]:
     """
@@ -280,6 +286,8 @@ def evaluate(
     :param mlrun_callback_kwargs:    Key word arguments for the MLRun callback. For further information see the
                                      documentation of the class 'MLRunLoggingCallback'. Note that both 'context',
                                      'custom_objects' and 'auto_log' parameters are already given here.
+    :param metrics_sync_frequency:   Per how many batches to copy the loss and metrics values from the device (e.g.
+                                     GPU) to the host. Default: 1 - every batch.
     :param context:                  The context to use for the logs.
 
     :return: A tuple of:
@@ -336,6 +344,7 @@ def evaluate(
             callbacks=callbacks_list,
             use_cuda=use_cuda,
             use_horovod=use_horovod,
+            metrics_sync_frequency=metrics_sync_frequency,
         ),
     )
 
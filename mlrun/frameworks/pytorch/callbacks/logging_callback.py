@@ -22,7 +22,7 @@ import mlrun
 
 from ..._common import LoggingMode
 from ..._dl_common.loggers import Logger
-from ..utils import PyTorchTypes
+from ..utils import DeferredMetricValue, PyTorchTypes
 from .callback import Callback
 
 
@@ -265,6 +265,9 @@ class LoggingCallback(Callback):
         """
         Before the training of the current epoch ends, this method will be called to lof the training summaries.
         """
+        # Synchronize the deferred results of this epoch:
+        self._synchronize_results(results=self._logger.training_results)
+
         # Store the last training loss result of this epoch:
         loss_name = self._get_metric_name(
             metric_function=self._objects[self._ObjectKeys.LOSS_FUNCTION],
@@ -303,6 +306,9 @@ class LoggingCallback(Callback):
         :param loss_value:    The loss summary of this validation.
         :param metric_values: The metrics summaries of this validation.
         """
+        # Synchronize the deferred results of this validation:
+        self._synchronize_results(results=self._logger.validation_results)
+
         # Store the validation loss average of this epoch:
         self._logger.log_validation_summary(
             metric_name=self._get_metric_name(
@@ -355,7 +361,7 @@ class LoggingCallback(Callback):
             metric_name=self._get_metric_name(
                 metric_function=self._objects[self._ObjectKeys.LOSS_FUNCTION],
             ),
-            result=float(loss_value),
+            result=self._to_result(value=loss_value),
         )
 
     def on_validation_loss_end(self, loss_value: PyTorchTypes.MetricValueType):
@@ -369,7 +375,7 @@ class LoggingCallback(Callback):
             metric_name=self._get_metric_name(
                 metric_function=self._objects[self._ObjectKeys.LOSS_FUNCTION],
             ),
-            result=float(loss_value),
+            result=self._to_result(value=loss_value),
         )
 
     def on_train_metrics_end(self, metric_values: list[PyTorchTypes.MetricValueType]):
@@ -385,7 +391,7 @@ class LoggingCallback(Callback):
                 metric_name=self._get_metric_name(
                     metric_function=metric_function,
                 ),
-                result=float(metric_value),
+                result=self._to_result(value=metric_value),
             )
 
     def on_validation_metrics_end(
@@ -403,9 +409,36 @@ class LoggingCallback(Callback):
                 metric_name=self._get_metric_name(
                     metric_function=metric_function,
                 ),
-                result=float(metric_value),
+                result=self._to_result(value=metric_value),
             )
 
+    @staticmethod
+    def _to_result(
+        value: Union[PyTorchTypes.MetricValueType, DeferredMetricValue],
+    ) -> Union[float, DeferredMetricValue]:
+        """
+        Convert a loss / metric value to a result to log. Deferred values are kept as they are (so the device is not
+        synchronized on every batch), and are converted once the epoch ends (see '_synchronize_results').
+
+        :param value: The value to convert.
+
+        :return: The result to log.
+        """
+        if isinstance(value, DeferredMetricValue):
+            return value
+        return float(value)
+
+    @staticmethod
+    def _synchronize_results(results: dict[str, list[list]]):
+        """
+        Convert the deferred values logged in the recent epoch to floats (synchronizing all the pending values at once).
+
+        :param results: The results dictionary (training or validation) to convert its recent epoch.
+        """
+        for epochs in results.values():
+            if epochs:
+                epochs[-1][:] = [float(value) for value in epochs[-1]]
+
     def _add_auto_hyperparameters(self):
         """
         Add auto log's hyperparameters if they are accessible. The automatic hyperparameters being added are:
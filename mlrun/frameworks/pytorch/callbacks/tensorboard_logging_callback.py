@@ -189,7 +189,7 @@ class _PyTorchTensorboardLogger(TensorboardLogger):
         """
         self._summary_writer.add_scalar(
             tag=name,
-            scalar_value=value,
+            scalar_value=float(value),
             global_step=step,
         )
 
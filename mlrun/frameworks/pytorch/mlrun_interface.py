@@ -14,6 +14,7 @@
 #
 import importlib
 import sys
+import time
 from typing import Any, Union
 
 import torch
@@ -35,7 +36,7 @@ from .callbacks import (
     TensorboardLoggingCallback,
 )
 from .callbacks_handler import CallbacksHandler
-from .utils import PyTorchTypes
+from .utils import MetricsSynchronizer, PyTorchTypes
 
 
 class PyTorchMLRunInterface:
@@ -78,9 +79,11 @@ class PyTorchMLRunInterface:
         self._callbacks = []  # type: List[Callback]
         self._use_cuda = None  # type: bool
         self._use_horovod = None  # type: bool
+        self._metrics_sync_frequency = None  # type: int
 
         # Prepare inner attributes:
         self._hvd = None
+        self._metrics_synchronizer = None  # type: MetricsSynchronizer
         self._training_sampler = None  # type: DistributedSampler
         self._validation_sampler = None  # type: DistributedSampler
         self._callbacks_handler = None  # type: CallbacksHandler
@@ -118,6 +121,7 @@ class PyTorchMLRunInterface:
         callbacks: list[Callback] = None,
         use_cuda: bool = True,
         use_horovod: bool = None,
+        metrics_sync_frequency: int = 1,
     ):
         """
         Initiate a training process on this interface configuration.
@@ -143,6 +147,11 @@ class PyTorchMLRunInterface:
         :param use_cuda:                 Whether to use cuda. Only relevant if cuda is available. Default: True.
         :param use_horovod:              Whether to use horovod - a distributed training framework. Default: None,
                                          meaning it will be read from context if available and if not - False.
+        :param metrics_sync_frequency:   Per how many batches to copy the loss and metrics values from the device (e.g.
+                                         GPU) to the host. The values are accumulated on the device in between and the
+                                         callbacks receive them as 'DeferredMetricValue' objects, synchronized when
+                                         they are converted to floats. The progress bar is updated on every sync.
+                                         Default: 1 - every batch.
         """
         # Load the input:
         self._parse_and_store(
@@ -159,6 +168,7 @@ class PyTorchMLRunInterface:
             callbacks=callbacks,
             use_cuda=use_cuda,
             use_horovod=use_horovod,
+            metrics_sync_frequency=metrics_sync_frequency,
         )
 
         # Set up the inner attributes (initializing horovod and creating the callbacks handler):
@@ -226,6 +236,7 @@ class PyTorchMLRunInterface:
         callbacks: list[Callback] = None,
         use_cuda: bool = True,
         use_horovod: bool = None,
+        metrics_sync_frequency: int = 1,
     ) -> list[PyTorchTypes.MetricValueType]:
         """
         Initiate an evaluation process on this interface configuration.
@@ -239,6 +250,8 @@ class PyTorchMLRunInterface:
         :param use_cuda:         Whether or not to use cuda. Only relevant if cuda is available. Default: True.
         :param use_horovod:      Whether or not to use horovod - a distributed training framework. Default: None,
                                  meaning it will be read from context if available and if not - False.
+        :param metrics_sync_frequency: Per how many batches to copy the loss and metrics values from the device to the
+                                       host, see 'train'. Default: 1 - every batch.
 
         :return: The evaluation loss and metrics results in a list.
         """
@@ -251,6 +264,7 @@ class PyTorchMLRunInterface:
             callbacks=callbacks,
             use_cuda=use_cuda,
             use_horovod=use_horovod,
+            metrics_sync_frequency=metrics_sync_frequency,
         )
 
         # Setup the inner attributes (initializing horovod and creating the callbacks handler):
@@ -300,6 +314,61 @@ class PyTorchMLRunInterface:
 
         return [loss_value] + metric_values
 
+    def benchmark(
+        self,
+        training_set: DataLoader,
+        loss_function: Module,
+        optimizer: Optimizer,
+        metric_functions: list[PyTorchTypes.MetricFunctionType] = None,
+        iterations: int = None,
+        metrics_sync_frequencies: list[int] = None,
+        use_cuda: bool = True,
+    ) -> dict[int, float]:
+        """
+        Measure the training speed (steps per second) of a single epoch with each of the given metrics sync
+        frequencies (see 'train'). Notice the model is trained during the benchmark and the interface callbacks are not
+        used.
+
+        :param training_set:             A data loader for the training process.
+        :param loss_function:            The loss function to use during training.
+        :param optimizer:                The optimizer to use during the training.
+        :param metric_functions:         The metrics to use on training.
+        :param iterations:               Amount of iterations (batches) to perform on each epoch. If 'None' the entire
+                                         training set will be used.
+        :param metrics_sync_frequencies: The metrics sync frequencies to measure. Default: [1, 10] - every batch and
+                                         every 10 batches.
+        :param use_cuda:                 Whether to use cuda. Only relevant if cuda is available. Default: True.
+
+        :return: The training steps per second of each metrics sync frequency.
+        """
+        # Set aside the interface callbacks (only the training loop is measured):
+        callbacks, self._callbacks = self._callbacks, []
+
+        try:
+            steps_per_second = {}
+            for metrics_sync_frequency in metrics_sync_frequencies or [1, 10]:
+                start = time.perf_counter()
+                self.train(
+                    training_set=training_set,
+                    loss_function=loss_function,
+                    optimizer=optimizer,
+                    metric_functions=metric_functions,
+                    training_iterations=iterations,
+                    use_cuda=use_cuda,
+                    use_horovod=False,
+                    metrics_sync_frequency=metrics_sync_frequency,
+                )
+                if use_cuda and torch.cuda.is_available():
+                    # Wait for the queued device work before stopping the clock:
+                    torch.cuda.synchronize()
+                steps_per_second[metrics_sync_frequency] = (
+                    iterations or len(training_set)
+                ) / (time.perf_counter() - start)
+        finally:
+            self._callbacks = callbacks
+
+        return steps_per_second
+
     def add_auto_logging_callbacks(
         self,
         add_mlrun_logger: bool = True,
@@ -411,6 +480,7 @@ class PyTorchMLRunInterface:
         callbacks: list[Callback] = None,
         use_cuda: bool = True,
         use_horovod: bool = None,
+        metrics_sync_frequency: int = 1,
     ):
         """
         Parse and store the given input so the interface can starting training / evaluating.
@@ -437,6 +507,8 @@ class PyTorchMLRunInterface:
                                          True.
         :param use_horovod:              Whether or not to use horovod - a distributed training framework. Default:
                                          None, meaning it will be read from context if available and if not - False.
+        :param metrics_sync_frequency:   Per how many batches to copy the loss and metrics values from the device to
+                                         the host. Default: 1 - every batch.
 
         :raise MLRunInvalidArgumentError: In case one of the given parameters is invalid.
         """
@@ -499,6 +571,12 @@ class PyTorchMLRunInterface:
             scheduler_step_frequency = int(
                 training_iterations * scheduler_step_frequency
             )
+        # # Metrics sync frequency:
+        if metrics_sync_frequency < 1:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The 'metrics_sync_frequency' parameter must be bigger or equal to one, received: "
+                f"{metrics_sync_frequency}"
+            )
         # # Callbacks:
         if callbacks is None:
             callbacks = []
@@ -524,6 +602,7 @@ class PyTorchMLRunInterface:
         self._callbacks += callbacks
         self._use_cuda = use_cuda
         self._use_horovod = use_horovod
+        self._metrics_sync_frequency = metrics_sync_frequency
 
     def _objects_to_cuda(self):
         """
@@ -558,6 +637,11 @@ class PyTorchMLRunInterface:
         Setup the inner attributes of the interface, initializing horovod and the callbacks handler. This method must be
         called before train and evaluate.
         """
+        # Setup the metrics synchronizer:
+        self._metrics_synchronizer = MetricsSynchronizer(
+            frequency=self._metrics_sync_frequency
+        )
+
         # Setup horovod:
         if self._use_horovod:
             # Import horovod:
@@ -668,6 +752,7 @@ class PyTorchMLRunInterface:
             description="Training",
             metrics=[self._loss_function] + self._metric_functions,
         )
+        last_values = None
         for batch, (x, y_true) in progress_bar:
             # Check if iteration exceeded:
             if batch == self._training_iterations:
@@ -690,22 +775,28 @@ class PyTorchMLRunInterface:
             y_pred = self._model(x)
             self._callbacks_handler.on_inference_end(y_pred=y_pred, y_true=y_true)
 
-            # Calculate loss:
+            # Calculate loss (the callbacks receive the value deferred if the metrics sync is deferred):
             self._callbacks_handler.on_train_loss_begin()
             loss_value = self._loss_function(y_pred, y_true)
-            self._callbacks_handler.on_train_loss_end(loss_value=loss_value)
+            deferred_loss_value = self._metrics_synchronizer.defer(value=loss_value)
+            self._callbacks_handler.on_train_loss_end(loss_value=deferred_loss_value)
 
             # Measure accuracies:
             self._callbacks_handler.on_train_metrics_begin()
-            metric_values = self._metrics(y_pred=y_pred, y_true=y_true)
+            metric_values = [
+                self._metrics_synchronizer.defer(value=metric_value)
+                for metric_value in self._metrics(y_pred=y_pred, y_true=y_true)
+            ]
             self._callbacks_handler.on_train_metrics_end(metric_values=metric_values)
 
-            # Update the progress bar with the recent values:
-            self._update_progress_bar(
-                progress_bar=progress_bar,
-                metrics=[self._loss_function] + self._metric_functions,
-                values=[loss_value] + metric_values,
-            )
+            # Update the progress bar with the recent values (on sync if the metrics sync is deferred):
+            last_values = [deferred_loss_value] + metric_values
+            if self._metrics_synchronizer.step():
+                self._update_progress_bar(
+                    progress_bar=progress_bar,
+                    metrics=[self._loss_function] + self._metric_functions,
+                    values=last_values,
+                )
 
             # Perform backward propagation:
             self._callbacks_handler.on_backward_begin()
@@ -732,6 +823,9 @@ class PyTorchMLRunInterface:
             ):
                 break
 
+        # Synchronize the remaining deferred values of the epoch:
+        self._synchronize_metrics(progress_bar=progress_bar, last_values=last_values)
+
     def _validate(
         self, is_evaluation: bool = False
     ) -> tuple[PyTorchTypes.MetricValueType, list[PyTorchTypes.MetricValueType]]:
@@ -756,6 +850,7 @@ class PyTorchMLRunInterface:
             description="Evaluating" if is_evaluation else "Validating",
             metrics=[self._loss_function] + self._metric_functions,
         )
+        last_values = None
         with torch.no_grad():
             for batch, (x, y_true) in progress_bar:
                 # Check if iteration exceeded:
@@ -776,26 +871,35 @@ class PyTorchMLRunInterface:
                 y_pred = self._model(x)
                 self._callbacks_handler.on_inference_end(y_pred=y_pred, y_true=y_true)
 
-                # Calculate loss:
+                # Calculate loss (the callbacks receive the value deferred if the metrics sync is deferred):
                 self._callbacks_handler.on_validation_loss_begin()
                 loss_value = self._loss_function(y_pred, y_true)
-                self._callbacks_handler.on_validation_loss_end(loss_value=loss_value)
+                deferred_loss_value = self._metrics_synchronizer.defer(value=loss_value)
+                self._callbacks_handler.on_validation_loss_end(
+                    loss_value=deferred_loss_value
+                )
 
                 # Measure accuracies:
                 self._callbacks_handler.on_validation_metrics_begin()
                 metric_values = self._metrics(y_pred=y_pred, y_true=y_true)
+                deferred_metric_values = [
+                    self._metrics_synchronizer.defer(value=metric_value)
+                    for metric_value in metric_values
+                ]
                 self._callbacks_handler.on_validation_metrics_end(
-                    metric_values=metric_values
+                    metric_values=deferred_metric_values
                 )
 
-                # Update the progress bar with the recent values:
-                self._update_progress_bar(
-                    progress_bar=progress_bar,
-                    metrics=[self._loss_function] + self._metric_functions,
-                    values=[loss_value] + metric_values,
-                )
+                # Update the progress bar with the recent values (on sync if the metrics sync is deferred):
+                last_values = [deferred_loss_value] + deferred_metric_values
+                if self._metrics_synchronizer.step():
+                    self._update_progress_bar(
+                        progress_bar=progress_bar,
+                        metrics=[self._loss_function] + self._metric_functions,
+                        values=last_values,
+                    )
 
-                # Collect results:
+                # Collect results (the tensors are summed on their device):
                 losses.append(loss_value)
                 metrics.append(metric_values)
 
@@ -808,6 +912,9 @@ class PyTorchMLRunInterface:
                 ):
                     break
 
+        # Synchronize the remaining deferred values of the epoch:
+        self._synchronize_metrics(progress_bar=progress_bar, last_values=last_values)
+
         # Calculate the final average of the loss and accuracy values:
         loss_value = sum(losses) / len(losses)
         metric_values = (
@@ -817,6 +924,25 @@ class PyTorchMLRunInterface:
         )
         return loss_value, metric_values
 
+    def _synchronize_metrics(
+        self, progress_bar: tqdm, last_values: list[PyTorchTypes.MetricValueType]
+    ):
+        """
+        Synchronize the deferred loss and metrics values which are still pending (at the end of an epoch), updating the
+        progress bar with the last values.
+
+        :param progress_bar: The progress bar of the epoch.
+        :param last_values:  The loss and metrics values of the last batch, None if there were no batches.
+        """
+        if not self._metrics_synchronizer.is_deferring or last_values is None:
+            return
+        self._metrics_synchronizer.synchronize()
+        self._update_progress_bar(
+            progress_bar=progress_bar,
+            metrics=[self._loss_function] + self._metric_functions,
+            values=last_values,
+        )
+
     def _print_results(self, loss_value: Tensor, metric_values: list[float]):
         """
         Print the given result between each epoch.
@@ -892,9 +1018,11 @@ class PyTorchMLRunInterface:
         self._callbacks = []  # type: List[Callback]
         self._use_cuda = None  # type: bool
         self._use_horovod = None  # type: bool
+        self._metrics_sync_frequency = None  # type: int
 
         # Clear the inner attributes:
         self._hvd = None
+        self._metrics_synchronizer = None  # type: MetricsSynchronizer
         self._training_sampler = None  # type: DistributedSampler
         self._validation_sampler = None  # type: DistributedSampler
         self._callbacks_handler = None  # type: CallbacksHandler
@@ -122,3 +122,132 @@ class PyTorchUtils(DLUtils):
         raise mlrun.errors.MLRunInvalidArgumentError(
             f"MLRun value type is not supporting the given torch data type: '{torch_dtype}'."
         )
+
+
+class DeferredMetricValue:
+    """
+    A loss / metric value of a batch which is kept on its device until it is synchronized (copied to the host) along
+    with the values of other batches, avoiding a device synchronization on every batch. Converting the value to a float
+    (using ``float(value)`` or ``value.item()``) synchronizes all the values which are pending synchronization at once.
+    """
+
+    def __init__(self, tensor: Tensor, synchronizer: "MetricsSynchronizer"):
+        """
+        Initialize a deferred value.
+
+        :param tensor:       The (detached) scalar tensor of the value.
+        :param synchronizer: The synchronizer which synchronizes the value.
+        """
+        self._tensor = tensor
+        self._synchronizer = synchronizer
+        self._value = None  # type: float
+
+    @property
+    def tensor(self) -> Tensor:
+        """
+        Get the value tensor (on its device), None if the value was already synchronized.
+
+        :return: The value tensor.
+        """
+        return self._tensor
+
+    @property
+    def is_synchronized(self) -> bool:
+        """
+        Whether the value was already copied to the host.
+
+        :return: True if the value was synchronized and False otherwise.
+        """
+        return self._value is not None
+
+    def item(self) -> float:
+        """
+        Get the value, synchronizing it (with the other pending values) if it was not synchronized yet.
+
+        :return: The value.
+        """
+        if self._value is None:
+            self._synchronizer.synchronize()
+        return self._value
+
+    def __float__(self) -> float:
+        return self.item()
+
+    def __repr__(self) -> str:
+        if self._value is None:
+            return "DeferredMetricValue(<pending>)"
+        return f"DeferredMetricValue({self._value})"
+
+
+class MetricsSynchronizer:
+    """
+    Accumulates the batches loss and metrics values on device and synchronizes them (copying them to the host in a
+    single transfer) every given amount of batches.
+    """
+
+    def __init__(self, frequency: int = 1):
+        """
+        Initialize a synchronizer.
+
+        :param frequency: Per how many batches to synchronize the values. 1 means every value is used as is (and
+                          synchronized by its first usage).
+        """
+        self._frequency = frequency
+        self._pending = []  # type: List[DeferredMetricValue]
+        self._batches = 0
+
+    @property
+    def is_deferring(self) -> bool:
+        """
+        Whether the values are deferred (synchronized every few batches) or not.
+
+        :return: True if the values are deferred and False otherwise.
+        """
+        return self._frequency > 1
+
+    def defer(
+        self, value: PyTorchTypes.MetricValueType
+    ) -> Union[PyTorchTypes.MetricValueType, DeferredMetricValue]:
+        """
+        Defer the synchronization of the given value. Values which are not scalar tensors are returned as is.
+
+        :param value: The loss / metric value.
+
+        :return: The deferred value.
+        """
+        if not self.is_deferring or not isinstance(value, Tensor) or value.numel() != 1:
+            return value
+        deferred_value = DeferredMetricValue(
+            tensor=value.detach().reshape(()), synchronizer=self
+        )
+        self._pending.append(deferred_value)
+        return deferred_value
+
+    def step(self) -> bool:
+        """
+        Count a batch, synchronizing the pending values if the batch is the last one before the synchronization.
+
+        :return: True if the values were synchronized and False otherwise.
+        """
+        self._batches += 1
+        if self._batches % self._frequency != 0:
+            return False
+        self.synchronize()
+        return True
+
+    def synchronize(self):
+        """
+        Synchronize all the pending values, copying them to the host together.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        tensors = [deferred_value._tensor for deferred_value in pending]
+        try:
+            values = torch.stack(tensors).tolist()
+        except RuntimeError:
+            # The values are on different devices or have different types:
+            values = [tensor.item() for tensor in tensors]
+        for deferred_value, value in zip(pending, values):
+            deferred_value._value = value
+            deferred_value._tensor = None
@@ -154,6 +154,17 @@ class StoreBase(ABC):
         """
         pass
 
+    def write_application_results(self, events: list[dict[str, typing.Any]]):
+        """
+        Write a batch of application result events in the target table. By default, the events are written one by
+        one, stores which support batched writes should override this method.
+
+        :param events: List of application result event dictionaries (see :py:meth:`write_application_result`). A
+                       later result of the same endpoint, application and result name overwrites the earlier one.
+        """
+        for event in events:
+            self.write_application_result(event=event)
+
     @abstractmethod
     def get_last_analyzed(self, endpoint_id: str, application_name: str) -> int:
         """
@@ -94,17 +94,21 @@ class SQLStoreBase(mlrun.model_monitoring.db.StoreBase):
             mlrun.common.schemas.model_monitoring.FileTargetKind.MONITORING_SCHEDULES
         ] = self.MonitoringSchedulesTable
 
-    def _write(self, table: str, event: dict[str, typing.Any]):
+    def _write(
+        self,
+        table: str,
+        event: typing.Union[dict[str, typing.Any], list[dict[str, typing.Any]]],
+    ):
         """
-        Create a new record in the SQL table.
+        Create a new record (or records) in the SQL table.
 
         :param table: Target table name.
-        :param event: Event dictionary that will be written into the DB.
+        :param event: Event dictionary (or a list of event dictionaries) that will be written into the DB.
         """
 
         with self._engine.connect() as connection:
             # Convert the result into a pandas Dataframe and write it into the database
-            event_df = pd.DataFrame([event])
+            event_df = pd.DataFrame(event if isinstance(event, list) else [event])
 
             event_df.to_sql(table, con=connection, index=False, if_exists="append")
 
@@ -397,6 +401,59 @@ class SQLStoreBase(mlrun.model_monitoring.db.StoreBase):
                 event=event,
             )
 
+    def write_application_results(self, events: list[dict[str, typing.Any]]):
+        """
+        Write a batch of application result events in the target table, the existing records are updated in a single
+        session and the new records are inserted together.
+
+        :param events: List of application result event dictionaries (see :py:meth:`write_application_result`). A
+                       later result of the same endpoint, application and result name overwrites the earlier one.
+        """
+        self._init_application_results_table()
+
+        # Keep the last result of each uid
+        events_by_uid = {
+            self._generate_application_result_uid(event): event for event in events
+        }
+        table = self.ApplicationResultsTable
+        with create_session(dsn=self._sql_connection_string) as session:
+            try:
+                existing_uids = {
+                    uid
+                    for (uid,) in session.query(table.uid).filter(
+                        table.uid.in_(list(events_by_uid))
+                    )
+                }
+            except sqlalchemy.exc.ProgrammingError:
+                # Probably table doesn't exist, try to create tables
+                self._create_tables_if_not_exist()
+                existing_uids = set()
+
+            # Update the existing application results
+            for uid in existing_uids:
+                event = events_by_uid[uid]
+                for key in [
+                    mlrun.common.schemas.model_monitoring.WriterEvent.START_INFER_TIME,
+                    mlrun.common.schemas.model_monitoring.WriterEvent.END_INFER_TIME,
+                ]:
+                    self._convert_to_datetime(event=event, key=key)
+                session.query(table).filter(table.uid == uid).update(
+                    event, synchronize_session=False
+                )
+            session.commit()
+
+        # Write the new application results
+        new_events = [
+            {**event, mlrun.common.schemas.model_monitoring.EventFieldType.UID: uid}
+            for uid, event in events_by_uid.items()
+            if uid not in existing_uids
+        ]
+        if new_events:
+            self._write(
+                table=mlrun.common.schemas.model_monitoring.FileTargetKind.APP_RESULTS,
+                event=new_events,
+            )
+
     @staticmethod
     def _convert_to_datetime(event: dict[str, typing.Any], key: str):
         if isinstance(event[key], str):
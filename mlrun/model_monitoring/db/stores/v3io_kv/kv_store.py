@@ -13,6 +13,7 @@
 # limitations under the License.
 #
 
+import collections
 import json
 import os
 import typing
@@ -440,6 +441,59 @@ class KVStoreBase(mlrun.model_monitoring.db.StoreBase):
             self._generate_kv_schema(endpoint_id, v3io_monitoring_apps_container)
         logger.info("Updated V3IO KV successfully", key=app_name)
 
+    def write_application_results(self, events: list[dict[str, typing.Any]]):
+        """
+        Write a batch of application result events in the target table. The results of the same endpoint and
+        application are written in a single KV update, and the schema file of each endpoint is checked once.
+
+        :param events: List of application result event dictionaries (see :py:meth:`write_application_result`). A
+                       later result of the same endpoint, application and result name overwrites the earlier one.
+        """
+        # Group the results attributes by endpoint and application
+        attributes_by_item = collections.defaultdict(dict)
+        for event in events:
+            event = dict(event)
+            endpoint_id = event.pop(
+                mlrun.common.schemas.model_monitoring.WriterEvent.ENDPOINT_ID
+            )
+            app_name = event.pop(
+                mlrun.common.schemas.model_monitoring.WriterEvent.APPLICATION_NAME
+            )
+            metric_name = event.pop(
+                mlrun.common.schemas.model_monitoring.WriterEvent.RESULT_NAME
+            )
+            attributes_by_item[(endpoint_id, app_name)][metric_name] = json.dumps(event)
+
+        v3io_monitoring_apps_container = self.get_v3io_monitoring_apps_container(
+            project_name=self.project
+        )
+        for (endpoint_id, app_name), attributes in attributes_by_item.items():
+            self.client.kv.update(
+                container=v3io_monitoring_apps_container,
+                table_path=endpoint_id,
+                key=app_name,
+                attributes=attributes,
+            )
+
+        for endpoint_id in {endpoint_id for endpoint_id, _ in attributes_by_item}:
+            schema_file = self.client.kv.new_cursor(
+                container=v3io_monitoring_apps_container,
+                table_path=endpoint_id,
+                filter_expression='__name==".#schema"',
+            )
+            if not schema_file.all():
+                logger.info(
+                    "Generate a new V3IO KV schema file",
+                    container=v3io_monitoring_apps_container,
+                    endpoint_id=endpoint_id,
+                )
+                self._generate_kv_schema(endpoint_id, v3io_monitoring_apps_container)
+        logger.info(
+            "Updated V3IO KV successfully",
+            results=len(events),
+            updates=len(attributes_by_item),
+        )
+
     def _generate_kv_schema(
         self, endpoint_id: str, v3io_monitoring_apps_container: str
     ):
@@ -0,0 +1,228 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Model endpoint records cache, shared by the steps of the monitoring stream graph
+
+The endpoint records are read from the model endpoints store (KV/SQL) once and kept for
+``mlrun.mlconf.model_endpoint_monitoring.endpoint_cache.ttl_secs`` seconds, the least recently used records are evicted
+when the cache exceeds ``max_size`` records. All the project endpoints are prefetched in a single listing on the first
+lookup (unless disabled), and the records written by the stream
+(:py:func:`~mlrun.model_monitoring.stream_processing.update_endpoint_record`) are updated in the cache, so later lookups
+of the same process see them.
+"""
+
+import collections
+import threading
+import time
+import typing
+
+import mlrun.errors
+import mlrun.model_monitoring
+from mlrun.common.schemas.model_monitoring.constants import EventFieldType
+from mlrun.config import config
+from mlrun.utils import logger
+
+
+class _CacheEntry(typing.NamedTuple):
+    record: dict
+    expires: float
+
+
+class EndpointRecordsCache:
+    """TTL and LRU bounded cache of model endpoint records"""
+
+    def __init__(self, ttl: float = 300, max_size: int = 10_000, prefetch: bool = True):
+        """
+        :param ttl:      Time (in seconds) to keep a record before it is read again from the store.
+        :param max_size: Maximum number of cached records, the least recently used records are evicted.
+        :param prefetch: Whether to list (and cache) all the project endpoints on the first lookup of the project.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.prefetch = prefetch
+        self._entries: collections.OrderedDict[tuple[str, str], _CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._prefetched_projects = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, project: str, endpoint_id: str) -> dict[str, typing.Any]:
+        """
+        Get a model endpoint record, from the cache or from the model endpoints store (cached).
+
+        :param project:     Project name.
+        :param endpoint_id: The unique id of the model endpoint.
+
+        :return: The model endpoint record, the returned dictionary should not be modified.
+        """
+        if self.prefetch and project not in self._prefetched_projects:
+            self.prefetch_project(project)
+
+        key = (project, endpoint_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.record
+            self.misses += 1
+
+        record = mlrun.model_monitoring.get_store_object(
+            project=project
+        ).get_model_endpoint(endpoint_id=endpoint_id)
+        self._put(key, record)
+        return record
+
+    def prefetch_project(self, project: str) -> None:
+        """Cache the records of all the project model endpoints (up to the cache size) with a single listing"""
+        with self._lock:
+            if project in self._prefetched_projects:
+                return
+            self._prefetched_projects.add(project)
+        try:
+            records = mlrun.model_monitoring.get_store_object(
+                project=project
+            ).list_model_endpoints()
+        except Exception as exc:
+            logger.warning(
+                "Failed to prefetch the model endpoints",
+                project=project,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            return
+        for record in records[: self.max_size]:
+            endpoint_id = record.get(EventFieldType.UID) or record.get(
+                EventFieldType.ENDPOINT_ID
+            )
+            if endpoint_id:
+                self._put((project, endpoint_id), record)
+        logger.debug(
+            "Prefetched the model endpoints", project=project, count=len(records)
+        )
+
+    def update(
+        self, project: str, endpoint_id: str, attributes: dict[str, typing.Any]
+    ) -> None:
+        """
+        Update a cached record with attributes which were written to the store (ignored if the record is not cached),
+        the record is replaced (not modified) so the steps can detect the change.
+
+        :param project:     Project name.
+        :param endpoint_id: The unique id of the model endpoint.
+        :param attributes:  The written attributes.
+        """
+        key = (project, endpoint_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = _CacheEntry(
+                    {**entry.record, **attributes}, entry.expires
+                )
+
+    def invalidate(
+        self, project: str, endpoint_id: typing.Optional[str] = None
+    ) -> None:
+        """Remove the record of a model endpoint (or all the project records) from the cache"""
+        with self._lock:
+            if endpoint_id is not None:
+                self._entries.pop((project, endpoint_id), None)
+                return
+            for key in [key for key in self._entries if key[0] == project]:
+                del self._entries[key]
+            self._prefetched_projects.discard(project)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._prefetched_projects.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def _put(self, key: tuple[str, str], record: dict[str, typing.Any]) -> None:
+        with self._lock:
+            self._entries[key] = _CacheEntry(record, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, typing.Any]:
+        """The cache statistics, the DB lookups saved are the cache hits"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "db_lookups_saved": self.hits,
+        }
+
+    def collect(self):
+        """Prometheus collector of the cache statistics"""
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        stats = self.stats
+        yield CounterMetricFamily(
+            "endpoint_cache_hits",
+            "Model endpoint records cache hits (store lookups saved)",
+            value=stats["hits"],
+        )
+        yield CounterMetricFamily(
+            "endpoint_cache_misses",
+            "Model endpoint records cache misses (store lookups)",
+            value=stats["misses"],
+        )
+        yield CounterMetricFamily(
+            "endpoint_cache_evictions",
+            "Model endpoint records evicted from the cache",
+            value=stats["evictions"],
+        )
+        yield GaugeMetricFamily(
+            "endpoint_cache_hit_rate",
+            "Model endpoint records cache hit rate",
+            value=stats["hit_rate"],
+        )
+        yield GaugeMetricFamily(
+            "endpoint_cache_size",
+            "Number of cached model endpoint records",
+            value=stats["size"],
+        )
+
+
+_endpoint_cache: typing.Optional[EndpointRecordsCache] = None
+
+
+def get_endpoint_cache() -> EndpointRecordsCache:
+    """The process endpoint records cache (created from the config on first use)"""
+    global _endpoint_cache
+    if _endpoint_cache is None:
+        cache_config = config.model_endpoint_monitoring.endpoint_cache
+        _endpoint_cache = EndpointRecordsCache(
+            ttl=float(cache_config.ttl_secs),
+            max_size=int(cache_config.max_size),
+            prefetch=bool(cache_config.prefetch),
+        )
+        try:
+            import mlrun.model_monitoring.prometheus
+
+            mlrun.model_monitoring.prometheus.register_collector(_endpoint_cache)
+        except ImportError:
+            pass
+    return _endpoint_cache
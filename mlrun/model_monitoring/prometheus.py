@@ -13,9 +13,16 @@
 # limitations under the License.
 #
 
+import bisect
+import threading
+import time
+import typing
+
 import prometheus_client
 
 from mlrun.common.schemas.model_monitoring import EventFieldType, PrometheusMetric
+from mlrun.config import config
+from mlrun.utils import logger
 
 # Memory path for Prometheus registry file
 _registry_path = "/tmp/prom-reg.txt"
@@ -35,25 +42,25 @@ _prediction_counter: prometheus_client.Counter = prometheus_client.Counter(
         EventFieldType.ENDPOINT_TYPE,
     ],
 )
-_model_latency: prometheus_client.Summary = prometheus_client.Summary(
-    name=PrometheusMetric.MODEL_LATENCY_SECONDS,
-    documentation="Summary for for model latency",
+_income_features: prometheus_client.Gauge = prometheus_client.Gauge(
+    name=PrometheusMetric.INCOME_FEATURES,
+    documentation="Samples of features and predictions",
     registry=_registry,
     labelnames=[
         EventFieldType.PROJECT,
         EventFieldType.ENDPOINT_ID,
-        EventFieldType.MODEL,
-        EventFieldType.ENDPOINT_TYPE,
+        EventFieldType.METRIC,
     ],
 )
-_income_features: prometheus_client.Gauge = prometheus_client.Gauge(
-    name=PrometheusMetric.INCOME_FEATURES,
-    documentation="Samples of features and predictions",
+_income_features_range: prometheus_client.Gauge = prometheus_client.Gauge(
+    name=PrometheusMetric.INCOME_FEATURES_RANGE,
+    documentation="Minimum and maximum of the features and predictions",
     registry=_registry,
     labelnames=[
         EventFieldType.PROJECT,
         EventFieldType.ENDPOINT_ID,
         EventFieldType.METRIC,
+        "stat",
     ],
 )
 _error_counter: prometheus_client.Counter = prometheus_client.Counter(
@@ -87,6 +94,276 @@ _drift_status: prometheus_client.Enum = prometheus_client.Enum(
 )
 
 
+# The following metrics are being updated by the serving graph steps (when the graph instrumentation is enabled),
+# they are exposed by the serving function itself (see get_graph_metrics) from a separate registry
+_graph_registry: prometheus_client.CollectorRegistry = (
+    prometheus_client.CollectorRegistry()
+)
+_collectors: list = []
+_graph_collectors: list = []
+_graph_step_labels = [EventFieldType.PROJECT, EventFieldType.FUNCTION, "step"]
+_graph_step_latency: prometheus_client.Histogram = prometheus_client.Histogram(
+    name=PrometheusMetric.GRAPH_STEP_LATENCY_SECONDS,
+    documentation="Histogram for the latency of the serving graph steps",
+    registry=_graph_registry,
+    labelnames=_graph_step_labels,
+    buckets=(
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    ),
+)
+_graph_step_errors: prometheus_client.Counter = prometheus_client.Counter(
+    name=PrometheusMetric.GRAPH_STEP_ERRORS_TOTAL,
+    documentation="Counter for the errors of the serving graph steps",
+    registry=_graph_registry,
+    labelnames=_graph_step_labels,
+)
+_graph_queue_wait: prometheus_client.Histogram = prometheus_client.Histogram(
+    name=PrometheusMetric.GRAPH_QUEUE_WAIT_SECONDS,
+    documentation="Histogram for the time events wait in the queues (streams) between serving graph functions",
+    registry=_graph_registry,
+    labelnames=[EventFieldType.PROJECT, EventFieldType.FUNCTION, "queue"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+
+class _EndpointWindow:
+    """The predictions count and the latency buckets of an endpoint in the current window"""
+
+    __slots__ = ("predictions", "latency_sum", "latency_buckets")
+
+    def __init__(self, buckets: int):
+        self.predictions = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * buckets
+
+
+class _WindowAggregator:
+    """
+    Pre-aggregate the monitoring stream metrics of each endpoint in a tumbling window, and update the registry once
+    per window (or when it is scraped): the predictions counter, the latency histogram buckets and the minimum,
+    maximum and mean of each feature. The number of endpoints and of features per endpoint are bounded (see
+    ``mlrun.mlconf.model_endpoint_monitoring.prometheus``), values of additional endpoints and features are dropped.
+    Endpoints without events for ``endpoint_idle_secs`` are evicted with their metrics, making room for new endpoints.
+
+    The latency histogram is exposed by the aggregator (a Prometheus collector) from its cumulative buckets.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._settings = None
+        self._windows: dict[tuple, _EndpointWindow] = {}
+        # (project, endpoint_id) -> feature name -> [min, max, sum, count]
+        self._features: dict[tuple[str, str], dict[str, list]] = {}
+        # Cumulative latency histograms (since the process start), labels -> [buckets counts, sum]
+        self._latency_histograms: dict[tuple, list] = {}
+        # (project, endpoint_id) -> the last time the endpoint had an event
+        self._endpoints: dict[tuple[str, str], float] = {}
+        self._dropped_endpoints: set[tuple[str, str]] = set()
+
+    @property
+    def settings(self):
+        if self._settings is None:
+            self._settings = config.model_endpoint_monitoring.prometheus
+            self._buckets = sorted(float(le) for le in self._settings.latency_buckets)
+        return self._settings
+
+    def _is_allowed(self, project: str, endpoint_id: str) -> bool:
+        endpoint = (project, endpoint_id)
+        if endpoint in self._endpoints or len(self._endpoints) < int(
+            self.settings.max_endpoints
+        ):
+            self._endpoints[endpoint] = time.monotonic()
+            return True
+        if endpoint not in self._dropped_endpoints:
+            self._dropped_endpoints.add(endpoint)
+            logger.warning(
+                "Reached the maximum number of endpoints with Prometheus metrics, the endpoint metrics are dropped",
+                project=project,
+                endpoint_id=endpoint_id,
+                max_endpoints=self.settings.max_endpoints,
+            )
+        return False
+
+    def add_predictions(
+        self,
+        project: str,
+        endpoint_id: str,
+        model_name: str,
+        endpoint_type: int,
+        latency: float,
+        predictions: int,
+    ) -> None:
+        with self._lock:
+            if not self._is_allowed(project, endpoint_id):
+                return
+            labels = (project, endpoint_id, model_name, str(endpoint_type))
+            window = self._windows.get(labels)
+            if window is None:
+                window = self._windows[labels] = _EndpointWindow(len(self._buckets) + 1)
+            window.predictions += predictions
+            window.latency_sum += latency * predictions
+            window.latency_buckets[bisect.bisect_left(self._buckets, latency)] += (
+                predictions
+            )
+        self._flush_if_due()
+
+    def add_features(
+        self, project: str, endpoint_id: str, features: dict[str, typing.Any]
+    ) -> None:
+        with self._lock:
+            if not self._is_allowed(project, endpoint_id):
+                return
+            endpoint_features = self._features.setdefault((project, endpoint_id), {})
+            max_features = int(self.settings.max_features)
+            for name, value in features.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                stats = endpoint_features.get(name)
+                if stats is None:
+                    if len(endpoint_features) >= max_features:
+                        continue
+                    endpoint_features[name] = [value, value, value, 1]
+                    continue
+                if value < stats[0]:
+                    stats[0] = value
+                if value > stats[1]:
+                    stats[1] = value
+                stats[2] += value
+                stats[3] += 1
+        self._flush_if_due()
+
+    def _flush_if_due(self) -> None:
+        if time.monotonic() - self._window_start >= float(self.settings.window_secs):
+            self.flush()
+
+    def flush(self) -> None:
+        """Update the registry with the current window aggregations and start a new window"""
+        with self._lock:
+            self._window_start = time.monotonic()
+            windows, self._windows = self._windows, {}
+            features, self._features = self._features, {}
+            for labels, window in windows.items():
+                project, endpoint_id, model_name, endpoint_type = labels
+                _prediction_counter.labels(
+                    project=project,
+                    endpoint_id=endpoint_id,
+                    model=model_name,
+                    endpoint_type=endpoint_type,
+                ).inc(window.predictions)
+                histogram = self._latency_histograms.get(labels)
+                if histogram is None:
+                    histogram = self._latency_histograms[labels] = [
+                        [0] * len(window.latency_buckets),
+                        0.0,
+                    ]
+                for i, count in enumerate(window.latency_buckets):
+                    histogram[0][i] += count
+                histogram[1] += window.latency_sum
+
+            for (project, endpoint_id), endpoint_features in features.items():
+                for name, (
+                    min_value,
+                    max_value,
+                    total,
+                    count,
+                ) in endpoint_features.items():
+                    _income_features.labels(
+                        project=project, endpoint_id=endpoint_id, metric=name
+                    ).set(total / count)
+                    _income_features_range.labels(
+                        project=project,
+                        endpoint_id=endpoint_id,
+                        metric=name,
+                        stat="min",
+                    ).set(min_value)
+                    _income_features_range.labels(
+                        project=project,
+                        endpoint_id=endpoint_id,
+                        metric=name,
+                        stat="max",
+                    ).set(max_value)
+            self._evict_idle_endpoints()
+        if windows or features:
+            prometheus_client.write_to_textfile(path=_registry_path, registry=_registry)
+
+    def _evict_idle_endpoints(self) -> None:
+        # Must be called while holding the lock
+        idle_secs = float(self.settings.endpoint_idle_secs)
+        if idle_secs <= 0:
+            return
+        now = time.monotonic()
+        idle_endpoints = {
+            endpoint
+            for endpoint, last_event in self._endpoints.items()
+            if now - last_event >= idle_secs
+        }
+        if not idle_endpoints:
+            return
+        for endpoint in idle_endpoints:
+            del self._endpoints[endpoint]
+        for labels in list(self._latency_histograms):
+            if labels[:2] in idle_endpoints:
+                del self._latency_histograms[labels]
+                try:
+                    _prediction_counter.remove(*labels)
+                except KeyError:
+                    pass
+        # The dropped endpoints may be added now
+        self._dropped_endpoints.clear()
+        logger.debug(
+            "Evicted the idle endpoints from the Prometheus metrics",
+            endpoints=len(idle_endpoints),
+        )
+
+    def collect(self):
+        """Prometheus collector of the latency histograms"""
+        from prometheus_client.core import HistogramMetricFamily
+
+        histograms = HistogramMetricFamily(
+            PrometheusMetric.MODEL_LATENCY_SECONDS,
+            "Histogram for model latency",
+            labels=[
+                EventFieldType.PROJECT,
+                EventFieldType.ENDPOINT_ID,
+                EventFieldType.MODEL,
+                EventFieldType.ENDPOINT_TYPE,
+            ],
+        )
+        with self._lock:
+            for labels, (buckets, latency_sum) in self._latency_histograms.items():
+                cumulative_buckets = []
+                total = 0
+                for le, count in zip([*self._buckets, float("inf")], buckets):
+                    total += count
+                    cumulative_buckets.append(
+                        ("+Inf" if le == float("inf") else repr(le), total)
+                    )
+                histograms.add_metric(
+                    list(labels), buckets=cumulative_buckets, sum_value=latency_sum
+                )
+        yield histograms
+
+
+_window_aggregator = _WindowAggregator()
+_registry.register(_window_aggregator)
+
+
 def _write_registry(func):
     def wrapper(*args, **kwargs):
         global _registry
@@ -97,15 +374,21 @@ def _write_registry(func):
     return wrapper
 
 
-@_write_registry
 def write_predictions_and_latency_metrics(
-    project: str, endpoint_id: str, latency: int, model_name: str, endpoint_type: int
+    project: str,
+    endpoint_id: str,
+    latency: int,
+    model_name: str,
+    endpoint_type: int,
+    predictions: int = 1,
 ):
     """
     Update the prediction counter and the latency value of the provided model endpoint within Prometheus registry.
-    Please note that while the prediction counter is ALWAYS increasing by 1,the latency summary metric is being
-    increased by the event latency time. Grafana dashboard will query the average latency time by dividing the total
-    latency value by the total amount of predictions.
+    Please note that while the prediction counter is increasing by the number of predictions (1 by default), the
+    latency histogram metric is being increased by the event latency time (of each prediction). Grafana dashboard will
+    query the average latency time by dividing the total latency value by the total amount of predictions.
+    The values are aggregated per endpoint and written to the registry once per window (see
+    ``mlrun.mlconf.model_endpoint_monitoring.prometheus.window_secs``).
 
     :param project:       Project name.
     :param endpoint_id:   Model endpoint unique id.
@@ -113,28 +396,22 @@ def write_predictions_and_latency_metrics(
     :param model_name:    Model name which will be used by Grafana for displaying the results by model.
     :param endpoint_type: Endpoint type that is represented by an int (possible values: 1,2,3) corresponding to the
                           Enum class :py:class:`~mlrun.common.schemas.model_monitoring.EndpointType`.
+    :param predictions:   Number of predictions of the event (e.g. the size of a columnar batch event).
     """
 
-    # Increase the prediction counter by 1
-    _prediction_counter.labels(
+    _window_aggregator.add_predictions(
         project=project,
         endpoint_id=endpoint_id,
-        model=model_name,
+        model_name=model_name,
         endpoint_type=endpoint_type,
-    ).inc(1)
-
-    # Increase the latency value according to the provided latency of the current event
-    _model_latency.labels(
-        project=project,
-        endpoint_id=endpoint_id,
-        model=model_name,
-        endpoint_type=endpoint_type,
-    ).observe(latency)
+        latency=latency,
+        predictions=predictions,
+    )
 
 
-@_write_registry
 def write_income_features(project: str, endpoint_id: str, features: dict[str, float]):
-    """Update a sample of features.
+    """Update a sample of features. The features are aggregated per endpoint (minimum, maximum and mean) and written
+    to the registry once per window, non numeric values are ignored.
 
     :param project:     Project name.
     :param endpoint_id: Model endpoint unique id.
@@ -143,10 +420,15 @@ def write_income_features(project: str, endpoint_id: str, features: dict[str, fl
 
     """
 
-    for metric in features:
-        _income_features.labels(
-            project=project, endpoint_id=endpoint_id, metric=metric
-        ).set(value=features[metric])
+    _window_aggregator.add_features(
+        project=project, endpoint_id=endpoint_id, features=features
+    )
+
+
+def flush_window_metrics():
+    """Write the metrics which were aggregated in the current window to the registry"""
+
+    _window_aggregator.flush()
 
 
 @_write_registry
@@ -194,9 +476,78 @@ def write_errors(project: str, endpoint_id: str, model_name: str):
     ).inc(1)
 
 
+def get_graph_step_metrics(project: str, function: str, step: str) -> tuple:
+    """
+    Get the latency histogram and the error counter of a serving graph step. The metrics are resolved once per step
+    (the label lookup is relatively expensive) and updated directly on each event.
+
+    :param project:  Project name.
+    :param function: Serving function name.
+    :param step:     Step full name.
+
+    :return: A tuple of the step latency histogram (seconds) and the step error counter.
+    """
+
+    return (
+        _graph_step_latency.labels(project=project, function=function, step=step),
+        _graph_step_errors.labels(project=project, function=function, step=step),
+    )
+
+
+def write_graph_queue_wait(project: str, function: str, queue: str, wait: float):
+    """
+    Update the queue wait time histogram with the time an event waited in a queue (stream) before it was consumed
+    by the serving graph.
+
+    :param project:  Project name.
+    :param function: Serving function name (the queue consumer).
+    :param queue:    Queue (stream trigger) name.
+    :param wait:     Wait time in seconds.
+    """
+
+    _graph_queue_wait.labels(project=project, function=function, queue=queue).observe(
+        wait
+    )
+
+
+def register_collector(collector) -> None:
+    """
+    Register a custom collector in the model monitoring registry (once), e.g. for the monitoring stream statistics
+    which are collected when the registry is written.
+
+    :param collector: A Prometheus collector, an object with a `collect()` method returning metric families.
+    """
+
+    if collector not in _collectors:
+        _registry.register(collector)
+        _collectors.append(collector)
+
+
+def register_graph_collector(collector) -> None:
+    """
+    Register a custom collector in the serving graph metrics registry (once), e.g. for metrics which are collected
+    when they are scraped.
+
+    :param collector: A Prometheus collector, an object with a `collect()` method returning metric families.
+    """
+
+    if collector not in _graph_collectors:
+        _graph_registry.register(collector)
+        _graph_collectors.append(collector)
+
+
+def get_graph_metrics() -> str:
+    """Returns the serving graph metrics according to the exposition format of Prometheus."""
+
+    return prometheus_client.generate_latest(_graph_registry).decode("utf-8")
+
+
 def get_registry() -> str:
     """Returns the parsed registry file according to the exposition format of Prometheus."""
 
+    # Write the current window aggregations before they are scraped
+    flush_window_metrics()
+
     # Read the registry file (note that the text is stored in UTF-8 format)
     f = open(_registry_path)
     lines = f.read()
@@ -214,3 +565,4 @@ def clean_metrics():
     them from the global registry after they have been scraped by Prometheus."""
 
     _income_features.clear()
+    _income_features_range.clear()
@@ -18,6 +18,7 @@ import json
 import os
 import typing
 
+import numpy as np
 import storey
 
 import mlrun
@@ -27,6 +28,7 @@ import mlrun.datastore.targets
 import mlrun.feature_store as fstore
 import mlrun.feature_store.steps
 import mlrun.model_monitoring.db
+import mlrun.model_monitoring.endpoint_cache
 import mlrun.model_monitoring.prometheus
 import mlrun.serving.states
 import mlrun.utils
@@ -40,7 +42,6 @@ from mlrun.common.schemas.model_monitoring.constants import (
     ProjectSecretKeys,
     PrometheusEndpoints,
 )
-from mlrun.model_monitoring.helpers import get_endpoint_record
 from mlrun.utils import logger
 
 
@@ -56,6 +57,7 @@ class EventStreamProcessor:
         aggregate_windows: typing.Optional[list[str]] = None,
         aggregate_period: str = "30s",
         model_monitoring_access_key: str = None,
+        columnar: typing.Optional[bool] = None,
     ):
         # General configurations, mainly used for the storey steps in the future serving graph
         self.project = project
@@ -63,6 +65,13 @@ class EventStreamProcessor:
         self.aggregate_windows = aggregate_windows or ["5m", "1h"]
         self.aggregate_period = aggregate_period
 
+        # Whether each model server request is processed as a single columnar batch event
+        self.columnar = (
+            mlrun.mlconf.model_endpoint_monitoring.stream_columnar_batches
+            if columnar is None
+            else columnar
+        )
+
         # Parquet path and configurations
         self.parquet_path = parquet_target
         self.parquet_batching_max_events = parquet_batching_max_events
@@ -163,6 +172,12 @@ class EventStreamProcessor:
            mlrun.mlconf.model_endpoint_monitoring.offline. Otherwise, the default parquet path is under
            mlrun.mlconf.model_endpoint_monitoring.user_space.
 
+        In columnar mode (see ``mlrun.mlconf.model_endpoint_monitoring.stream_columnar_batches``), each model server
+        request passes through the graph as a single batch event, its features and predictions are 2-dimensional
+        arrays (a row per prediction) and the metadata is shared by all the rows. The live stats are aggregated from
+        the batch sizes (step 7), the TSDB and Prometheus samples are the last row of the sampled batches, and the
+        batches are expanded to rows only for the Parquet target (step 23).
+
         :param fn: A serving function.
         """
 
@@ -204,6 +219,7 @@ class EventStreamProcessor:
                 full_event=True,
                 project=self.project,
                 after="filter_stream_event",
+                columnar=self.columnar,
             )
 
         apply_process_endpoint_event()
@@ -218,10 +234,14 @@ class EventStreamProcessor:
                 after="ProcessEndpointEvent",
             )
 
-            # flatten the events
-            graph.add_step(
-                "storey.FlatMap", "flatten_events", _fn="(event)", after="filter_none"
-            )
+            # flatten the events (a columnar batch event is processed as a whole)
+            if not self.columnar:
+                graph.add_step(
+                    "storey.FlatMap",
+                    "flatten_events",
+                    _fn="(event)",
+                    after="filter_none",
+                )
 
         apply_storey_filter_and_flatmap()
 
@@ -232,13 +252,18 @@ class EventStreamProcessor:
                 name="MapFeatureNames",
                 infer_columns_from_data=True,
                 project=self.project,
-                after="flatten_events",
+                after="filter_none" if self.columnar else "flatten_events",
             )
 
         apply_map_feature_names()
 
         # Step 7 - Calculate number of predictions and average latency
+        live_stats_step = "ComputeBatchLiveStats" if self.columnar else "Rename"
+
         def apply_storey_aggregations():
+            if self.columnar:
+                apply_storey_batch_aggregations()
+                return
             # Step 7.1 - Calculate number of predictions for each window (5 min and 1 hour by default)
             graph.add_step(
                 class_name="storey.AggregateByKey",
@@ -268,6 +293,37 @@ class EventStreamProcessor:
                 after=EventFieldType.LATENCY,
             )
 
+        def apply_storey_batch_aggregations():
+            # Step 7.1 - Sum the number of predictions and the total latency of the batches for each window
+            graph.add_step(
+                class_name="storey.AggregateByKey",
+                aggregates=[
+                    {
+                        "name": column,
+                        "column": column,
+                        "operations": ["sum"],
+                        "windows": self.aggregate_windows,
+                        "period": self.aggregate_period,
+                    }
+                    for column in [
+                        EventFieldType.BATCH_SIZE,
+                        EventFieldType.TOTAL_LATENCY,
+                    ]
+                ],
+                name=EventFieldType.LATENCY,
+                after="MapFeatureNames",
+                step_name="Aggregates",
+                table=".",
+                key_field=EventFieldType.ENDPOINT_ID,
+            )
+            # Step 7.2 - Calculate the number of predictions and the average latency for each window
+            graph.add_step(
+                "ComputeBatchLiveStats",
+                name="ComputeBatchLiveStats",
+                after=EventFieldType.LATENCY,
+                windows=self.aggregate_windows,
+            )
+
         apply_storey_aggregations()
 
         # Steps 8-10 - KV/SQL branch
@@ -276,7 +332,7 @@ class EventStreamProcessor:
             graph.add_step(
                 "ProcessBeforeEndpointUpdate",
                 name="ProcessBeforeEndpointUpdate",
-                after="Rename",
+                after=live_stats_step,
             )
 
         apply_process_before_endpoint_update()
@@ -314,7 +370,7 @@ class EventStreamProcessor:
             graph.add_step(
                 "storey.steps.SampleWindow",
                 name="sample",
-                after="Rename",
+                after=live_stats_step,
                 window_size=self.sample_window,
                 key=EventFieldType.ENDPOINT_ID,
             )
@@ -431,10 +487,20 @@ class EventStreamProcessor:
 
         # Step 23 - Write the Parquet target file, partitioned by key (endpoint_id) and time.
         def apply_parquet_target():
+            if self.columnar:
+                # A row per prediction
+                graph.add_step(
+                    "storey.FlatMap",
+                    "flatten_parquet_events",
+                    _fn="(event)",
+                    after="ProcessBeforeParquet",
+                )
             graph.add_step(
                 "storey.ParquetTarget",
                 name="ParquetTarget",
-                after="ProcessBeforeParquet",
+                after="flatten_parquet_events"
+                if self.columnar
+                else "ProcessBeforeParquet",
                 graph_shape="cylinder",
                 path=self.parquet_path,
                 storage_options=self.storage_options,
@@ -450,6 +516,29 @@ class EventStreamProcessor:
         apply_parquet_target()
 
 
+class ComputeBatchLiveStats(mlrun.feature_store.steps.MapClass):
+    def __init__(self, windows: list[str], **kwargs):
+        """
+        Calculate the number of predictions and the average latency of each aggregation window from the sums of the
+        columnar batch events (the batch sizes and their total latency), equivalent to the count and average of the
+        latency in the non columnar mode.
+
+        :param windows: The aggregation windows (e.g. ["5m", "1h"]).
+
+        :returns: The event with the number of predictions and the average latency of each window.
+        """
+        super().__init__(**kwargs)
+        self.windows = windows
+
+    def do(self, event):
+        for window in self.windows:
+            count = event.pop(f"{EventFieldType.BATCH_SIZE}_sum_{window}", 0)
+            total_latency = event.pop(f"{EventFieldType.TOTAL_LATENCY}_sum_{window}", 0)
+            event[f"predictions_count_{window}"] = count
+            event[f"latency_avg_{window}"] = total_latency / count if count else 0
+        return event
+
+
 class ProcessBeforeEndpointUpdate(mlrun.feature_store.steps.MapClass):
     def __init__(self, **kwargs):
         """
@@ -552,8 +641,7 @@ class ProcessBeforeTSDB(mlrun.feature_store.steps.MapClass):
         # endpoint_features includes the event values of each feature and prediction
         endpoint_features = {
             EventFieldType.RECORD_TYPE: EventKeyMetrics.ENDPOINT_FEATURES,
-            **event[EventFieldType.NAMED_PREDICTIONS],
-            **event[EventFieldType.NAMED_FEATURES],
+            **get_named_values(event),
             **base_event,
         }
         # Create a dictionary that includes both base_metrics and endpoint_features
@@ -585,7 +673,9 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
         super().__init__(**kwargs)
 
     def do(self, event):
-        logger.info("ProcessBeforeParquet1", event=event)
+        if EventFieldType.BATCH_SIZE in event:
+            return self._expand_batch(event)
+
         # Remove the following keys from the event
         for key in [
             EventFieldType.FEATURES,
@@ -608,14 +698,56 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
         ]:
             if not event.get(key):
                 event[key] = None
-        logger.info("ProcessBeforeParquet2", event=event)
         return event
 
+    @staticmethod
+    def _expand_batch(event: dict) -> list[dict]:
+        """Expand a columnar batch event to a list of Parquet rows (a row per prediction). The batch event is shared
+        with the other branches of the graph, so it is not modified."""
+        metadata = {
+            key: value
+            for key, value in event.items()
+            if key
+            not in [
+                EventFieldType.FEATURES,
+                EventFieldType.FEATURE_NAMES,
+                EventFieldType.PREDICTION,
+                EventFieldType.LABEL_NAMES,
+                EventFieldType.BATCH_SIZE,
+                EventFieldType.TOTAL_LATENCY,
+            ]
+        }
+        entities = metadata.get(EventFieldType.ENTITIES)
+        if entities is not None:
+            metadata = {**entities, **metadata}
+        for key in [
+            EventFieldType.LABELS,
+            EventFieldType.METRICS,
+            EventFieldType.ENTITIES,
+        ]:
+            if not metadata.get(key):
+                metadata[key] = None
+
+        feature_names = event[EventFieldType.FEATURE_NAMES]
+        label_names = event[EventFieldType.LABEL_NAMES]
+        return [
+            {
+                **metadata,
+                **dict(zip(feature_names, feature_values)),
+                **dict(zip(label_names, label_values)),
+            }
+            for feature_values, label_values in zip(
+                event[EventFieldType.FEATURES].tolist(),
+                event[EventFieldType.PREDICTION].tolist(),
+            )
+        ]
+
 
 class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
     def __init__(
         self,
         project: str,
+        columnar: bool = False,
         **kwargs,
     ):
         """
@@ -623,7 +755,10 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         Adding important details to the event such as endpoint_id, handling errors coming from the stream, validation
         of event data such as inputs and outputs, and splitting model event into sub-events.
 
-        :param project: Project name.
+        :param project:  Project name.
+        :param columnar: If true, the model event is not split, a single columnar batch event is created with the
+                         request metadata, the features and predictions arrays (a row per prediction) and the
+                         batch size.
 
         :returns: A Storey event object which is the basic unit of data in Storey. Note that the next steps of
                   the monitoring serving graph are based on Storey operations.
@@ -632,6 +767,7 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         super().__init__(**kwargs)
 
         self.project: str = project
+        self.columnar: bool = columnar
 
         # First and last requests timestamps (value) of each endpoint (key)
         self.first_request: dict[str, str] = dict()
@@ -640,8 +776,9 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         # Number of errors (value) per endpoint (key)
         self.error_count: dict[str, int] = collections.defaultdict(int)
 
-        # Set of endpoints in the current events
-        self.endpoints: set[str] = set()
+        # Endpoints of the current events (in least recently used order), the states of the least recently used
+        # endpoints are removed above the endpoint cache size and resumed again when needed
+        self.endpoints: collections.OrderedDict[str, None] = collections.OrderedDict()
 
     def do(self, full_event):
         event = full_event.body
@@ -746,6 +883,20 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         # Convert timestamp to a datetime object
         timestamp = datetime.datetime.fromisoformat(timestamp)
 
+        if self.columnar:
+            return self._create_batch_event(
+                event=event,
+                function_uri=function_uri,
+                versioned_model=versioned_model,
+                model_class=model_class,
+                timestamp=timestamp,
+                endpoint_id=endpoint_id,
+                request_id=request_id,
+                latency=latency,
+                features=features,
+                predictions=predictions,
+            )
+
         # Separate each model invocation into sub events that will be stored as dictionary
         # in list of events. This list will be used as the body for the storey event.
         events = []
@@ -783,6 +934,58 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         storey_event = storey.Event(body=events, key=endpoint_id)
         return storey_event
 
+    def _create_batch_event(
+        self,
+        event: dict,
+        function_uri: str,
+        versioned_model: str,
+        model_class: str,
+        timestamp: datetime.datetime,
+        endpoint_id: str,
+        request_id: str,
+        latency: int,
+        features: list,
+        predictions: list,
+    ) -> typing.Optional[storey.Event]:
+        """Create a single columnar batch event of the model invocation, the metadata is shared by all the rows"""
+        features = _to_columns(features)
+        predictions = _to_columns(predictions)
+        if features is None or predictions is None:
+            logger.error(
+                "Expected event inputs and outputs rows of the same size",
+                endpoint_id=endpoint_id,
+            )
+            self.error_count[endpoint_id] += 1
+            return None
+
+        # Similar to the rows of the split events (zip)
+        batch_size = min(len(features), len(predictions))
+        if not batch_size:
+            return None
+
+        batch = {
+            EventFieldType.FUNCTION_URI: function_uri,
+            EventFieldType.MODEL: versioned_model,
+            EventFieldType.MODEL_CLASS: model_class,
+            EventFieldType.TIMESTAMP: timestamp,
+            EventFieldType.ENDPOINT_ID: endpoint_id,
+            EventFieldType.REQUEST_ID: request_id,
+            EventFieldType.LATENCY: latency,
+            EventFieldType.FEATURES: features[:batch_size],
+            EventFieldType.PREDICTION: predictions[:batch_size],
+            EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
+            EventFieldType.LAST_REQUEST: self.last_request[endpoint_id],
+            EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
+            EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
+            EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
+            EventFieldType.ENTITIES: event.get("request", {}).get(
+                EventFieldType.ENTITIES, {}
+            ),
+            EventFieldType.BATCH_SIZE: batch_size,
+            EventFieldType.TOTAL_LATENCY: latency * batch_size,
+        }
+        return storey.Event(body=batch, key=endpoint_id)
+
     def _validate_last_request_timestamp(self, endpoint_id: str, timestamp: str):
         """Validate that the request time of the current event is later than the previous request time that has
         already been processed.
@@ -805,9 +1008,12 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
     def resume_state(self, endpoint_id):
         # Make sure process is resumable, if process fails for any reason, be able to pick things up close to where we
         # left them
-        if endpoint_id not in self.endpoints:
+        if endpoint_id in self.endpoints:
+            self.endpoints.move_to_end(endpoint_id)
+        else:
             logger.info("Trying to resume state", endpoint_id=endpoint_id)
-            endpoint_record = get_endpoint_record(
+            endpoint_cache = mlrun.model_monitoring.endpoint_cache.get_endpoint_cache()
+            endpoint_record = endpoint_cache.get(
                 project=self.project,
                 endpoint_id=endpoint_id,
             )
@@ -828,8 +1034,13 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
                 if error_count:
                     self.error_count[endpoint_id] = int(error_count)
 
-            # add endpoint to endpoints set
-            self.endpoints.add(endpoint_id)
+            # add endpoint to endpoints and remove the state of the least recently used endpoints
+            self.endpoints[endpoint_id] = None
+            while len(self.endpoints) > endpoint_cache.max_size:
+                evicted_endpoint_id, _ = self.endpoints.popitem(last=False)
+                self.first_request.pop(evicted_endpoint_id, None)
+                self.last_request.pop(evicted_endpoint_id, None)
+                self.error_count.pop(evicted_endpoint_id, None)
 
     def is_valid(
         self,
@@ -844,6 +1055,53 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         return False
 
 
+def _to_columns(rows: list) -> typing.Optional[np.ndarray]:
+    """Convert the rows of a model invocation (inputs or outputs) to a 2-dimensional array with a row per
+    prediction, None if the rows are not of the same size"""
+    if not rows:
+        return np.empty((0, 0))
+    try:
+        columns = np.asarray(rows)
+    except ValueError:
+        columns = None
+    if columns is not None and columns.dtype.kind in "biuf" and columns.ndim <= 2:
+        return columns.reshape(len(rows), -1)
+
+    # Non numeric (e.g. strings mixed with numbers) or nested values keep their original objects
+    rows = [row if isinstance(row, list) else [row] for row in rows]
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        return None
+    columns = np.empty((len(rows), width), dtype=object)
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            columns[i, j] = value
+    return columns
+
+
+def get_named_values(event: dict) -> dict[str, typing.Any]:
+    """Get the named predictions and features of an event, the last row of a columnar batch event"""
+    if EventFieldType.BATCH_SIZE not in event:
+        return {
+            **event[EventFieldType.NAMED_PREDICTIONS],
+            **event[EventFieldType.NAMED_FEATURES],
+        }
+    return {
+        **dict(
+            zip(
+                event[EventFieldType.LABEL_NAMES],
+                event[EventFieldType.PREDICTION][-1].tolist(),
+            )
+        ),
+        **dict(
+            zip(
+                event[EventFieldType.FEATURE_NAMES],
+                event[EventFieldType.FEATURES][-1].tolist(),
+            )
+        ),
+    }
+
+
 def is_not_none(field: typing.Any, dict_path: list[str]):
     if field is not None:
         return True
@@ -902,7 +1160,8 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
 
         :returns: A single event as a dictionary that includes metadata (endpoint_id, model_class, etc.) and also
-                  feature names and values (as well as the prediction results).
+                  feature names and values (as well as the prediction results). The values of a columnar batch
+                  event are not copied, the feature names and label columns are added to the event instead.
         """
         super().__init__(**kwargs)
 
@@ -917,33 +1176,48 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         # Dictionary to manage the model endpoint types - important for the V3IO TSDB
         self.endpoint_type = {}
 
-    def _infer_feature_names_from_data(self, event):
+        # The endpoint record values which the names were resolved from (in least recently used order), the names
+        # are resolved again when the (cached) endpoint record changes
+        self._resolved_records: collections.OrderedDict[str, tuple] = (
+            collections.OrderedDict()
+        )
+
+    def _infer_feature_names_from_data(self, feature_values: list):
         for endpoint_id in self.feature_names:
-            if len(self.feature_names[endpoint_id]) >= len(
-                event[EventFieldType.FEATURES]
-            ):
+            if len(self.feature_names[endpoint_id]) >= len(feature_values):
                 return self.feature_names[endpoint_id]
         return None
 
-    def _infer_label_columns_from_data(self, event):
+    def _infer_label_columns_from_data(self, label_values: list):
         for endpoint_id in self.label_columns:
-            if len(self.label_columns[endpoint_id]) >= len(
-                event[EventFieldType.PREDICTION]
-            ):
+            if len(self.label_columns[endpoint_id]) >= len(label_values):
                 return self.label_columns[endpoint_id]
         return None
 
     def do(self, event: dict):
         endpoint_id = event[EventFieldType.ENDPOINT_ID]
 
+        is_batch = EventFieldType.BATCH_SIZE in event
         feature_values = event[EventFieldType.FEATURES]
         label_values = event[EventFieldType.PREDICTION]
+        if is_batch:
+            # The names are resolved by the values of the first row
+            feature_values = feature_values[0].tolist()
+            label_values = label_values[0].tolist()
         # Get feature names and label columns
-        if endpoint_id not in self.feature_names:
-            endpoint_record = get_endpoint_record(
-                project=self.project,
-                endpoint_id=endpoint_id,
-            )
+        endpoint_cache = mlrun.model_monitoring.endpoint_cache.get_endpoint_cache()
+        endpoint_record = endpoint_cache.get(
+            project=self.project,
+            endpoint_id=endpoint_id,
+        )
+        resolved_record = (
+            endpoint_record.get(EventFieldType.FEATURE_NAMES),
+            endpoint_record.get(EventFieldType.LABEL_NAMES),
+            endpoint_record.get(EventFieldType.ENDPOINT_TYPE),
+        )
+        if self._resolved_records.get(endpoint_id) == resolved_record:
+            self._resolved_records.move_to_end(endpoint_id)
+        else:
             feature_names = endpoint_record.get(EventFieldType.FEATURE_NAMES)
             feature_names = json.loads(feature_names) if feature_names else None
 
@@ -953,16 +1227,14 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             # If feature names were not found,
             # try to retrieve them from the previous events of the current process
             if not feature_names and self._infer_columns_from_data:
-                feature_names = self._infer_feature_names_from_data(event)
+                feature_names = self._infer_feature_names_from_data(feature_values)
 
             if not feature_names:
                 logger.warn(
                     "Feature names are not initialized, they will be automatically generated",
                     endpoint_id=endpoint_id,
                 )
-                feature_names = [
-                    f"f{i}" for i, _ in enumerate(event[EventFieldType.FEATURES])
-                ]
+                feature_names = [f"f{i}" for i, _ in enumerate(feature_values)]
 
                 # Update the endpoint record with the generated features
                 update_endpoint_record(
@@ -981,16 +1253,14 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
             # Similar process with label columns
             if not label_columns and self._infer_columns_from_data:
-                label_columns = self._infer_label_columns_from_data(event)
+                label_columns = self._infer_label_columns_from_data(label_values)
 
             if not label_columns:
                 logger.warn(
                     "label column names are not initialized, they will be automatically generated",
                     endpoint_id=endpoint_id,
                 )
-                label_columns = [
-                    f"p{i}" for i, _ in enumerate(event[EventFieldType.PREDICTION])
-                ]
+                label_columns = [f"p{i}" for i, _ in enumerate(label_values)]
 
                 update_endpoint_record(
                     project=self.project,
@@ -1017,6 +1287,23 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             endpoint_type = int(endpoint_record.get(EventFieldType.ENDPOINT_TYPE))
             self.endpoint_type[endpoint_id] = endpoint_type
 
+            self._resolved_records[endpoint_id] = resolved_record
+            self._resolved_records.move_to_end(endpoint_id)
+            while len(self._resolved_records) > endpoint_cache.max_size:
+                evicted_endpoint_id, _ = self._resolved_records.popitem(last=False)
+                self.feature_names.pop(evicted_endpoint_id, None)
+                self.label_columns.pop(evicted_endpoint_id, None)
+                self.endpoint_type.pop(evicted_endpoint_id, None)
+
+        # Add endpoint type to the event
+        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
+
+        if is_batch:
+            # The names of the batch columns
+            event[EventFieldType.FEATURE_NAMES] = self.feature_names[endpoint_id]
+            event[EventFieldType.LABEL_NAMES] = self.label_columns[endpoint_id]
+            return event
+
         # Add feature_name:value pairs along with a mapping dictionary of all of these pairs
         feature_names = self.feature_names[endpoint_id]
         self._map_dictionary_values(
@@ -1035,10 +1322,6 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             mapping_dictionary=EventFieldType.NAMED_PREDICTIONS,
         )
 
-        # Add endpoint type to the event
-        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
-
-        logger.info("Mapped event", event=event)
         return event
 
     @staticmethod
@@ -1192,6 +1475,7 @@ class IncCounter(mlrun.feature_store.steps.MapClass):
             latency=event[EventFieldType.LATENCY],
             model_name=event[EventFieldType.MODEL],
             endpoint_type=event[EventFieldType.ENDPOINT_TYPE],
+            predictions=event.get(EventFieldType.BATCH_SIZE, 1),
         )
 
         return event
@@ -1206,10 +1490,7 @@ class RecordFeatures(mlrun.feature_store.steps.MapClass):
 
     def do(self, event):
         # Generate a dictionary of features and predictions
-        features = {
-            **event[EventFieldType.NAMED_PREDICTIONS],
-            **event[EventFieldType.NAMED_FEATURES],
-        }
+        features = get_named_values(event)
 
         mlrun.model_monitoring.prometheus.write_income_features(
             project=self.project,
@@ -1233,6 +1514,11 @@ def update_endpoint_record(
         endpoint_id=endpoint_id, attributes=attributes
     )
 
+    # Keep the cached endpoint record up to date with the written attributes
+    mlrun.model_monitoring.endpoint_cache.get_endpoint_cache().update(
+        project=project, endpoint_id=endpoint_id, attributes=attributes
+    )
+
 
 def update_monitoring_feature_set(
     endpoint_record: dict[str, typing.Any],
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import datetime
 import json
-from typing import Any, NewType
+import threading
+import weakref
+from typing import Any, NewType, Optional
 
 import pandas as pd
 from v3io.dataplane import Client as V3IOClient
@@ -101,6 +104,22 @@ Extra data: `{self._event[WriterEvent.RESULT_EXTRA_DATA]}`\
         logger.debug("A notification should have been sent")
 
 
+# the writers, held weakly so they are not kept alive until exit
+_writers: "weakref.WeakSet[ModelMonitoringWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_writers() -> None:
+    for writer in list(_writers):
+        try:
+            writer.flush()
+        except Exception as exc:
+            logger.error(
+                "Failed to write the application results at exit",
+                exc=mlrun.errors.err_to_str(exc),
+            )
+
+
 class ModelMonitoringWriter(StepToDict):
     """
     Write monitoring app events to V3IO KV storage
@@ -108,9 +127,25 @@ class ModelMonitoringWriter(StepToDict):
 
     kind = "monitoring_application_stream_pusher"
 
-    def __init__(self, project: str) -> None:
+    def __init__(
+        self, project: str, max_batch_size: int = 100, flush_interval: float = 5.0
+    ) -> None:
+        """
+        The application results are buffered and written to the TSDB and to the application results store in
+        batches, when the buffer reaches `max_batch_size` results or `flush_interval` seconds after the first
+        buffered result (the earlier of the two). The notifications and the drift events are sent per result.
+        Results which failed to be written are buffered again and written by the next flush, the buffered results
+        are flushed at exit.
+
+        :param project:        Project name.
+        :param max_batch_size: Maximum number of buffered application results, 1 to write each result on arrival.
+        :param flush_interval: Maximum time (in seconds) to buffer an application result, 0 to write only when
+                               the buffer is full.
+        """
         self.project = project
         self.name = project  # required for the deployment process
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
         self._v3io_container = self.get_v3io_container(self.name)
         self._tsdb_client = self._get_v3io_frames_client(self._v3io_container)
         self._custom_notifier = CustomNotificationPusher(
@@ -118,6 +153,13 @@ class ModelMonitoringWriter(StepToDict):
         )
         self._create_tsdb_table()
         self._endpoints_records = {}
+        self._app_results_store = None
+        self._pending_events: list[_AppResultEvent] = []
+        self._lock = threading.Lock()
+        # held across the write, so a timer flush and a full buffer flush write their batches in order
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        _writers.add(self)
 
     @staticmethod
     def get_v3io_container(project_name: str) -> str:
@@ -144,24 +186,33 @@ class ModelMonitoringWriter(StepToDict):
             rate=_TSDB_RATE,
         )
 
-    def _update_kv_db(self, event: _AppResultEvent) -> None:
-        event = _AppResultEvent(event.copy())
-        application_result_store = mlrun.model_monitoring.get_store_object(
-            project=self.project
-        )
-        application_result_store.write_application_result(event=event)
+    def _get_app_results_store(self) -> mlrun.model_monitoring.db.StoreBase:
+        # The store object (and its DB client / engine) is reused by all the writes
+        if self._app_results_store is None:
+            self._app_results_store = mlrun.model_monitoring.get_store_object(
+                project=self.project
+            )
+        return self._app_results_store
 
-    def _update_tsdb(self, event: _AppResultEvent) -> None:
-        event = _AppResultEvent(event.copy())
-        event[WriterEvent.END_INFER_TIME] = datetime.datetime.fromisoformat(
-            event[WriterEvent.END_INFER_TIME]
+    def _update_kv_db(self, events: list[_AppResultEvent]) -> None:
+        self._get_app_results_store().write_application_results(
+            events=[_AppResultEvent(event.copy()) for event in events]
         )
-        del event[WriterEvent.RESULT_EXTRA_DATA]
+
+    def _update_tsdb(self, events: list[_AppResultEvent]) -> None:
+        records = []
+        for event in events:
+            event = _AppResultEvent(event.copy())
+            event[WriterEvent.END_INFER_TIME] = datetime.datetime.fromisoformat(
+                event[WriterEvent.END_INFER_TIME]
+            )
+            del event[WriterEvent.RESULT_EXTRA_DATA]
+            records.append(event)
         try:
             self._tsdb_client.write(
                 backend=_TSDB_BE,
                 table=_TSDB_TABLE,
-                dfs=pd.DataFrame.from_records([event]),
+                dfs=pd.DataFrame.from_records(records),
                 index_cols=[
                     WriterEvent.END_INFER_TIME,
                     WriterEvent.ENDPOINT_ID,
@@ -169,15 +220,66 @@ class ModelMonitoringWriter(StepToDict):
                     WriterEvent.RESULT_NAME,
                 ],
             )
-            logger.info("Updated V3IO TSDB successfully", table=_TSDB_TABLE)
+            logger.info(
+                "Updated V3IO TSDB successfully",
+                table=_TSDB_TABLE,
+                results=len(records),
+            )
         except V3IOFramesError as err:
             logger.warn(
                 "Could not write drift measures to TSDB",
                 err=err,
                 table=_TSDB_TABLE,
-                event=event,
+                results=len(records),
+            )
+
+    def _add_pending_event(self, event: _AppResultEvent) -> None:
+        with self._lock:
+            self._pending_events.append(event)
+            is_full = len(self._pending_events) >= self.max_batch_size
+            if not is_full:
+                self._start_flush_timer()
+        if is_full:
+            self.flush()
+
+    def _start_flush_timer(self) -> None:
+        # must be called while holding the lock
+        if self._flush_timer is None and self.flush_interval > 0:
+            self._flush_timer = threading.Timer(
+                self.flush_interval, self._flush_on_timer
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.error(
+                "Failed to write the application results",
+                exc=mlrun.errors.err_to_str(exc),
             )
 
+    def flush(self) -> None:
+        """Write the buffered application results to the TSDB and to the application results store"""
+        with self._flush_lock:
+            with self._lock:
+                events, self._pending_events = self._pending_events, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not events:
+                return
+            try:
+                self._update_tsdb(events)
+                self._update_kv_db(events)
+            except Exception:
+                # keep the results (before the ones buffered meanwhile) for the next flush
+                with self._lock:
+                    self._pending_events[:0] = events
+                    self._start_flush_timer()
+                raise
+
     @staticmethod
     def _generate_event_on_drift(
         uid: str, drift_status: str, event_value: dict, project_name: str
@@ -227,17 +329,17 @@ class ModelMonitoringWriter(StepToDict):
 
     def do(self, event: _RawEvent) -> None:
         event = self._reconstruct_event(event)
-        logger.info("Starting to write event", event=event)
-        self._update_tsdb(event)
-        self._update_kv_db(event)
+        logger.debug("Starting to write event", event=event)
+        self._add_pending_event(event)
         _Notifier(event=event, notification_pusher=self._custom_notifier).notify()
 
         if mlrun.mlconf.alerts.mode == mlrun.common.schemas.alert.AlertsModes.enabled:
             endpoint_id = event[WriterEvent.ENDPOINT_ID]
-            endpoint_record = self._endpoints_records.setdefault(
-                endpoint_id,
-                get_endpoint_record(project=self.project, endpoint_id=endpoint_id),
-            )
+            if endpoint_id not in self._endpoints_records:
+                self._endpoints_records[endpoint_id] = get_endpoint_record(
+                    project=self.project, endpoint_id=endpoint_id
+                )
+            endpoint_record = self._endpoints_records[endpoint_id]
             event_value = {
                 "app_name": event[WriterEvent.APPLICATION_NAME],
                 "model": endpoint_record.get(EventFieldType.MODEL),
@@ -251,4 +353,4 @@ class ModelMonitoringWriter(StepToDict):
                 event_value,
                 self.project,
             )
-        logger.info("Completed event DB writes")
+        logger.debug("Completed event processing")
@@ -0,0 +1,332 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Codecs used by the graph server for decoding request bodies and encoding response bodies
+
+The codec is selected by the content type of the request (see :py:func:`get_codec`), and the response is encoded
+with the same codec (falling back to JSON if it cannot represent the response body).
+Custom codecs can be added with :py:func:`register_codec`.
+"""
+
+__all__ = [
+    "Codec",
+    "JSONCodec",
+    "MsgpackCodec",
+    "ArrowCodec",
+    "BinaryTensorCodec",
+    "get_codec",
+    "register_codec",
+]
+
+import json
+import typing
+
+import numpy as np
+import orjson
+
+# header holding the size of the JSON header which precedes the binary tensors data (KServe v2 binary extension)
+inference_header_content_length_key = "Inference-Header-Content-Length"
+
+
+class Codec:
+    """Base class of the request/response body codecs"""
+
+    #: content types handled by the codec, the first one is used as the content type of encoded responses
+    content_types: list[str] = []
+
+    def accepts(self, content_type: str, headers: dict) -> bool:
+        """Whether the codec can decode a request with the given content type and headers"""
+        return content_type in self.content_types
+
+    def decode(self, body: typing.Union[str, bytes], headers: dict) -> typing.Any:
+        """Decode a request body, should raise a ``ValueError`` if the body is malformed"""
+        raise NotImplementedError()
+
+    def encode(
+        self, body: typing.Any
+    ) -> typing.Optional[tuple[bytes, typing.Optional[dict]]]:
+        """Encode a response body
+
+        :return: The encoded body and the response headers it requires (or None), or None if the codec cannot
+                 represent the body
+        """
+        raise NotImplementedError()
+
+    @property
+    def content_type(self) -> str:
+        return self.content_types[0]
+
+
+class JSONCodec(Codec):
+    """JSON codec (the default), serializes NumPy arrays and scalars natively (no need to convert them to lists)
+
+    Responses are encoded with orjson into bytes (instead of a str), and since orjson produces standard JSON,
+    non-finite floats (NaN/Infinity) are encoded as ``null`` rather than as the non-standard ``NaN``/``Infinity``
+    tokens which the standard json encoder produced (and which most JSON parsers reject).
+    Requests with such tokens are still decoded.
+    """
+
+    content_types = ["application/json", "json"]
+
+    def accepts(self, content_type: str, headers: dict) -> bool:
+        # bodies without a content type are assumed to be JSON
+        return not content_type or super().accepts(content_type, headers)
+
+    def decode(self, body: typing.Union[str, bytes], headers: dict) -> typing.Any:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # the standard json decoder accepts some non-standard values (e.g. NaN) which orjson rejects
+            return json.loads(body)
+
+    def encode(self, body: typing.Any) -> tuple[bytes, typing.Optional[dict]]:
+        try:
+            return (
+                orjson.dumps(
+                    body, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ),
+                None,
+            )
+        except TypeError:
+            # e.g. non-contiguous arrays or types which orjson does not support
+            return json.dumps(body, default=_to_json_serializable).encode(), None
+
+
+class MsgpackCodec(Codec):
+    """MessagePack codec, requires the msgpack package
+
+    When msgpack is not installed, decoding raises an ImportError (turned into a 400 response by the graph server)
+    and responses are encoded with the default codec.
+    """
+
+    content_types = ["application/msgpack", "application/x-msgpack"]
+
+    def decode(self, body: typing.Union[str, bytes], headers: dict) -> typing.Any:
+        msgpack = self._import_msgpack()
+        try:
+            return msgpack.unpackb(body, raw=False)
+        except Exception as exc:
+            raise ValueError(str(exc)) from exc
+
+    def encode(self, body: typing.Any) -> tuple[bytes, typing.Optional[dict]]:
+        msgpack = self._import_msgpack()
+        return msgpack.packb(body, default=_to_json_serializable), None
+
+    @staticmethod
+    def _import_msgpack():
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                'msgpack is not installed, run "pip install msgpack" first!'
+            )
+        return msgpack
+
+
+class ArrowCodec(Codec):
+    """Arrow IPC stream codec
+
+    The request table is decoded into ``{"inputs": <2D array of rows>}``, other request fields can be passed in the
+    schema metadata. Responses are encoded into a table holding the ``outputs`` (a column per output for 2D outputs),
+    with the rest of the response fields in the schema metadata.
+    """
+
+    content_types = ["application/vnd.apache.arrow.stream"]
+
+    def decode(self, body: typing.Union[str, bytes], headers: dict) -> typing.Any:
+        import pyarrow
+
+        try:
+            table = pyarrow.ipc.open_stream(body).read_all()
+        except pyarrow.ArrowInvalid as exc:
+            raise ValueError(str(exc)) from exc
+
+        request = {
+            key.decode(): value.decode()
+            for key, value in (table.schema.metadata or {}).items()
+        }
+        columns = [column.to_numpy() for column in table.columns]
+        if len(columns) == 1:
+            # a single column is passed as is (no copy when it has a single chunk and no nulls)
+            request["inputs"] = columns[0].reshape(-1, 1)
+        else:
+            request["inputs"] = np.column_stack(columns) if columns else []
+        return request
+
+    def encode(
+        self, body: typing.Any
+    ) -> typing.Optional[tuple[bytes, typing.Optional[dict]]]:
+        import pyarrow
+
+        if not isinstance(body, dict) or "outputs" not in body:
+            return None
+        try:
+            outputs = np.asarray(body["outputs"])
+        except ValueError:
+            return None
+        if outputs.dtype == object or outputs.ndim > 2:
+            return None
+
+        if outputs.ndim < 2:
+            columns = {"outputs": outputs.reshape(-1)}
+        else:
+            columns = {
+                f"output_{index}": outputs[:, index]
+                for index in range(outputs.shape[1])
+            }
+        metadata = {key: str(value) for key, value in body.items() if key != "outputs"}
+        table = pyarrow.table(columns, metadata=metadata)
+
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), None
+
+
+class BinaryTensorCodec(Codec):
+    """Raw little-endian tensors codec, following the KServe v2 binary data extension
+
+    The body starts with a JSON header (its size is set in the ``Inference-Header-Content-Length`` header) which
+    describes the tensors (``name``, ``shape``, ``datatype`` and ``parameters.binary_data_size``), followed by the
+    raw tensors data. The tensors are decoded into read-only NumPy views of the request body (without copying it),
+    ``inputs`` holds the single input tensor or a list of the input tensors. Response outputs which are arrays are
+    encoded in the same way.
+    """
+
+    content_types = ["application/octet-stream"]
+
+    _datatypes = {
+        "BOOL": np.dtype("bool"),
+        "UINT8": np.dtype("<u1"),
+        "UINT16": np.dtype("<u2"),
+        "UINT32": np.dtype("<u4"),
+        "UINT64": np.dtype("<u8"),
+        "INT8": np.dtype("<i1"),
+        "INT16": np.dtype("<i2"),
+        "INT32": np.dtype("<i4"),
+        "INT64": np.dtype("<i8"),
+        "FP16": np.dtype("<f2"),
+        "FP32": np.dtype("<f4"),
+        "FP64": np.dtype("<f8"),
+    }
+
+    def accepts(self, content_type: str, headers: dict) -> bool:
+        # raw octet-stream bodies (e.g. images) are passed as is, only bodies with the inference header are decoded
+        return _get_header(headers, inference_header_content_length_key) is not None
+
+    def decode(self, body: typing.Union[str, bytes], headers: dict) -> typing.Any:
+        if isinstance(body, str):
+            body = body.encode()
+        header_length = int(_get_header(headers, inference_header_content_length_key))
+        request = orjson.loads(body[:header_length])
+        buffer = memoryview(body)
+        offset = header_length
+
+        tensors = []
+        for tensor in request.get("inputs", []):
+            dtype = self._datatypes.get(tensor.get("datatype"))
+            if dtype is None:
+                raise ValueError(
+                    f"Unsupported tensor datatype {tensor.get('datatype')}, "
+                    f"supported datatypes are {list(self._datatypes)}"
+                )
+            size = (tensor.get("parameters") or {}).get("binary_data_size")
+            if size is None:
+                array = np.asarray(tensor.get("data", []), dtype=dtype)
+            else:
+                if offset + size > len(buffer):
+                    raise ValueError(
+                        f"Tensor {tensor.get('name')} exceeds the request body"
+                    )
+                array = np.frombuffer(buffer[offset : offset + size], dtype=dtype)
+                offset += size
+            tensors.append(array.reshape(tensor.get("shape", [-1])))
+
+        request["inputs"] = tensors[0] if len(tensors) == 1 else tensors
+        return request
+
+    def encode(
+        self, body: typing.Any
+    ) -> typing.Optional[tuple[bytes, typing.Optional[dict]]]:
+        if not isinstance(body, dict) or "outputs" not in body:
+            return None
+        outputs = body["outputs"]
+        if isinstance(outputs, np.ndarray):
+            outputs = [outputs]
+        if not isinstance(outputs, list) or not all(
+            isinstance(output, np.ndarray) for output in outputs
+        ):
+            return None
+        datatypes = {dtype: name for name, dtype in self._datatypes.items()}
+        if not all(output.dtype.newbyteorder("<") in datatypes for output in outputs):
+            return None
+
+        header = {key: value for key, value in body.items() if key != "outputs"}
+        header["outputs"] = []
+        buffers = []
+        for index, output in enumerate(outputs):
+            data = np.ascontiguousarray(output, dtype=output.dtype.newbyteorder("<"))
+            header["outputs"].append(
+                {
+                    "name": f"output_{index}",
+                    "shape": list(data.shape),
+                    "datatype": datatypes[data.dtype],
+                    "parameters": {"binary_data_size": data.nbytes},
+                }
+            )
+            buffers.append(data.tobytes())
+
+        header_bytes = orjson.dumps(header, option=orjson.OPT_SERIALIZE_NUMPY)
+        return b"".join([header_bytes, *buffers]), {
+            inference_header_content_length_key: str(len(header_bytes))
+        }
+
+
+_codecs: list[Codec] = [
+    BinaryTensorCodec(),
+    JSONCodec(),
+    MsgpackCodec(),
+    ArrowCodec(),
+]
+default_codec = _codecs[1]
+
+
+def register_codec(codec: Codec):
+    """Register a request/response body codec, it takes precedence over the codecs registered before it"""
+    _codecs.insert(0, codec)
+
+
+def get_codec(content_type: str, headers: dict = None) -> typing.Optional[Codec]:
+    """Get the codec which decodes requests with the given content type and headers, None if there is none"""
+    # ignore content type parameters, e.g. "application/json; charset=utf-8"
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    for codec in _codecs:
+        if codec.accepts(content_type, headers or {}):
+            return codec
+    return None
+
+
+def _get_header(headers: dict, key: str):
+    key = key.lower()
+    for header_key, value in (headers or {}).items():
+        if header_key.lower() == key:
+            return value
+    return None
+
+
+def _to_json_serializable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
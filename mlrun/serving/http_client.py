@@ -0,0 +1,517 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared asyncio HTTP client of the remote graph steps (:py:class:`~mlrun.serving.remote.RemoteStep` and
+:py:class:`~mlrun.serving.remote.BatchHttpRequests`)
+
+The client holds a keep-alive connection pool per event loop (shared by all the remote steps of the process, sync
+steps run their requests on a background event loop), limits the number of concurrent requests, can hedge slow
+requests (send a second request and use the first response) and has a circuit breaker per host.
+The client is configured with ``mlrun.mlconf.serving.remote``.
+"""
+
+import asyncio
+import bisect
+import ssl
+import threading
+import time
+import typing
+import urllib.parse
+import weakref
+
+import aiohttp
+
+import mlrun.errors
+from mlrun.config import config
+from mlrun.utils import logger
+
+# latency histogram buckets (seconds) of the remote requests
+latency_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RemoteResponse:
+    """Response of a remote request (the body is read before the connection is released to the pool)"""
+
+    def __init__(self, status: int, body: bytes, headers):
+        self.status = status
+        self.body = body
+        self.headers = headers
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class CircuitBreaker:
+    """Circuit breaker of a remote host
+
+    The circuit opens after ``failure_threshold`` consecutive failures (connection errors, timeouts and 5xx
+    responses), requests are rejected while it is open, and after ``reset_timeout`` seconds a single trial request is
+    let through (half open) which closes the circuit if it succeeds or reopens it if it fails.
+    A ``failure_threshold`` of 0 disables the circuit breaker.
+    """
+
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.closed
+        if self._trial or time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.half_open
+        return self.open
+
+    def allow(self) -> typing.Optional[str]:
+        """The state in which a request can be sent (``half_open`` for the trial request), None if it is rejected"""
+        if self._opened_at is None:
+            return self.closed
+        with self._lock:
+            if self._opened_at is None:
+                return self.closed
+            if (
+                not self._trial
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._trial = True
+                return self.half_open
+            return None
+
+    def abort_trial(self):
+        """Let another trial request through, when the trial request ended without a result (e.g. was cancelled)"""
+        with self._lock:
+            self._trial = False
+
+    def record_success(self):
+        if self._failures or self._opened_at is not None:
+            with self._lock:
+                self._failures = 0
+                self._opened_at = None
+                self._trial = False
+
+    def record_failure(self):
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+
+class _HostStats:
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.rejected = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(latency_buckets) + 1)
+
+    def observe(self, latency: float):
+        self.latency_sum += latency
+        self.latency_buckets[bisect.bisect_left(latency_buckets, latency)] += 1
+
+
+class _LoopPool:
+    # connection pool (session) and concurrency semaphore of an event loop
+    def __init__(self, session: aiohttp.ClientSession, semaphore):
+        self.session = session
+        self.semaphore = semaphore
+        self.users = 0
+
+
+class RemoteHTTPClient:
+    """Shared asyncio HTTP client with keep-alive connection pools, hedged requests and per host circuit breakers"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_concurrency: int = 0,
+        keepalive_timeout: float = 30.0,
+        hedge_after: float = 0.0,
+        failure_threshold: int = 0,
+        reset_timeout: float = 30.0,
+    ):
+        """
+        :param max_connections:          Max open connections (per event loop), 0 for unlimited.
+        :param max_connections_per_host: Max open connections to the same host, 0 for unlimited.
+        :param max_concurrency:          Max concurrent requests (per event loop), 0 for unlimited.
+        :param keepalive_timeout:        Seconds to keep idle connections open.
+        :param hedge_after:              Default seconds after which a slow request is hedged, 0 to disable.
+        :param failure_threshold:        Consecutive failures which open the circuit of a host, 0 to disable.
+        :param reset_timeout:            Seconds after which an open circuit lets a trial request through.
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self.hedge_after = hedge_after
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        # a connection pool (session) and a concurrency semaphore per event loop
+        self._sessions = weakref.WeakKeyDictionary()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._stats: dict[str, _HostStats] = {}
+        self._lock = threading.Lock()
+        self._sync_loop = None
+
+    @classmethod
+    def from_config(cls) -> "RemoteHTTPClient":
+        remote_config = config.serving.remote
+        return cls(
+            max_connections=int(remote_config.max_connections),
+            max_connections_per_host=int(remote_config.max_connections_per_host),
+            max_concurrency=int(remote_config.max_concurrency),
+            keepalive_timeout=float(remote_config.keepalive_timeout),
+            hedge_after=float(remote_config.hedge_after),
+            failure_threshold=int(remote_config.circuit_breaker.failure_threshold),
+            reset_timeout=float(remote_config.circuit_breaker.reset_timeout),
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        data=None,
+        timeout: float = None,
+        ssl_verify: typing.Union[bool, str] = False,
+        hedge_after: float = None,
+        retries: int = 0,
+        backoff_factor: float = 1.0,
+        retry_statuses: typing.Collection[int] = (),
+    ) -> RemoteResponse:
+        """Send a request and read its response
+
+        :param method:         HTTP method.
+        :param url:            Request url.
+        :param headers:        Request headers.
+        :param data:           Request body.
+        :param timeout:        Total timeout of the request in seconds.
+        :param ssl_verify:     Verify the server certificate (bool), or the path of a CA bundle to verify it with.
+        :param hedge_after:    Seconds after which a second request is sent if there is no response yet (and the
+                               first response of the two is used), None for the client default, 0 to disable.
+                               Hedged requests may reach the server twice.
+        :param retries:        Number of retries of responses with a status in ``retry_statuses``.
+        :param backoff_factor: Backoff factor (seconds) of the retries.
+        :param retry_statuses: Response statuses to retry.
+
+        :return: The response.
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        breaker = self._get_breaker(host)
+        stats = self._get_stats(host)
+        hedge_after = self.hedge_after if hedge_after is None else hedge_after
+        attempt = 0
+        while True:
+            breaker_state = breaker.allow()
+            if breaker_state is None:
+                stats.rejected += 1
+                raise mlrun.errors.MLRunServiceUnavailableError(
+                    f"circuit breaker of {host} is open after {breaker.failure_threshold} consecutive failures, "
+                    f"request to {url} was rejected"
+                )
+            try:
+                response = await self._send(
+                    method,
+                    url,
+                    headers,
+                    data,
+                    timeout,
+                    ssl_verify,
+                    hedge_after,
+                    stats,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                stats.failures += 1
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # cancelled or failed before reaching the host, a trial request must not keep the circuit half open
+                if breaker_state == CircuitBreaker.half_open:
+                    breaker.abort_trial()
+                raise
+            if response.status >= 500:
+                stats.failures += 1
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if response.status not in retry_statuses or attempt >= retries:
+                return response
+            attempt += 1
+            await asyncio.sleep(backoff_factor * (2 ** (attempt - 1)))
+
+    def request_sync(self, *args, **kwargs) -> RemoteResponse:
+        """Send a request from synchronous code (on the background event loop of the client), see :py:meth:`request`"""
+        loop = self._get_sync_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self.request(*args, **kwargs), loop
+        ).result()
+
+    def stats(self) -> dict:
+        """Request statistics per host (requests, failures, in flight, hedges, circuit state and latencies)"""
+        with self._lock:
+            hosts = list(self._stats.items())
+        return {
+            host: {
+                "requests": stats.requests,
+                "failures": stats.failures,
+                "in_flight": stats.in_flight,
+                "hedged": stats.hedged,
+                "hedge_wins": stats.hedge_wins,
+                "rejected": stats.rejected,
+                "circuit": self._breakers[host].state,
+                "latency_sum": stats.latency_sum,
+                "latency_buckets": list(stats.latency_buckets),
+            }
+            for host, stats in hosts
+        }
+
+    def acquire(self):
+        """Register a user (e.g. a step) of the connection pool of the current event loop, see :py:meth:`release`"""
+        self._get_pool().users += 1
+
+    async def release(self):
+        """Unregister a user of the connection pool of the current event loop, the pool is closed with its last user"""
+        loop = asyncio.get_running_loop()
+        pool = self._sessions.get(loop)
+        if pool is None:
+            return
+        pool.users -= 1
+        if pool.users <= 0:
+            del self._sessions[loop]
+            await pool.session.close()
+
+    async def _send(
+        self, method, url, headers, data, timeout, ssl_verify, hedge_after, stats
+    ) -> RemoteResponse:
+        pool = self._get_pool()
+        session, semaphore = pool.session, pool.semaphore
+        kwargs = {"ssl": self._resolve_ssl(ssl_verify)}
+        if timeout:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async def send():
+            start = time.perf_counter()
+            stats.requests += 1
+            stats.in_flight += 1
+            try:
+                async with session.request(
+                    method, url, headers=headers, data=data, **kwargs
+                ) as response:
+                    body = await response.read()
+                    return RemoteResponse(response.status, body, response.headers)
+            finally:
+                stats.in_flight -= 1
+                stats.observe(time.perf_counter() - start)
+
+        async def limited_send():
+            if semaphore is None:
+                return await send()
+            async with semaphore:
+                return await send()
+
+        if not hedge_after or hedge_after <= 0:
+            return await limited_send()
+
+        first = asyncio.ensure_future(limited_send())
+        hedge = None
+        try:
+            done, _ = await asyncio.wait([first], timeout=hedge_after)
+            if done:
+                return first.result()
+
+            # no response yet, hedge the request and use the first response
+            stats.hedged += 1
+            hedge = asyncio.ensure_future(limited_send())
+            pending = {first, hedge}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            stats.hedge_wins += 1
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            # the slower request, or both of them when the request is cancelled
+            for task in (first, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def _get_pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        pool = self._sessions.get(loop)
+        if pool is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            semaphore = (
+                asyncio.Semaphore(self.max_concurrency)
+                if self.max_concurrency > 0
+                else None
+            )
+            pool = _LoopPool(aiohttp.ClientSession(connector=connector), semaphore)
+            self._sessions[loop] = pool
+        return pool
+
+    def _get_breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host, CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                )
+                self._stats.setdefault(host, _HostStats())
+        return breaker
+
+    def _get_stats(self, host: str) -> _HostStats:
+        return self._stats[host]
+
+    def _get_sync_loop(self) -> asyncio.AbstractEventLoop:
+        if self._sync_loop is None:
+            with self._lock:
+                if self._sync_loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="remote-http-client",
+                        daemon=True,
+                    ).start()
+                    self._sync_loop = loop
+        return self._sync_loop
+
+    @staticmethod
+    def _resolve_ssl(ssl_verify):
+        if isinstance(ssl_verify, str):
+            return ssl.create_default_context(cafile=ssl_verify)
+        # aiohttp uses ssl=None for the default verification
+        return None if ssl_verify else False
+
+
+_client: typing.Optional[RemoteHTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> RemoteHTTPClient:
+    """Get the HTTP client shared by the remote steps of the process"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = RemoteHTTPClient.from_config()
+                logger.debug(
+                    "Initialized the remote steps http client",
+                    max_connections=_client.max_connections,
+                    max_concurrency=_client.max_concurrency,
+                )
+    return _client
+
+
+class RemoteClientCollector:
+    """Prometheus collector of the shared client statistics (per host)"""
+
+    def collect(self):
+        from prometheus_client.core import (
+            CounterMetricFamily,
+            GaugeMetricFamily,
+            HistogramMetricFamily,
+        )
+
+        requests = CounterMetricFamily(
+            "graph_remote_requests", "Remote step requests", labels=["host"]
+        )
+        failures = CounterMetricFamily(
+            "graph_remote_failures", "Remote step failed requests", labels=["host"]
+        )
+        hedged = CounterMetricFamily(
+            "graph_remote_hedged_requests",
+            "Remote step hedged requests",
+            labels=["host"],
+        )
+        rejected = CounterMetricFamily(
+            "graph_remote_rejected_requests",
+            "Remote step requests rejected by an open circuit breaker",
+            labels=["host"],
+        )
+        in_flight = GaugeMetricFamily(
+            "graph_remote_in_flight_requests",
+            "Remote step requests in flight (open pool connections in use)",
+            labels=["host"],
+        )
+        circuit_open = GaugeMetricFamily(
+            "graph_remote_circuit_open",
+            "Whether the circuit breaker of the host is open",
+            labels=["host"],
+        )
+        latency = HistogramMetricFamily(
+            "graph_remote_latency_seconds",
+            "Remote step request latency",
+            labels=["host"],
+        )
+        stats = _client.stats() if _client else {}
+        for host, host_stats in stats.items():
+            requests.add_metric([host], host_stats["requests"])
+            failures.add_metric([host], host_stats["failures"])
+            hedged.add_metric([host], host_stats["hedged"])
+            rejected.add_metric([host], host_stats["rejected"])
+            in_flight.add_metric([host], host_stats["in_flight"])
+            circuit_open.add_metric(
+                [host], int(host_stats["circuit"] != CircuitBreaker.closed)
+            )
+            cumulative, buckets = 0, []
+            for bound, count in zip(
+                [*latency_buckets, float("inf")], host_stats["latency_buckets"]
+            ):
+                cumulative += count
+                buckets.append(
+                    ("+Inf" if bound == float("inf") else str(bound), cumulative)
+                )
+            latency.add_metric([host], buckets, host_stats["latency_sum"])
+        return [
+            requests,
+            failures,
+            hedged,
+            rejected,
+            in_flight,
+            circuit_open,
+            latency,
+        ]
+
+
+metrics_collector = RemoteClientCollector()
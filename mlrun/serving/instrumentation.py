@@ -0,0 +1,193 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Serving graph instrumentation: per step latency histograms, error counters and queue wait times (Prometheus),
+and optional OpenTelemetry spans
+
+Enabled with ``mlrun.mlconf.serving.instrumentation.enabled``, the metrics are exposed by the serving function on
+the ``/serving-graph-metrics`` path (GET).
+"""
+
+import contextlib
+import datetime
+import inspect
+import random
+import time
+import typing
+
+from mlrun.config import config
+
+# nuclio triggers whose events were queued (in a stream) before being consumed by the graph
+_stream_trigger_kinds = ["v3io-stream", "kafka-cluster", "kafka"]
+
+
+class GraphInstrumentation:
+    """Instruments the steps of a serving graph"""
+
+    def __init__(
+        self,
+        project: str,
+        function: str,
+        sample_rate: float = 1.0,
+        tracer=None,
+        trace_sample_rate: float = 0.0,
+    ):
+        """
+        :param project:           Project name (metrics label).
+        :param function:          Serving function name (metrics label).
+        :param sample_rate:       Fraction of the events whose step latencies are observed (errors are always counted).
+        :param tracer:            OpenTelemetry tracer, None to disable the spans.
+        :param trace_sample_rate: Fraction of the events which are traced (a span per step).
+        """
+        import mlrun.model_monitoring.prometheus
+
+        from .http_client import metrics_collector
+
+        self._prometheus = mlrun.model_monitoring.prometheus
+        # the pool and latency metrics of the remote steps http client
+        self._prometheus.register_graph_collector(metrics_collector)
+        self.project = project or ""
+        self.function = function or ""
+        self.sample_rate = sample_rate
+        self.tracer = tracer
+        self.trace_sample_rate = trace_sample_rate
+        self._get_current_span = None
+        if tracer is not None:
+            from opentelemetry import trace
+
+            self._get_current_span = trace.get_current_span
+
+    @classmethod
+    def from_config(
+        cls, project: str, function: str
+    ) -> typing.Optional["GraphInstrumentation"]:
+        """Create the graph instrumentation from the serving config, None if it is disabled"""
+        instrumentation_config = config.serving.instrumentation
+        if not instrumentation_config.enabled:
+            return None
+        try:
+            import prometheus_client  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                'prometheus_client is not installed, run "pip install prometheus_client" first!'
+            )
+
+        tracer = None
+        if instrumentation_config.tracing.enabled:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError(
+                    'opentelemetry is not installed, run "pip install opentelemetry-api" first!'
+                )
+            tracer = trace.get_tracer("mlrun.serving")
+        return cls(
+            project,
+            function,
+            sample_rate=float(instrumentation_config.sample_rate),
+            tracer=tracer,
+            trace_sample_rate=float(instrumentation_config.tracing.sample_rate),
+        )
+
+    def wrap(self, step_name: str, handler: typing.Callable) -> typing.Callable:
+        """Wrap a step handler, observe its latency and count its errors (sync and async handlers)"""
+        latency, errors = self._prometheus.get_graph_step_metrics(
+            self.project, self.function, step_name
+        )
+        sample_rate = self.sample_rate
+        step_span = self._step_span if self.tracer is not None else None
+
+        if inspect.iscoroutinefunction(handler):
+
+            async def instrumented_async_handler(*args, **kwargs):
+                sampled = sample_rate >= 1 or random.random() < sample_rate
+                start = time.perf_counter()
+                try:
+                    if step_span is None:
+                        return await handler(*args, **kwargs)
+                    with step_span(step_name):
+                        return await handler(*args, **kwargs)
+                except Exception:
+                    errors.inc()
+                    raise
+                finally:
+                    if sampled:
+                        latency.observe(time.perf_counter() - start)
+
+            return instrumented_async_handler
+
+        def instrumented_handler(*args, **kwargs):
+            sampled = sample_rate >= 1 or random.random() < sample_rate
+            start = time.perf_counter()
+            try:
+                if step_span is None:
+                    return handler(*args, **kwargs)
+                with step_span(step_name):
+                    return handler(*args, **kwargs)
+            except Exception:
+                errors.inc()
+                raise
+            finally:
+                if sampled:
+                    latency.observe(time.perf_counter() - start)
+
+        return instrumented_handler
+
+    def event_span(self, event):
+        """Context of an event run through the graph, traces the event (when sampled) and observes its queue wait"""
+        self._observe_queue_wait(event)
+        if self.tracer is None or random.random() >= self.trace_sample_rate:
+            return contextlib.nullcontext()
+        return self.tracer.start_as_current_span(
+            "serving-graph",
+            attributes={
+                "mlrun.project": self.project,
+                "mlrun.function": self.function,
+                "mlrun.event_id": str(getattr(event, "id", "")),
+                "mlrun.event_path": str(getattr(event, "path", "")),
+            },
+        )
+
+    def _step_span(self, step_name: str):
+        # steps are traced only within a sampled (recording) event span
+        if not self._get_current_span().is_recording():
+            return contextlib.nullcontext()
+        return self.tracer.start_as_current_span(step_name)
+
+    def _observe_queue_wait(self, event):
+        trigger = getattr(event, "trigger", None)
+        if getattr(trigger, "kind", None) not in _stream_trigger_kinds:
+            return
+        timestamp = getattr(event, "timestamp", None)
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.datetime.fromisoformat(timestamp)
+            except ValueError:
+                return
+        if not isinstance(timestamp, datetime.datetime):
+            return
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        wait = (
+            datetime.datetime.now(datetime.timezone.utc) - timestamp
+        ).total_seconds()
+        self._prometheus.write_graph_queue_wait(
+            self.project,
+            self.function,
+            getattr(trigger, "name", "") or "",
+            max(wait, 0.0),
+        )
+
+    def get_metrics(self) -> str:
+        """The graph metrics in the Prometheus exposition format"""
+        return self._prometheus.get_graph_metrics()
@@ -13,21 +13,70 @@
 # limitations under the License.
 #
 
+import re
+import time
+
 import storey
 
+import mlrun.errors
+
+# a key path accessor, e.g. .id or ["doc_id"] or [3]
+_accessor_pattern = re.compile(
+    r"""\s*(?:\.\s*([A-Za-z_]\w*)|\[\s*(?:'([^']*)'|"([^"]*)"|(-?\d+))\s*\])"""
+)
+
+
+def _compile_key_path(key_path: str):
+    """compile a join key path (e.g. 'event["doc_id"]' or "event.id") into a function, without eval
+
+    paths which do not start with "event" are dot separated paths in the event, e.g. "doc.id"
+    """
+    key_path = key_path.strip()
+    if not key_path.startswith("event"):
+        keys = key_path.split(".")
+
+        def get_path(event):
+            for key in keys:
+                event = event[key]
+            return event
+
+        return get_path
+
+    accessors = []
+    position = len("event")
+    while position < len(key_path):
+        match = _accessor_pattern.match(key_path, position)
+        if not match:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"unsupported merge key_path {key_path}, expected a path such as event['key'] or event.id "
+                f"(overwrite get_join_key() for custom keys)"
+            )
+        attribute, single_quoted, double_quoted, index = match.groups()
+        if attribute is not None:
+            accessors.append((True, attribute))
+        elif index is not None:
+            accessors.append((False, int(index)))
+        else:
+            accessors.append(
+                (False, single_quoted if single_quoted is not None else double_quoted)
+            )
+        position = match.end()
+
+    def get_key(event):
+        for is_attribute, key in accessors:
+            event = getattr(event, key) if is_attribute else event[key]
+        return event
+
+    return get_key
+
 
 class CacheEntry:
-    def __init__(self, sequence, event):
+    def __init__(self, event, created: float = None):
         self.arrived = 1
-        self.sequence = sequence
+        self.created = time.monotonic() if created is None else created
         self.events = [event]
-        self.is_late = False
 
     def add_event(self, context, event, merge_key):
-        if self.is_late:
-            context.logger.warning(f"event id {self} arrived late")
-            return None
-
         if context.verbose:
             context.logger.info(f"event id {merge_key} part {self.arrived} arrived")
         self.arrived += 1
@@ -35,29 +84,48 @@ class CacheEntry:
 
 
 class Merge(storey.Flow):
+    late_policies = ["drop", "emit", "error"]
+
     def __init__(
         self,
         full_event: bool = None,
         key_path: str = None,
         max_behind: int = None,
         expected_num_events: int = None,
+        timeout: float = None,
+        late_policy: str = None,
         **kwargs,
     ):
         """Merge multiple events based on event id or provided key path
 
         Users can subclass and overwrite the `get_join_key()` and `merge_function()` with custom logic
 
+        partial (unmerged) events are dropped when they wait longer than the timeout, or when there are more than
+        max_behind partial keys (the oldest ones are dropped), the parts of dropped keys which arrive later are handled
+        according to the late_policy. the counts of the merged, expired (dropped) and late events are available in
+        the `stats` property.
+
         :param key_path:   path to the event join key e.g. 'event["doc_id"]', default is the unique event id
-        :param max_behind: max queue size to hold unmerged events,
-                           oldest events will be dropped is queued longer (default=64)
+        :param max_behind: max number of keys with partial events to hold,
+                           oldest keys will be dropped when it is exceeded (default=64)
         :param expected_num_events:  manually set the expected number of events per key
                                      (keep blank to auto detect from the graph)
+        :param timeout:    max seconds to wait for the rest of the events of a key (default is no timeout), expired
+                           keys are dropped when the next events arrive
+        :param late_policy: how to handle events of dropped keys which arrive late: "drop" (default) drops them,
+                            "emit" passes them downstream unmerged, "error" pushes them to the error stream
         :param full_event: this step accepts the full Event object (body + metadata), not just body
         :param kwargs:     reserved for system use
         """
+        if late_policy and late_policy not in self.late_policies:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"illegal late_policy {late_policy}, must be one of {self.late_policies}"
+            )
         self.key_path = key_path
         self.max_behind = max_behind
         self.expected_num_events = expected_num_events
+        self.timeout = timeout
+        self.late_policy = late_policy
 
         # use event.id (require full event) by default
         if full_event is None and not key_path:
@@ -66,11 +134,15 @@ class Merge(storey.Flow):
         super().__init__(full_event=full_event, **kwargs)
 
         self._uplinks = None
+        # partial entries by key, in arrival order (the oldest first)
         self._cache = {}
-        self._sequence = 0
+        # keys which were dropped, mapped to the number of their parts which did not arrive yet
+        self._late_keys = {}
         self._get_join_key = None
-        self._queue_len = max_behind or 64  # default queue is 64 entries
-        self._keys_queue = []
+        self._max_pending = max_behind or 64  # default is 64 keys
+        self.merged = 0
+        self.expired = 0
+        self.late = 0
 
     def post_init(self, mode="sync"):
         # auto detect number of uplinks or use user specified value
@@ -79,9 +151,17 @@ class Merge(storey.Flow):
         )
 
         # function to extract the join key from the event
-        key_path = self.key_path or "event.id"
-        self._get_join_key = eval("lambda event: " + key_path, {}, {})
-        self._keys_queue = [None] * self._queue_len
+        self._get_join_key = _compile_key_path(self.key_path or "event.id")
+
+    @property
+    def stats(self) -> dict:
+        """counts of the merged events, the expired (dropped) partial events and the late events"""
+        return {
+            "merged": self.merged,
+            "expired": self.expired,
+            "late": self.late,
+            "pending": len(self._cache),
+        }
 
     def get_join_key(self, event):
         """function extract the join key from the event, can be overwritten by sub class"""
@@ -93,55 +173,107 @@ class Merge(storey.Flow):
         else:
             element = self._get_event_or_body(event)
             fn_result = self._merge_events(element)
+            if fn_result is self._late_event:
+                if self.late_policy == "emit":
+                    await self._do_downstream(event)
+                return
             if fn_result:
                 mapped_event = self._user_fn_output_to_event(event, fn_result)
                 await self._do_downstream(mapped_event)
 
+    # marks a late event (of a dropped key)
+    _late_event = object()
+
     def _merge_events(self, event):
         # skip if only one uplink
         if self._uplinks <= 1:
             return event
 
+        now = time.monotonic()
+        if self.timeout:
+            self._expire(now)
+
         merge_key = self.get_join_key(event)
-        if merge_key in self._cache:
+        entry: CacheEntry = self._cache.get(merge_key)
+        if entry is not None:
             # old events with that key already exist (cached)
-            entry: CacheEntry = self._cache[merge_key]
             entry.add_event(self.context, event, merge_key)
 
-            if entry.arrived == self._uplinks:
+            if entry.arrived >= self._uplinks:
                 # expected number of events arrived, can merge them
                 if self.context.verbose:
                     self.context.logger.info(
                         f"event {merge_key}, all {entry.arrived} parts arrived"
                     )
                 del self._cache[merge_key]
-                self._keys_queue[entry.sequence % self._queue_len] = None
+                self.merged += entry.arrived
                 return self.merge_function(event, entry.events)
-        else:
-            # first time the key arrives
-            self._cache[merge_key] = CacheEntry(self._sequence, event)
-            queue_index = self._sequence % self._queue_len
-            old_key = self._keys_queue[queue_index]
-
-            if self.context.verbose:
-                self.context.logger.info(f"new event id {merge_key} arrived")
-
-            if old_key is not None:
-                # reached max queued entries, need to drop the old event
-                message = (
-                    f"missing parts for event key {old_key} after a long wait, dropping"
-                )
-                self.context.logger.warning(message)
-                if self._full_event:
-                    self.context.push_error(
-                        self._cache[old_key].events[0], f"{message}", source=self.name
-                    )
-                self._cache[old_key].is_late = True
-
-            self._keys_queue[queue_index] = merge_key
-            self._sequence += 1
             return None
 
+        if merge_key in self._late_keys:
+            return self._handle_late(merge_key, event)
+
+        # first time the key arrives
+        if self.context.verbose:
+            self.context.logger.info(f"new event id {merge_key} arrived")
+        self._cache[merge_key] = CacheEntry(event, now)
+        if len(self._cache) > self._max_pending:
+            # reached max pending keys, need to drop the oldest one
+            oldest_key = next(iter(self._cache))
+            self._drop(
+                oldest_key,
+                f"missing parts for event key {oldest_key} after a long wait, dropping",
+            )
+        return None
+
+    def _expire(self, now: float):
+        # the entries are ordered by arrival, so only the oldest ones need to be checked
+        while self._cache:
+            oldest_key = next(iter(self._cache))
+            if now - self._cache[oldest_key].created < self.timeout:
+                break
+            self._drop(
+                oldest_key,
+                f"missing parts for event key {oldest_key} after {self.timeout} seconds, dropping",
+            )
+
+    def _drop(self, key, message: str):
+        entry = self._cache.pop(key)
+        self.expired += entry.arrived
+        self.context.logger.warning(message)
+        if self._full_event:
+            self.context.push_error(entry.events[0], f"{message}", source=self.name)
+
+        # remember the key, to detect its late parts (bounded like the pending keys)
+        self._late_keys[key] = self._uplinks - entry.arrived
+        if len(self._late_keys) > self._max_pending:
+            del self._late_keys[next(iter(self._late_keys))]
+
+    def _handle_late(self, key, event):
+        self.late += 1
+        self._late_keys[key] -= 1
+        if self._late_keys[key] <= 0:
+            del self._late_keys[key]
+        message = f"event id {key} arrived late"
+        self.context.logger.warning(message)
+        if self.late_policy == "error" and self._full_event:
+            self.context.push_error(event, message, source=self.name)
+        return self._late_event
+
+    def merge_branches(self, events: list):
+        """merge the events of the branches of a sync flow (joined per event by the flow, no join key is needed)
+
+        :param events: the event of each branch, ordered like the merged steps
+        :return: merged event
+        """
+        last_event = events[-1]
+        if self._full_event:
+            return self.merge_function(last_event, events)
+        last_event.body = self.merge_function(
+            last_event.body, [event.body for event in events]
+        )
+        return last_event
+
     def merge_function(self, last_event, events):
         """logic to merge all gathered events to a result event, can be overwritten by sub class
 
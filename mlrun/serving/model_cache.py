@@ -0,0 +1,293 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per pod model files cache, shared by the serving workers
+
+Remote model files are downloaded once into a local cache directory (``mlrun.mlconf.serving.model_cache.path``),
+the workers (processes) of the pod which load the same model reuse the downloaded file, and the least recently used
+files are removed once the cache grows over ``mlrun.mlconf.serving.model_cache.max_size_mb``. Weights which are
+loaded with :py:func:`load_weights` are memory mapped (read-only), so the workers share the same (page cache) memory
+instead of holding a private copy each.
+"""
+
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import time
+import typing
+
+import numpy as np
+
+import mlrun.datastore
+import mlrun.errors
+from mlrun.config import config
+
+try:
+    import fcntl
+except (
+    ImportError
+):  # not available on windows, the downloads are still atomic (but may be repeated)
+    fcntl = None
+
+_safetensors_dtypes = {
+    "BOOL": np.dtype("bool"),
+    "U8": np.dtype("<u1"),
+    "I8": np.dtype("<i1"),
+    "U16": np.dtype("<u2"),
+    "I16": np.dtype("<i2"),
+    "U32": np.dtype("<u4"),
+    "I32": np.dtype("<i4"),
+    "U64": np.dtype("<u8"),
+    "I64": np.dtype("<i8"),
+    "F16": np.dtype("<f2"),
+    "F32": np.dtype("<f4"),
+    "F64": np.dtype("<f8"),
+}
+
+
+def get_cache_dir() -> str:
+    """The local model cache directory (created if it does not exist)"""
+    path = config.serving.model_cache.path or os.path.join(
+        tempfile.gettempdir(), "mlrun-model-cache"
+    )
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_local_path(url: str, related_urls: list = None, cache_dir: str = None) -> str:
+    """Get a local path of a (remote) file, download it into the cache once (reused by the other workers)
+
+    :param url:          File url, local files are returned as is.
+    :param related_urls: Urls of files which are loaded together with the file (e.g. ONNX external data files),
+                         downloaded into the same directory as the file.
+    :param cache_dir:    The cache directory, default is the configured model cache path.
+
+    :return: The local file path.
+    """
+    obj = mlrun.datastore.store_manager.object(url=url)
+    if obj.kind == "file":
+        return url
+
+    # the file version is a part of the cache key, so updated files (with the same url) are downloaded again
+    version = ""
+    try:
+        stat = obj.stat()
+        version = f"{stat.size}:{stat.modified}"
+    except Exception:
+        pass
+    entry_key = hashlib.sha256(f"{url}\n{version}".encode()).hexdigest()
+    entry_dir = os.path.join(cache_dir or get_cache_dir(), entry_key[:32])
+    os.makedirs(entry_dir, exist_ok=True)
+
+    local_path = _download(obj, url, entry_dir)
+    for related_url in related_urls or []:
+        _download(
+            mlrun.datastore.store_manager.object(url=related_url),
+            related_url,
+            entry_dir,
+        )
+    # the entry dir modification time is its last use
+    os.utime(entry_dir)
+    _evict(os.path.dirname(entry_dir), keep=entry_dir)
+    return local_path
+
+
+def _download(obj, url: str, entry_dir: str) -> str:
+    local_path = os.path.join(entry_dir, os.path.basename(url.rstrip("/")) or "model")
+    if os.path.exists(local_path):
+        return local_path
+
+    with _lock_entry(entry_dir):
+        # another worker may have downloaded the file while this one waited for the lock
+        if not os.path.exists(local_path):
+            # the entry may have been evicted while this worker waited for the lock
+            os.makedirs(entry_dir, exist_ok=True)
+            temp_path = f"{local_path}.{os.getpid()}.tmp"
+            try:
+                obj.download(temp_path)
+                os.replace(temp_path, local_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+    return local_path
+
+
+def _evict(cache_dir: str, keep: str):
+    """remove the least recently used entries while the cache is larger than its max size"""
+    max_size = int(config.serving.model_cache.max_size_mb) * 1024 * 1024
+    if max_size <= 0:
+        return
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if not entry.is_dir():
+            continue
+        size = sum(file.stat().st_size for file in os.scandir(entry.path))
+        entries.append((entry.stat().st_mtime, size, entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, entry_dir in sorted(entries):
+        if total_size <= max_size:
+            break
+        if entry_dir == keep:
+            continue
+        # the workers which already opened (or memory mapped) the files keep using them after they are removed
+        with _lock_entry(entry_dir):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        total_size -= size
+
+
+@contextlib.contextmanager
+def _lock_entry(entry_dir: str):
+    """exclusive (inter process) lock of a cache entry directory"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(entry_dir, ".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_weights(path: str) -> typing.Union[np.ndarray, dict[str, np.ndarray]]:
+    """Memory map model weights (read-only), the pages are shared by all the processes which map the same file
+
+    Supported formats are NumPy ``.npy`` files (returns an array) and ``.safetensors`` files (returns a dict of
+    arrays, read without the safetensors package). ONNX models should be loaded by path (e.g. with
+    ``onnxruntime.InferenceSession(path)``), their external data files are placed next to the model file by
+    :py:meth:`~mlrun.serving.V2ModelServer.get_model`.
+
+    :param path: Local weights file path (see :py:func:`get_local_path`).
+    """
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if path.endswith(".safetensors"):
+        return _load_safetensors(path)
+    raise mlrun.errors.MLRunInvalidArgumentError(
+        f"cannot memory map {path}, supported weights files are .npy and .safetensors"
+    )
+
+
+def _load_safetensors(path: str) -> dict[str, np.ndarray]:
+    # the format is an 8 bytes (little endian) header size, a json header and the tensors data
+    with open(path, "rb") as file:
+        header_size = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(header_size))
+    header.pop("__metadata__", None)
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=8 + header_size)
+
+    tensors = {}
+    for name, tensor in header.items():
+        dtype = _safetensors_dtypes.get(tensor["dtype"])
+        if dtype is None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"unsupported safetensors dtype {tensor['dtype']} (tensor {name}), "
+                f"supported dtypes are {list(_safetensors_dtypes)}"
+            )
+        start, end = tensor["data_offsets"]
+        tensors[name] = data[start:end].view(dtype).reshape(tensor["shape"])
+    return tensors
+
+
+def benchmark(path: str, workers: int = 4, timeout: float = 300) -> dict:
+    """Measure the load time and the memory of workers which load the same weights, copied vs. memory mapped
+
+    Each worker (process) loads the weights and touches all their pages (like inference does), the memory is the
+    sum of the workers proportional set size growth while loading (shared pages are split between the processes
+    which map them), requires linux.
+
+    :param path:    Local weights file path (.npy or .safetensors).
+    :param workers: Number of worker processes.
+    :param timeout: Max seconds to wait for the workers (of each mode).
+
+    :return: ``{"copy": {"load_seconds", "memory_mb"}, "mmap": {...}}``
+    """
+    results = {}
+    for mode in ["copy", "mmap"]:
+        context = multiprocessing.get_context("spawn")
+        stats_queue = context.Queue()
+        done = context.Event()
+        processes = [
+            context.Process(
+                target=_benchmark_worker, args=(path, mode, stats_queue, done)
+            )
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            stats = _get_workers_stats(stats_queue, processes, timeout)
+        finally:
+            done.set()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        results[mode] = {
+            "load_seconds": max(load_seconds for load_seconds, _ in stats),
+            "memory_mb": sum(pss for _, pss in stats) / 1024,
+        }
+    return results
+
+
+def _get_workers_stats(stats_queue, processes, timeout: float) -> list:
+    stats = []
+    deadline = time.monotonic() + timeout
+    while len(stats) < len(processes):
+        try:
+            stats.append(stats_queue.get(timeout=1))
+            continue
+        except queue.Empty:
+            pass
+        # workers only exit after reporting (once done is set), an exited worker failed
+        failed = [process.exitcode for process in processes if not process.is_alive()]
+        if failed:
+            raise mlrun.errors.MLRunRuntimeError(
+                f"benchmark workers failed (exit codes {failed}) loading the weights"
+            )
+        if time.monotonic() > deadline:
+            raise mlrun.errors.MLRunRuntimeError(
+                f"benchmark workers did not load the weights within {timeout} seconds"
+            )
+    return stats
+
+
+def _benchmark_worker(path, mode, stats_queue, done):
+    pss_before = _get_pss_kb()
+    start = time.perf_counter()
+    weights = load_weights(path)
+    arrays = list(weights.values()) if isinstance(weights, dict) else [weights]
+    if mode == "copy":
+        # private copies (like a regular load), the mapping is released
+        arrays = [np.array(array) for array in arrays]
+        del weights
+    for array in arrays:
+        # touch all the pages
+        array.sum()
+    load_seconds = time.perf_counter() - start
+    # the workers report their memory while all of them hold the weights
+    stats_queue.put((load_seconds, _get_pss_kb() - pss_before))
+    done.wait()
+
+
+def _get_pss_kb() -> int:
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
@@ -16,7 +16,6 @@ import asyncio
 import json
 
 import aiohttp
-import requests
 import storey
 from storey.flow import _ConcurrentJobExecution
 
@@ -25,6 +24,7 @@ import mlrun.config
 from mlrun.errors import err_to_str
 from mlrun.utils import logger
 
+from .http_client import get_http_client
 from .utils import (
     _extract_input_data,
     _update_result_body,
@@ -52,6 +52,7 @@ class RemoteStep(storey.SendToHttp):
         retries=None,
         backoff_factor=None,
         timeout=None,
+        hedge_after=None,
         **kwargs,
     ):
         """class for calling remote endpoints
@@ -85,6 +86,9 @@ class RemoteStep(storey.SendToHttp):
         :param retries:     number of retries (in exponential backoff)
         :param backoff_factor: A backoff factor in seconds to apply between attempts after the second try
         :param timeout:     How long to wait for the server to send data before giving up, float in seconds
+        :param hedge_after: Seconds after which a slow request is hedged (a second request is sent and the first
+                            response is used), default to mlrun.mlconf.serving.remote.hedge_after, 0 to disable.
+                            note that hedged requests may reach the server twice
         """
         # init retry args for storey
         retries = default_retries if retries is None else retries
@@ -107,10 +111,11 @@ class RemoteStep(storey.SendToHttp):
         self.subpath = subpath
 
         self.timeout = timeout
+        self.hedge_after = hedge_after
 
         self._append_event_path = False
         self._endpoint = ""
-        self._session = None
+        self._http_client = None
         self._url_function_handler = None
         self._body_function_handler = None
 
@@ -135,27 +140,37 @@ class RemoteStep(storey.SendToHttp):
             if not self._append_event_path:
                 self._endpoint = self._endpoint + "/" + self.subpath.lstrip("/")
 
+    async def _lazy_init(self):
+        # the connection pool is shared by the remote steps (of the event loop)
+        self._http_client = get_http_client()
+        self._http_client.acquire()
+
+    async def _cleanup(self):
+        if self._http_client:
+            await self._http_client.release()
+
     async def _process_event(self, event):
         # async implementation (with storey)
         body = self._get_event_or_body(event)
         method, url, headers, body = self._generate_request(event, body)
-        kwargs = {}
-        if self.timeout:
-            kwargs["timeout"] = aiohttp.ClientTimeout(total=self.timeout)
         try:
-            resp = await self._client_session.request(
-                method, url, headers=headers, data=body, ssl=False, **kwargs
+            resp = await self._http_client.request(
+                method,
+                url,
+                headers=headers,
+                data=body,
+                timeout=self.timeout,
+                hedge_after=self.hedge_after,
             )
             if resp.status >= 500:
-                text = await resp.text()
-                raise RuntimeError(f"bad http response {resp.status}: {text}")
+                raise RuntimeError(f"bad http response {resp.status}: {resp.text}")
             return resp
         except asyncio.TimeoutError as exc:
             logger.error(f"http request to {url} timed out in RemoteStep {self.name}")
             raise exc
 
     async def _handle_completed(self, event, response):
-        response_body = await response.read()
+        response_body = response.body
         if response.status >= 400:
             raise ValueError(
                 f"For event {event}, RemoteStep {self.name} got an unexpected response "
@@ -168,37 +183,36 @@ class RemoteStep(storey.SendToHttp):
         await self._do_downstream(new_event)
 
     def do_event(self, event):
-        # sync implementation (without storey)
-        if not self._session:
-            self._session = mlrun.utils.HTTPSessionWithRetry(
-                self.retries,
-                self.backoff_factor or mlrun.mlconf.http_retry_defaults.backoff_factor,
-                retry_on_exception=False,
-                retry_on_status=self.retries > 0,
-                retry_on_post=True,
-            )
-
+        # sync implementation (without storey), the requests run on the event loop of the shared http client
         body = _extract_input_data(self._input_path, event.body)
         method, url, headers, body = self._generate_request(event, body)
         try:
-            resp = self._session.request(
+            resp = get_http_client().request_sync(
                 method,
                 url,
-                verify=mlrun.mlconf.httpdb.http.verify,
                 headers=headers,
                 data=body,
                 timeout=self.timeout,
+                ssl_verify=mlrun.mlconf.httpdb.http.verify,
+                hedge_after=self.hedge_after,
+                retries=self.retries,
+                backoff_factor=self.backoff_factor
+                or mlrun.mlconf.http_retry_defaults.backoff_factor,
+                retry_statuses=mlrun.mlconf.http_retry_defaults.status_codes,
             )
-        except requests.exceptions.ReadTimeout as err:
-            raise requests.exceptions.ReadTimeout(
+        except mlrun.errors.MLRunServiceUnavailableError:
+            # the circuit breaker of the host is open
+            raise
+        except asyncio.TimeoutError as err:
+            raise TimeoutError(
                 f"http request to {url} timed out in RemoteStep {self.name}, {err_to_str(err)}"
             )
-        except OSError as err:
+        except (aiohttp.ClientError, OSError) as err:
             raise OSError(f"cannot invoke url: {url}, {err_to_str(err)}")
         if not resp.ok:
-            raise RuntimeError(f"bad http response {resp.status_code}: {resp.text}")
+            raise RuntimeError(f"bad http response {resp.status}: {resp.text}")
 
-        result = self._get_data(resp.content, resp.headers)
+        result = self._get_data(resp.body, resp.headers)
         event.body = _update_result_body(self._result_path, event.body, result)
         return event
 
@@ -253,6 +267,7 @@ class BatchHttpRequests(_ConcurrentJobExecution):
         retries=None,
         backoff_factor=None,
         timeout=None,
+        hedge_after=None,
         **kwargs,
     ):
         """class for calling remote endpoints in parallel
@@ -298,6 +313,9 @@ class BatchHttpRequests(_ConcurrentJobExecution):
         :param retries:     number of retries (in exponential backoff)
         :param backoff_factor: A backoff factor in seconds to apply between attempts after the second try
         :param timeout:     How long to wait for the server to send data before giving up, float in seconds
+        :param hedge_after: Seconds after which a slow request is hedged (a second request is sent and the first
+                            response is used), default to mlrun.mlconf.serving.remote.hedge_after, 0 to disable.
+                            note that hedged requests may reach the server twice
         """
         if url and url_expression:
             raise mlrun.errors.MLRunInvalidArgumentError(
@@ -313,25 +331,26 @@ class BatchHttpRequests(_ConcurrentJobExecution):
         super().__init__(input_path=input_path, result_path=result_path, **kwargs)
 
         self.timeout = timeout
+        self.hedge_after = hedge_after
         self.retries = retries
         self.backoff_factor = backoff_factor
         self._append_event_path = False
         self._endpoint = ""
-        self._session = None
         self._url_function_handler = None
         self._body_function_handler = None
-        self._request_args = {}
 
     def _init(self):
         super()._init()
-        self._client_session = None
+        self._http_client = None
 
     async def _lazy_init(self):
-        connector = aiohttp.TCPConnector()
-        self._client_session = aiohttp.ClientSession(connector=connector)
+        # the connection pool is shared by the remote steps (of the event loop)
+        self._http_client = get_http_client()
+        self._http_client.acquire()
 
     async def _cleanup(self):
-        await self._client_session.close()
+        if self._http_client:
+            await self._http_client.release()
 
     def post_init(self, mode="sync"):
         self._endpoint = self.url
@@ -349,8 +368,6 @@ class BatchHttpRequests(_ConcurrentJobExecution):
             )
         elif self.subpath:
             self._endpoint = self._endpoint + "/" + self.subpath.lstrip("/")
-        if self.timeout:
-            self._request_args["timeout"] = aiohttp.ClientTimeout(total=self.timeout)
 
     async def _process_event(self, event):
         # async implementation (with storey)
@@ -393,13 +410,17 @@ class BatchHttpRequests(_ConcurrentJobExecution):
         return await self._process_event(event)
 
     async def _submit(self, method, url, headers, body):
-        async with self._client_session.request(
-            method, url, headers=headers, data=body, ssl=False, **self._request_args
-        ) as future:
-            if future.status >= 500:
-                text = await future.text()
-                raise RuntimeError(f"bad http response {future.status}: {text}")
-            return await future.read(), future.headers
+        response = await self._http_client.request(
+            method,
+            url,
+            headers=headers,
+            data=body,
+            timeout=self.timeout,
+            hedge_after=self.hedge_after,
+        )
+        if response.status >= 500:
+            raise RuntimeError(f"bad http response {response.status}: {response.text}")
+        return response.body, response.headers
 
     async def _submit_with_retries(self, method, url, headers, body):
         times_attempted = 0
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import concurrent
 import concurrent.futures
 import copy
 import json
+import threading
 import traceback
 import typing
 from enum import Enum
@@ -166,6 +168,62 @@ class BaseModelRouter(RouterToDict):
 
 
 class ModelRouter(BaseModelRouter):
+    def __init__(
+        self,
+        context=None,
+        name: str = None,
+        routes=None,
+        protocol: str = None,
+        url_prefix: str = None,
+        health_prefix: str = None,
+        input_path: str = None,
+        result_path: str = None,
+        lazy_load: bool = False,
+        memory_budget: float = None,
+        **kwargs,
+    ):
+        """Model Serving Router, route between child models by the request url or the model in the body
+
+        the models are loaded in parallel when the router is initialized (see
+        mlrun.mlconf.serving.router_init_max_workers), or, with lazy_load, on their first request. lazy loaded
+        models are evicted (unloaded) when the memory budget is exceeded, least recently used first, and are loaded
+        again on their next request (models which are handling a request are not evicted). the model memory size
+        is set by its load() method (model_size), otherwise it is the size of its model files.
+
+        :param context:       for internal use (passed in init)
+        :param name:          step name
+        :param routes:        for internal use (routes passed in init)
+        :param protocol:      serving API protocol (default "v2")
+        :param url_prefix:    url prefix for the router (default /v2/models)
+        :param health_prefix: health api url prefix (default /v2/health)
+        :param input_path:    when specified selects the key/path in the event to use as body
+                              this require that the event body will behave like a dict, example:
+                              event: {"data": {"a": 5, "b": 7}}, input_path="data.b" means request body will be 7
+        :param result_path:   selects the key/path in the event to write the results to
+                              this require that the event body will behave like a dict, example:
+                              event: {"x": 5} , result_path="resp" means the returned response will be written
+                              to event["y"] resulting in {"x": 5, "resp": <result>}
+        :param lazy_load:     load the models on their first request (instead of when the router is initialized)
+        :param memory_budget: max memory (in MB) of the lazy loaded models, None for unlimited
+        :param kwargs:        extra arguments
+        """
+        super().__init__(
+            context=context,
+            name=name,
+            routes=routes,
+            protocol=protocol,
+            url_prefix=url_prefix,
+            health_prefix=health_prefix,
+            input_path=input_path,
+            result_path=result_path,
+            **kwargs,
+        )
+        self.lazy_load = lazy_load
+        self.memory_budget = memory_budget
+        # the loaded (lazy) models and their memory size, the least recently used first
+        self._loaded_models = collections.OrderedDict()
+        self._loaded_models_lock = threading.Lock()
+
     def _resolve_route(self, body, urlpath):
         subpath = None
         model = ""
@@ -209,8 +267,37 @@ class ModelRouter(BaseModelRouter):
         event.path = subpath
         response = route.run(event)
         event.body = response.body if response else None
+        if self.lazy_load:
+            self._update_loaded_models(name, route)
         return event
 
+    def _update_loaded_models(self, name: str, route):
+        model = getattr(route, "_object", None)
+        if not getattr(model, "ready", False):
+            return
+        with self._loaded_models_lock:
+            self._loaded_models[name] = getattr(model, "model_size", None) or 0
+            self._loaded_models.move_to_end(name)
+            if self.memory_budget is None:
+                return
+            budget = self.memory_budget * 1024 * 1024
+            # evict the least recently used models, except for the model which was just used and the models which
+            # are handling a request
+            for evicted_name in list(self._loaded_models):
+                if sum(self._loaded_models.values()) <= budget:
+                    break
+                evicted_model = self.routes[evicted_name]._object
+                if (
+                    evicted_name == name
+                    or not hasattr(evicted_model, "_unload_and_update_state")
+                    or not evicted_model._unload_and_update_state()
+                ):
+                    continue
+                del self._loaded_models[evicted_name]
+                self.context.logger.info(
+                    f"evicted model {evicted_name} (memory budget {self.memory_budget}MB exceeded)"
+                )
+
 
 class ParallelRunnerModes(str, Enum):
     """Supported parallel running modes for VotingEnsemble"""
@@ -15,9 +15,10 @@
 __all__ = ["GraphServer", "create_graph_server", "GraphContext", "MockEvent"]
 
 import asyncio
-import json
+import copy
 import os
 import socket
+import time
 import traceback
 import uuid
 from typing import Optional, Union
@@ -31,12 +32,17 @@ from mlrun.errors import err_to_str
 from mlrun.secrets import SecretsStore
 
 from ..common.helpers import parse_versioned_object_uri
-from ..common.schemas.model_monitoring.constants import FileTargetKind
+from ..common.schemas.model_monitoring.constants import (
+    FileTargetKind,
+    PrometheusEndpoints,
+)
 from ..datastore import get_stream_pusher
 from ..datastore.store_resources import ResourceCache
 from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj
 from ..utils import get_caller_globals
+from .codecs import default_codec, get_codec
+from .instrumentation import GraphInstrumentation
 from .states import RootFlowStep, RouterStep, get_function, graph_root_setter
 from .utils import (
     event_id_key,
@@ -176,6 +182,7 @@ class GraphServer(ModelObj):
         )
         context.get_table = self.resource_cache.get_table
         context.verbose = self.verbose
+        context.instrumentation = self._init_instrumentation()
         self.context = context
 
         if self.graph_initializer:
@@ -187,6 +194,15 @@ class GraphServer(ModelObj):
 
         context.root = self.graph
 
+    def _init_instrumentation(self) -> Optional[GraphInstrumentation]:
+        project, function_name = "", ""
+        if self.function_uri:
+            project, function_name, _, _ = parse_versioned_object_uri(self.function_uri)
+        if self._current_function and self._current_function != "*":
+            # a child function of the graph
+            function_name = self._current_function
+        return GraphInstrumentation.from_config(project, function_name)
+
     def init_object(self, namespace):
         self.graph.init_object(self.context, namespace, self.load_mode, reset=True)
 
@@ -246,6 +262,103 @@ class GraphServer(ModelObj):
             raise RuntimeError(f"failed ({resp.status_code}): {resp.body}")
         return resp
 
+    def benchmark(
+        self,
+        path: str = "/",
+        body: Union[str, bytes, dict] = None,
+        method: str = "",
+        headers: Optional[str] = None,
+        content_type: Optional[str] = None,
+        iterations: int = 1000,
+        warmup: int = 10,
+    ) -> dict:
+        """micro-benchmark the graph, invoke the same test event repeatedly and report the latency of the server
+        and of each step (in microseconds), e.g. to measure the per step overhead of deep preprocessing graphs
+
+        example::
+
+            server = function.to_mock_server()
+            stats = server.benchmark("/v2/models/my/infer", body={"inputs": [[5, 6]]})
+            print(stats["total"]["mean_us"], stats["steps"])
+
+        step latencies are measured for steps run by the sync engine (async flows run the steps through storey),
+        and include the latency of their child steps (routes, sub flows)
+
+        :param path:         api path, e.g. (/{router.url_prefix}/{model-name}/..) path
+        :param body:         message body (dict or json str/bytes), copied for every event
+        :param method:       optional, GET, POST, ..
+        :param headers:      optional, request headers, ..
+        :param content_type: optional, http mime type
+        :param iterations:   number of measured events
+        :param warmup:       number of events to run before measuring (e.g. to warm caches)
+        :return: dict with the total latency (mean/p50/p99) and the mean latency of each step
+        """
+        if iterations < 1:
+            raise MLRunInvalidArgumentError("iterations must be a positive number")
+        steps = {}
+        pending = [self.graph]
+        while pending:
+            step = pending.pop()
+            if step is not self.graph:
+                steps[step.fullname] = step
+            pending.extend(step.get_children() or [])
+
+        step_times = {name: [] for name in steps}
+
+        def timed_run(step, times):
+            run = step.run
+
+            def run_and_measure(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return run(*args, **kwargs)
+                finally:
+                    times.append(time.perf_counter() - start)
+
+            return run_and_measure
+
+        for name, step in steps.items():
+            step.run = timed_run(step, step_times[name])
+
+        total_times = []
+        try:
+            for index in range(warmup + iterations):
+                event_body = copy.deepcopy(body)
+                start = time.perf_counter()
+                self.test(
+                    path,
+                    event_body,
+                    method=method,
+                    headers=copy.copy(headers),
+                    content_type=content_type,
+                )
+                if index >= warmup:
+                    total_times.append(time.perf_counter() - start)
+                else:
+                    for times in step_times.values():
+                        times.clear()
+        finally:
+            for step in steps.values():
+                del step.run
+
+        total_times.sort()
+        return {
+            "iterations": iterations,
+            "total": {
+                "mean_us": _mean_us(total_times),
+                "p50_us": total_times[len(total_times) // 2] * 1e6,
+                "p99_us": total_times[
+                    min(int(len(total_times) * 0.99), len(total_times) - 1)
+                ]
+                * 1e6,
+            },
+            "steps": {
+                name: {"calls": len(times), "mean_us": _mean_us(times)}
+                for name, times in step_times.items()
+                if times
+            },
+        }
+
     def run(self, event, context=None, get_body=False, extra_args=None):
         server_context = self.context
         context = context or server_context
@@ -256,24 +369,37 @@ class GraphServer(ModelObj):
             if event_path_key in event.headers:
                 event.path = event.headers.get(event_path_key)
 
-        if isinstance(event.body, (str, bytes)) and (
-            not event.content_type or event.content_type in ["json", "application/json"]
-        ):
-            # assume it is json and try to load
+        codec = get_codec(event.content_type, event.headers)
+        if isinstance(event.body, (str, bytes)) and codec:
             try:
-                body = json.loads(event.body)
-                event.body = body
-            except (json.decoder.JSONDecodeError, UnicodeDecodeError) as exc:
-                if event.content_type in ["json", "application/json"]:
-                    # if its json type and didnt load, raise exception
-                    message = f"failed to json decode event, {err_to_str(exc)}"
+                event.body = codec.decode(event.body, event.headers)
+            except (ValueError, UnicodeDecodeError, ImportError) as exc:
+                # bodies without a content type are assumed to be json, but are passed as is if they are not.
+                # ImportError is raised by codecs whose (optional) package is not installed
+                if event.content_type:
+                    # if its of the codec type and didnt decode, raise exception
+                    message = f"failed to decode event ({event.content_type}), {err_to_str(exc)}"
                     context.logger.error(message)
                     server_context.push_error(event, message, source="_handler")
                     return context.Response(
                         body=message, content_type="text/plain", status_code=400
                     )
+        instrumentation = server_context.instrumentation
         try:
-            response = self.graph.run(event, **(extra_args or {}))
+            if instrumentation:
+                if (
+                    event.path == PrometheusEndpoints.SERVING_GRAPH_METRICS
+                    and event.method == "GET"
+                ):
+                    return context.Response(
+                        body=instrumentation.get_metrics(),
+                        content_type="text/plain",
+                        status_code=200,
+                    )
+                with instrumentation.event_span(event):
+                    response = self.graph.run(event, **(extra_args or {}))
+            else:
+                response = self.graph.run(event, **(extra_args or {}))
         except Exception as exc:
             message = f"{exc.__class__.__name__}: {err_to_str(exc)}"
             if server_context.verbose:
@@ -285,22 +411,38 @@ class GraphServer(ModelObj):
             )
 
         if asyncio.iscoroutine(response):
-            return self._process_async_response(context, response, get_body)
+            return self._process_async_response(context, response, get_body, codec)
         else:
-            return self._process_response(context, response, get_body)
+            return self._process_response(context, response, get_body, codec)
 
-    async def _process_async_response(self, context, response, get_body):
-        return self._process_response(context, await response, get_body)
+    async def _process_async_response(self, context, response, get_body, codec=None):
+        return self._process_response(context, await response, get_body, codec)
 
-    def _process_response(self, context, response, get_body):
+    def _process_response(self, context, response, get_body, codec=None):
         body = response.body
         if isinstance(body, context.Response) or get_body:
             return body
 
         if body and not isinstance(body, (str, bytes)):
-            body = json.dumps(body)
+            # respond in the format of the request when possible
+            encoded = None
+            if codec:
+                try:
+                    encoded = codec.encode(body)
+                except (TypeError, ValueError, ImportError) as exc:
+                    context.logger.debug(
+                        f"failed to encode response ({codec.content_type}), "
+                        f"falling back to json, {err_to_str(exc)}"
+                    )
+            if encoded is None:
+                codec = default_codec
+                encoded = codec.encode(body)
+            body, headers = encoded
             return context.Response(
-                body=body, content_type="application/json", status_code=200
+                headers=headers,
+                body=body,
+                content_type=codec.content_type,
+                status_code=200,
             )
         return body
 
@@ -309,6 +451,10 @@ class GraphServer(ModelObj):
         return self.graph.wait_for_completion()
 
 
+def _mean_us(times: list) -> float:
+    return sum(times) / len(times) * 1e6 if times else 0.0
+
+
 def v2_serving_init(context, namespace=None):
     """hook for nuclio init_context()"""
 
@@ -477,6 +623,7 @@ class GraphContext:
         self.verbose = False
         self.stream = None
         self.root = None
+        self.instrumentation = None
 
         if nuclio_context:
             self.logger = nuclio_context.logger
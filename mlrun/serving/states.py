@@ -14,9 +14,12 @@
 
 __all__ = ["TaskStep", "RouterStep", "RootFlowStep", "ErrorStep"]
 
+import concurrent.futures
 import os
 import pathlib
+import threading
 import traceback
+import typing
 from copy import copy, deepcopy
 from inspect import getfullargspec, signature
 from typing import Union
@@ -33,7 +36,13 @@ from ..errors import MLRunInvalidArgumentError, err_to_str
 from ..model import ModelObj, ObjectDict
 from ..platforms.iguazio import parse_path
 from ..utils import get_class, get_function, is_explicit_ack_supported
-from .utils import StepToDict, _extract_input_data, _update_result_body
+from .utils import (
+    StepToDict,
+    _compile_input_path,
+    _compile_result_path,
+    _extract_input_data,
+    _update_result_body,
+)
 
 callable_prefix = "_"
 path_splitter = "/"
@@ -388,10 +397,12 @@ class TaskStep(BaseStep):
         self.on_error = None
         self._inject_context = False
         self._call_with_event = False
+        self._compiled_run = None
 
     def init_object(self, context, namespace, mode="sync", reset=False, **extra_kwargs):
         self.context = context
         self._async_object = None
+        self._compiled_run = None
         if not self._is_local_function(context):
             # skip init of non local functions
             return
@@ -406,7 +417,9 @@ class TaskStep(BaseStep):
             args = signature(self._handler).parameters
             if args and "context" in list(args.keys()):
                 self._inject_context = True
+            self._instrument_handler()
             self._set_error_handler()
+            self._compile()
             return
 
         self._class_object, self.class_name = self.get_step_class_object(
@@ -441,11 +454,63 @@ class TaskStep(BaseStep):
                     handler = "do"
             if handler:
                 self._handler = getattr(self._object, handler, None)
+                self._instrument_handler()
 
         self._set_error_handler()
+        self._compile()
         if mode != "skip":
             self._post_init(mode)
 
+    def _instrument_handler(self):
+        # observe the latency and the errors of the step (when the graph instrumentation is enabled)
+        instrumentation = getattr(self.context, "instrumentation", None)
+        if instrumentation and self._handler:
+            self._handler = instrumentation.wrap(self.fullname, self._handler)
+
+    def _compile(self):
+        """resolve the per event decisions of run() once (compiled graph mode), into a function specialized for
+        this step (context injection, verbose logging, input/result paths)"""
+        if not config.serving.compiled_graph or self._handler is None:
+            return
+        handler = self._handler
+        context = self.context
+        name = self.name
+        logger = context.logger if context.verbose else None
+        inject_context = self._inject_context
+        call_with_event = self.full_event or self._call_with_event
+        extract_input_data = _compile_input_path(self.input_path)
+        update_result_body = _compile_result_path(self.result_path)
+
+        def run(event, *args, **kwargs):
+            if logger:
+                logger.info(f"step {name} got event {event.body}")
+            if inject_context:
+                kwargs["context"] = context
+            elif kwargs:
+                kwargs.pop("context", None)
+
+            try:
+                if call_with_event:
+                    return handler(event, *args, **kwargs)
+                body = event.body
+                result = handler(
+                    extract_input_data(body) if extract_input_data else body,
+                    *args,
+                    **kwargs,
+                )
+                event.body = (
+                    update_result_body(body, result) if update_result_body else result
+                )
+            except Exception as exc:
+                if not self._on_error_handler:
+                    raise exc
+                self._log_error(event, exc)
+                result = self._call_error_handler(event, exc)
+                event.body = _update_result_body(self.result_path, event.body, result)
+            return event
+
+        self._compiled_run = run
+
     def get_full_class_args(self, namespace, class_object, **extra_kwargs):
         class_args = {}
         for key, arg in self.class_args.items():
@@ -499,6 +564,7 @@ class TaskStep(BaseStep):
 
     def clear_object(self):
         self._object = None
+        self._compiled_run = None
 
     def _post_init(self, mode="sync"):
         if self._object and hasattr(self._object, "post_init"):
@@ -516,6 +582,8 @@ class TaskStep(BaseStep):
 
     def run(self, event, *args, **kwargs):
         """run this step, in async flows the run is done through storey"""
+        if self._compiled_run:
+            return self._compiled_run(event, *args, **kwargs)
         if not self._is_local_function(self.context):
             # todo invoke remote via REST call
             return event
@@ -676,17 +744,49 @@ class RouterStep(TaskStep):
             context, namespace, "skip", reset=reset, routes=self._routes, **extra_kwargs
         )
 
-        for route in self._routes.values():
+        routes = list(self._routes.values())
+        for route in routes:
             if self.function and not route.function:
                 # if the router runs on a child function and the
                 # model function is not specified use the router function
                 route.function = self.function
             route.set_parent(self)
-            route.init_object(context, namespace, mode, reset=reset)
+
+        # lazy routers load the models on their first request
+        route_kwargs = {"lazy_load": True} if self._is_lazy_router() else {}
+        max_workers = min(config.serving.router_init_max_workers, len(routes))
+        # the models are loaded in parallel, the routes are initialized (and post initialized, which creates the
+        # model endpoint records) in sequence
+        parallel_load = max_workers > 1 and mode == "sync" and not route_kwargs
+        for route in routes:
+            route.init_object(
+                context,
+                namespace,
+                "skip" if parallel_load else mode,
+                reset=reset,
+                **route_kwargs,
+            )
+        if parallel_load:
+            models = [
+                route._object
+                for route in routes
+                if hasattr(getattr(route, "_object", None), "_init_load")
+            ]
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"{self.name}-init"
+            ) as executor:
+                futures = [executor.submit(model._init_load, mode) for model in models]
+                for future in futures:
+                    future.result()
+            for route in routes:
+                route._post_init(mode)
 
         self._set_error_handler()
         self._post_init(mode)
 
+    def _is_lazy_router(self):
+        return bool(getattr(self._object, "lazy_load", False))
+
     def __getitem__(self, name):
         return self._routes[name]
 
@@ -743,6 +843,7 @@ class QueueStep(BaseStep):
         self.options = options
         self.trigger_args = trigger_args
         self._stream = None
+        self._push = None
         self._async_object = None
 
     def init_object(self, context, namespace, mode="sync", reset=False, **extra_kwargs):
@@ -754,6 +855,10 @@ class QueueStep(BaseStep):
                 retention_in_hours=self.retention_in_hours,
                 **self.options,
             )
+            self._push = self._stream.push
+            instrumentation = getattr(context, "instrumentation", None)
+            if instrumentation:
+                self._push = instrumentation.wrap(self.fullname, self._push)
         self._set_error_handler()
 
     @property
@@ -766,7 +871,7 @@ class QueueStep(BaseStep):
             return event
 
         if self._stream:
-            self._stream.push({"id": event.id, "body": data, "path": event.path})
+            self._push({"id": event.id, "body": data, "path": event.path})
             event.terminated = True
             event.body = None
         return event
@@ -802,6 +907,8 @@ class FlowStep(BaseStep):
         self._wait_for_result = False
         self._source = None
         self._start_steps = []
+        self._sync_schedule = None
+        self._sync_executor = None
 
     def get_children(self):
         return self._steps.values()
@@ -952,6 +1059,8 @@ class FlowStep(BaseStep):
         if self.engine != "sync":
             self._build_async_flow()
             self._run_async_flow()
+        else:
+            self._sync_schedule = _SyncFlowSchedule.build(self)
 
     def check_and_process_graph(self, allow_empty=False):
         """validate correct graph layout and initialize the .next links"""
@@ -1041,11 +1150,6 @@ class FlowStep(BaseStep):
                 )
             self._start_steps = new_start_steps
 
-        if self.engine == "sync" and len(self._start_steps) > 1:
-            raise GraphError(
-                "sync engine can only have one starting step (without .after)"
-            )
-
         default_final_step = None
         if self.final_step:
             if self.final_step not in self.steps:
@@ -1174,6 +1278,10 @@ class FlowStep(BaseStep):
 
         if len(self._start_steps) == 0:
             return event
+        if self._sync_schedule:
+            # sync flow with branches
+            return self._run_sync_flow(event, *args, **kwargs)
+
         next_obj = self._start_steps[0]
         while next_obj:
             try:
@@ -1203,6 +1311,104 @@ class FlowStep(BaseStep):
             next_obj = self[next[0]] if next else None
         return event
 
+    def _run_sync_flow(self, event, *args, **kwargs):
+        """run a sync flow with branches, independent branches run concurrently and are joined by Merge steps"""
+        run = _SyncFlowRun(self._sync_schedule)
+        try:
+            self._run_sync_branches(run, self._start_steps, event, None, args, kwargs)
+        except Exception as exc:
+            if self._on_error_handler:
+                self._log_error(event, exc, failed_step=run.failed_step)
+                event.body = self._call_error_handler(event, exc)
+                event.terminated = True
+                return event
+            raise exc
+        return run.get_result(event)
+
+    def _run_sync_branches(self, run, steps, event, previous, args, kwargs):
+        # each branch gets its own copy of the event (made before any of them runs, as steps update the event),
+        # the first branch runs in the calling thread and the rest on the thread pool
+        branches = [(steps[0], event)] + [
+            (step, _copy_event(event)) for step in steps[1:]
+        ]
+        if self._sync_executor is None:
+            self._sync_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(config.serving.sync_flow_max_workers),
+                thread_name_prefix=f"{self.name or 'flow'}-branch",
+            )
+        futures = [
+            (
+                self._sync_executor.submit(
+                    self._run_sync_branch,
+                    run,
+                    step,
+                    branch_event,
+                    previous,
+                    args,
+                    kwargs,
+                ),
+                step,
+                branch_event,
+            )
+            for step, branch_event in branches[1:]
+        ]
+
+        error = None
+        try:
+            self._run_sync_branch(run, *branches[0], previous, args, kwargs)
+        except Exception as exc:
+            error = exc
+        for future, step, branch_event in futures:
+            try:
+                if future.cancel():
+                    # the branch didn't start yet (all the workers are busy), run it here instead of waiting for a
+                    # worker, which can't become free if all of them wait for their own branches
+                    self._run_sync_branch(
+                        run, step, branch_event, previous, args, kwargs
+                    )
+                else:
+                    future.result()
+            except Exception as exc:
+                error = error or exc
+        if error:
+            raise error
+
+    def _run_sync_branch(self, run, step, event, previous, args, kwargs):
+        schedule = run.schedule
+        while step:
+            if step.name in schedule.join_steps:
+                events = run.join(step.name, previous, event)
+                if events is None:
+                    # the last branch to arrive continues with the merged event
+                    return
+                event = step.async_object.merge_branches(events)
+            else:
+                try:
+                    event = step.run(event, *args, **kwargs)
+                except Exception:
+                    run.failed_step = run.failed_step or step.name
+                    raise
+            if step.name in schedule.result_steps:
+                run.results[step.name] = event
+
+            if getattr(event, "terminated", False):
+                run.terminated_event = event
+                return
+            if (
+                hasattr(event, "error")
+                and isinstance(event.error, dict)
+                and step.name in event.error
+            ):
+                step = self._steps[step.on_error]
+
+            next_steps = schedule.next_steps[step.name]
+            previous = step.name
+            if len(next_steps) > 1:
+                return self._run_sync_branches(
+                    run, next_steps, event, previous, args, kwargs
+                )
+            step = next_steps[0] if next_steps else None
+
     def wait_for_completion(self):
         """wait for completion of run in async flows"""
 
@@ -1558,3 +1764,135 @@ def _init_async_objects(context, steps):
         **source_args,
     )
     return default_source, wait_for_result
+
+
+class _SyncFlowSchedule:
+    """schedule of a sync flow with branches, precomputed once when the flow is initialized"""
+
+    def __init__(self, next_steps, join_steps, result_steps):
+        # next steps (objects) of each step, branches run concurrently
+        self.next_steps: dict[str, list] = next_steps
+        # steps which join branches (Merge steps), mapped to the names of the steps they join
+        self.join_steps: dict[str, list[str]] = join_steps
+        # steps whose output is the result of the flow, by priority
+        self.result_steps: list[str] = result_steps
+
+    @classmethod
+    def build(cls, flow: FlowStep) -> typing.Optional["_SyncFlowSchedule"]:
+        """build the schedule, None if the flow has no branches (and is run as a simple sequence of steps)"""
+        steps = flow.steps
+        error_handlers = {step.on_error for step in steps.values() if step.on_error}
+        error_handlers.update(
+            name for name, step in steps.items() if step.kind == "error_step"
+        )
+        if flow.on_error:
+            error_handlers.add(flow.on_error)
+        next_steps = {
+            name: [steps[next_name] for next_name in step.next or []]
+            for name, step in steps.items()
+        }
+
+        # topological order of the steps reachable from the start steps (error handlers are reached on errors only)
+        reachable = set()
+        pending = [step.name for step in flow._start_steps]
+        while pending:
+            name = pending.pop()
+            if name not in reachable:
+                reachable.add(name)
+                pending.extend(step.name for step in next_steps[name])
+        uplinks = {
+            name: [
+                previous
+                for previous in steps[name].after or []
+                if previous in reachable and previous not in error_handlers
+            ]
+            for name in reachable
+        }
+        order = []
+        in_degree = {name: len(uplinks[name]) for name in reachable}
+        ready = [step.name for step in flow._start_steps]
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for step in next_steps[name]:
+                if step.name in in_degree and name not in error_handlers:
+                    in_degree[step.name] -= 1
+                    if in_degree[step.name] == 0:
+                        ready.append(step.name)
+
+        has_branches = len(flow._start_steps) > 1 or any(
+            len(next_steps[name]) > 1 for name in reachable
+        )
+        if not has_branches:
+            return None
+
+        join_steps = {}
+        for name in order:
+            step = steps[name]
+            is_merge = hasattr(getattr(step, "async_object", None), "merge_branches")
+            if is_merge:
+                join_steps[name] = uplinks[name]
+            elif len(uplinks[name]) > 1:
+                raise GraphError(
+                    f"step {name} follows multiple steps ({', '.join(uplinks[name])}), the sync engine can only "
+                    f"join branches with a Merge step"
+                )
+
+        responders = [
+            name for name in order if getattr(steps[name], "responder", False)
+        ]
+        if responders:
+            result_steps = responders
+        elif flow.final_step:
+            result_steps = [flow.final_step]
+        else:
+            result_steps = [name for name in order if not next_steps[name]]
+        return cls(next_steps, join_steps, result_steps)
+
+
+class _SyncFlowRun:
+    """state of a single event run through a sync flow with branches"""
+
+    def __init__(self, schedule: _SyncFlowSchedule):
+        self.schedule = schedule
+        self.results = {}
+        self.terminated_event = None
+        self.failed_step = None
+        self._arrived = {}
+        self._lock = threading.Lock()
+
+    def join(self, step_name: str, previous: str, event) -> typing.Optional[list]:
+        """
+        add the event of a branch arriving at a join step, return the events of all the joined branches (ordered
+        like the joined steps) once the last one arrives, None until then
+        """
+        joined_steps = self.schedule.join_steps[step_name]
+        with self._lock:
+            arrived = self._arrived.setdefault(step_name, {})
+            arrived[previous] = event
+            if len(arrived) < len(joined_steps):
+                return None
+            del self._arrived[step_name]
+        events = [arrived.pop(name) for name in joined_steps if name in arrived]
+        # events arriving from other steps (e.g. error handlers) come last
+        return events + list(arrived.values())
+
+    def get_result(self, event):
+        if self.terminated_event is not None:
+            return self.terminated_event
+        for name in self.schedule.result_steps:
+            if name in self.results:
+                return self.results[name]
+        return event
+
+
+def _copy_event(event):
+    # like storey, which deep copies the event for each additional branch (without the awaitable result reference)
+    awaitable_result = getattr(event, "_awaitable_result", None)
+    if awaitable_result is not None:
+        event._awaitable_result = None
+    event_copy = deepcopy(event)
+    if awaitable_result is not None:
+        event._awaitable_result = awaitable_result
+        event_copy._awaitable_result = awaitable_result
+    return event_copy
@@ -15,6 +15,7 @@
 import inspect
 
 from mlrun.utils import get_in, update_in
+from mlrun.utils.helpers import _split_by_dots_with_escaping
 
 # headers keys with underscore are getting ignored by werkzeug https://github.com/pallets/werkzeug/pull/2622
 # to avoid conflicts with WGSI which converts all header keys to uppercase with underscores.
@@ -43,6 +44,39 @@ def _update_result_body(result_path, event_body, result):
     return event_body
 
 
+def _compile_input_path(input_path):
+    """return a function extracting the input data from the event body, with the input path parsed once"""
+    if not input_path:
+        return None
+    keys = input_path.split(".")
+
+    def extract_input_data(body):
+        if not hasattr(body, "__getitem__"):
+            raise TypeError("input_path parameter supports only dict-like event bodies")
+        return get_in(body, keys)
+
+    return extract_input_data
+
+
+def _compile_result_path(result_path):
+    """return a function updating the event body with the result, with the result path parsed once"""
+    if not result_path:
+        return None
+    keys = _split_by_dots_with_escaping(result_path)
+
+    def update_result_body(event_body, result):
+        if not event_body:
+            return result
+        if not hasattr(event_body, "__getitem__"):
+            raise TypeError(
+                "result_path parameter supports only dict-like event bodies"
+            )
+        update_in(event_body, keys, result)
+        return event_body
+
+    return update_result_body
+
+
 class StepToDict:
     """auto serialization of graph steps to a python dictionary"""
 
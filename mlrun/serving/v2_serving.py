@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import os
 import threading
 import time
 import traceback
 from typing import Union
 
+import numpy as np
+
 import mlrun.common.model_monitoring
 import mlrun.common.schemas.model_monitoring
 from mlrun.artifacts import ModelArtifact  # noqa: F401
@@ -25,9 +29,19 @@ from mlrun.errors import err_to_str
 from mlrun.utils import logger, now_date
 
 from ..common.helpers import parse_versioned_object_uri
+from . import model_cache
 from .server import GraphServer
 from .utils import StepToDict, _extract_input_data, _update_result_body
 
+# model operations which run the model inference (predict)
+_infer_operations = frozenset(["predict", "infer", "infer_dict", "predict_dict"])
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_to_operation(path: str) -> str:
+    # the model server path is stripped by the router to the operation (e.g. "/infer"), paths repeat across events
+    return path.strip("/")
+
 
 class V2ModelServer(StepToDict):
     def __init__(
@@ -70,7 +84,8 @@ class V2ModelServer(StepToDict):
                     events = np.array(request["inputs"])
                     dmatrix = xgb.DMatrix(events)
                     result: xgb.DMatrix = self.model.predict(dmatrix)
-                    return {"outputs": result.tolist()}
+                    # numpy arrays are serialized natively, no need to convert them to lists
+                    return {"outputs": result}
 
         usage example::
 
@@ -120,6 +135,13 @@ class V2ModelServer(StepToDict):
             self.model = model
             self.ready = True
         self.model_endpoint_uid = None
+        self._custom_operations = None
+        self._lazy_load = False
+        self._load_lock = threading.Lock()
+        # the number of events the model is handling, the model is not unloaded while it is in use
+        self._in_use = 0
+        # model memory size in bytes, can be set by load(), otherwise the size of the model files (see get_model())
+        self.model_size = None
 
     def _load_and_update_state(self):
         try:
@@ -128,19 +150,44 @@ class V2ModelServer(StepToDict):
             self.error = exc
             self.context.logger.error(traceback.format_exc())
             raise RuntimeError(f"failed to load model {self.name}") from exc
+        if self.get_param("warmup", config.serving.model_cache.warmup):
+            self.warmup()
         self.ready = True
         self.context.logger.info(f"model {self.name} was loaded")
 
-    def post_init(self, mode="sync"):
-        """sync/async model loading, for internal use"""
+    def _unload_and_update_state(self) -> bool:
+        """unload the model unless it is in use, returns False if it is in use"""
+        with self._load_lock:
+            if not self.ready:
+                return True
+            if self._in_use:
+                return False
+            self.ready = False
+            self.unload()
+        self.context.logger.info(f"model {self.name} was unloaded")
+        return True
+
+    def _init_load(self, mode="sync"):
+        """load the model when the step is initialized (unless it is lazy loaded), for internal use"""
+        self._lazy_load = self.get_param(
+            "lazy_load", config.serving.model_cache.lazy_load
+        )
         if not self.ready:
-            if mode == "async":
+            if self._lazy_load:
+                self.context.logger.info(
+                    f"model {self.name} will be loaded on its first request"
+                )
+            elif mode == "async":
                 t = threading.Thread(target=self._load_and_update_state)
                 t.start()
                 self.context.logger.info(f"started async model loading for {self.name}")
             else:
                 self._load_and_update_state()
 
+    def post_init(self, mode="sync"):
+        """sync/async model loading, for internal use"""
+        self._init_load(mode)
+
         server = getattr(self.context, "_server", None) or getattr(
             self.context, "server", None
         )
@@ -180,6 +227,11 @@ class V2ModelServer(StepToDict):
                 self.model = load(open(model_file, "rb"))
                 categories = extra_data["categories"].as_df()
 
+        when the model cache is enabled (see mlrun.mlconf.serving.model_cache), remote model files are downloaded
+        once per pod into the cache and reused by the other workers, use mlrun.serving.model_cache.load_weights()
+        to memory map the weights (.npy, .safetensors) so the workers share their memory. ONNX external data files
+        (the model extra data) are downloaded next to the ONNX model file.
+
         Parameters
         ----------
         suffix : str
@@ -193,9 +245,27 @@ class V2ModelServer(StepToDict):
             extra dataitems dictionary
 
         """
+        use_cache = config.serving.model_cache.enabled
         model_file, self.model_spec, extra_dataitems = mlrun.artifacts.get_model(
-            self.model_path, suffix
+            self.model_path, suffix, download=not use_cache
         )
+        if use_cache:
+            related_urls = []
+            if model_file.endswith(".onnx"):
+                # onnx external data files are loaded from the model file dir
+                related_urls = [item.url for item in extra_dataitems.values()]
+            model_file = model_cache.get_local_path(model_file, related_urls)
+            model_files = [model_file] + [
+                os.path.join(os.path.dirname(model_file), os.path.basename(url))
+                for url in related_urls
+            ]
+        else:
+            model_files = [model_file]
+        if self.model_size is None:
+            # the model memory size is approximated by the size of its files
+            self.model_size = sum(
+                os.path.getsize(path) for path in model_files if os.path.isfile(path)
+            )
         if self.model_spec and self.model_spec.parameters:
             for key, value in self.model_spec.parameters.items():
                 self._params[key] = value
@@ -206,9 +276,25 @@ class V2ModelServer(StepToDict):
         if not self.ready and not self.model:
             raise ValueError("please specify a load method or a model object")
 
+    def warmup(self):
+        """model warmup, called after the model is loaded (e.g. run a dummy inference), can be overwritten"""
+        pass
+
+    def unload(self):
+        """release the model memory (e.g. when it is evicted by a lazy loading router), can be overwritten
+
+        the model is loaded again (using load()) on its next request
+        """
+        self.model = None
+
     def _check_readiness(self, event):
         if self.ready:
             return
+        if self._lazy_load:
+            with self._load_lock:
+                if not self.ready:
+                    self._load_and_update_state()
+            return
         if not event.trigger or event.trigger.kind in ["http", ""]:
             raise RuntimeError(f"model {self.name} is not ready yet")
         self.context.logger.info(f"waiting for model {self.name} to load")
@@ -227,23 +313,28 @@ class V2ModelServer(StepToDict):
 
     def do_event(self, event, *args, **kwargs):
         """main model event handler method"""
+        # the model is not unloaded (e.g. evicted by a lazy loading router) while it handles the event
+        with self._load_lock:
+            self._in_use += 1
+        try:
+            return self._do_event(event)
+        finally:
+            with self._load_lock:
+                self._in_use -= 1
+
+    def _do_event(self, event):
         start = now_date()
         original_body = event.body
         event_body = _extract_input_data(self._input_path, event.body)
         event_id = event.id
-        op = event.path.strip("/")
+        op = _path_to_operation(event.path) if event.path else ""
         if event_body and isinstance(event_body, dict):
             op = op or event_body.get("operation")
             event_id = event_body.get("id", event_id)
         if not op and event.method != "GET":
             op = "infer"
 
-        if (
-            op == "predict"
-            or op == "infer"
-            or op == "infer_dict"
-            or op == "predict_dict"
-        ):
+        if op in _infer_operations:
             # predict operation
             request = self._pre_event_processing_actions(event, event_body, op)
             try:
@@ -265,6 +356,12 @@ class V2ModelServer(StepToDict):
         elif op == "ready" and event.method == "GET":
             # get model health operation
             setattr(event, "terminated", True)
+            if self._lazy_load and not self.ready:
+                # lazy models are loaded by their first request (including a readiness check)
+                try:
+                    self._check_readiness(event)
+                except RuntimeError:
+                    pass
             if self.ready:
                 # Generate a response, confirming that the model is ready
                 event.body = self.context.Response(
@@ -318,9 +415,9 @@ class V2ModelServer(StepToDict):
             if self.version:
                 response["model_version"] = self.version
 
-        elif hasattr(self, "op_" + op):
+        elif op in self._get_custom_operations():
             # custom operation (child methods starting with "op_")
-            response = getattr(self, "op_" + op)(event)
+            response = self._get_custom_operations()[op](event)
             event.body = _update_result_body(self._result_path, original_body, response)
             return event
 
@@ -339,6 +436,19 @@ class V2ModelServer(StepToDict):
         event.body = _update_result_body(self._result_path, original_body, response)
         return event
 
+    def _get_custom_operations(self) -> dict:
+        # the custom operations (child methods starting with "op_") are resolved once, in compiled graph mode
+        if self._custom_operations is not None:
+            return self._custom_operations
+        operations = {
+            name[len("op_") :]: getattr(self, name)
+            for name in dir(type(self))
+            if name.startswith("op_") and callable(getattr(self, name, None))
+        }
+        if config.serving.compiled_graph:
+            self._custom_operations = operations
+        return operations
+
     def logged_results(self, request: dict, response: dict, op: str):
         """hook for controlling which results are tracked by the model monitoring
 
@@ -363,7 +473,8 @@ class V2ModelServer(StepToDict):
             if "inputs" not in request:
                 raise Exception('Expected key "inputs" in request body')
 
-            if not isinstance(request["inputs"], list):
+            # binary request formats (see mlrun.serving.codecs) pass the inputs as numpy arrays
+            if not isinstance(request["inputs"], (list, np.ndarray)):
                 raise Exception('Expected "inputs" to be a list')
 
         return request
@@ -14,18 +14,24 @@
 #
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 import mlrun.common.schemas
 import server.api.crud
 import server.api.utils.auth.verifier
+import server.api.utils.pagination
 import server.api.utils.singletons.project_member
 from mlrun.common.schemas.artifact import ArtifactsFormat
 from mlrun.utils import logger
 from server.api.api import deps
-from server.api.api.utils import artifact_project_and_resource_name_extractor
+from server.api.api.utils import (
+    artifact_project_and_resource_name_extractor,
+    ndjson_requested,
+    ndjson_streaming_response,
+)
 
 router = APIRouter()
 
@@ -139,8 +145,45 @@ async def store_artifact(
     )
 
 
+@router.put("/projects/{project}/artifacts")
+async def store_artifacts(
+    project: str,
+    store_artifacts_request: mlrun.common.schemas.StoreArtifactsRequest,
+    auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    await run_in_threadpool(
+        server.api.utils.singletons.project_member.get_project_member().ensure_project,
+        db_session,
+        project,
+        auth_info=auth_info,
+    )
+
+    logger.debug(
+        "Storing artifacts",
+        project=project,
+        count=len(store_artifacts_request.artifacts),
+    )
+    await server.api.utils.auth.verifier.AuthVerifier().query_project_resources_permissions(
+        mlrun.common.schemas.AuthorizationResourceTypes.artifact,
+        store_artifacts_request.artifacts,
+        lambda artifact: (project, artifact.key),
+        mlrun.common.schemas.AuthorizationAction.store,
+        auth_info,
+    )
+    await run_in_threadpool(
+        server.api.crud.Artifacts().store_artifacts,
+        db_session,
+        store_artifacts_request.artifacts,
+        project,
+        auth_info=auth_info,
+    )
+    return {}
+
+
 @router.get("/projects/{project}/artifacts")
 async def list_artifacts(
+    request: Request,
     project: str,
     name: str = None,
     tag: str = None,
@@ -160,13 +203,11 @@ async def list_artifacts(
         auth_info,
     )
 
-    artifacts = await run_in_threadpool(
-        server.api.crud.Artifacts().list_artifacts,
-        db_session,
-        project,
-        name,
-        tag,
-        labels,
+    list_artifacts_kwargs = dict(
+        project=project,
+        name=name,
+        tag=tag,
+        labels=labels,
         kind=kind,
         category=category,
         iter=iter,
@@ -175,15 +216,44 @@ async def list_artifacts(
         producer_id=tree,
     )
 
+    if ndjson_requested(request):
+
+        async def _filter_artifacts(_artifacts):
+            return await server.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
+                mlrun.common.schemas.AuthorizationResourceTypes.artifact,
+                _artifacts,
+                artifact_project_and_resource_name_extractor,
+                auth_info,
+            )
+
+        # bulk export - stream all the artifacts page by page (keyset paginated by the artifact id)
+        return ndjson_streaming_response(
+            server.api.utils.pagination.Paginator().iterate_permission_filtered_request(
+                server.api.crud.Artifacts().list_artifacts,
+                _filter_artifacts,
+                **list_artifacts_kwargs,
+            )
+        )
+
+    artifacts = await run_in_threadpool(
+        server.api.crud.Artifacts().list_artifacts,
+        db_session,
+        **list_artifacts_kwargs,
+    )
+
     artifacts = await server.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
         mlrun.common.schemas.AuthorizationResourceTypes.artifact,
         artifacts,
         artifact_project_and_resource_name_extractor,
         auth_info,
     )
-    return {
-        "artifacts": artifacts,
-    }
+    # large listings are serialized by orjson directly, skipping the costly generic encoding of fastapi.
+    # note that as with the default (orjson) response class, NaN and Inf floats are serialized as null
+    return ORJSONResponse(
+        content={
+            "artifacts": artifacts,
+        }
+    )
 
 
 @router.get("/projects/{project}/artifacts/{key:path}")
@@ -27,6 +27,7 @@ from fastapi import (
     Response,
 )
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from kubernetes.client.rest import ApiException
 from sqlalchemy.orm import Session
 
@@ -242,10 +243,14 @@ async def list_functions(
         hash_key=hash_key,
     )
 
-    return {
-        "funcs": functions,
-        "pagination": page_info,
-    }
+    # large listings are serialized by orjson directly, skipping the costly generic encoding of fastapi.
+    # note that as with the default (orjson) response class, NaN and Inf floats are serialized as null
+    return ORJSONResponse(
+        content={
+            "funcs": functions,
+            "pagination": page_info,
+        }
+    )
 
 
 @router.post("/build/function")
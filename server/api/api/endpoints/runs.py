@@ -18,6 +18,7 @@ from http import HTTPStatus
 
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, Query, Request, Response
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 import mlrun.common.schemas
@@ -28,7 +29,11 @@ import server.api.utils.pagination
 import server.api.utils.singletons.project_member
 from mlrun.utils import logger
 from server.api.api import deps
-from server.api.api.utils import log_and_raise
+from server.api.api.utils import (
+    log_and_raise,
+    ndjson_requested,
+    ndjson_streaming_response,
+)
 
 router = APIRouter()
 
@@ -119,6 +124,29 @@ async def update_run(
     return {}
 
 
+@router.patch("/projects/{project}/runs")
+async def update_runs(
+    project: str,
+    update_runs_request: mlrun.common.schemas.UpdateRunsRequest,
+    auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    await server.api.utils.auth.verifier.AuthVerifier().query_project_resources_permissions(
+        mlrun.common.schemas.AuthorizationResourceTypes.run,
+        update_runs_request.runs,
+        lambda run: (project, run.uid),
+        mlrun.common.schemas.AuthorizationAction.update,
+        auth_info,
+    )
+    await run_in_threadpool(
+        server.api.crud.Runs().update_runs,
+        db_session,
+        project,
+        update_runs_request.runs,
+    )
+    return {}
+
+
 # TODO: remove /run/{project}/{uid} in 1.8.0
 @router.get(
     "/run/{project}/{uid}",
@@ -189,6 +217,7 @@ async def delete_run(
 )
 @router.get("/projects/{project}/runs")
 async def list_runs(
+    request: Request,
     project: str = None,
     name: str = None,
     uid: list[str] = Query([]),
@@ -239,14 +268,7 @@ async def list_runs(
             auth_info,
         )
 
-    runs, page_info = await paginator.paginate_permission_filtered_request(
-        db_session,
-        server.api.crud.Runs().list_runs,
-        _filter_runs,
-        auth_info,
-        token=page_token,
-        page=page,
-        page_size=page_size,
+    list_runs_kwargs = dict(
         name=name,
         uid=uid,
         project=project,
@@ -266,10 +288,36 @@ async def list_runs(
         max_partitions=max_partitions,
         with_notifications=with_notifications,
     )
-    return {
-        "runs": runs,
-        "pagination": page_info,
-    }
+
+    if ndjson_requested(request):
+        # bulk export - stream all the runs page by page (the page size sets the size of the retrieved batches)
+        return ndjson_streaming_response(
+            paginator.iterate_permission_filtered_request(
+                server.api.crud.Runs().list_runs,
+                _filter_runs,
+                page_size=page_size,
+                **list_runs_kwargs,
+            )
+        )
+
+    runs, page_info = await paginator.paginate_permission_filtered_request(
+        db_session,
+        server.api.crud.Runs().list_runs,
+        _filter_runs,
+        auth_info,
+        token=page_token,
+        page=page,
+        page_size=page_size,
+        **list_runs_kwargs,
+    )
+    # large listings are serialized by orjson directly, skipping the costly generic encoding of fastapi.
+    # note that as with the default (orjson) response class, NaN and Inf floats are serialized as null
+    return ORJSONResponse(
+        content={
+            "runs": runs,
+            "pagination": page_info,
+        }
+    )
 
 
 # TODO: remove /runs in 1.8.0
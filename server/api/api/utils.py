@@ -27,10 +27,12 @@ from os import environ
 from pathlib import Path
 
 import kubernetes.client
+import orjson
 import semver
 import sqlalchemy.orm
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 import mlrun.common.schemas
@@ -100,6 +102,40 @@ def lru_cache_with_ttl(maxsize=128, typed=False, ttl_seconds=60):
     return decorator
 
 
+def ndjson_requested(request: Request) -> bool:
+    """Whether the request accepts a newline delimited JSON response (i.e. a streaming bulk export)"""
+    return mlrun.common.schemas.MediaTypes.ndjson in request.headers.get("accept", "")
+
+
+def ndjson_streaming_response(
+    batches: typing.AsyncIterator[list],
+) -> StreamingResponse:
+    """
+    Stream the objects in the given batches as newline delimited JSON, one object per line, so a bulk export is
+    never serialized into a single response body
+    """
+
+    async def _generate_lines():
+        async for batch in batches:
+            yield _serialize_ndjson_batch(batch)
+
+    return StreamingResponse(
+        _generate_lines(), media_type=mlrun.common.schemas.MediaTypes.ndjson
+    )
+
+
+def _serialize_ndjson_batch(batch: list) -> bytes:
+    return b"".join(
+        orjson.dumps(
+            item,
+            option=orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        for item in batch
+    )
+
+
 def log_path(project, uid) -> Path:
     return project_logs_path(project) / uid
 
@@ -73,6 +73,25 @@ class Artifacts(
             producer_id=producer_id,
         )
 
+    def store_artifacts(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        artifacts: list[mlrun.common.schemas.ArtifactToStore],
+        project: str = None,
+        auth_info: mlrun.common.schemas.AuthInfo = None,
+    ):
+        for artifact in artifacts:
+            self.store_artifact(
+                db_session,
+                artifact.key,
+                artifact.artifact.dict(exclude_none=True),
+                tag=artifact.tag,
+                iter=artifact.iter or 0,
+                project=project,
+                producer_id=artifact.tree,
+                auth_info=auth_info,
+            )
+
     def create_artifact(
         self,
         db_session: sqlalchemy.orm.Session,
@@ -149,6 +168,9 @@ class Artifacts(
         best_iteration: bool = False,
         format_: mlrun.common.schemas.artifact.ArtifactsFormat = mlrun.common.schemas.artifact.ArtifactsFormat.full,
         producer_id: str = None,
+        page: typing.Optional[int] = None,
+        page_size: typing.Optional[int] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> list:
         project = project or mlrun.mlconf.default_project
         if labels is None:
@@ -166,6 +188,9 @@ class Artifacts(
             iter,
             best_iteration,
             producer_id=producer_id,
+            page=page,
+            page_size=page_size,
+            page_cursor=page_cursor,
         )
         return artifacts
 
@@ -93,6 +93,7 @@ class Functions(
         hash_key: str = None,
         page: int = None,
         page_size: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
     ) -> list:
         project = project or mlrun.mlconf.default_project
         if labels is None:
@@ -106,6 +107,7 @@ class Functions(
             hash_key=hash_key,
             page=page,
             page_size=page_size,
+            page_cursor=page_cursor,
         )
 
     def get_function_status(
@@ -32,10 +32,17 @@ class PaginationCache(metaclass=mlrun.utils.singleton.Singleton):
         current_page: int,
         page_size: int,
         kwargs: dict,
+        page_cursor: typing.Optional[dict] = None,
     ):
         db = server.api.utils.singletons.db.get_db()
         return db.store_paginated_query_cache_record(
-            session, user, method.__name__, current_page, page_size, kwargs
+            session,
+            user,
+            method.__name__,
+            current_page,
+            page_size,
+            kwargs,
+            page_cursor,
         )
 
     @staticmethod
@@ -14,7 +14,6 @@
 #
 import asyncio
 import collections
-import datetime
 import typing
 
 import fastapi.concurrency
@@ -40,12 +39,6 @@ class Projects(
     project_follower.Member,
     metaclass=mlrun.utils.singleton.AbstractSingleton,
 ):
-    def __init__(self) -> None:
-        super().__init__()
-        self._cache = {
-            "project_resources_counters": {"value": None, "ttl": datetime.datetime.min}
-        }
-
     def create_project(
         self, session: sqlalchemy.orm.Session, project: mlrun.common.schemas.Project
     ):
@@ -273,8 +266,10 @@ class Projects(
             state,
             names,
         )
-        project_summaries = await self.generate_projects_summaries(
-            projects_output.projects
+        project_summaries = await fastapi.concurrency.run_in_threadpool(
+            server.api.utils.singletons.db.get_db().list_project_summaries,
+            session,
+            projects_output.projects,
         )
         return mlrun.common.schemas.ProjectSummariesOutput(
             project_summaries=project_summaries
@@ -285,8 +280,31 @@ class Projects(
     ) -> mlrun.common.schemas.ProjectSummary:
         # Call get project so we'll explode if project doesn't exists
         await fastapi.concurrency.run_in_threadpool(self.get_project, session, name)
-        project_summaries = await self.generate_projects_summaries([name])
-        return project_summaries[0]
+        return await fastapi.concurrency.run_in_threadpool(
+            server.api.utils.singletons.db.get_db().get_project_summary,
+            session,
+            name,
+        )
+
+    async def refresh_project_summaries(self, session: sqlalchemy.orm.Session):
+        """
+        Recalculate the resources counters of all projects and store them as the project summaries.
+        The summaries are read from the DB when listing them, so this is the only place the (heavy) counters
+        calculation takes place. Running it periodically also repairs summaries that drifted or are missing.
+        """
+        projects_output = await fastapi.concurrency.run_in_threadpool(
+            self.list_projects,
+            session,
+            format_=mlrun.common.schemas.ProjectsFormat.name_only,
+        )
+        project_summaries = await self.generate_projects_summaries(
+            projects_output.projects
+        )
+        await fastapi.concurrency.run_in_threadpool(
+            server.api.utils.singletons.db.get_db().refresh_project_summaries,
+            session,
+            project_summaries,
+        )
 
     async def generate_projects_summaries(
         self, projects: list[str]
@@ -331,45 +349,28 @@ class Projects(
         dict[str, int],
         dict[str, typing.Union[int, None]],
     ]:
-        now = datetime.datetime.now()
-        if (
-            not self._cache["project_resources_counters"]["ttl"]
-            or self._cache["project_resources_counters"]["ttl"] < now
-        ):
-            logger.debug(
-                "Project resources counter cache expired. Calculating",
-                ttl=self._cache["project_resources_counters"]["ttl"],
-            )
-
-            results = await asyncio.gather(
-                server.api.utils.singletons.db.get_db().get_project_resources_counters(),
-                self._calculate_pipelines_counters(),
-            )
-            (
-                project_to_files_count,
-                project_to_schedule_count,
-                project_to_feature_set_count,
-                project_to_models_count,
-                project_to_recent_failed_runs_count,
-                project_to_running_runs_count,
-            ) = results[0]
-            project_to_running_pipelines_count = results[1]
-            self._cache["project_resources_counters"]["result"] = (
-                project_to_files_count,
-                project_to_schedule_count,
-                project_to_feature_set_count,
-                project_to_models_count,
-                project_to_recent_failed_runs_count,
-                project_to_running_runs_count,
-                project_to_running_pipelines_count,
-            )
-            ttl_time = datetime.datetime.now() + datetime.timedelta(
-                seconds=humanfriendly.parse_timespan(
-                    mlrun.mlconf.httpdb.projects.counters_cache_ttl
-                )
-            )
-            self._cache["project_resources_counters"]["ttl"] = ttl_time
-        return self._cache["project_resources_counters"]["result"]
+        results = await asyncio.gather(
+            server.api.utils.singletons.db.get_db().get_project_resources_counters(),
+            self._calculate_pipelines_counters(),
+        )
+        (
+            project_to_files_count,
+            project_to_schedule_count,
+            project_to_feature_set_count,
+            project_to_models_count,
+            project_to_recent_failed_runs_count,
+            project_to_running_runs_count,
+        ) = results[0]
+        project_to_running_pipelines_count = results[1]
+        return (
+            project_to_files_count,
+            project_to_schedule_count,
+            project_to_feature_set_count,
+            project_to_models_count,
+            project_to_recent_failed_runs_count,
+            project_to_running_runs_count,
+            project_to_running_pipelines_count,
+        )
 
     @staticmethod
     def _list_pipelines(
@@ -107,6 +107,29 @@ class Runs(
             db_session, data, uid, project, iter
         )
 
+    def update_runs(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        project: str,
+        runs: list[mlrun.common.schemas.RunUpdate],
+    ):
+        project = project or mlrun.mlconf.default_project
+        # aborting a run deletes its runtime resources, so aborts are handled one by one by update_run
+        aborts = [
+            run
+            for run in runs
+            if run.updates.get("status.state")
+            == mlrun.runtimes.constants.RunStates.aborted
+        ]
+        for run in aborts:
+            self.update_run(db_session, project, run.uid, run.iter, run.updates)
+        runs = [run for run in runs if run not in aborts]
+        if runs:
+            logger.debug("Updating runs", project=project, count=len(runs))
+            server.api.utils.singletons.db.get_db().update_runs(
+                db_session, runs, project
+            )
+
     def get_run(
         self,
         db_session: sqlalchemy.orm.Session,
@@ -149,6 +172,7 @@ class Runs(
         with_notifications: bool = False,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> mlrun.lists.RunList:
         project = project or mlrun.mlconf.default_project
         if (
@@ -210,6 +234,7 @@ class Runs(
             with_notifications=with_notifications,
             page=page,
             page_size=page_size,
+            page_cursor=page_cursor,
         )
 
     async def delete_run(
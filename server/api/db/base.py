@@ -61,6 +61,15 @@ class DBInterface(ABC):
     def update_run(self, session, updates: dict, uid, project="", iter=0):
         pass
 
+    def update_runs(
+        self,
+        session,
+        runs: list[mlrun.common.schemas.RunUpdate],
+        project: str = "",
+    ):
+        for run in runs:
+            self.update_run(session, run.updates, run.uid, project, run.iter)
+
     @abstractmethod
     def list_distinct_runs_uids(
         self,
@@ -110,6 +119,7 @@ class DBInterface(ABC):
         with_notifications: bool = False,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        page_cursor: Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> mlrun.lists.RunList:
         pass
 
@@ -210,6 +220,9 @@ class DBInterface(ABC):
         as_records: bool = False,
         uid=None,
         producer_id=None,
+        page: int = None,
+        page_size: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
     ):
         pass
 
@@ -306,6 +319,7 @@ class DBInterface(ABC):
         hash_key: str = None,
         page: int = None,
         page_size: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
     ):
         pass
 
@@ -431,6 +445,28 @@ class DBInterface(ABC):
     ]:
         pass
 
+    @abstractmethod
+    def get_project_summary(
+        self, session, project: str
+    ) -> mlrun.common.schemas.ProjectSummary:
+        pass
+
+    @abstractmethod
+    def list_project_summaries(
+        self,
+        session,
+        projects: Optional[list[str]] = None,
+    ) -> list[mlrun.common.schemas.ProjectSummary]:
+        pass
+
+    @abstractmethod
+    def refresh_project_summaries(
+        self,
+        session,
+        project_summaries: list[mlrun.common.schemas.ProjectSummary],
+    ):
+        pass
+
     @abstractmethod
     def create_project(self, session, project: mlrun.common.schemas.Project):
         pass
@@ -788,6 +824,7 @@ class DBInterface(ABC):
         current_page: int,
         page_size: int,
         kwargs: dict,
+        page_cursor: Optional[dict] = None,
     ):
         raise NotImplementedError
 
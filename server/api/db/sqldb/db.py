@@ -13,7 +13,6 @@
 # limitations under the License.
 #
 import asyncio
-import collections
 import functools
 import hashlib
 import pathlib
@@ -81,6 +80,7 @@ from server.api.db.sqldb.models import (
     Log,
     PaginationCache,
     Project,
+    ProjectSummary,
     Run,
     Schedule,
     User,
@@ -226,6 +226,34 @@ class SQLDB(DBInterface):
 
     def update_run(self, session, updates: dict, uid, project="", iter=0):
         project = project or config.default_project
+        run = self._update_run_record(session, updates, uid, project, iter)
+        self._upsert(session, [run])
+        self._delete_empty_labels(session, Run.Label)
+        return run.struct
+
+    def update_runs(
+        self,
+        session,
+        runs: list[mlrun.common.schemas.RunUpdate],
+        project: str = "",
+    ):
+        """Update several runs in a single transaction (a single commit), see update_run"""
+        project = project or config.default_project
+        try:
+            db_runs = [
+                self._update_run_record(
+                    session, run.updates, run.uid, project, run.iter
+                )
+                for run in runs
+            ]
+        except Exception:
+            # none of the runs is updated when one of them fails
+            session.rollback()
+            raise
+        self._upsert(session, db_runs)
+        self._delete_empty_labels(session, Run.Label)
+
+    def _update_run_record(self, session, updates: dict, uid, project, iter=0) -> Run:
         run = self._get_run(session, uid, project, iter, with_for_update=True)
         if not run:
             run_uri = RunObject.create_uri(project, uid, iter)
@@ -244,9 +272,7 @@ class SQLDB(DBInterface):
             update_labels(run, run_labels(struct))
         self._update_run_updated_time(run, struct)
         run.struct = struct
-        self._upsert(session, [run])
-        self._delete_empty_labels(session, Run.Label)
-        return run.struct
+        return run
 
     def list_distinct_runs_uids(
         self,
@@ -352,6 +378,7 @@ class SQLDB(DBInterface):
         with_notifications: bool = False,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> RunList:
         project = project or config.default_project
         query = self._find_runs(session, uid, project, labels)
@@ -368,7 +395,8 @@ class SQLDB(DBInterface):
         if last_update_time_to is not None:
             query = query.filter(Run.updated <= last_update_time_to)
         if sort:
-            query = query.order_by(Run.start_time.desc())
+            # the id breaks start time ties so the order, and therefore the pages, are deterministic
+            query = query.order_by(Run.start_time.desc(), Run.id.desc())
         if last:
             if not sort:
                 raise mlrun.errors.MLRunInvalidArgumentError(
@@ -399,13 +427,25 @@ class SQLDB(DBInterface):
                 max_partitions,
             )
 
-        query = self._paginate_query(query, page, page_size)
+        # partitioned queries are wrapped in sub-queries, so only plain sorted queries can seek to the next page
+        seekable = sort and not last and not partition_by
+        query = self._paginate_query(
+            query,
+            page,
+            page_size,
+            page_cursor,
+            id_column=Run.id if seekable else None,
+            sort_column=Run.start_time,
+            descending=True,
+        )
+        db_runs = query.all()
+        self._advance_page_cursor(db_runs, page, page_cursor, "start_time")
 
         if not return_as_run_structs:
-            return query.all()
+            return db_runs
 
         runs = RunList()
-        for run in query:
+        for run in db_runs:
             run_struct = run.struct
             if with_notifications:
                 run_struct.setdefault("spec", {}).setdefault("notifications", [])
@@ -657,6 +697,9 @@ class SQLDB(DBInterface):
         as_records: bool = False,
         uid=None,
         producer_id=None,
+        page: int = None,
+        page_size: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
     ):
         project = project or config.default_project
 
@@ -679,7 +722,11 @@ class SQLDB(DBInterface):
             uid=uid,
             producer_id=producer_id,
             best_iteration=best_iteration,
+            page=page,
+            page_size=page_size,
+            page_cursor=page_cursor,
         )
+        self._advance_page_cursor(artifact_records, page, page_cursor)
         if as_records:
             return artifact_records
 
@@ -1248,6 +1295,9 @@ class SQLDB(DBInterface):
         producer_id=None,
         best_iteration=False,
         most_recent=False,
+        page=None,
+        page_size=None,
+        page_cursor=None,
     ):
         if category and kind:
             message = "Category and Kind filters can't be given together"
@@ -1295,6 +1345,11 @@ class SQLDB(DBInterface):
                 query = query.filter(ArtifactV2.kind.in_(kinds))
         if most_recent:
             query = self._attach_most_recent_artifact_query(session, query)
+        if page is not None:
+            query = query.order_by(ArtifactV2.id)
+        query = self._paginate_query(
+            query, page, page_size, page_cursor, id_column=ArtifactV2.id
+        )
 
         return query.all()
 
@@ -1590,6 +1645,7 @@ class SQLDB(DBInterface):
         hash_key: str = None,
         page: int = None,
         page_size: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
     ) -> list[dict]:
         project = project or config.default_project
         uids = None
@@ -1600,9 +1656,18 @@ class SQLDB(DBInterface):
         if not tag and hash_key:
             uids = [hash_key]
         functions = []
-        for function in self._find_functions(
-            session, name, project, uids, labels, page=page, page_size=page_size
-        ):
+        db_functions = self._find_functions(
+            session,
+            name,
+            project,
+            uids,
+            labels,
+            page=page,
+            page_size=page_size,
+            page_cursor=page_cursor,
+        ).all()
+        self._advance_page_cursor(db_functions, page, page_cursor)
+        for function in db_functions:
             function_dict = function.struct
             if not tag:
                 function_tags = self._list_function_tags(session, project, function.id)
@@ -2058,7 +2123,16 @@ class SQLDB(DBInterface):
         )
         labels = project.metadata.labels or {}
         update_labels(project_record, labels)
-        self._upsert(session, [project_record])
+
+        # create an empty summary for the project, it will be filled by the periodic summaries refresh
+        project_summary = ProjectSummary(
+            project=project.metadata.name,
+            summary=mlrun.common.schemas.ProjectSummary(
+                name=project.metadata.name
+            ).dict(),
+            updated=created,
+        )
+        self._upsert(session, [project_record, project_summary])
 
     @retry_on_conflict
     def store_project(
@@ -2125,6 +2199,7 @@ class SQLDB(DBInterface):
             "Deleting project from DB", name=name, deletion_strategy=deletion_strategy
         )
         self._delete(session, Project, name=name)
+        self._delete(session, ProjectSummary, project=name)
 
     def list_projects(
         self,
@@ -2266,36 +2341,28 @@ class SQLDB(DBInterface):
     def _calculate_models_counters(self, session) -> dict[str, int]:
         import mlrun.artifacts
 
-        # The kind filter is applied post the query to the DB (manually in python code), so counting should be that
-        # way as well, therefore we're doing it here, and can't do it with sql as the above
-        # We're using the "most_recent" which gives us only one version of each artifact key, which is what we want to
-        # count (artifact count, not artifact versions count)
-        model_artifacts = self._find_artifacts(
-            session,
-            None,
-            kind=mlrun.artifacts.model.ModelArtifact.kind,
-            most_recent=True,
+        return self._calculate_artifacts_counters(
+            session, kinds=[mlrun.artifacts.model.ModelArtifact.kind]
         )
-        project_to_models_count = collections.defaultdict(int)
-        for model_artifact in model_artifacts:
-            project_to_models_count[model_artifact.project] += 1
-        return project_to_models_count
 
     def _calculate_files_counters(self, session) -> dict[str, int]:
-        # The category filter is applied post the query to the DB (manually in python code), so counting should be that
-        # way as well, therefore we're doing it here, and can't do it with sql as the above
-        # We're using the "most_recent" flag which gives us only one version of each artifact key, which is what we
-        # want to count (artifact count, not artifact versions count)
-        file_artifacts = self._find_artifacts(
-            session,
-            None,
-            category=mlrun.common.schemas.ArtifactCategories.other,
-            most_recent=True,
-        )
-        project_to_files_count = collections.defaultdict(int)
-        for file_artifact in file_artifacts:
-            project_to_files_count[file_artifact.project] += 1
-        return project_to_files_count
+        kinds, exclude = mlrun.common.schemas.ArtifactCategories.other.to_kinds_filter()
+        return self._calculate_artifacts_counters(session, kinds=kinds, exclude=exclude)
+
+    def _calculate_artifacts_counters(
+        self, session, kinds: list[str], exclude: bool = False
+    ) -> dict[str, int]:
+        # We're counting only the most recent version of each artifact key, which is what we want to count (artifact
+        # count, not artifact versions count). The counting is done by the DB, so we won't load every artifact record
+        # (and its pickled body) into memory just to count it
+        query = session.query(ArtifactV2.project, func.count(distinct(ArtifactV2.key)))
+        if exclude:
+            query = query.filter(ArtifactV2.kind.notin_(kinds))
+        else:
+            query = query.filter(ArtifactV2.kind.in_(kinds))
+        query = self._attach_most_recent_artifact_query(session, query)
+        artifacts_count_per_project = query.group_by(ArtifactV2.project).all()
+        return {result[0]: result[1] for result in artifacts_count_per_project}
 
     def _calculate_runs_counters(
         self, session
@@ -2332,6 +2399,99 @@ class SQLDB(DBInterface):
         }
         return project_to_recent_failed_runs_count, project_to_running_runs_count
 
+    def get_project_summary(
+        self, session: Session, project: str
+    ) -> mlrun.common.schemas.ProjectSummary:
+        project_summary_record = self._query(
+            session, ProjectSummary, project=project
+        ).one_or_none()
+        if not project_summary_record:
+            # the summary of a project is created by the periodic refresh, until then (e.g. right after upgrading)
+            # an existing project has an empty summary
+            if not self._query(session, Project.name, name=project).one_or_none():
+                raise mlrun.errors.MLRunNotFoundError(
+                    f"Project summary for project {project} not found"
+                )
+            return mlrun.common.schemas.ProjectSummary(name=project)
+        return mlrun.common.schemas.ProjectSummary(**project_summary_record.summary)
+
+    def list_project_summaries(
+        self,
+        session: Session,
+        projects: typing.Optional[list[str]] = None,
+    ) -> list[mlrun.common.schemas.ProjectSummary]:
+        query = self._query(session, ProjectSummary)
+        if projects is not None:
+            query = query.filter(ProjectSummary.project.in_(projects))
+        project_summaries = {
+            project_summary_record.project: mlrun.common.schemas.ProjectSummary(
+                **project_summary_record.summary
+            )
+            for project_summary_record in query
+        }
+
+        # projects whose summary wasn't created yet by the periodic refresh (e.g. right after upgrading) have an
+        # empty summary
+        if projects is None:
+            projects = [
+                project_record.name
+                for project_record in self._query(session, Project.name)
+            ]
+        for project in projects:
+            if project not in project_summaries:
+                project_summaries[project] = mlrun.common.schemas.ProjectSummary(
+                    name=project
+                )
+        return list(project_summaries.values())
+
+    def refresh_project_summaries(
+        self,
+        session: Session,
+        project_summaries: list[mlrun.common.schemas.ProjectSummary],
+    ):
+        """
+        Store the given project summaries, overriding existing ones. Summaries of projects that no longer exist are
+        not created, and stale summaries of deleted projects are removed.
+
+        :param session:           SQLAlchemy session
+        :param project_summaries: the freshly calculated project summaries
+        """
+        summaries_by_project = {
+            project_summary.name: project_summary
+            for project_summary in project_summaries
+        }
+        existing_projects = {
+            project_record.name for project_record in self._query(session, Project.name)
+        }
+        now = datetime.now(timezone.utc)
+        records_to_upsert = []
+        for project_summary_record in self._query(session, ProjectSummary):
+            project_summary = summaries_by_project.pop(
+                project_summary_record.project, None
+            )
+            if project_summary_record.project not in existing_projects:
+                session.delete(project_summary_record)
+                continue
+            if project_summary:
+                project_summary_record.summary = project_summary.dict()
+                project_summary_record.updated = now
+                records_to_upsert.append(project_summary_record)
+
+        for project_name, project_summary in summaries_by_project.items():
+            if project_name not in existing_projects:
+                continue
+            records_to_upsert.append(
+                ProjectSummary(
+                    project=project_name,
+                    summary=project_summary.dict(),
+                    updated=now,
+                )
+            )
+
+        self._upsert(session, records_to_upsert)
+        # commit the deletions even if there is nothing to upsert
+        session.commit()
+
     async def generate_projects_summaries(
         self, session: Session, projects: list[str]
     ) -> list[mlrun.common.schemas.ProjectSummary]:
@@ -3761,7 +3921,15 @@ class SQLDB(DBInterface):
         )
 
     def _find_functions(
-        self, session, name, project, uids=None, labels=None, page=None, page_size=None
+        self,
+        session,
+        name,
+        project,
+        uids=None,
+        labels=None,
+        page=None,
+        page_size=None,
+        page_cursor=None,
     ):
         query = self._query(session, Function, project=project)
         if name:
@@ -3771,7 +3939,11 @@ class SQLDB(DBInterface):
 
         labels = label_set(labels)
         query = self._add_labels_filter(session, query, Function, labels)
-        query = self._paginate_query(query, page, page_size)
+        if page is not None:
+            query = query.order_by(Function.id)
+        query = self._paginate_query(
+            query, page, page_size, page_cursor, id_column=Function.id
+        )
         return query
 
     def _delete(self, session, cls, **kw):
@@ -4853,6 +5025,7 @@ class SQLDB(DBInterface):
         current_page: int,
         page_size: int,
         kwargs: dict,
+        page_cursor: typing.Optional[dict] = None,
     ):
         # generate key hash from user, function, current_page and kwargs
         key = hashlib.sha256(
@@ -4861,6 +5034,7 @@ class SQLDB(DBInterface):
         existing_record = self.get_paginated_query_cache_record(session, key)
         if existing_record:
             existing_record.current_page = current_page
+            existing_record.page_cursor = page_cursor
             existing_record.last_accessed = datetime.now(timezone.utc)
             param_record = existing_record
         else:
@@ -4871,6 +5045,7 @@ class SQLDB(DBInterface):
                 current_page=current_page,
                 page_size=page_size,
                 kwargs=kwargs,
+                page_cursor=page_cursor,
                 last_accessed=datetime.now(timezone.utc),
             )
 
@@ -4984,11 +5159,94 @@ class SQLDB(DBInterface):
         return table_name in metadata.tables.keys()
 
     @staticmethod
-    def _paginate_query(query, page: int = None, page_size: int = None):
-        if page is not None:
-            page_size = page_size or config.httpdb.pagination.default_page_size
-            if query.count() < page_size * (page - 1):
+    def _paginate_query(
+        query,
+        page: int = None,
+        page_size: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
+        id_column=None,
+        sort_column=None,
+        descending: bool = False,
+    ):
+        """
+        Limit the query to the requested page.
+        When the query is ordered by sort_column (optional) and then by id_column, and the page cursor points at the
+        last record of the previous page, the page is seeked to right after that record instead of being reached with
+        an offset, so deep pages cost the same as the first one.
+        """
+        if page is None:
+            return query
+
+        page_size = page_size or config.httpdb.pagination.default_page_size
+        if (
+            id_column is not None
+            and page_cursor is not None
+            and page_cursor.last_id is not None
+            and page_cursor.page == page - 1
+        ):
+            return query.filter(
+                SQLDB._generate_seek_predicate(
+                    page_cursor, id_column, sort_column, descending
+                )
+            ).limit(page_size)
+
+        return query.limit(page_size).offset((page - 1) * page_size)
+
+    @staticmethod
+    def _generate_seek_predicate(
+        page_cursor: mlrun.common.schemas.PageCursor,
+        id_column,
+        sort_column=None,
+        descending: bool = False,
+    ):
+        def after(column, value):
+            return column < value if descending else column > value
+
+        id_predicate = after(id_column, page_cursor.last_id)
+        if sort_column is None:
+            return id_predicate
+
+        # nulls are the lowest values in both sqlite and mysql, so they come last in a descending order
+        # and first in an ascending one
+        last_sort_value = page_cursor.last_sort_value
+        if last_sort_value is None:
+            if descending:
+                return and_(sort_column.is_(None), id_predicate)
+            return or_(
+                sort_column.isnot(None), and_(sort_column.is_(None), id_predicate)
+            )
+
+        predicates = [
+            after(sort_column, last_sort_value),
+            and_(sort_column == last_sort_value, id_predicate),
+        ]
+        if descending:
+            predicates.append(sort_column.is_(None))
+        return or_(*predicates)
+
+    @staticmethod
+    def _advance_page_cursor(
+        records: list,
+        page: int = None,
+        page_cursor: mlrun.common.schemas.PageCursor = None,
+        sort_attribute: str = None,
+    ):
+        """
+        Move the page cursor to the last of the records retrieved for the page.
+        Raises StopIteration when a page beyond the first one is empty, which marks the end of the pagination.
+        """
+        if page is None:
+            return
+
+        if not records:
+            if page > 1:
                 raise StopIteration
-            query = query.limit(page_size).offset((page - 1) * page_size)
+            return
 
-        return query
+        if page_cursor is not None:
+            last_record = records[-1]
+            page_cursor.page = page
+            page_cursor.last_id = last_record.id
+            page_cursor.last_sort_value = (
+                getattr(last_record, sort_attribute) if sort_attribute else None
+            )
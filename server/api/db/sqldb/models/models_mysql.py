@@ -635,11 +635,29 @@ with warnings.catch_warnings():
         current_page = Column(Integer)
         page_size = Column(Integer)
         kwargs = Column(JSON)
+        page_cursor = Column(JSON)
         last_accessed = Column(
             sqlalchemy.dialects.mysql.TIMESTAMP(fsp=3),
             default=datetime.now(timezone.utc),
         )
 
+    class ProjectSummary(Base, mlrun.utils.db.BaseModel):
+        __tablename__ = "project_summaries"
+        __table_args__ = (UniqueConstraint("project", name="_project_summaries_uc"),)
+
+        id = Column(Integer, primary_key=True)
+        project = Column(
+            String(255, collation=SQLCollationUtil.collation()), nullable=False
+        )
+        updated = Column(
+            sqlalchemy.dialects.mysql.TIMESTAMP(fsp=3),
+            default=datetime.now(timezone.utc),
+        )
+        summary = Column(JSON)
+
+        def get_identifier_string(self) -> str:
+            return f"{self.project}"
+
     class AlertState(Base, mlrun.utils.db.BaseModel):
         __tablename__ = "alert_states"
         __table_args__ = (UniqueConstraint("id", "parent_id", name="alert_states_uc"),)
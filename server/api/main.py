@@ -22,6 +22,7 @@ import typing
 
 import fastapi
 import fastapi.concurrency
+import humanfriendly
 import sqlalchemy.orm
 from fastapi.exception_handlers import http_exception_handler
 
@@ -120,6 +121,12 @@ app.add_middleware(
     server.api.middlewares.UiClearCacheMiddleware, backend_version=config.version
 )
 app.add_middleware(server.api.middlewares.RequestLoggerMiddleware, logger=logger)
+if config.httpdb.response_compression.mode == "enabled":
+    app.add_middleware(
+        server.api.middlewares.ResponseCompressionMiddleware,
+        minimum_size=int(config.httpdb.response_compression.minimum_size),
+        compresslevel=int(config.httpdb.response_compression.level),
+    )
 
 
 @app.exception_handler(Exception)
@@ -223,6 +230,7 @@ async def move_api_to_online():
             _start_periodic_cleanup()
             _start_periodic_runs_monitoring()
             _start_periodic_pagination_cache_monitoring()
+            _start_periodic_project_summaries_calculation()
             await _start_periodic_logs_collection()
             await _start_periodic_stop_logs()
 
@@ -516,6 +524,22 @@ def _start_periodic_pagination_cache_monitoring():
         )
 
 
+def _start_periodic_project_summaries_calculation():
+    interval = int(
+        humanfriendly.parse_timespan(config.httpdb.projects.summaries_refresh_interval)
+    )
+    if interval > 0:
+        logger.info(
+            "Starting periodic project summaries calculation", interval=interval
+        )
+        run_function_periodically(
+            interval,
+            _refresh_project_summaries.__name__,
+            False,
+            _refresh_project_summaries,
+        )
+
+
 async def _start_periodic_stop_logs():
     if config.log_collector.mode == mlrun.common.schemas.LogsCollectorMode.legacy:
         logger.info(
@@ -704,6 +728,14 @@ def _monitor_runs_and_push_terminal_notifications(db_session):
     return stale_runs
 
 
+async def _refresh_project_summaries():
+    db_session = create_session()
+    try:
+        await server.api.crud.Projects().refresh_project_summaries(db_session)
+    finally:
+        close_session(db_session)
+
+
 def _cleanup_runtimes():
     db_session = create_session()
     try:
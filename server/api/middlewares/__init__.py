@@ -15,4 +15,5 @@
 
 from .ensure_be_version import EnsureBackendVersionMiddleware
 from .request_logger import RequestLoggerMiddleware
+from .response_compression import ResponseCompressionMiddleware
 from .ui_clear_cache import UiClearCacheMiddleware
@@ -0,0 +1,60 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from uvicorn._types import (
+    ASGI3Application,
+    ASGIReceiveCallable,
+    ASGISendCallable,
+    Scope,
+)
+
+import mlrun.common.schemas
+
+
+class ResponseCompressionMiddleware(GZipMiddleware):
+    """
+    Gzip compresses the responses for clients that accept it, except for the streamed responses (run logs and
+    NDJSON exports). The compression buffers the body until enough of it was written, which would break their
+    incremental delivery.
+    """
+
+    # GET /log/{project}/{uid} and /projects/{project}/logs/{uid}
+    _streamed_paths = re.compile(r"/(log/[^/]+|projects/[^/]+/logs)/[^/]+/?$")
+
+    def __init__(
+        self,
+        app: "ASGI3Application",
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(
+        self, scope: "Scope", receive: "ASGIReceiveCallable", send: "ASGISendCallable"
+    ) -> None:
+        if scope["type"] == "http" and self._is_streamed(scope):
+            return await self.app(scope, receive, send)
+        return await super().__call__(scope, receive, send)
+
+    def _is_streamed(self, scope: "Scope") -> bool:
+        headers = Headers(scope=scope)
+        if mlrun.common.schemas.MediaTypes.ndjson in headers.get("accept", ""):
+            return True
+        return scope.get("method") == "GET" and bool(
+            self._streamed_paths.search(scope.get("path", ""))
+        )
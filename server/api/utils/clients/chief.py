@@ -327,14 +327,21 @@ class Client(
     async def _convert_requests_response_to_fastapi_response(
         chief_response: aiohttp.ClientResponse,
     ) -> fastapi.Response:
+        # the http client already decompressed the content, so the encoding and length headers describe a body we
+        # are not sending. the response is compressed (if needed) again on its way back to the client
+        headers = {
+            name: value
+            # chief_response.headers is of type CaseInsensitiveDict
+            for name, value in dict(chief_response.headers).items()
+            if name.lower() not in ["content-encoding", "content-length"]
+        }
+
         # based on the way we implemented the exception handling for endpoints in MLRun we can expect the media type
         # of the response to be of type application/json, see server.api.http_status_error_handler for reference
         return fastapi.responses.Response(
             content=await chief_response.text(),
             status_code=chief_response.status,
-            headers=dict(
-                chief_response.headers
-            ),  # chief_response.headers is of type CaseInsensitiveDict
+            headers=headers,
             media_type="application/json",
         )
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 #
 import inspect
+import json
 import typing
 
 import pydantic
@@ -22,6 +23,7 @@ import mlrun.common.schemas
 import mlrun.errors
 import mlrun.utils.singleton
 import server.api.crud
+import server.api.db.session
 import server.api.utils.asyncio
 from mlrun import mlconf
 from mlrun.utils import logger
@@ -61,6 +63,7 @@ class PaginatedMethods:
         # TODO: add methods when they implement pagination
         server.api.crud.Runs().list_runs,
         server.api.crud.Functions().list_functions,
+        server.api.crud.Artifacts().list_artifacts,
     ]
     _method_map = {
         method.__name__: {
@@ -133,9 +136,58 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
             last_pagination_info = pagination_info
             current_page = last_pagination_info.page + 1
             page_size = last_pagination_info.page_size
+            # continue with the token so the next page is retrieved from where the current one ended
+            token = last_pagination_info.page_token
 
         return result, last_pagination_info.dict(by_alias=True)
 
+    async def iterate_permission_filtered_request(
+        self,
+        method: typing.Callable,
+        filter_: typing.Callable,
+        page_size: typing.Optional[int] = None,
+        **method_kwargs,
+    ) -> typing.AsyncIterator[list]:
+        """
+        Iterate over all the results of a request in pages, yielding each page after it was filtered with the
+        provided filter function. Used for streaming bulk exports, so unlike the paginated requests no pagination
+        cache record is stored, and the pages are retrieved with a db session of their own as the iteration outlives
+        the request which started it.
+        """
+        if not PaginatedMethods.method_is_supported(method):
+            raise NotImplementedError(
+                f"Pagination is not supported for method {method}"
+            )
+
+        page_size = page_size or mlconf.httpdb.pagination.export_batch_size
+        page_cursor = mlrun.common.schemas.pagination.PageCursor()
+        page = 1
+        session = server.api.db.session.create_session()
+        try:
+            while True:
+                try:
+                    result = await server.api.utils.asyncio.await_or_call_in_threadpool(
+                        method,
+                        session,
+                        **method_kwargs,
+                        page=page,
+                        page_size=page_size,
+                        page_cursor=page_cursor,
+                    )
+                except (RuntimeError, StopIteration) as exc:
+                    if isinstance(exc, StopIteration) or "StopIteration" in str(exc):
+                        return
+                    raise
+
+                yield await server.api.utils.asyncio.await_or_call_in_threadpool(
+                    filter_, result
+                )
+                if len(result) < page_size:
+                    return
+                page += 1
+        finally:
+            server.api.db.session.close_session(session)
+
     async def paginate_request(
         self,
         session: sqlalchemy.orm.Session,
@@ -162,12 +214,12 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
         page_size = page_size or mlconf.httpdb.pagination.default_page_size
 
         (
-            token,
             page,
             page_size,
             method,
             method_kwargs,
-        ) = self._create_or_update_pagination_cache_record(
+            page_cursor,
+        ) = self._resolve_pagination_cache_record(
             session,
             method,
             auth_info,
@@ -184,23 +236,47 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
                 page_size=page_size,
                 method=method.__name__,
             )
-            return await server.api.utils.asyncio.await_or_call_in_threadpool(
-                method, session, **method_kwargs, page=page, page_size=page_size
-            ), mlrun.common.schemas.pagination.PaginationInfo(
-                page=page, page_size=page_size, page_token=token
+            result = await server.api.utils.asyncio.await_or_call_in_threadpool(
+                method,
+                session,
+                **method_kwargs,
+                page=page,
+                page_size=page_size,
+                page_cursor=page_cursor,
             )
         except (RuntimeError, StopIteration) as exc:
             if isinstance(exc, StopIteration) or "StopIteration" in str(exc):
                 self._logger.debug(
                     "End of pagination", token=token, method=method.__name__
                 )
-                self._pagination_cache.delete_pagination_cache_record(
-                    session, key=token
-                )
+                if token:
+                    self._pagination_cache.delete_pagination_cache_record(
+                        session, key=token
+                    )
                 return [], None
             raise
 
-    def _create_or_update_pagination_cache_record(
+        # store the record only once the page was retrieved, so it holds the cursor the page ended at
+        self._logger.debug(
+            "Storing pagination cache record",
+            method=method.__name__,
+            page=page,
+            page_size=page_size,
+        )
+        token = self._pagination_cache.store_pagination_cache_record(
+            session,
+            user=auth_info.user_id if auth_info else None,
+            method=method,
+            current_page=page,
+            page_size=page_size,
+            kwargs=method_kwargs,
+            page_cursor=json.loads(page_cursor.json()),
+        )
+        return result, mlrun.common.schemas.pagination.PaginationInfo(
+            page=page, page_size=page_size, page_token=token
+        )
+
+    def _resolve_pagination_cache_record(
         self,
         session: sqlalchemy.orm.Session,
         method: typing.Callable,
@@ -209,10 +285,13 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
         **method_kwargs,
-    ) -> tuple[str, int, int, typing.Callable, dict]:
+    ) -> tuple[
+        int, int, typing.Callable, dict, mlrun.common.schemas.pagination.PageCursor
+    ]:
+        page_cursor = mlrun.common.schemas.pagination.PageCursor()
         if token:
             self._logger.debug(
-                "Token provided, updating pagination cache record", token=token
+                "Token provided, resolving pagination cache record", token=token
             )
             pagination_cache_record = (
                 self._pagination_cache.get_pagination_cache_record(session, key=token)
@@ -226,29 +305,18 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
             page = page or pagination_cache_record.current_page + 1
             page_size = pagination_cache_record.page_size
             user = pagination_cache_record.user
+            if pagination_cache_record.page_cursor:
+                page_cursor = mlrun.common.schemas.pagination.PageCursor(
+                    **pagination_cache_record.page_cursor
+                )
 
             if user and (not auth_info or auth_info.user_id != user):
                 raise mlrun.errors.MLRunAccessDeniedError(
                     "User is not allowed to access this token"
                 )
 
-        # upsert pagination cache record to update last_accessed time or create a new record
         method_schema = PaginatedMethods.get_method_schema(method.__name__)
         serialized_kwargs = method_schema(**method_kwargs).dict()
-        del serialized_kwargs["page"]
-        del serialized_kwargs["page_size"]
-        self._logger.debug(
-            "Storing pagination cache record",
-            method=method.__name__,
-            page=page,
-            page_size=page_size,
-        )
-        token = self._pagination_cache.store_pagination_cache_record(
-            session,
-            user=auth_info.user_id if auth_info else None,
-            method=method,
-            current_page=page,
-            page_size=page_size,
-            kwargs=serialized_kwargs,
-        )
-        return token, page, page_size, method, serialized_kwargs
+        for pagination_kwarg in ["page", "page_size", "page_cursor"]:
+            serialized_kwargs.pop(pagination_kwarg, None)
+        return page, page_size, method, serialized_kwargs, page_cursor
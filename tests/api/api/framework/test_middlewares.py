@@ -21,6 +21,7 @@ import sqlalchemy.orm
 
 import mlrun.common.schemas.constants
 import mlrun.utils.version
+import server.api.middlewares
 
 
 @pytest.mark.parametrize(
@@ -86,3 +87,34 @@ def test_ensure_be_version_middleware(
         response.headers[mlrun.common.schemas.constants.HeaderNames.backend_version]
         == "dummy-version"
     )
+
+
+@pytest.mark.parametrize(
+    "method,path,accept,streamed",
+    [
+        ("GET", "/api/v1/projects/some-project/runs", "", False),
+        ("GET", "/api/v1/projects/some-project/logs/some-uid", "", True),
+        ("GET", "/api/v1/log/some-project/some-uid", "", True),
+        ("GET", "/api/v1/projects/some-project/logs/some-uid/size", "", False),
+        ("POST", "/api/v1/projects/some-project/logs/some-uid", "", False),
+        (
+            "GET",
+            "/api/v1/projects/some-project/runs",
+            mlrun.common.schemas.MediaTypes.ndjson,
+            True,
+        ),
+    ],
+)
+def test_response_compression_middleware_skips_streamed_responses(
+    method: str, path: str, accept: str, streamed: bool
+) -> None:
+    middleware = server.api.middlewares.ResponseCompressionMiddleware(
+        unittest.mock.Mock()
+    )
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(b"accept", accept.encode()), (b"accept-encoding", b"gzip")],
+    }
+    assert middleware._is_streamed(scope) == streamed
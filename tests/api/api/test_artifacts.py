@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import json
 import tempfile
 import unittest.mock
 from http import HTTPStatus
@@ -23,6 +24,7 @@ from sqlalchemy.orm import Session
 
 import mlrun.artifacts
 import mlrun.common.schemas
+import server.api.crud
 from mlrun.common.constants import MYSQL_MEDIUMBLOB_SIZE_BYTES
 from mlrun.utils.helpers import is_legacy_artifact
 
@@ -203,6 +205,81 @@ def test_create_artifact(db: Session, unversioned_client: TestClient):
     assert response_data["spec"]["target_path"] == data["spec"]["target_path"]
 
 
+def test_store_artifacts(db: Session, unversioned_client: TestClient):
+    _create_project(unversioned_client, prefix="v1")
+    keys = [f"{KEY}-{index}" for index in range(3)]
+    artifacts = [
+        {
+            "key": key,
+            "artifact": mlrun.artifacts.Artifact(key=key, body="123").to_dict(),
+            "tag": TAG,
+            "tree": "some-tree",
+        }
+        for key in keys
+    ]
+    resp = unversioned_client.put(
+        f"v2/projects/{PROJECT}/artifacts", json={"artifacts": artifacts}
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+
+    resp = unversioned_client.get(
+        f"v2/projects/{PROJECT}/artifacts", params={"tag": TAG}
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    stored_artifacts = resp.json()["artifacts"]
+    assert sorted(
+        artifact["metadata"]["key"] for artifact in stored_artifacts
+    ) == sorted(keys)
+    for artifact in stored_artifacts:
+        assert artifact["metadata"]["tree"] == "some-tree"
+
+
+def test_export_artifacts_ndjson(db: Session, unversioned_client: TestClient):
+    _create_project(unversioned_client, prefix="v1")
+    keys = [f"{KEY}-{index}" for index in range(5)]
+    resp = unversioned_client.put(
+        f"v2/projects/{PROJECT}/artifacts",
+        json={
+            "artifacts": [
+                {
+                    "key": key,
+                    "artifact": mlrun.artifacts.Artifact(key=key, body="123").to_dict(),
+                    "tag": TAG,
+                }
+                for key in keys
+            ]
+        },
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+
+    # export in batches smaller than the number of artifacts
+    mlrun.mlconf.httpdb.pagination.export_batch_size = 2
+    list_artifacts_mock = unittest.mock.Mock(
+        side_effect=server.api.crud.Artifacts().list_artifacts
+    )
+    list_artifacts_mock.__name__ = "list_artifacts"
+    with unittest.mock.patch.object(
+        server.api.crud.Artifacts, "list_artifacts", list_artifacts_mock
+    ):
+        resp = unversioned_client.get(
+            f"v2/projects/{PROJECT}/artifacts",
+            params={"tag": TAG},
+            headers={"Accept": mlrun.common.schemas.MediaTypes.ndjson},
+        )
+    assert resp.status_code == HTTPStatus.OK.value
+    assert resp.headers["content-type"] == mlrun.common.schemas.MediaTypes.ndjson
+    exported_artifacts = [json.loads(line) for line in resp.text.splitlines()]
+    assert sorted(
+        artifact["metadata"]["key"] for artifact in exported_artifacts
+    ) == sorted(keys)
+    # the artifacts are retrieved from the db page by page (3 full or partial pages)
+    assert [call.kwargs["page"] for call in list_artifacts_mock.call_args_list] == [
+        1,
+        2,
+        3,
+    ]
+
+
 def test_delete_artifacts_after_storing_empty_dict(db: Session, client: TestClient):
     _create_project(client)
     empty_artifact = "{}"
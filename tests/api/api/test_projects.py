@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import copy
 import datetime
 import http
@@ -365,6 +366,7 @@ def test_list_and_get_project_summaries(
     )
 
     # list project summaries
+    _refresh_project_summaries(db)
     response = client.get("project-summaries")
     project_summaries_output = mlrun.common.schemas.ProjectSummariesOutput(
         **response.json()
@@ -423,6 +425,7 @@ def test_list_project_summaries_different_installation_modes(
     mlrun.mlconf.kfp_url = "https://somekfp-url.com"
     mlrun.mlconf.namespace = "default-tenant"
 
+    _refresh_project_summaries(db)
     response = client.get("project-summaries")
     assert response.status_code == HTTPStatus.OK.value
     project_summaries_output = mlrun.common.schemas.ProjectSummariesOutput(
@@ -445,6 +448,7 @@ def test_list_project_summaries_different_installation_modes(
     mlrun.mlconf.kfp_url = ""
     mlrun.mlconf.namespace = "default-tenant"
 
+    _refresh_project_summaries(db)
     response = client.get("project-summaries")
     assert response.status_code == HTTPStatus.OK.value
     project_summaries_output = mlrun.common.schemas.ProjectSummariesOutput(
@@ -467,6 +471,7 @@ def test_list_project_summaries_different_installation_modes(
     mlrun.mlconf.kfp_url = ""
     mlrun.mlconf.namespace = "mlrun"
 
+    _refresh_project_summaries(db)
     response = client.get("project-summaries")
     assert response.status_code == HTTPStatus.OK.value
     project_summaries_output = mlrun.common.schemas.ProjectSummariesOutput(
@@ -489,6 +494,7 @@ def test_list_project_summaries_different_installation_modes(
     mlrun.mlconf.kfp_url = ""
     mlrun.mlconf.namespace = ""
 
+    _refresh_project_summaries(db)
     response = client.get("project-summaries")
     assert response.status_code == HTTPStatus.OK.value
     project_summaries_output = mlrun.common.schemas.ProjectSummariesOutput(
@@ -1538,6 +1544,11 @@ def _assert_project_response(
     _assert_project(expected_project, project, extra_exclude)
 
 
+def _refresh_project_summaries(db: Session):
+    # project summaries are calculated by a periodic task, trigger it so the summaries will be up-to-date
+    asyncio.run(server.api.crud.Projects().refresh_project_summaries(db))
+
+
 def _assert_project_summary(
     project_summary: mlrun.common.schemas.ProjectSummary,
     files_count: int,
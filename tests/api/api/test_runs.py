@@ -14,6 +14,7 @@
 #
 import asyncio
 import copy
+import json
 import time
 import unittest.mock
 import uuid
@@ -942,6 +943,89 @@ def test_abort_aborted_run_failure(db: Session, client: TestClient) -> None:
         assert background_task.status.error == "some error"
 
 
+def test_list_runs_compressed_response(db: Session, client: TestClient):
+    project = "some-project"
+    for _ in range(20):
+        _store_run(db, uid=None, project=project)
+
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project),
+        params={"iter": True},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == HTTPStatus.OK.value
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["runs"]) == 20
+
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project),
+        params={"iter": True},
+        headers={"Accept-Encoding": "identity"},
+    )
+    assert response.status_code == HTTPStatus.OK.value
+    assert "content-encoding" not in response.headers
+    assert len(response.json()["runs"]) == 20
+
+
+def test_export_runs_ndjson(db: Session, client: TestClient):
+    project = "some-project"
+    names = {f"run-name-{index}" for index in range(25)}
+    for name in names:
+        _store_run(db, uid=None, project=project, name=name)
+
+    # a page size smaller than the number of runs, so the export spans several pages
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project),
+        params={"iter": True, "page-size": 10},
+        headers={
+            "Accept": mlrun.common.schemas.MediaTypes.ndjson,
+            "Accept-Encoding": "gzip",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK.value
+    assert response.headers["content-type"] == mlrun.common.schemas.MediaTypes.ndjson
+    # streamed responses are not compressed, which would buffer them
+    assert "content-encoding" not in response.headers
+    runs = [json.loads(line) for line in response.text.splitlines()]
+    assert {run["metadata"]["name"] for run in runs} == names
+    assert len(runs) == 25
+
+    # filtered out runs are not exported
+    with unittest.mock.patch.object(
+        server.api.utils.auth.verifier.AuthVerifier,
+        "filter_project_resources_by_permissions",
+        side_effect=lambda _, resources, *args, **kwargs: resources[:1],
+    ):
+        response = client.get(
+            RUNS_API_ENDPOINT.format(project=project),
+            params={"iter": True, "page-size": 10},
+            headers={"Accept": mlrun.common.schemas.MediaTypes.ndjson},
+        )
+    assert len(response.text.splitlines()) == 3
+
+
+def test_update_runs(db: Session, client: TestClient):
+    project = "some-project"
+    uids = [str(uuid.uuid4()) for _ in range(3)]
+    for uid in uids:
+        _store_run(db, uid=uid, project=project)
+
+    response = client.patch(
+        RUNS_API_ENDPOINT.format(project=project),
+        json={
+            "runs": [
+                {"uid": uid, "updates": {"status.state": "completed"}}
+                for uid in uids[:2]
+            ]
+        },
+    )
+    assert response.status_code == HTTPStatus.OK.value
+
+    for uid, expected_state in zip(uids, ["completed", "completed", "created"]):
+        run = server.api.crud.Runs().get_run(db, uid, 0, project)
+        assert run["status"]["state"] == expected_state
+
+
 def _store_run(db, uid, project="some-project", name="run-name"):
     run_with_nan_float = {
         "metadata": {"name": name},
@@ -66,6 +66,33 @@ class TestArtifacts:
         artifacts = db.list_artifacts(db_session, name="~artifact_name")
         assert len(artifacts) == 2
 
+    def test_list_artifacts_paginated_with_page_cursor(
+        self, db: DBInterface, db_session: Session
+    ):
+        for i in range(5):
+            key = f"artifact_{i}"
+            db.store_artifact(db_session, key, self._generate_artifact(key))
+        expected_keys = [
+            artifact["metadata"]["key"] for artifact in db.list_artifacts(db_session)
+        ]
+        assert len(expected_keys) == 5
+
+        page_cursor = mlrun.common.schemas.PageCursor()
+        page_size = 2
+        paginated_keys = []
+        for page in range(1, 4):
+            artifacts = db.list_artifacts(
+                db_session, page=page, page_size=page_size, page_cursor=page_cursor
+            )
+            assert page_cursor.page == page
+            paginated_keys.extend(artifact["metadata"]["key"] for artifact in artifacts)
+
+        assert sorted(paginated_keys) == sorted(expected_keys)
+        with pytest.raises(StopIteration):
+            db.list_artifacts(
+                db_session, page=4, page_size=page_size, page_cursor=page_cursor
+            )
+
     def test_list_artifact_iter_parameter(self, db: DBInterface, db_session: Session):
         artifact_name_1 = "artifact_name_1"
         artifact_name_2 = "artifact_name_2"
@@ -22,7 +22,7 @@ import mlrun.common.schemas
 import mlrun.config
 import mlrun.errors
 from server.api.db.base import DBInterface
-from server.api.db.sqldb.models import Project
+from server.api.db.sqldb.models import Project, ProjectSummary
 
 
 def test_get_project(
@@ -320,6 +320,73 @@ def test_delete_project(
 
     with pytest.raises(mlrun.errors.MLRunNotFoundError):
         db.get_project(db_session, project_name)
+    with pytest.raises(mlrun.errors.MLRunNotFoundError):
+        db.get_project_summary(db_session, project_name)
+
+
+def test_refresh_project_summaries(
+    db: DBInterface,
+    db_session: sqlalchemy.orm.Session,
+):
+    project_names = ["project-1", "project-2"]
+    for project_name in project_names:
+        db.create_project(
+            db_session,
+            mlrun.common.schemas.Project(
+                metadata=mlrun.common.schemas.ProjectMetadata(name=project_name),
+            ),
+        )
+
+    # new projects get an empty summary until the summaries are refreshed
+    project_summary = db.get_project_summary(db_session, "project-1")
+    assert project_summary.name == "project-1"
+    assert project_summary.files_count == 0
+
+    db.refresh_project_summaries(
+        db_session,
+        [
+            mlrun.common.schemas.ProjectSummary(name="project-1", files_count=3),
+            mlrun.common.schemas.ProjectSummary(name="project-2", models_count=2),
+            # summaries of projects that don't exist should be ignored
+            mlrun.common.schemas.ProjectSummary(name="no-such-project"),
+        ],
+    )
+    project_summaries = db.list_project_summaries(db_session)
+    assert len(project_summaries) == 2
+    project_summaries = {
+        project_summary.name: project_summary for project_summary in project_summaries
+    }
+    assert project_summaries["project-1"].files_count == 3
+    assert project_summaries["project-2"].models_count == 2
+
+    project_summaries = db.list_project_summaries(db_session, projects=["project-2"])
+    assert len(project_summaries) == 1
+    assert project_summaries[0].name == "project-2"
+
+
+def test_project_summaries_without_records(
+    db: DBInterface,
+    db_session: sqlalchemy.orm.Session,
+):
+    project_name = "project-name"
+    db.create_project(
+        db_session,
+        mlrun.common.schemas.Project(
+            metadata=mlrun.common.schemas.ProjectMetadata(name=project_name),
+        ),
+    )
+    # simulate a project that existed before the summaries table, which wasn't refreshed yet
+    db_session.query(ProjectSummary).delete()
+    db_session.commit()
+
+    project_summary = db.get_project_summary(db_session, project_name)
+    assert project_summary == mlrun.common.schemas.ProjectSummary(name=project_name)
+
+    project_summaries = db.list_project_summaries(db_session)
+    assert project_summaries == [mlrun.common.schemas.ProjectSummary(name=project_name)]
+
+    with pytest.raises(mlrun.errors.MLRunNotFoundError):
+        db.get_project_summary(db_session, "no-such-project")
 
 
 def _generate_project():
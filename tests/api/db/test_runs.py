@@ -397,6 +397,40 @@ def test_update_run_labels(db: DBInterface, db_session: Session):
     assert run["metadata"]["labels"] == {"a": "b"}
 
 
+def test_update_runs(db: DBInterface, db_session: Session):
+    uids = [f"run-uid-{index}" for index in range(3)]
+    for uid in uids:
+        project, *_ = _create_new_run(db, db_session, uid=uid)
+
+    runs = [
+        mlrun.common.schemas.RunUpdate(
+            uid=uid,
+            updates={"status.state": "completed", "metadata.labels": {"a": uid}},
+        )
+        for uid in uids[:2]
+    ]
+    with unittest.mock.patch.object(db, "_commit", wraps=db._commit) as commit:
+        db.update_runs(db_session, runs, project)
+    # the runs are committed together
+    assert commit.call_count == 1
+
+    for uid, state in zip(uids, ["completed", "completed", "created"]):
+        run = db.read_run(db_session, uid, project)
+        assert run["status"]["state"] == state
+    assert db.read_run(db_session, uids[0], project)["metadata"]["labels"] == {
+        "a": uids[0]
+    }
+
+    # none of the runs is updated when one of them is not found
+    runs = [
+        mlrun.common.schemas.RunUpdate(uid=uid, updates={"status.state": "error"})
+        for uid in [uids[2], "missing-uid"]
+    ]
+    with pytest.raises(mlrun.errors.MLRunNotFoundError):
+        db.update_runs(db_session, runs, project)
+    assert db.read_run(db_session, uids[2], project)["status"]["state"] == "created"
+
+
 def test_store_and_update_run_update_name_failure(db: DBInterface, db_session: Session):
     project, name, uid, iteration, run = _create_new_run(db, db_session)
 
@@ -438,6 +472,59 @@ def test_list_runs_limited_unsorted_failure(db: DBInterface, db_session: Session
         )
 
 
+def test_list_runs_paginated_with_page_cursor(db: DBInterface, db_session: Session):
+    project = "project"
+    start_times = [
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, tzinfo=timezone.utc),
+    ]
+    for i in range(7):
+        # runs share start times so the pages are split in the middle of start time ties
+        run = {
+            "metadata": {"name": f"run-{i}", "uid": f"uid-{i}", "project": project},
+            "status": {"start_time": start_times[i % 2].isoformat()},
+        }
+        db.store_run(db_session, run, f"uid-{i}", project)
+
+    expected_uids = [
+        run["metadata"]["uid"] for run in db.list_runs(db_session, project=project)
+    ]
+    assert len(expected_uids) == 7
+
+    page_cursor = mlrun.common.schemas.PageCursor()
+    page_size = 3
+    paginated_uids = []
+    for page in range(1, 4):
+        runs = db.list_runs(
+            db_session,
+            project=project,
+            page=page,
+            page_size=page_size,
+            page_cursor=page_cursor,
+        )
+        assert page_cursor.page == page
+        paginated_uids.extend(run["metadata"]["uid"] for run in runs)
+
+        # seeking from the cursor and offsetting to the page must retrieve the same runs
+        offset_runs = db.list_runs(
+            db_session, project=project, page=page, page_size=page_size
+        )
+        assert [run["metadata"]["uid"] for run in offset_runs] == [
+            run["metadata"]["uid"] for run in runs
+        ]
+
+    assert paginated_uids == expected_uids
+
+    with pytest.raises(StopIteration):
+        db.list_runs(
+            db_session,
+            project=project,
+            page=4,
+            page_size=page_size,
+            page_cursor=page_cursor,
+        )
+
+
 def _change_run_record_to_before_align_runs_migration(run, time_before_creation):
     run_dict = run.struct
 
@@ -406,6 +406,7 @@ async def test_list_project_summaries(
     nop_leader: server.api.utils.projects.remotes.leader.Member,
 ):
     project = _generate_project(name="name-1")
+    server.api.utils.singletons.db.get_db().create_project(db, project)
     project_summary = mlrun.common.schemas.ProjectSummary(
         name=project.metadata.name,
         files_count=4,
@@ -422,6 +423,7 @@ async def test_list_project_summaries(
     server.api.crud.Projects().generate_projects_summaries.return_value.set_result(
         [project_summary]
     )
+    await server.api.crud.Projects().refresh_project_summaries(db)
     project_summaries = await projects_follower.list_project_summaries(db)
     assert len(project_summaries.project_summaries) == 1
     assert (
@@ -442,7 +444,9 @@ async def test_list_project_summaries_fails_to_list_pipeline_runs(
     nop_leader: server.api.utils.projects.remotes.leader.Member,
 ):
     project_name = "project-name"
-    _generate_project(name=project_name)
+    server.api.utils.singletons.db.get_db().create_project(
+        db, _generate_project(name=project_name)
+    )
     server.api.utils.singletons.db.get_db().list_projects = unittest.mock.Mock(
         return_value=mlrun.common.schemas.ProjectsOutput(projects=[project_name])
     )
@@ -453,6 +457,7 @@ async def test_list_project_summaries_fails_to_list_pipeline_runs(
     server.api.utils.singletons.db.get_db().get_project_resources_counters = (
         unittest.mock.AsyncMock(return_value=tuple({project_name: i} for i in range(6)))
     )
+    await server.api.crud.Projects().refresh_project_summaries(db)
     project_summaries = await projects_follower.list_project_summaries(db)
     assert len(project_summaries.project_summaries) == 1
     assert project_summaries.project_summaries[0].name == project_name
@@ -30,6 +30,7 @@ def paginated_method(
     total_amount: int,
     page: typing.Optional[int] = None,
     page_size: typing.Optional[int] = None,
+    page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
 ):
     items = [{"name": f"item{i}"} for i in range(total_amount)]
     if not page_size:
@@ -625,3 +625,67 @@ def test_producer_in_exported_artifact():
     with open(artifact_path) as file:
         exported_artifact = yaml.load(file, Loader=yaml.FullLoader)
         assert "producer" not in exported_artifact["spec"]
+
+
+def test_coalesce_artifacts_db_writes():
+    artifact_db = unittest.mock.Mock()
+    artifact_manager = mlrun.artifacts.manager.ArtifactManager(db=artifact_db)
+    producer = mlrun.artifacts.manager.ArtifactProducer(
+        "api", "my-project", "my-producer"
+    )
+    keys = ["artifact-1", "artifact-2"]
+
+    with tempfile.TemporaryDirectory() as artifact_path:
+        with artifact_manager.coalesce_db_writes():
+            # nested contexts are flushed by the outermost one
+            with artifact_manager.coalesce_db_writes():
+                for key in keys:
+                    artifact_manager.log_artifact(
+                        producer,
+                        mlrun.artifacts.Artifact(key=key, body=b"x=1"),
+                        artifact_path=artifact_path,
+                    )
+            artifact_db.store_artifact.assert_not_called()
+            artifact_db.store_artifacts.assert_not_called()
+
+    artifact_db.store_artifact.assert_not_called()
+    artifact_db.store_artifacts.assert_called_once()
+    stored_artifacts = artifact_db.store_artifacts.call_args.args[0]
+    assert [artifact["key"] for artifact in stored_artifacts] == keys
+    assert artifact_db.store_artifacts.call_args.kwargs["project"] == "my-project"
+
+
+def test_coalesce_artifacts_db_writes_failures():
+    artifact_db = unittest.mock.Mock()
+    artifact_manager = mlrun.artifacts.manager.ArtifactManager(db=artifact_db)
+    producer = mlrun.artifacts.manager.ArtifactProducer(
+        "api", "my-project", "my-producer"
+    )
+
+    with tempfile.TemporaryDirectory() as artifact_path:
+        # the artifacts logged before a failure are stored, and a failure to store them doesn't mask the original one
+        artifact_db.store_artifacts.side_effect = mlrun.errors.MLRunRuntimeError(
+            "store failed"
+        )
+        with pytest.raises(ValueError, match="handler failed"):
+            with artifact_manager.coalesce_db_writes():
+                artifact_manager.log_artifact(
+                    producer,
+                    mlrun.artifacts.Artifact(key="artifact-1", body=b"x=1"),
+                    artifact_path=artifact_path,
+                )
+                raise ValueError("handler failed")
+        artifact_db.store_artifacts.assert_called_once()
+
+        # when the context succeeds, a failure to store the artifacts is raised
+        with pytest.raises(mlrun.errors.MLRunRuntimeError, match="store failed"):
+            with artifact_manager.coalesce_db_writes():
+                artifact_manager.log_artifact(
+                    producer,
+                    mlrun.artifacts.Artifact(key="artifact-2", body=b"x=1"),
+                    artifact_path=artifact_path,
+                )
+        assert artifact_db.store_artifacts.call_count == 2
+
+    # the pending artifacts are reset, so the manager can coalesce again
+    assert artifact_manager._pending_db_artifacts is None
@@ -66,7 +66,7 @@ def config_test_base():
     environ["MLRUN_HTTPDB__DIRPATH"] = rundb_path
     environ["MLRUN_HTTPDB__LOGS_PATH"] = logs_path
     environ["MLRUN_HTTPDB__PROJECTS__PERIODIC_SYNC_INTERVAL"] = "0 seconds"
-    environ["MLRUN_HTTPDB__PROJECTS__COUNTERS_CACHE_TTL"] = "0 seconds"
+    environ["MLRUN_HTTPDB__PROJECTS__SUMMARIES_REFRESH_INTERVAL"] = "0 seconds"
     environ["MLRUN_EXEC_CONFIG"] = ""
     global_context.set(None)
     log_level = "DEBUG"
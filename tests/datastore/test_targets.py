@@ -11,15 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import collections
+import datetime
+import fnmatch
 import os
+import time
+import unittest.mock
 
 import pandas as pd
 import pytest
 
 import mlrun.errors
-from mlrun.datastore import StreamTarget
-from mlrun.datastore.targets import BaseStoreTarget, KafkaTarget, ParquetTarget
-from mlrun.feature_store import FeatureSet
+from mlrun.datastore import StreamTarget, targets
+from mlrun.datastore.targets import (
+    BaseStoreTarget,
+    KafkaTarget,
+    NoSqlTarget,
+    ParquetTarget,
+    RedisNoSqlTarget,
+)
+from mlrun.feature_store import FeatureSet, ingestion
 
 
 class MockGraph:
@@ -111,3 +123,312 @@ def test_write_with_too_many_partitions():
         match="Maximum number of partitions exceeded. To resolve this.*",
     ):
         parquet_target.write_dataframe(df)
+
+
+class FakeRedis:
+    """in memory redis hashes, with the commands used by the bulk load and the storey redis driver"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.executed_pipelines = 0
+        # single (not pipelined) commands
+        self.calls = collections.Counter()
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+    def get(self, name):
+        self.calls["get"] += 1
+        return None
+
+    def hget(self, name, key):
+        self.calls["hget"] += 1
+        return self.hashes.get(name, {}).get(key)
+
+    def hgetall(self, name):
+        self.calls["hgetall"] += 1
+        return dict(self.hashes.get(name, {}))
+
+    def hmget(self, name, keys):
+        self.calls["hmget"] += 1
+        values = self.hashes.get(name, {})
+        return [values.get(key) for key in keys]
+
+    def hscan(self, name, cursor=0, match=None):
+        self.calls["hscan"] += 1
+        values = self.hashes.get(name, {})
+        pattern = (match or "*").replace("[^", "[!")
+        return 0, {
+            key: value
+            for key, value in values.items()
+            if fnmatch.fnmatchcase(key, pattern)
+        }
+
+
+class FakeRedisPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hset(self, name, mapping):
+        self.commands.append(
+            lambda: self.redis.hashes.setdefault(name, {}).update(mapping)
+        )
+
+    def hgetall(self, name):
+        self.commands.append(lambda: dict(self.redis.hashes.get(name, {})))
+
+    def execute(self):
+        self.redis.executed_pipelines += 1
+        return [command() for command in self.commands]
+
+
+def _online_df(size):
+    return pd.DataFrame(
+        {
+            "id": [f"id{i % (size // 2)}" for i in range(size)],
+            "count": range(size),
+            "value": [i / 2 for i in range(size)],
+            "name": [f"name{i}" for i in range(size)],
+            "time": pd.Timestamp("2024-01-01", tz="UTC"),
+        }
+    ).set_index("id")
+
+
+@pytest.mark.parametrize("parallelism", [1, 3])
+def test_redis_bulk_load(parallelism):
+    from storey.redis_driver import RedisDriver
+    from storey.utils import _split_path
+
+    redis = FakeRedis()
+    target = RedisNoSqlTarget(path="redis://localhost:6379")
+    target.set_resource(FeatureSet("my-featureset", entities=["id"]))
+    with unittest.mock.patch(
+        "mlrun.datastore.redis.get_redis_client", return_value=redis
+    ):
+        target.write_dataframe(_online_df(100), batch_size=10, parallelism=parallelism)
+
+    # the last row of each key is written, in batches
+    assert len(redis.hashes) == 50
+    assert redis.executed_pipelines == 5
+
+    # the storey driver (used for the online reads) reads the written values
+    _, uri = target._get_server_endpoint()
+    container, table_path = _split_path(uri)
+    driver = RedisDriver(redis_client=redis, key_prefix="/")
+    values = asyncio.run(driver._load_by_key(container, table_path, "id3", "*"))
+    assert values == {
+        "count": 53,
+        "value": 26.5,
+        "name": "name53",
+        "time": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "alice",
+        3,
+        2.5,
+        4.0,
+        True,
+        float("inf"),
+        datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        datetime.timedelta(minutes=5),
+    ],
+)
+def test_redis_bulk_load_values(value):
+    from storey.redis_driver import RedisDriver
+
+    from mlrun.datastore.targets import _to_redis_value
+
+    # the values are encoded like the storey writer, so they are decoded by the storey driver
+    decoded = RedisDriver.convert_redis_value_to_python_obj(_to_redis_value(value))
+    assert decoded == value
+
+
+def test_nosql_bulk_load():
+    written = []
+    frames_client = unittest.mock.Mock()
+    frames_client.write.side_effect = lambda kind, path, df, **kwargs: written.append(
+        (path, len(df), kwargs)
+    )
+    target = NoSqlTarget(path="v3io:///projects/my-project/my-table")
+    with unittest.mock.patch.object(
+        targets, "get_frames_client", return_value=frames_client
+    ):
+        stats = target.bulk_load(
+            _online_df(100).reset_index(), key_column=["id"], batch_size=40
+        )
+
+    assert stats["rows"] == 100 and stats["batches"] == 3
+    assert sorted(rows for _, rows, _ in written) == [20, 40, 40]
+    assert all(path == "/my-project/my-table/" for path, _, _ in written)
+    assert all(kwargs == {"index_cols": ["id"]} for _, _, kwargs in written)
+
+
+def test_ingest_bulk_load(rundb_mock):
+    redis = FakeRedis()
+    df = _online_df(20).reset_index()
+    feature_set = FeatureSet("my-featureset", entities=["id"], timestamp_key="time")
+    feature_set._run_db = rundb_mock
+    feature_set.reload = unittest.mock.Mock()
+    feature_set.save = unittest.mock.Mock()
+    feature_set.purge_targets = unittest.mock.Mock()
+
+    target = RedisNoSqlTarget(path="redis://localhost:6379")
+    with unittest.mock.patch(
+        "mlrun.datastore.redis.get_redis_client", return_value=redis
+    ):
+        feature_set.ingest(df, targets=[target], overwrite=True)
+    assert len(redis.hashes) == 10
+    assert redis.executed_pipelines == 1
+    values = next(iter(redis.hashes.values()))
+    assert set(values) == {"count", "value", "name"}
+    assert feature_set.status.targets[0].status == "ready"
+
+    # the aggregations state is written by the storey target
+    feature_set.add_aggregation("value", ["sum"], "1h")
+    assert ingestion._get_bulk_load_targets(feature_set, [target]) == []
+
+
+def test_get_redis_client(monkeypatch):
+    import redis
+
+    from mlrun.datastore.redis import get_redis_client
+
+    monkeypatch.setattr(mlrun.mlconf.redis, "max_connections", 8)
+    cluster_from_url = unittest.mock.Mock(
+        side_effect=redis.cluster.RedisClusterException("not a cluster")
+    )
+    from_url = unittest.mock.Mock()
+    monkeypatch.setattr(redis.cluster.RedisCluster, "from_url", cluster_from_url)
+    monkeypatch.setattr(redis.Redis, "from_url", from_url)
+
+    assert get_redis_client("redis://localhost:6379") == from_url.return_value
+    for mock in [cluster_from_url, from_url]:
+        mock.assert_called_once_with(
+            "redis://localhost:6379", decode_responses=True, max_connections=8
+        )
+
+
+def test_redis_online_driver(monkeypatch):
+    from storey.redis_driver import RedisDriver
+
+    from mlrun.datastore.redis import RedisOnlineDriver
+
+    container, table_path = "projects", "/my-project/my-table/"
+    redis = FakeRedis()
+    storey_driver = RedisDriver(redis_client=redis, key_prefix="/")
+    for i in range(3):
+        key = storey_driver._make_key(container, table_path, f"id{i}")
+        # the storey layout of a key, its features and the state of a "value" sum aggregation
+        redis.hashes[storey_driver._static_data_key(key)] = {
+            "count": str(i),
+            "name": f"name{i}",
+            "\x01aggr_value_sum_a": "1.0,2.5,4.0",
+            "\x01aggr_value_sum_b": "0.5,0.0,0.0",
+            "\x01mtaggr_value_a": "1704067200000",
+            "\x01mtaggr_value_b": "1704070800000",
+            "\x01_mtime_": "1704070800000",
+        }
+
+    # the same aggregations and features as the storey driver, with a single command
+    expected = asyncio.run(
+        storey_driver._load_aggregates_by_key(container, table_path, "id1")
+    )
+    assert expected[1] == {"count": 1, "name": "name1"}
+    assert sum(redis.calls.values()) > 1
+    redis.calls.clear()
+    driver = RedisOnlineDriver(redis_client=redis, key_prefix="/")
+    load = driver._load_aggregates_by_key
+    assert asyncio.run(load(container, table_path, "id1")) == expected
+    assert redis.calls == {"hgetall": 1}
+    assert asyncio.run(load(container, table_path, "missing")) == (None, None)
+    assert asyncio.run(
+        driver._load_by_key(container, table_path, "id2", ["count", "name", "other"])
+    ) == {"count": 2, "name": "name2"}
+
+    # the prefetched keys are read in pipelines and serve the following reads (once)
+    monkeypatch.setattr(mlrun.mlconf.redis, "read_batch_size", 2)
+    redis.calls.clear()
+    keys = ["id0", "id1", "id1", "id2", "missing"]
+    assert driver.prefetch(container, table_path, keys) == 4
+    assert redis.executed_pipelines == 2
+
+    async def load_keys():
+        return [await load(container, table_path, key) for key in keys[1:]]
+
+    results = asyncio.run(load_keys())
+    assert results[0] == results[1] == expected
+    assert results[-1] == (None, None)
+    assert redis.calls == {"hgetall": 1}
+
+    # the concurrent prefetches are merged, the released keys are read from redis
+    redis.calls.clear()
+    driver.prefetch(container, table_path, ["id0"])
+    driver.prefetch(container, table_path, ["id1", "id2"])
+    driver.release(container, table_path, ["id1"])
+    for key in ["id0", "id1", "id2"]:
+        asyncio.run(load(container, table_path, key))
+    assert redis.calls == {"hgetall": 1}
+
+    # the expired prefetched hashes are read from redis
+    redis.calls.clear()
+    monkeypatch.setattr(mlrun.mlconf.redis, "prefetch_ttl_secs", 0)
+    driver.prefetch(container, table_path, ["id0"])
+    time.sleep(0.01)
+    asyncio.run(load(container, table_path, "id0"))
+    assert redis.calls == {"hgetall": 1}
+    assert driver._prefetched == {}
+
+
+def test_online_service_prefetch(rundb_mock):
+    import mlrun.feature_store as fstore
+    from mlrun.feature_store.retrieval.storey_merger import StoreyFeatureMerger
+
+    redis = FakeRedis()
+    feature_set = FeatureSet("my-featureset", entities=["id"], timestamp_key="time")
+    feature_set._run_db = rundb_mock
+    feature_set.reload = unittest.mock.Mock()
+    feature_set.save = unittest.mock.Mock()
+    feature_set.purge_targets = unittest.mock.Mock()
+    vector = fstore.FeatureVector("my-vector", ["my-featureset.*"])
+    vector.status.index_keys = ["id"]
+    parsed_features = (
+        {"my-featureset": feature_set},
+        {"my-featureset": [("count", None), ("value", None)]},
+    )
+
+    with (
+        unittest.mock.patch(
+            "mlrun.datastore.redis.get_redis_client", return_value=redis
+        ),
+        unittest.mock.patch.object(
+            vector, "parse_features", return_value=parsed_features
+        ),
+    ):
+        target = RedisNoSqlTarget(path="redis://localhost:6379")
+        feature_set.ingest(_online_df(20).reset_index(), targets=[target])
+        service = StoreyFeatureMerger(vector).init_online_vector_service(
+            ["id"], fstore.FixedWindowType.LastClosedWindow
+        )
+        try:
+            redis.executed_pipelines = 0
+            result = service.get([["id1"], ["id3"], ["missing"], ["id1"]])
+        finally:
+            service.close()
+    # the prefetched hashes are released after the rows are processed
+    table, _ = service._prefetch_tables[0]
+    assert table._storage._prefetched == {}
+
+    assert result == [
+        {"count": 11, "value": 5.5},
+        {"count": 13, "value": 6.5},
+        None,
+        {"count": 11, "value": 5.5},
+    ]
+    # a pipeline for all the rows, the duplicate key is read again
+    assert redis.executed_pipelines == 1
+    assert redis.calls["hgetall"] == 1
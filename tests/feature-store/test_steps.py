@@ -31,6 +31,7 @@ from mlrun.feature_store.steps import (
     MapValues,
     OneHotEncoder,
     SetEventMetadata,
+    benchmark,
 )
 from mlrun.features import MinMaxValidator
 
@@ -733,6 +734,184 @@ def test_imputer_default_value(rundb_mock, engine):
     assert not imputed_df.isnull().values.any()
 
 
+@pytest.mark.parametrize(
+    "ranges, expected",
+    [
+        # sorted boundaries (looked up with bisect), values out of the ranges are kept
+        (
+            {"low": ["-inf", 0], "mid": [0, 10], "high": [10, "inf"]},
+            ["low", "mid", "mid", "high", "high"],
+        ),
+        ({"mid": [0, 10], "tens": [10, 20]}, [-5, "mid", "mid", "tens", 25]),
+        # overlapping ranges, the first matching range is used
+        (
+            {"any": ["-inf", "inf"], "mid": [0, 10]},
+            ["any", "any", "any", "any", "any"],
+        ),
+    ],
+)
+def test_storey_step_mapval_ranges(ranges, expected):
+    step = MapValues(mapping={"age": {"ranges": ranges}}, with_original_features=True)
+    mapped = [
+        step._do_storey({"age": age, "name": "a"})["age_mapped"]
+        for age in [-5, 0, 9.5, 10, 25]
+    ]
+    assert mapped == expected
+
+
+def test_pandas_step_mapval_ranges():
+    df = pd.DataFrame(
+        {"age": [-5, 0, 9.5, 10, 25, np.nan], "grade": [1, 2, 3, 1, 2, 3]}
+    )
+    step = MapValues(
+        mapping={
+            "age": {"ranges": {"mid": [0, 10], "tens": [10, 20]}},
+            "grade": {1: "A", 2: "B"},
+        }
+    )
+    mapped = step._do_pandas(df)
+    # the values out of the ranges and the unmapped values are mapped to NaN
+    assert mapped["age"].fillna("-").tolist() == ["-", "mid", "mid", "tens", "-", "-"]
+    assert mapped["grade"].fillna("-").tolist() == ["A", "B", "-", "A", "B", "-"]
+
+    # the labels type is kept when all the values are in the ranges
+    step = MapValues(mapping={"age": {"ranges": {1: ["-inf", 10], 2: [10, "inf"]}}})
+    mapped = step._do_pandas(df.dropna())
+    assert mapped["age"].tolist() == [1, 1, 1, 2, 2]
+    assert mapped["age"].dtype == np.int64
+
+
+def test_storey_step_onehot():
+    step = OneHotEncoder(mapping={"department": ["IT", "R D", "IT"], "grade": [1, 2]})
+    assert step._do_storey({"department": "R D", "grade": 2, "age": 3}) == {
+        "department_IT": 0,
+        "department_R_D": 1,
+        "grade_1": 0,
+        "grade_2": 1,
+        "age": 3,
+    }
+    # the encodings are not shared between the events
+    assert step._do_storey({"department": "HR", "grade": [1]}) == {
+        "department_IT": 0,
+        "department_R_D": 0,
+        "grade_1": 0,
+        "grade_2": 0,
+    }
+
+
+def test_storey_steps_benchmark():
+    events = [
+        {
+            "age": age,
+            "department": None,
+            "timestamp": pd.Timestamp(time.time(), unit="s"),
+        }
+        for age in range(100)
+    ]
+    results = benchmark(
+        [
+            MapValues(mapping={"age": {"ranges": {"young": [0, 40]}}}),
+            OneHotEncoder(mapping={"department": ["IT", "RD"]}),
+            Imputer(default_value="IT"),
+            DateExtractor(parts=["hour", "day_of_week"]),
+        ],
+        events,
+        repeat=1,
+    )
+    assert list(results) == ["MapValues", "OneHotEncoder", "Imputer", "DateExtractor"]
+    assert all(events_per_second > 0 for events_per_second in results.values())
+    # the events are not modified
+    assert events[0]["department"] is None and len(events[0]) == 3
+
+    # pandas engine
+    results = benchmark(
+        [MapValues(mapping={"age": {"ranges": {"young": [0, 40]}}})],
+        pd.DataFrame(events),
+        repeat=1,
+    )
+    assert results["MapValues"] > 0
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_polars_engine(rundb_mock, partitioned):
+    pytest.importorskip("polars")
+    import pyarrow as pa
+
+    data, _ = get_data(with_none=True)
+    data["timestamp"] = pd.to_datetime(data["timestamp"].astype(int), unit="s")
+    steps = [
+        Imputer(mapping={"department": "RD"}),
+        MapValues(
+            mapping={"age": {"ranges": {"child": ["-inf", 18], "adult": [18, "inf"]}}},
+            with_original_features=True,
+        ),
+        OneHotEncoder(mapping={"department": ["IT", "RD", "Marketing"]}),
+        DateExtractor(parts=["hour", "day_of_week"]),
+        DropFeatures(features=["name"]),
+    ]
+    output_path = tempfile.TemporaryDirectory()
+    results = {}
+    for engine in ["pandas", "polars"]:
+        feature_set = fstore.FeatureSet(
+            f"fs-{engine}",
+            entities=["id"],
+            timestamp_key="timestamp",
+            engine=engine,
+        )
+        graph = feature_set.graph
+        for step in steps:
+            graph = graph.to(step)
+        feature_set._run_db = rundb_mock
+        feature_set.reload = unittest.mock.Mock()
+        feature_set.save = unittest.mock.Mock()
+        feature_set.purge_targets = unittest.mock.Mock()
+        target_path = f"{output_path.name}/{engine}"
+        results[engine] = feature_set.ingest(
+            pa.Table.from_pandas(data) if engine == "polars" else data.copy(),
+            targets=[
+                ParquetTarget(
+                    path=target_path if partitioned else f"{target_path}.parquet",
+                    partitioned=partitioned,
+                )
+            ],
+        )
+
+    # the polars engine returns an Arrow table (the entities are columns)
+    assert isinstance(results["polars"], pa.Table)
+    polars_df = results["polars"].to_pandas().set_index("id")
+    pd.testing.assert_frame_equal(
+        polars_df, results["pandas"], check_like=True, check_dtype=False
+    )
+    written_df = pd.read_parquet(feature_set.get_target_path())
+    assert written_df["department_RD"].tolist() == [1, 1, 1, 0, 0]
+    assert written_df["age_mapped"].tolist() == [
+        "adult",
+        "child",
+        "adult",
+        "adult",
+        "adult",
+    ]
+
+
+def test_polars_step_mapval_without_original_features():
+    pytest.importorskip("polars")
+
+    data, _ = get_data()
+    data["timestamp"] = pd.to_datetime(data["timestamp"].astype(int), unit="s")
+    step = MapValues(
+        mapping={"age": {"ranges": {"child": ["-inf", 18], "adult": [18, "inf"]}}},
+        with_original_features=False,
+    )
+    mapped = step._do_polars(data).collect().to_pandas()
+
+    # the mapped column replaces the original one, the entities, timestamp and unmapped columns are kept
+    assert list(mapped.columns) == list(data.columns)
+    assert mapped["id"].tolist() == data["id"].tolist()
+    assert mapped["timestamp"].tolist() == data["timestamp"].tolist()
+    assert mapped["department"].tolist() == data["department"].tolist()
+    assert mapped["age"].tolist() == ["adult", "child", "adult", "adult", "adult"]
+
+
 def get_data(with_none=False):
     names = ["A", "B", "C", "D", "E"]
     ages = [33, 4, 76, 90, 24]
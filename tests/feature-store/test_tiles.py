@@ -0,0 +1,179 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlrun
+import mlrun.feature_store as fstore
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store import tiles
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+
+operations = ["count", "sum", "min", "max", "avg", "stddev", "first", "last"]
+
+
+def _events(size=600, seed=0):
+    rng = np.random.default_rng(seed)
+    seconds = np.sort(rng.integers(0, 2 * 24 * 3600, size))
+    return pd.DataFrame(
+        {
+            "ticker": rng.choice(["a", "b", "c"], size),
+            "time": pd.Timestamp("2024-01-01") + pd.to_timedelta(seconds, "s"),
+            "price": rng.random(size).round(3),
+        }
+    )
+
+
+def _feature_set(rundb_mock, name="ticks"):
+    feature_set = fstore.FeatureSet(name, entities=["ticker"], timestamp_key="time")
+    feature_set.add_aggregation("price", operations, ["2h", "6h"], "1h")
+    feature_set.set_tiles()
+    feature_set._run_db = rundb_mock
+    feature_set.reload = unittest.mock.Mock()
+    feature_set.save = unittest.mock.Mock()
+    feature_set.purge_targets = unittest.mock.Mock()
+    return feature_set
+
+
+def _expected(events, windows_ends, window):
+    """brute force window aggregations of the events in [end - window, end)"""
+    rows = []
+    for ticker, end in windows_ends:
+        prices = events[
+            (events["ticker"] == ticker)
+            & (events["time"] >= end - pd.Timedelta(window))
+            & (events["time"] < end)
+        ]["price"]
+        rows.append(
+            {
+                f"price_count_{window}": len(prices),
+                f"price_sum_{window}": prices.sum(),
+                f"price_min_{window}": prices.min(),
+                f"price_max_{window}": prices.max(),
+                f"price_avg_{window}": prices.mean(),
+                f"price_stddev_{window}": prices.std(),
+                f"price_first_{window}": prices.iloc[0],
+                f"price_last_{window}": prices.iloc[-1],
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def test_window_aggregates(rundb_mock, tmp_path):
+    events = _events()
+    feature_set = _feature_set(rundb_mock)
+    feature_set.ingest(events, targets=[ParquetTarget(path=f"{tmp_path}/ticks/")])
+
+    tiles_df = ParquetTarget(path=tiles.get_tiles_path(feature_set)).as_df()
+    # a tile per ticker and hour
+    assert len(tiles_df) <= 3 * 48 < len(events)
+
+    for windows in [None, ["1d"]]:
+        result = feature_set.get_window_aggregates(windows=windows)
+        windows_ends = list(zip(result["ticker"], result["time"]))
+        for window in windows or ["2h", "6h"]:
+            expected = _expected(events, windows_ends, window)
+            pd.testing.assert_frame_equal(
+                result[expected.columns],
+                expected,
+                check_dtype=False,
+                check_exact=False,
+            )
+
+    # the storey aggregations of the last event of each hour match the tiles (up to that event)
+    ingested = feature_set.to_dataframe().reset_index()
+    ingested["time"] = ingested["time"].dt.floor("1h") + pd.Timedelta("1h")
+    ingested = ingested.groupby(["ticker", "time"]).last().reset_index()
+    result = feature_set.get_window_aggregates()
+    merged = ingested.merge(result, on=["ticker", "time"], suffixes=("", "_tiles"))
+    assert len(merged) == len(result)
+    for column in ["price_count_6h", "price_sum_6h", "price_max_2h", "price_avg_2h"]:
+        np.testing.assert_allclose(merged[column], merged[f"{column}_tiles"])
+
+    start_time = pd.Timestamp("2024-01-02")
+    filtered = feature_set.get_window_aggregates(
+        columns=["price_sum_6h"], start_time=start_time
+    )
+    assert list(filtered.columns) == ["ticker", "time", "price_sum_6h"]
+    expected = result[result["time"] >= start_time]
+    np.testing.assert_allclose(filtered["price_sum_6h"], expected["price_sum_6h"])
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="multiple"):
+        feature_set.get_window_aggregates(windows=["90m"])
+
+
+def test_append_tiles(rundb_mock, tmp_path):
+    events = _events()
+    feature_set = _feature_set(rundb_mock)
+    feature_set.ingest(events, targets=[ParquetTarget(path=f"{tmp_path}/all/")])
+    expected = feature_set.get_window_aggregates()
+
+    # the second ingestion starts in the middle of an hour, its tiles are merged with the existing tiles
+    feature_set = _feature_set(rundb_mock)
+    target = ParquetTarget(path=f"{tmp_path}/parts/")
+    half = len(events) // 2
+    feature_set.ingest(events.iloc[:half], targets=[target])
+    feature_set.ingest(events.iloc[half:], targets=[target], overwrite=False)
+    pd.testing.assert_frame_equal(feature_set.get_window_aggregates(), expected)
+
+
+def test_merger_reads_tiles(rundb_mock, tmp_path):
+    feature_set = _feature_set(rundb_mock)
+    feature_set.ingest(_events(), targets=[ParquetTarget(path=f"{tmp_path}/ticks/")])
+    merger = LocalFeatureMerger(fstore.FeatureVector("vector", []))
+
+    with unittest.mock.patch.object(feature_set, "to_dataframe") as to_dataframe:
+        df = merger._get_engine_df(
+            feature_set, "ticks", ["price_avg_6h"], time_column="time"
+        )
+    to_dataframe.assert_not_called()
+    pd.testing.assert_frame_equal(
+        df, feature_set.get_window_aggregates(columns=["price_avg_6h"])
+    )
+
+    # raw features are read from the offline target
+    df = merger._get_engine_df(feature_set, "ticks", ["price_avg_6h", "price"])
+    assert "price" in df.columns
+
+
+def test_set_tiles_errors():
+    feature_set = fstore.FeatureSet("ticks", entities=["ticker"])
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="timestamp"):
+        feature_set.set_tiles()
+    feature_set = fstore.FeatureSet(
+        "ticks", entities=["ticker"], timestamp_key="time", engine="pandas"
+    )
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="storey"):
+        feature_set.set_tiles()
+
+    # the tiles period must divide all the aggregation windows
+    feature_set = fstore.FeatureSet("ticks", entities=["ticker"], timestamp_key="time")
+    feature_set.add_aggregation("price", ["avg"], ["2h", "90m"], "1h")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="90m"):
+        feature_set.set_tiles()
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="2h"):
+        feature_set.set_tiles(period="45m")
+    feature_set.set_tiles(period="30m")
+    assert feature_set.spec.tiles == {"period": "30m"}
+
+    # aggregations added after the tiles are enabled are validated with the tiles period
+    feature_set.add_aggregation("volume", ["sum"], ["45m"], "15m")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="45m"):
+        tiles.get_tiles_period(
+            tiles.get_aggregations(feature_set), feature_set.spec.tiles["period"]
+        )
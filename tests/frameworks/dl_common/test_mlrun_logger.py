@@ -0,0 +1,158 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import contextlib
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+from mlrun.frameworks._dl_common.loggers import mlrun_logger
+from mlrun.frameworks._dl_common.loggers.mlrun_logger import (
+    MLRunLogger,
+    _BackgroundArtifactsLogger,
+)
+
+
+class SerialContext:
+    """Mocked context which fails when it is used by two threads at the same time"""
+
+    def __init__(self):
+        self.artifact_path = "/tmp"
+        self.logged_artifacts = []
+        self.commits = 0
+        self._busy = threading.Lock()
+
+    def log_artifact(self, artifact, **kwargs):
+        with self._use():
+            self.logged_artifacts.append(artifact.key)
+
+    def log_result(self, key, value):
+        with self._use():
+            pass
+
+    def commit(self, completed=False):
+        with self._use():
+            self.commits += 1
+
+    @contextlib.contextmanager
+    def _use(self):
+        if not self._busy.acquire(blocking=False):
+            raise RuntimeError("the context is used concurrently")
+        try:
+            # hold the context for a while, so concurrent uses overlap
+            time.sleep(0.01)
+            yield
+        finally:
+            self._busy.release()
+
+
+def _artifact(key: str, version: int = 0):
+    artifact = unittest.mock.Mock()
+    artifact.key = key
+    artifact.version = version
+    return artifact
+
+
+def test_background_logger_coalesces_artifacts():
+    context = SerialContext()
+    background_logger = _BackgroundArtifactsLogger(
+        context=context, max_pending=8, workers=4
+    )
+    for version in range(5):
+        for key in ["loss", "accuracy"]:
+            background_logger.submit(
+                key=key,
+                generate_artifact=lambda key=key, version=version: _artifact(
+                    key, version
+                ),
+            )
+    logged = background_logger.flush()
+
+    # the versions submitted while the previous one was being logged are coalesced, the last version is logged
+    assert len(context.logged_artifacts) < 10
+    assert {key: artifact.version for key, artifact in logged.items()} == {
+        "loss": 4,
+        "accuracy": 4,
+    }
+    assert background_logger not in mlrun_logger._unflushed_loggers
+
+
+def test_mlrun_logger_serializes_context_access():
+    context = SerialContext()
+    logger = MLRunLogger(context=context, logging_workers=4)
+    for epoch in range(5):
+        logger.log_epoch()
+        for metric in ["loss", "accuracy", "f1"]:
+            logger.log_training_result(metric, epoch)
+            logger.log_validation_result(metric, epoch)
+            logger.log_training_summary(metric, epoch)
+            logger.log_validation_summary(metric, epoch)
+        logger.log_epoch_to_context(epoch=epoch)
+    logger.flush()
+
+    assert context.commits == 5
+    assert {
+        f"{loop}_{metric}"
+        for loop in ["training", "validation"]
+        for metric in ["loss", "accuracy", "f1"]
+    } <= set(logger._artifacts)
+
+
+def test_background_logger_flushed_at_exit():
+    context = SerialContext()
+    background_logger = _BackgroundArtifactsLogger(
+        context=context, max_pending=8, workers=2
+    )
+    background_logger.submit(key="loss", generate_artifact=lambda: _artifact("loss"))
+    assert background_logger in mlrun_logger._unflushed_loggers
+
+    # the artifacts which were not flushed (e.g. the training failed) are flushed at exit
+    mlrun_logger._flush_background_loggers()
+    assert context.logged_artifacts == ["loss"]
+    assert background_logger not in mlrun_logger._unflushed_loggers
+
+
+def test_background_logger_flushes_unscheduled_artifacts():
+    context = SerialContext()
+    background_logger = _BackgroundArtifactsLogger(
+        context=context, max_pending=8, workers=2
+    )
+    background_logger.submit(key="loss", generate_artifact=lambda: _artifact("loss"))
+    background_logger._executor.shutdown(wait=True)
+
+    # the executor is shut down (as in the interpreter shutdown), the artifact is logged when flushed
+    background_logger.submit(
+        key="accuracy", generate_artifact=lambda: _artifact("accuracy")
+    )
+    assert context.logged_artifacts == ["loss"]
+    assert set(background_logger.flush()) == {"loss", "accuracy"}
+    assert context.logged_artifacts == ["loss", "accuracy"]
+
+
+def test_background_logger_raises_logging_errors():
+    context = SerialContext()
+    background_logger = _BackgroundArtifactsLogger(
+        context=context, max_pending=8, workers=2
+    )
+
+    def generate_artifact():
+        raise ValueError("bad artifact")
+
+    background_logger.submit(key="loss", generate_artifact=generate_artifact)
+    with pytest.raises(ValueError, match="bad artifact"):
+        background_logger.flush()
+    # the error is raised once
+    assert background_logger.flush() == {}
@@ -66,7 +66,7 @@ class TestRun(tests.integration.sdk_api.base.TestMLRunIntegration):
         assert runs[0]["metadata"]["labels"] == {}
 
         ctx.set_label("label-key", "label-value")
-        ctx._update_run(commit=True)
+        ctx._update_run(commit=True, flush=True)
         runs = mlrun.get_run_db().list_runs(
             name=ctx_name, project=mlrun.mlconf.default_project
         )
@@ -79,7 +79,7 @@ class TestRun(tests.integration.sdk_api.base.TestMLRunIntegration):
         ctx.set_label("host", "worker-1")
         ctx.set_label("kind", "mpijob")
         assert not ctx.is_logging_worker()
-        ctx._update_run(commit=True)
+        ctx._update_run(commit=True, flush=True)
 
         # labels should remain the same
         runs = mlrun.get_run_db().list_runs(
@@ -0,0 +1,83 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+import mlrun.model_monitoring
+from mlrun.model_monitoring.endpoint_cache import EndpointRecordsCache
+
+
+@pytest.fixture
+def store() -> Mock:
+    store = Mock()
+    store.get_model_endpoint.side_effect = lambda endpoint_id: {
+        "uid": endpoint_id,
+        "model": "model",
+    }
+    store.list_model_endpoints.return_value = [
+        {"uid": f"ep{i}", "model": "model"} for i in range(3)
+    ]
+    with patch.object(mlrun.model_monitoring, "get_store_object", return_value=store):
+        yield store
+
+
+def test_prefetch(store: Mock):
+    cache = EndpointRecordsCache(max_size=10)
+    for _ in range(2):
+        for i in range(3):
+            assert cache.get("project", f"ep{i}")["uid"] == f"ep{i}"
+    # all the endpoints are listed once, and none is read separately
+    store.list_model_endpoints.assert_called_once()
+    store.get_model_endpoint.assert_not_called()
+    assert cache.stats["hit_rate"] == 1.0
+    assert cache.stats["db_lookups_saved"] == 6
+
+    cache.get("project", "new-ep")
+    store.get_model_endpoint.assert_called_once_with(endpoint_id="new-ep")
+
+
+def test_ttl_and_lru(store: Mock):
+    cache = EndpointRecordsCache(ttl=0, max_size=10, prefetch=False)
+    cache.get("project", "ep0")
+    cache.get("project", "ep0")
+    # expired records are read again
+    assert store.get_model_endpoint.call_count == 2
+
+    cache = EndpointRecordsCache(max_size=2, prefetch=False)
+    for endpoint_id in ["ep0", "ep1", "ep0", "ep2"]:
+        cache.get("project", endpoint_id)
+    # ep1 is the least recently used record
+    assert len(cache) == 2 and cache.stats["evictions"] == 1
+    store.get_model_endpoint.reset_mock()
+    cache.get("project", "ep0")
+    cache.get("project", "ep1")
+    store.get_model_endpoint.assert_called_once_with(endpoint_id="ep1")
+
+
+def test_update_and_invalidate(store: Mock):
+    cache = EndpointRecordsCache(prefetch=False)
+    record = cache.get("project", "ep0")
+    cache.update("project", "ep0", {"model": "new-model"})
+    updated_record = cache.get("project", "ep0")
+    # the record is replaced, not modified
+    assert updated_record["model"] == "new-model" and record["model"] == "model"
+    # records which are not cached are not added
+    cache.update("project", "ep1", {"model": "new-model"})
+    assert len(cache) == 1
+
+    cache.invalidate("project", "ep0")
+    assert cache.get("project", "ep0")["model"] == "model"
+    assert store.get_model_endpoint.call_count == 2
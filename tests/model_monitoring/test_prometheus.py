@@ -0,0 +1,174 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+import mlrun
+import mlrun.model_monitoring.prometheus as prometheus
+
+
+@pytest.fixture
+def aggregator(tmp_path, monkeypatch):
+    settings = mlrun.mlconf.model_endpoint_monitoring.prometheus
+    monkeypatch.setattr(settings, "max_endpoints", 2)
+    monkeypatch.setattr(settings, "max_features", 2)
+    with (
+        patch.object(prometheus, "_registry_path", str(tmp_path / "registry.txt")),
+        patch.object(prometheus, "_window_aggregator", prometheus._WindowAggregator()),
+    ):
+        prometheus._registry.register(prometheus._window_aggregator)
+        yield prometheus._window_aggregator
+        prometheus._registry.unregister(prometheus._window_aggregator)
+    prometheus._prediction_counter.clear()
+    prometheus.clean_metrics()
+
+
+def _sample(name: str, labels: dict):
+    return prometheus._registry.get_sample_value(name, labels)
+
+
+def test_window_aggregation(aggregator):
+    labels = {
+        "project": "project",
+        "endpoint_id": "ep",
+        "model": "model",
+        "endpoint_type": "1",
+    }
+    prometheus.write_predictions_and_latency_metrics(
+        project="project",
+        endpoint_id="ep",
+        latency=2_000,
+        model_name="model",
+        endpoint_type=1,
+        predictions=3,
+    )
+    prometheus.write_predictions_and_latency_metrics(
+        project="project",
+        endpoint_id="ep",
+        latency=20_000_000,
+        model_name="model",
+        endpoint_type=1,
+    )
+    for value in [1.0, 5.0, 3.0]:
+        prometheus.write_income_features(
+            project="project",
+            endpoint_id="ep",
+            features={"a": value, "b": 1, "c": 2, "s": "text"},
+        )
+
+    # nothing is written until the window is flushed
+    assert _sample("predictions_total", labels) is None
+    aggregator.flush()
+
+    assert _sample("predictions_total", labels) == 4
+    assert _sample("model_latency_seconds_count", labels) == 4
+    assert _sample("model_latency_seconds_sum", labels) == 20_006_000
+    assert _sample("model_latency_seconds_bucket", {**labels, "le": "5000.0"}) == 3
+    assert _sample("model_latency_seconds_bucket", {**labels, "le": "+Inf"}) == 4
+
+    feature_labels = {"project": "project", "endpoint_id": "ep", "metric": "a"}
+    assert _sample("income_features", feature_labels) == 3.0
+    assert _sample("income_features_range", {**feature_labels, "stat": "min"}) == 1
+    assert _sample("income_features_range", {**feature_labels, "stat": "max"}) == 5
+    # the features above max_features and the non numeric features are dropped
+    assert _sample("income_features", {**feature_labels, "metric": "b"}) == 1
+    assert _sample("income_features", {**feature_labels, "metric": "c"}) is None
+    assert _sample("income_features", {**feature_labels, "metric": "s"}) is None
+
+    # the histogram is cumulative across the windows
+    prometheus.write_predictions_and_latency_metrics(
+        project="project",
+        endpoint_id="ep",
+        latency=2_000,
+        model_name="model",
+        endpoint_type=1,
+    )
+    assert "model_latency_seconds_count" in prometheus.get_registry()
+    assert _sample("model_latency_seconds_count", labels) == 5
+    assert _sample("income_features", feature_labels) is None
+
+
+def test_max_endpoints(aggregator):
+    for endpoint_id in ["ep1", "ep2", "ep3"]:
+        prometheus.write_predictions_and_latency_metrics(
+            project="project",
+            endpoint_id=endpoint_id,
+            latency=100,
+            model_name="model",
+            endpoint_type=1,
+        )
+    aggregator.flush()
+    counts = {
+        endpoint_id: _sample(
+            "predictions_total",
+            {
+                "project": "project",
+                "endpoint_id": endpoint_id,
+                "model": "model",
+                "endpoint_type": "1",
+            },
+        )
+        for endpoint_id in ["ep1", "ep2", "ep3"]
+    }
+    assert counts == {"ep1": 1, "ep2": 1, "ep3": None}
+
+
+def test_idle_endpoints_eviction(aggregator, monkeypatch):
+    monkeypatch.setattr(
+        mlrun.mlconf.model_endpoint_monitoring.prometheus, "endpoint_idle_secs", 60
+    )
+
+    def write_prediction(endpoint_id: str):
+        prometheus.write_predictions_and_latency_metrics(
+            project="project",
+            endpoint_id=endpoint_id,
+            latency=100,
+            model_name="model",
+            endpoint_type=1,
+        )
+
+    def predictions_count(endpoint_id: str):
+        return _sample(
+            "predictions_total",
+            {
+                "project": "project",
+                "endpoint_id": endpoint_id,
+                "model": "model",
+                "endpoint_type": "1",
+            },
+        )
+
+    now = time.monotonic()
+    with patch.object(prometheus.time, "monotonic", return_value=now):
+        write_prediction("ep1")
+        write_prediction("ep2")
+        write_prediction("ep3")
+        aggregator.flush()
+    assert predictions_count("ep1") == 1
+    assert predictions_count("ep3") is None
+
+    # ep1 is active, ep2 is idle and evicted, which makes room for ep3
+    with patch.object(prometheus.time, "monotonic", return_value=now + 50):
+        write_prediction("ep1")
+    with patch.object(prometheus.time, "monotonic", return_value=now + 70):
+        aggregator.flush()
+        assert set(aggregator._endpoints) == {("project", "ep1")}
+        assert predictions_count("ep2") is None
+        write_prediction("ep3")
+        aggregator.flush()
+    assert predictions_count("ep1") == 2
+    assert predictions_count("ep3") == 1
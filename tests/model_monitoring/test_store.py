@@ -205,6 +205,23 @@ class TestSQLStore:
 
         cls.assert_application_record(event=event_v2, new_sql_store=new_sql_store)
 
+    def test_sql_write_application_results(
+        cls,
+        event: _AppResultEvent,
+        event_v2: _AppResultEvent,
+        new_sql_store: SQLStoreBase,
+    ):
+        new_sql_store.write_application_result(event=_AppResultEvent(event.copy()))
+
+        # A batch of an updated result and a new result
+        new_event = _AppResultEvent({**event_v2, WriterEvent.ENDPOINT_ID: "new-ep"})
+        new_sql_store.write_application_results(
+            events=[_AppResultEvent(event_v2.copy()), new_event]
+        )
+
+        cls.assert_application_record(event=event_v2, new_sql_store=new_sql_store)
+        cls.assert_application_record(event=new_event, new_sql_store=new_sql_store)
+
     @staticmethod
     def assert_application_record(event: _AppResultEvent, new_sql_store: SQLStoreBase):
         application_filter_dict = new_sql_store.filter_endpoint_and_application_name(
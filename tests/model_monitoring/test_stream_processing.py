@@ -0,0 +1,193 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+import storey
+
+import mlrun
+import mlrun.model_monitoring.endpoint_cache
+import mlrun.model_monitoring.stream_processing as stream_processing
+from mlrun.common.schemas.model_monitoring.constants import (
+    EventFieldType,
+    EventKeyMetrics,
+)
+
+_endpoint_record = {
+    EventFieldType.FEATURE_NAMES: json.dumps(["a", "b"]),
+    EventFieldType.LABEL_NAMES: json.dumps(["label"]),
+    EventFieldType.ENDPOINT_TYPE: "1",
+}
+
+
+def _serving_event(inputs: list, outputs: list) -> storey.Event:
+    return storey.Event(
+        body={
+            EventFieldType.FUNCTION_URI: "project/serving",
+            EventFieldType.MODEL: "model",
+            "class": "ModelClass",
+            "when": "2024-01-01 10:00:00",
+            "microsec": 100,
+            "request": {"id": "request-id", "inputs": inputs},
+            "resp": {"outputs": outputs},
+        }
+    )
+
+
+def _process(full_event: storey.Event, columnar: bool) -> list[dict]:
+    """Run the event through the first steps of the graph and expand the Parquet rows"""
+    process_endpoint_event = stream_processing.ProcessEndpointEvent(
+        project="project", columnar=columnar
+    )
+    map_feature_names = stream_processing.MapFeatureNames(project="project")
+    event = process_endpoint_event.do(full_event)
+    events = [event.body] if columnar else event.body
+    return [map_feature_names.do(event) for event in events]
+
+
+@pytest.fixture
+def endpoint_record():
+    store = Mock()
+    store.get_model_endpoint.return_value = _endpoint_record
+    store.list_model_endpoints.return_value = []
+    endpoint_cache = mlrun.model_monitoring.endpoint_cache.get_endpoint_cache()
+    endpoint_cache.clear()
+    with patch.object(mlrun.model_monitoring, "get_store_object", return_value=store):
+        yield store
+    endpoint_cache.clear()
+
+
+@pytest.mark.usefixtures("endpoint_record")
+def test_columnar_batch_event():
+    inputs = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    (batch,) = _process(_serving_event(inputs, [0, 1, 0]), columnar=True)
+
+    assert batch[EventFieldType.BATCH_SIZE] == 3
+    assert batch[EventFieldType.TOTAL_LATENCY] == 300
+    np.testing.assert_array_equal(batch[EventFieldType.FEATURES], inputs)
+    assert batch[EventFieldType.PREDICTION].shape == (3, 1)
+    assert batch[EventFieldType.FEATURE_NAMES] == ["a", "b"]
+    assert batch[EventFieldType.LABEL_NAMES] == ["label"]
+    # the values are not copied to named keys
+    assert "a" not in batch and EventFieldType.NAMED_FEATURES not in batch
+
+    # the samples are the last row of the batch
+    processed = stream_processing.ProcessBeforeTSDB().do(
+        {
+            **batch,
+            "predictions_count_5m": 3,
+            "predictions_count_1h": 3,
+            "latency_avg_5m": 100,
+            "latency_avg_1h": 100,
+        }
+    )
+    endpoint_features = processed[EventKeyMetrics.ENDPOINT_FEATURES]
+    assert endpoint_features["a"] == 5.0 and endpoint_features["b"] == 6.0
+    assert endpoint_features["label"] == 0
+
+
+@pytest.mark.usefixtures("endpoint_record")
+@pytest.mark.parametrize(
+    "inputs, outputs",
+    [
+        ([[1.0, 2.0], [3.0, 4.0]], [1, 0]),
+        ([[1, "x"], [2, "y"]], [[0.5], [0.7]]),
+    ],
+)
+def test_columnar_parquet_rows(inputs, outputs):
+    # the Parquet rows are the same in both modes
+    rows = [
+        stream_processing.ProcessBeforeParquet().do(event)
+        for event in _process(_serving_event(inputs, outputs), columnar=False)
+    ]
+    (batch,) = _process(_serving_event(inputs, outputs), columnar=True)
+    assert stream_processing.ProcessBeforeParquet().do(batch) == rows
+    # the batch event is shared with the other branches, so it is not changed
+    assert EventFieldType.FEATURES in batch
+
+
+@pytest.mark.usefixtures("endpoint_record")
+def test_columnar_ragged_rows():
+    process_endpoint_event = stream_processing.ProcessEndpointEvent(
+        project="project", columnar=True
+    )
+    assert process_endpoint_event.do(_serving_event([[1, 2], [3]], [0, 1])) is None
+    assert list(process_endpoint_event.error_count.values()) == [1]
+
+
+def test_compute_batch_live_stats():
+    step = stream_processing.ComputeBatchLiveStats(windows=["5m", "1h"])
+    event = step.do(
+        {
+            "batch_size_sum_5m": 4,
+            "total_latency_sum_5m": 400,
+            "batch_size_sum_1h": 10,
+            "total_latency_sum_1h": 2000,
+        }
+    )
+    assert event == {
+        "predictions_count_5m": 4,
+        "latency_avg_5m": 100,
+        "predictions_count_1h": 10,
+        "latency_avg_1h": 200,
+    }
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_monitoring_serving_graph(columnar):
+    fn = mlrun.new_function("stream", kind="serving")
+    processor = stream_processing.EventStreamProcessor(
+        project="project",
+        parquet_batching_max_events=100,
+        parquet_batching_timeout_secs=10,
+        parquet_target="v3io:///projects/project/parquet",
+        columnar=columnar,
+    )
+    processor.apply_monitoring_serving_graph(fn)
+    steps = fn.spec.graph.steps
+    assert ("flatten_events" in steps) is not columnar
+    assert ("ComputeBatchLiveStats" in steps) is columnar
+    assert steps["sample"].after == ["ComputeBatchLiveStats" if columnar else "Rename"]
+    assert steps["ParquetTarget"].after == [
+        "flatten_parquet_events" if columnar else "ProcessBeforeParquet"
+    ]
+
+
+def test_feature_names_update(endpoint_record: Mock):
+    map_feature_names = stream_processing.MapFeatureNames(project="project")
+
+    def map_event() -> dict:
+        return map_feature_names.do(
+            {
+                EventFieldType.ENDPOINT_ID: "ep",
+                EventFieldType.FEATURES: [1, 2],
+                EventFieldType.PREDICTION: [0],
+            }
+        )
+
+    assert map_event()[EventFieldType.NAMED_FEATURES] == {"a": 1, "b": 2}
+    assert map_event()[EventFieldType.NAMED_FEATURES] == {"a": 1, "b": 2}
+    # the endpoint record is read from the store once
+    endpoint_record.get_model_endpoint.assert_called_once()
+
+    # the names are resolved again after the endpoint record is updated
+    stream_processing.update_endpoint_record(
+        project="project",
+        endpoint_id="ep",
+        attributes={EventFieldType.FEATURE_NAMES: json.dumps(["c", "d"])},
+    )
+    assert map_event()[EventFieldType.NAMED_FEATURES] == {"c": 1, "d": 2}
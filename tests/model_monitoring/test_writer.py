@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
 from functools import partial
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+import mlrun.model_monitoring
 from mlrun.model_monitoring.writer import (
     ModelMonitoringWriter,
     V3IOFramesClient,
@@ -98,9 +101,126 @@ class TestTSDB:
         tsdb_client: V3IOFramesClient,
         writer: ModelMonitoringWriter,
     ) -> None:
-        writer._update_tsdb(event)
+        writer._update_tsdb([event])
         tsdb_client.write.assert_called()
         assert (
             WriterEvent.RESULT_EXTRA_DATA
             not in tsdb_client.write.call_args.kwargs["dfs"].columns
         ), "The extra data should not be written to the TSDB"
+
+
+class TestBatching:
+    @staticmethod
+    @pytest.fixture
+    def store() -> Mock:
+        store = Mock()
+        with patch.object(
+            mlrun.model_monitoring, "get_store_object", return_value=store
+        ) as get_store_object:
+            yield store
+        # the store object is reused by all the writes
+        assert get_store_object.call_count <= 1
+
+    @staticmethod
+    def _new_writer(**kwargs) -> ModelMonitoringWriter:
+        with (
+            patch.object(ModelMonitoringWriter, "_get_v3io_frames_client"),
+            patch.object(ModelMonitoringWriter, "_create_tsdb_table"),
+        ):
+            return ModelMonitoringWriter(project="project", **kwargs)
+
+    @staticmethod
+    def _raw_event(result_name: str) -> _RawEvent:
+        return {
+            WriterEvent.ENDPOINT_ID: "some-ep-id",
+            WriterEvent.START_INFER_TIME: "2023-09-19 14:26:06.501084",
+            WriterEvent.END_INFER_TIME: "2023-09-19 16:26:06.501084",
+            WriterEvent.APPLICATION_NAME: "dummy-app",
+            WriterEvent.RESULT_NAME: result_name,
+            WriterEvent.RESULT_KIND: 0,
+            WriterEvent.RESULT_VALUE: 0.32,
+            WriterEvent.RESULT_STATUS: 2,
+            WriterEvent.RESULT_EXTRA_DATA: "",
+            WriterEvent.CURRENT_STATS: "{}",
+        }
+
+    def test_batch_size(self, store: Mock) -> None:
+        writer = self._new_writer(max_batch_size=3, flush_interval=0)
+        writer._custom_notifier = Mock(spec=CustomNotificationPusher)
+        for i in range(2):
+            writer.do(self._raw_event(f"result-{i}"))
+        store.write_application_results.assert_not_called()
+        writer._tsdb_client.write.assert_not_called()
+        # the notifications are sent per result
+        assert writer._custom_notifier.push.call_count == 2
+
+        writer.do(self._raw_event("result-2"))
+        store.write_application_results.assert_called_once()
+        assert len(store.write_application_results.call_args.kwargs["events"]) == 3
+        writer._tsdb_client.write.assert_called_once()
+        assert len(writer._tsdb_client.write.call_args.kwargs["dfs"]) == 3
+
+    def test_flush_interval(self, store: Mock) -> None:
+        writer = self._new_writer(max_batch_size=100, flush_interval=0.1)
+        writer._custom_notifier = Mock(spec=CustomNotificationPusher)
+        writer.do(self._raw_event("result-0"))
+        writer.do(self._raw_event("result-1"))
+        for _ in range(50):
+            if store.write_application_results.called:
+                break
+            time.sleep(0.1)
+        store.write_application_results.assert_called_once()
+        assert len(store.write_application_results.call_args.kwargs["events"]) == 2
+        # nothing is left to write
+        writer.flush()
+        store.write_application_results.assert_called_once()
+
+    def test_failed_flush_keeps_results(self, store: Mock) -> None:
+        writer = self._new_writer(max_batch_size=2, flush_interval=0)
+        writer._custom_notifier = Mock(spec=CustomNotificationPusher)
+        store.write_application_results.side_effect = RuntimeError("store is down")
+        writer.do(self._raw_event("result-0"))
+        with pytest.raises(RuntimeError, match="store is down"):
+            writer.do(self._raw_event("result-1"))
+
+        # the results are written by the next flush
+        store.write_application_results.side_effect = None
+        store.write_application_results.reset_mock()
+        writer.do(self._raw_event("result-2"))
+        events = store.write_application_results.call_args.kwargs["events"]
+        assert [event[WriterEvent.RESULT_NAME] for event in events] == [
+            "result-0",
+            "result-1",
+            "result-2",
+        ]
+
+    def test_flushes_are_serialized(self, store: Mock) -> None:
+        writer = self._new_writer(max_batch_size=100, flush_interval=0)
+        writer._custom_notifier = Mock(spec=CustomNotificationPusher)
+        writing = []
+
+        def write_application_results(events):
+            writing.append(len(events))
+            assert len(writing) == 1, "the flushes write concurrently"
+            time.sleep(0.1)
+            writing.pop()
+
+        store.write_application_results.side_effect = write_application_results
+        writer.do(self._raw_event("result-0"))
+        flush_thread = threading.Thread(target=writer.flush)
+        flush_thread.start()
+        time.sleep(0.05)
+        writer.do(self._raw_event("result-1"))
+        writer.flush()
+        flush_thread.join()
+        assert store.write_application_results.call_count == 2
+
+    def test_flush_at_exit(self, store: Mock) -> None:
+        writer = self._new_writer(max_batch_size=100, flush_interval=3600)
+        writer._custom_notifier = Mock(spec=CustomNotificationPusher)
+        writer.do(self._raw_event("result-0"))
+        store.write_application_results.assert_not_called()
+
+        mlrun.model_monitoring.writer._flush_writers()
+        store.write_application_results.assert_called_once()
+        assert writer._flush_timer is None
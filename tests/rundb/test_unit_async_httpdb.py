@@ -0,0 +1,191 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import re
+import ssl
+from http import HTTPStatus
+
+import aiohttp
+import certifi
+import pytest
+
+import mlrun.artifacts
+import mlrun.common.schemas
+import mlrun.db.async_httpdb
+import mlrun.db.httpdb
+import mlrun.errors
+from mlrun.config import config
+
+BASE_URL = "https://wherever.com"
+
+
+def _get_requests(aioresponses_mock, method: str) -> list:
+    return [
+        request
+        for (request_method, _), requests in aioresponses_mock.requests.items()
+        if request_method == method
+        for request in requests
+    ]
+
+
+@pytest.mark.asyncio
+async def test_api_call_basic_auth_and_versions(aioresponses_mock):
+    run_db = mlrun.db.httpdb.HTTPRunDB(BASE_URL)
+    run_db.user, run_db.password = "some-user", "some-password"
+    aioresponses_mock.get(
+        re.compile(f"{BASE_URL}/api/v1/projects/some-project/runs/some-uid.*"),
+        payload={"data": {"metadata": {"uid": "some-uid"}}},
+    )
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(run_db) as db:
+        run = await db.read_run("some-uid", project="some-project")
+
+    assert run == {"metadata": {"uid": "some-uid"}}
+    request = _get_requests(aioresponses_mock, "GET")[0]
+    assert request.kwargs["auth"] == aiohttp.BasicAuth("some-user", "some-password")
+    assert (
+        request.kwargs["headers"][mlrun.common.schemas.HeaderNames.client_version]
+        == run_db.client_version
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_call_iguazio_session_cookie(aioresponses_mock):
+    run_db = mlrun.db.httpdb.HTTPRunDB(BASE_URL)
+    run_db.user = None
+    run_db.token = "946b0749-5c40-4837-a4ac-341d295bfaf7"
+    aioresponses_mock.patch(f"{BASE_URL}/api/v1/projects/some-project/runs", payload={})
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(run_db) as db:
+        await db.update_runs(
+            [{"uid": "some-uid", "updates": {"status.state": "completed"}}],
+            project="some-project",
+        )
+
+    request = _get_requests(aioresponses_mock, "PATCH")[0]
+    assert request.kwargs["cookies"] == {"session": f'j:{{"sid": "{run_db.token}"}}'}
+    assert "auth" not in request.kwargs
+    assert request.kwargs["json"] == {
+        "runs": [{"uid": "some-uid", "updates": {"status.state": "completed"}}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_api_call_params_stringification(aioresponses_mock):
+    run_db = mlrun.db.httpdb.HTTPRunDB(BASE_URL)
+    aioresponses_mock.get(
+        re.compile(f"{BASE_URL}/api/v2/projects/some-project/artifacts/some-key.*"),
+        payload={"metadata": {"key": "some-key"}},
+    )
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(run_db) as db:
+        await db.read_artifact("some-key", iter=2, project="some-project")
+
+    # enums are converted to their values, the rest of the values to strings and None values are dropped
+    request = _get_requests(aioresponses_mock, "GET")[0]
+    assert request.kwargs["params"] == {
+        "format": mlrun.common.schemas.ArtifactsFormat.full.value,
+        "tag": "latest",
+        "iter": "2",
+    }
+    assert mlrun.db.async_httpdb.AsyncHTTPRunDB._resolve_params(
+        {"enum": mlrun.common.schemas.ArtifactsFormat.full, "int": 1, "none": None}
+    ) == {"enum": "full", "int": "1"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, expected_error",
+    [
+        (HTTPStatus.NOT_FOUND.value, mlrun.errors.MLRunNotFoundError),
+        (HTTPStatus.BAD_REQUEST.value, mlrun.errors.MLRunBadRequestError),
+        (HTTPStatus.CONFLICT.value, mlrun.errors.MLRunConflictError),
+    ],
+)
+async def test_api_call_error_mapping(aioresponses_mock, status, expected_error):
+    run_db = mlrun.db.httpdb.HTTPRunDB(BASE_URL)
+    aioresponses_mock.get(
+        re.compile(f"{BASE_URL}/api/v1/projects/some-project/runs/some-uid.*"),
+        status=status,
+        payload={"detail": {"reason": "some reason"}},
+    )
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(run_db) as db:
+        with pytest.raises(expected_error, match="some reason"):
+            await db.read_run("some-uid", project="some-project")
+
+
+@pytest.mark.asyncio
+async def test_api_call_connection_error(aioresponses_mock):
+    run_db = mlrun.db.httpdb.HTTPRunDB(BASE_URL)
+    config.httpdb.retry_api_call_on_exception = (
+        mlrun.common.schemas.HTTPSessionRetryMode.disabled.value
+    )
+    aioresponses_mock.put(
+        f"{BASE_URL}/api/v2/projects/some-project/artifacts",
+        exception=aiohttp.ClientConnectionError("connection refused"),
+    )
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(run_db) as db:
+        with pytest.raises(mlrun.errors.MLRunRuntimeError, match="store artifacts"):
+            await db.store_artifacts(
+                [
+                    {
+                        "key": "some-key",
+                        "artifact": mlrun.artifacts.Artifact(key="some-key"),
+                    }
+                ],
+                project="some-project",
+            )
+
+
+@pytest.mark.parametrize(
+    "verify, expected_ssl",
+    [(True, True), (False, False), (certifi.where(), ssl.SSLContext)],
+)
+def test_resolve_ssl(verify, expected_ssl):
+    config.httpdb.http.verify = verify
+    resolved_ssl = mlrun.db.async_httpdb.AsyncHTTPRunDB._resolve_ssl()
+    if isinstance(expected_ssl, type):
+        assert isinstance(resolved_ssl, expected_ssl)
+    else:
+        assert resolved_ssl is expected_ssl
+
+
+@pytest.mark.asyncio
+async def test_requests_share_connection_pool(aioresponses_mock):
+    run_db = mlrun.db.httpdb.HTTPRunDB(BASE_URL)
+    config.httpdb.http.async_connection_pool_size = 4
+    keys = [f"key-{index}" for index in range(10)]
+    for key in keys:
+        aioresponses_mock.get(
+            re.compile(f"{BASE_URL}/api/v2/projects/some-project/artifacts/{key}.*"),
+            payload={"metadata": {"key": key}},
+            repeat=True,
+        )
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(run_db) as db:
+        artifacts = await asyncio.gather(
+            *[db.read_artifact(key, project="some-project") for key in keys]
+        )
+        session = db._session
+        # all the requests go through a single session, limited to the configured pool size
+        assert session._client.connector.limit == 4
+        await db.read_artifact(keys[0], project="some-project")
+        assert db._session is session
+
+    assert [artifact["metadata"]["key"] for artifact in artifacts] == keys
+    assert db._session is None
+    assert session._client.closed
@@ -16,6 +16,9 @@
 # currently we are running it in the integration tests CI step so adding this file for unit tests for the httpdb
 import enum
 import io
+import json
+import threading
+import time
 import unittest.mock
 
 import pytest
@@ -301,3 +304,180 @@ def test_watch_logs_continue():
     assert (
         adapter.call_count == len(log_lines) + 1
     ), "should have called the adapter once per log line, and one more time at the end of log"
+
+
+def test_paginated_api_call_prefetches_next_page():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    adapter = requests_mock.Adapter()
+    pages = [["run-1", "run-2"], ["run-3", "run-4"], ["run-5"]]
+    requested_pages = []
+    page_requested_events = [threading.Event() for _ in range(len(pages) + 1)]
+
+    def callback(request, context):
+        # the first page is requested with a page number, the rest with the token
+        page = len(requested_pages) + 1
+        requested_pages.append(page)
+        page_requested_events[page - 1].set()
+        context.status_code = 200
+        if page > len(pages):
+            return {"runs": [], "pagination": {}}
+        return {
+            "runs": pages[page - 1],
+            "pagination": {"page": page, "page-size": 2, "page-token": "token"},
+        }
+
+    adapter.register_uri(
+        "GET", "https://wherever.com/api/v1/projects/some-project/runs", json=callback
+    )
+    sessions = []
+
+    def init_session(*args, **kwargs):
+        session = mlrun.utils.HTTPSessionWithRetry()
+        session.mount("https://", adapter)
+        sessions.append(session)
+        return session
+
+    db._init_session = init_session
+    db.session = db._init_session()
+
+    runs = []
+    for response in db.paginated_api_call("GET", "projects/some-project/runs"):
+        page = response.json()["pagination"]["page"]
+        # the next page is requested before the current one is processed
+        assert page_requested_events[page].wait(timeout=5)
+        runs.extend(response.json()["runs"])
+
+    assert runs == ["run-1", "run-2", "run-3", "run-4", "run-5"]
+    assert requested_pages == [1, 2, 3, 4]
+    # the next pages are prefetched with a session of their own
+    assert len(sessions) == 2
+
+
+def test_paginated_api_call_stops_prefetching_when_abandoned():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    adapter = requests_mock.Adapter()
+    requested_pages = []
+    next_page_requested = threading.Event()
+    release_page_request = threading.Event()
+
+    def callback(request, context):
+        page = len(requested_pages) + 1
+        requested_pages.append(page)
+        if page > 1:
+            next_page_requested.set()
+            release_page_request.wait(timeout=5)
+        context.status_code = 200
+        return {
+            "runs": [f"run-{page}"],
+            "pagination": {"page": page, "page-size": 1, "page-token": "token"},
+        }
+
+    adapter.register_uri(
+        "GET", "https://wherever.com/api/v1/projects/some-project/runs", json=callback
+    )
+    sessions = []
+
+    def init_session(*args, **kwargs):
+        session = mlrun.utils.HTTPSessionWithRetry()
+        session.mount("https://", adapter)
+        session.close = unittest.mock.Mock()
+        sessions.append(session)
+        return session
+
+    db._init_session = init_session
+    db.session = db._init_session()
+
+    responses = db.paginated_api_call("GET", "projects/some-project/runs")
+    next(responses)
+    assert next_page_requested.wait(timeout=5)
+    responses.close()
+
+    # the in-flight prefetch completes, its session is closed and no further pages are requested
+    prefetch_session = sessions[1]
+    prefetch_session.close.assert_not_called()
+    release_page_request.set()
+    for _ in range(50):
+        if prefetch_session.close.called:
+            break
+        time.sleep(0.1)
+    prefetch_session.close.assert_called_once()
+    assert requested_pages == [1, 2]
+
+
+def test_export_runs_streams_ndjson():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    adapter = requests_mock.Adapter()
+    runs = [{"metadata": {"name": f"run-{index}"}} for index in range(3)]
+    adapter.register_uri(
+        "GET",
+        "https://wherever.com/api/v1/projects/some-project/runs",
+        content=b"".join(json.dumps(run).encode() + b"\n" for run in runs),
+        headers={"Content-Type": mlrun.common.schemas.MediaTypes.ndjson},
+    )
+    db.session = mlrun.utils.HTTPSessionWithRetry()
+    db.session.mount("https://", adapter)
+
+    assert list(db.export_runs(project="some-project", iter=True)) == runs
+    request = adapter.last_request
+    assert request.headers["Accept"] == mlrun.common.schemas.MediaTypes.ndjson
+    assert request.qs["page-size"] == [
+        str(mlrun.mlconf.httpdb.pagination.export_batch_size)
+    ]
+
+
+def test_update_runs():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        "PATCH", "https://wherever.com/api/v1/projects/some-project/runs", json={}
+    )
+    db.session = mlrun.utils.HTTPSessionWithRetry()
+    db.session.mount("https://", adapter)
+
+    runs_updates = [
+        {"uid": "uid-1", "iter": 1, "updates": {"status.state": "completed"}},
+        {"uid": "uid-1", "iter": 2, "updates": {"status.state": "error"}},
+    ]
+    db.update_runs(runs_updates, project="some-project")
+
+    # all the updates are sent in a single request
+    assert adapter.call_count == 1
+    assert adapter.last_request.json() == {"runs": runs_updates}
+
+
+def test_store_artifacts():
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        "PUT",
+        "https://wherever.com/api/v2/projects/some-project/artifacts",
+        json={},
+    )
+    db.session = mlrun.utils.HTTPSessionWithRetry()
+    db.session.mount("https://", adapter)
+
+    artifacts = [
+        {
+            "key": f"artifact-{index}",
+            "artifact": mlrun.artifacts.Artifact(
+                key=f"artifact-{index}", body="123"
+            ).to_dict(),
+            "tag": "some-tag",
+            "tree": "some-tree",
+        }
+        for index in range(3)
+    ]
+    db.store_artifacts(artifacts, project="some-project")
+
+    assert adapter.call_count == 1
+    stored_artifacts = adapter.last_request.json()["artifacts"]
+    assert [artifact["key"] for artifact in stored_artifacts] == [
+        "artifact-0",
+        "artifact-1",
+        "artifact-2",
+    ]
+    assert all(
+        artifact["tag"] == "some-tag" and artifact["tree"] == "some-tree"
+        for artifact in stored_artifacts
+    )
+    assert stored_artifacts[0]["artifact"]["metadata"]["key"] == "artifact-0"
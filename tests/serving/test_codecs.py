@@ -0,0 +1,148 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+import numpy as np
+import pyarrow
+import pytest
+
+import mlrun.serving.codecs
+
+
+@pytest.mark.parametrize(
+    "content_type, headers, expected_codec",
+    [
+        ("", {}, mlrun.serving.codecs.JSONCodec),
+        ("application/json; charset=utf-8", {}, mlrun.serving.codecs.JSONCodec),
+        ("application/msgpack", {}, mlrun.serving.codecs.MsgpackCodec),
+        (
+            "application/vnd.apache.arrow.stream",
+            {},
+            mlrun.serving.codecs.ArrowCodec,
+        ),
+        (
+            "application/octet-stream",
+            {"inference-header-content-length": "10"},
+            mlrun.serving.codecs.BinaryTensorCodec,
+        ),
+        # raw binary bodies are passed as is
+        ("application/octet-stream", {}, None),
+        ("text/plain", {}, None),
+    ],
+)
+def test_get_codec(content_type, headers, expected_codec):
+    codec = mlrun.serving.codecs.get_codec(content_type, headers)
+    if expected_codec is None:
+        assert codec is None
+    else:
+        assert isinstance(codec, expected_codec)
+
+
+def test_json_codec():
+    codec = mlrun.serving.codecs.JSONCodec()
+    assert codec.decode(b'{"inputs": [1, NaN]}', {})["inputs"][0] == 1
+
+    body = {"outputs": np.arange(4).reshape(2, 2), "score": np.float32(0.5)}
+    encoded, headers = codec.encode(body)
+    assert headers is None
+    assert json.loads(encoded) == {"outputs": [[0, 1], [2, 3]], "score": 0.5}
+
+    # non-finite floats are encoded as standard json nulls
+    encoded, _ = codec.encode({"outputs": [float("nan"), np.inf]})
+    assert encoded == b'{"outputs":[null,null]}'
+
+    # non-contiguous arrays are not supported natively
+    encoded, _ = codec.encode({"outputs": np.arange(4).reshape(2, 2).T})
+    assert json.loads(encoded) == {"outputs": [[0, 2], [1, 3]]}
+
+
+def test_msgpack_codec():
+    codec = mlrun.serving.codecs.MsgpackCodec()
+    encoded, _ = codec.encode({"outputs": np.array([1, 2]), "id": "some-id"})
+    assert codec.decode(encoded, {}) == {"outputs": [1, 2], "id": "some-id"}
+
+    with pytest.raises(ValueError):
+        codec.decode(b"\xc1", {})
+
+
+def test_arrow_codec():
+    codec = mlrun.serving.codecs.ArrowCodec()
+    table = pyarrow.table(
+        {"a": [1.0, 2.0], "b": [3.0, 4.0]}, metadata={"id": "some-id"}
+    )
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    request = codec.decode(sink.getvalue().to_pybytes(), {})
+    assert request["id"] == "some-id"
+    assert request["inputs"].tolist() == [[1.0, 3.0], [2.0, 4.0]]
+
+    encoded, _ = codec.encode({"id": "some-id", "outputs": np.array([[1, 2], [3, 4]])})
+    response = pyarrow.ipc.open_stream(encoded).read_all()
+    assert response.schema.metadata == {b"id": b"some-id"}
+    assert response.to_pydict() == {"output_0": [1, 3], "output_1": [2, 4]}
+
+    # responses which can't be represented as a table are left for the default codec
+    assert codec.encode("some text") is None
+
+
+def test_binary_tensor_codec():
+    codec = mlrun.serving.codecs.BinaryTensorCodec()
+    first = np.arange(6, dtype="<i8").reshape(2, 3)
+    second = np.array([0.5, 1.5], dtype="<f4")
+    header = json.dumps(
+        {
+            "id": "some-id",
+            "inputs": [
+                {
+                    "name": "first",
+                    "shape": [2, 3],
+                    "datatype": "INT64",
+                    "parameters": {"binary_data_size": first.nbytes},
+                },
+                {"name": "inline", "shape": [2], "datatype": "INT32", "data": [7, 8]},
+                {
+                    "name": "second",
+                    "shape": [2],
+                    "datatype": "FP32",
+                    "parameters": {"binary_data_size": second.nbytes},
+                },
+            ],
+        }
+    ).encode()
+    body = header + first.tobytes() + second.tobytes()
+
+    request = codec.decode(body, {"Inference-Header-Content-Length": str(len(header))})
+    assert request["id"] == "some-id"
+    decoded_first, inline, decoded_second = request["inputs"]
+    np.testing.assert_array_equal(decoded_first, first)
+    np.testing.assert_array_equal(inline, [7, 8])
+    np.testing.assert_array_equal(decoded_second, second)
+    # binary tensors are read-only views of the request body
+    assert not decoded_first.flags.owndata and not decoded_first.flags.writeable
+
+    encoded, headers = codec.encode({"id": "some-id", "outputs": decoded_first})
+    header_length = int(headers["Inference-Header-Content-Length"])
+    assert json.loads(encoded[:header_length])["outputs"][0]["shape"] == [2, 3]
+    np.testing.assert_array_equal(
+        np.frombuffer(encoded[header_length:], dtype="<i8").reshape(2, 3), first
+    )
+
+    with pytest.raises(ValueError):
+        codec.decode(
+            header + first.tobytes(),
+            {"Inference-Header-Content-Length": str(len(header))},
+        )
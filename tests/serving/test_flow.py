@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import datetime
 import pathlib
 
 import pytest
 
 import mlrun
+from mlrun.common.schemas.model_monitoring import PrometheusEndpoints
 from mlrun.serving import GraphContext, V2ModelServer
+from mlrun.serving.server import MockEvent, MockTrigger
 from mlrun.serving.states import TaskStep
 
 from .demo_states import *  # noqa
@@ -122,6 +125,72 @@ def test_handler_with_context():
     assert resp == 40, f"got unexpected result {resp}"
 
 
+@pytest.mark.parametrize("compiled_graph", [True, False])
+def test_compiled_graph(compiled_graph):
+    mlrun.mlconf.serving.compiled_graph = compiled_graph
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="s1", handler=myfunc1, input_path="x", result_path="y").to(
+        name="s2", handler=myfunc2, input_path="y", result_path="z.w"
+    ).to(name="s3", class_name="Echo")
+
+    server = fn.to_mock_server()
+    assert (graph["s1"]._compiled_run is not None) == compiled_graph
+    resp = server.test(body={"x": 5})
+    assert resp == {"x": 5, "y": 10, "z": {"w": 20}}, f"got unexpected result {resp}"
+
+
+def test_benchmark():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="s1", handler=myfunc1).to(name="s2", handler=myfunc2)
+
+    server = fn.to_mock_server()
+    stats = server.benchmark(body=5, iterations=20, warmup=2)
+    assert stats["iterations"] == 20
+    assert stats["total"]["p99_us"] >= stats["total"]["p50_us"] > 0
+    assert set(stats["steps"]) == {"s1", "s2"}
+    assert all(step["calls"] == 20 for step in stats["steps"].values())
+    # the steps are restored after the benchmark
+    assert "run" not in graph["s1"].__dict__
+    assert server.test(body=5) == 20
+
+
+def test_instrumentation():
+    mlrun.mlconf.serving.instrumentation.enabled = True
+    fn = mlrun.new_function("instrumented", kind="serving", project="x")
+    graph = fn.set_topology("flow", engine="sync")
+    graph.to(name="s1", handler=myfunc1).to(name="s2", handler="(1 / event)")
+
+    server = fn.to_mock_server()
+    assert server.test(body=1) == 0.5
+    with pytest.raises(RuntimeError, match="ZeroDivisionError"):
+        server.test(body=0)
+
+    # an event consumed from a stream, which waited in the stream for 2 seconds
+    event = MockEvent(body=1, trigger=MockTrigger("v3io-stream", "my-stream"))
+    event.timestamp = datetime.datetime.now(
+        tz=datetime.timezone.utc
+    ) - datetime.timedelta(seconds=2)
+    server.run(event, get_body=True)
+
+    metrics = server.test(
+        PrometheusEndpoints.SERVING_GRAPH_METRICS, method="GET", get_body=True
+    ).body
+    labels = 'function="instrumented",project="x"'
+    assert f'graph_step_latency_seconds_count{{{labels},step="s1"}} 3.0' in metrics
+    assert f'graph_step_latency_seconds_count{{{labels},step="s2"}} 3.0' in metrics
+    assert f'graph_step_errors_total{{{labels},step="s2"}} 1.0' in metrics
+    assert f'graph_step_errors_total{{{labels},step="s1"}} 0.0' in metrics
+    queue_labels = 'function="instrumented",le="{}",project="x",queue="my-stream"'
+    assert (
+        f"graph_queue_wait_seconds_bucket{{{queue_labels.format(1.0)}}} 0.0" in metrics
+    )
+    assert (
+        f"graph_queue_wait_seconds_bucket{{{queue_labels.format(5.0)}}} 1.0" in metrics
+    )
+
+
 def test_init_class():
     fn = mlrun.new_function("tests", kind="serving")
     graph = fn.set_topology("flow", engine="sync")
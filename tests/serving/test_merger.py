@@ -13,12 +13,16 @@
 # limitations under the License.
 #
 import asyncio
+import threading
+import time
+import unittest.mock
 
 import pytest
 import storey
 
 import mlrun
 from mlrun.serving.merger import Merge
+from mlrun.serving.states import GraphError
 
 
 async def double(event):
@@ -143,3 +147,144 @@ def test_delayed():
     mylist = [sorted(item) for item in server.context.mylist]
     assert len(mylist) == 3, "expected 3 results in total (2 were dropped due to delay)"
     assert mylist == [[16, 17], [18, 19], [20, 21]]
+
+
+def sync_double(event):
+    return event * 2
+
+
+def total(event):
+    return sum(event)
+
+
+class SlowAdder(Adder):
+    def __init__(self, context, add=2, wait=0.5):
+        super().__init__(add)
+        self.context = context
+        self.wait = wait
+
+    def do(self, event):
+        time.sleep(self.wait)
+        self.context.threads.add(threading.current_thread().name)
+        return super().do(event)
+
+
+def test_sync_branches():
+    # split and merge in a sync flow, the branches are joined per event (no join key)
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync", exist_ok=True)
+    dbl = graph.to(name="double", handler="sync_double")
+    dbl.to(name="add3", class_name="SlowAdder", add=3)
+    dbl.to(name="add2", class_name="SlowAdder", add=2)
+    graph.add_step(Merge(name="Merge"), after=["add2", "add3"]).to(
+        name="total", handler="total"
+    ).respond()
+
+    server = fn.to_mock_server()
+    server.context.threads = set()
+    start = time.monotonic()
+    resp = server.test("", body=5)
+    # the branches run concurrently (in different threads)
+    assert time.monotonic() - start < 0.9
+    assert len(server.context.threads) == 2
+    # expected => (double+2) + (double+3)
+    assert resp == 25
+    assert server.test("", body=6) == 29
+
+
+def test_sync_start_branches():
+    # multiple start steps in a sync flow
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync", exist_ok=True)
+    graph.add_step(name="add3", class_name="Adder", add=3)
+    graph.add_step(name="add2", class_name="Adder", add=2)
+    graph.add_step(Merge(name="Merge", full_event=False), after=["add3", "add2"])
+
+    server = fn.to_mock_server()
+    assert server.test("", body=5) == [8, 7]
+
+
+def test_sync_join_without_merge():
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", engine="sync", exist_ok=True)
+    dbl = graph.to(name="double", handler="sync_double")
+    dbl.to(name="add3", class_name="Adder", add=3)
+    dbl.to(name="add2", class_name="Adder", add=2)
+    graph.add_step(name="add1", class_name="Adder", after=["add2", "add3"])
+
+    with pytest.raises(GraphError, match="Merge step"):
+        fn.to_mock_server()
+
+
+def _merge_step(**kwargs):
+    context = unittest.mock.Mock(verbose=False)
+    merge = Merge(
+        name="Merge", expected_num_events=2, full_event=False, context=context, **kwargs
+    )
+    merge.post_init()
+    return merge
+
+
+def test_merge_timeout():
+    merge = _merge_step(key_path="key", timeout=0.2)
+    assert merge._merge_events({"key": 1, "x": 1}) is None
+    assert merge._merge_events({"key": 2, "x": 2}) is None
+    time.sleep(0.3)
+    # the partial events of keys 1 and 2 expired, key 3 is merged
+    assert merge._merge_events({"key": 3, "x": 3}) is None
+    assert merge._merge_events({"key": 3, "x": 4}) == [
+        {"key": 3, "x": 3},
+        {"key": 3, "x": 4},
+    ]
+    assert merge.stats == {"merged": 2, "expired": 2, "late": 0, "pending": 0}
+
+    # the missing part of key 1 arrives late (after it expired)
+    assert merge._merge_events({"key": 1, "x": 5}) is merge._late_event
+    assert merge.stats["late"] == 1
+    # a new event with the same key (after all the parts arrived) is not late
+    assert merge._merge_events({"key": 1, "x": 6}) is None
+    assert merge.stats["pending"] == 1
+
+
+@pytest.mark.parametrize("late_policy", ["drop", "emit", "error"])
+def test_merge_late_policy(late_policy):
+    fn = mlrun.new_function("x", kind="serving")
+    graph = fn.set_topology("flow", exist_ok=True)
+    dbl = graph.to(name="double", handler="double")
+    dbl.to(name="add3", class_name="AsyncAdder", add=3, wait=0.1)
+    dbl.to(name="add2", class_name="AsyncAdder", add=2, wait=0.2)
+    graph.add_step(
+        Merge(name="Merge", max_behind=3, late_policy=late_policy),
+        after=["add2", "add3"],
+    ).to("Gather")
+
+    server = fn.to_mock_server()
+    for data in [5, 6, 7, 8, 9]:
+        server.test("", body=data)
+    server.wait_for_completion()
+    merged = [item for item in server.context.mylist if isinstance(item, list)]
+    assert [sorted(item) for item in merged] == [[16, 17], [18, 19], [20, 21]]
+    late = [item for item in server.context.mylist if not isinstance(item, list)]
+    # the dropped keys get their missing (add2) parts late
+    assert late == ([12, 14] if late_policy == "emit" else [])
+
+
+def test_merge_bad_args():
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="late_policy"):
+        Merge(name="Merge", late_policy="wait")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="get_join_key"):
+        _merge_step(key_path="event['key'] + 1")
+
+
+@pytest.mark.parametrize(
+    "key_path, event, expected",
+    [
+        ("event['key']", {"key": 3}, 3),
+        ('event["doc"]["id"]', {"doc": {"id": 4}}, 4),
+        ("event['items'][1]", {"items": [5, 6]}, 6),
+        ("event.body['key']", mlrun.serving.server.MockEvent({"key": 7}), 7),
+        ("doc.id", {"doc": {"id": 8}}, 8),
+    ],
+)
+def test_merge_key_path(key_path, event, expected):
+    assert _merge_step(key_path=key_path).get_join_key(event) == expected
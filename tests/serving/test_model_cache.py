@@ -0,0 +1,182 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import unittest.mock
+
+import numpy as np
+import pytest
+
+import mlrun
+import mlrun.datastore.base
+from mlrun.serving import V2ModelServer, model_cache
+
+
+class LazyModel(V2ModelServer):
+    loads = 0
+    warmups = 0
+
+    def load(self):
+        LazyModel.loads += 1
+        self.model = self.get_param("multiplier")
+
+    def warmup(self):
+        LazyModel.warmups += 1
+
+    def predict(self, request):
+        return request["inputs"][0] * self.model
+
+
+def test_get_local_path(tmp_path):
+    store = mlrun.datastore.store_manager.object(url="memory://models/model.onnx")
+    store.put(b"model")
+    mlrun.datastore.store_manager.object(url="memory://models/weights.bin").put(
+        b"weights"
+    )
+
+    with unittest.mock.patch.object(
+        mlrun.datastore.base.DataItem,
+        "download",
+        autospec=True,
+        side_effect=lambda item, target: open(target, "wb").write(item.get()),
+    ) as download:
+        local_path = model_cache.get_local_path(
+            "memory://models/model.onnx",
+            ["memory://models/weights.bin"],
+            cache_dir=str(tmp_path),
+        )
+        # the cached files are reused (not downloaded again)
+        assert (
+            model_cache.get_local_path(
+                "memory://models/model.onnx",
+                ["memory://models/weights.bin"],
+                cache_dir=str(tmp_path),
+            )
+            == local_path
+        )
+    assert download.call_count == 2
+
+    # the related files are placed next to the file
+    assert os.path.basename(local_path) == "model.onnx"
+    with open(os.path.join(os.path.dirname(local_path), "weights.bin"), "rb") as file:
+        assert file.read() == b"weights"
+
+    # local files are used as is
+    assert model_cache.get_local_path(local_path) == local_path
+
+
+def test_get_local_path_evicts_least_recently_used(tmp_path):
+    mlrun.mlconf.serving.model_cache.max_size_mb = 1
+    for name in ["model1", "model2", "model3"]:
+        mlrun.datastore.store_manager.object(url=f"memory://models/{name}").put(
+            b"0" * 400 * 1024
+        )
+
+    with unittest.mock.patch.object(
+        mlrun.datastore.base.DataItem,
+        "download",
+        autospec=True,
+        side_effect=lambda item, target: open(target, "wb").write(item.get()),
+    ):
+        path1 = model_cache.get_local_path(
+            "memory://models/model1", cache_dir=str(tmp_path)
+        )
+        path2 = model_cache.get_local_path(
+            "memory://models/model2", cache_dir=str(tmp_path)
+        )
+        # model1 is used again, model2 is the least recently used
+        os.utime(os.path.dirname(path2), (0, 0))
+        model_cache.get_local_path("memory://models/model1", cache_dir=str(tmp_path))
+        path3 = model_cache.get_local_path(
+            "memory://models/model3", cache_dir=str(tmp_path)
+        )
+
+    assert os.path.exists(path1)
+    assert not os.path.exists(path2)
+    assert os.path.exists(path3)
+
+
+def test_load_weights(tmp_path):
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    npy_path = str(tmp_path / "weights.npy")
+    np.save(npy_path, array)
+    weights = model_cache.load_weights(npy_path)
+    assert isinstance(weights, np.memmap)
+    np.testing.assert_array_equal(weights, array)
+
+    ids = np.array([1, 2, 3], dtype=np.int64)
+    header = json.dumps(
+        {
+            "__metadata__": {"format": "np"},
+            "weights": {"dtype": "F32", "shape": [3, 4], "data_offsets": [0, 48]},
+            "ids": {"dtype": "I64", "shape": [3], "data_offsets": [48, 72]},
+        }
+    ).encode()
+    safetensors_path = str(tmp_path / "model.safetensors")
+    with open(safetensors_path, "wb") as file:
+        file.write(len(header).to_bytes(8, "little"))
+        file.write(header)
+        file.write(array.tobytes())
+        file.write(ids.tobytes())
+    tensors = model_cache.load_weights(safetensors_path)
+    assert list(tensors) == ["weights", "ids"]
+    np.testing.assert_array_equal(tensors["weights"], array)
+    np.testing.assert_array_equal(tensors["ids"], ids)
+    assert not tensors["weights"].flags.writeable
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="memory map"):
+        model_cache.load_weights(str(tmp_path / "model.pkl"))
+
+
+@pytest.mark.parametrize("lazy_load", [False, True])
+def test_lazy_load(lazy_load):
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("router")
+    graph.add_route(
+        "my", class_name=LazyModel, model_path="", multiplier=3, lazy_load=lazy_load
+    )
+    LazyModel.loads = LazyModel.warmups = 0
+    server = fn.to_mock_server(namespace=globals(), track_models=False)
+    # the model is loaded (and warmed up) when the server starts, unless it is lazy
+    assert LazyModel.loads == (0 if lazy_load else 1)
+    assert server.graph.routes["my"]._object.ready is not lazy_load
+
+    # a lazy model is loaded by its readiness check
+    resp = server.test("/v2/models/my/ready", method="GET")
+    assert resp.status_code == 200
+    assert LazyModel.loads == 1
+    resp = server.test("/v2/models/my/infer", {"inputs": [5]})
+    assert resp["outputs"] == 15
+    server.test("/v2/models/my/infer", {"inputs": [5]})
+    assert LazyModel.loads == LazyModel.warmups == 1
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup"), reason="requires linux"
+)
+def test_benchmark(tmp_path):
+    path = str(tmp_path / "weights.npy")
+    np.save(path, np.ones((4096, 4096), dtype=np.float32))
+    results = model_cache.benchmark(path, workers=2)
+    assert set(results) == {"copy", "mmap"}
+    # the mapped weights (64MB) are shared by the workers, each worker holds a copy of the copied weights
+    assert results["copy"]["memory_mb"] > 100
+    assert results["mmap"]["memory_mb"] < results["copy"]["memory_mb"] * 0.75
+    assert results["mmap"]["load_seconds"] > 0
+
+
+def test_benchmark_failed_workers(tmp_path):
+    with pytest.raises(mlrun.errors.MLRunRuntimeError, match="workers failed"):
+        model_cache.benchmark(str(tmp_path / "missing.npy"), workers=2, timeout=60)
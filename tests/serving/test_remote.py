@@ -12,16 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import re
 import time
+import unittest.mock
 
+import aiohttp
 import pytest
+from pytest_httpserver import HTTPServer
 from werkzeug.wrappers import Request, Response
 
 import mlrun
+import mlrun.serving.http_client
 from mlrun.serving.utils import event_id_key, event_path_key
 
 
+@pytest.fixture(autouse=True)
+def reset_http_client():
+    # the shared client is configured once, from the (per test) config
+    mlrun.serving.http_client._client = None
+    yield
+    mlrun.serving.http_client._client = None
+
+
 def echo(event):
     print(event)
     return event
@@ -409,3 +422,160 @@ def test_parallel_remote_retry(httpserver):
         "/1": retries + 1,
         "/0": retries + 1,
     }, "didnt retry properly"
+
+
+def test_circuit_breaker(httpserver):
+    mlrun.mlconf.serving.remote.circuit_breaker.failure_threshold = 2
+    mlrun.mlconf.serving.remote.circuit_breaker.reset_timeout = 1
+    tester = RetryTester(ok_after=3)
+    httpserver.expect_request("/data", method="POST").respond_with_handler(
+        tester.handler
+    )
+    url = httpserver.url_for("/data")
+    server = _new_server(url, "sync", return_json=False, retries=0)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="bad http response 500"):
+            server.test(body=b"tst")
+    # the circuit is open, the request is rejected without reaching the server
+    with pytest.raises(RuntimeError, match="circuit breaker .* is open"):
+        server.test(body=b"tst")
+    assert tester.retries_dict["/data"] == 2
+
+    # after the reset timeout a trial request is sent (and fails, which reopens the circuit)
+    time.sleep(1)
+    with pytest.raises(RuntimeError, match="bad http response 500"):
+        server.test(body=b"tst")
+    with pytest.raises(RuntimeError, match="circuit breaker .* is open"):
+        server.test(body=b"tst")
+
+    # a successful trial request closes the circuit
+    time.sleep(1)
+    assert server.test(body=b"tst") == b"tst"
+    assert server.test(body=b"tst") == b"tst"
+    stats = mlrun.serving.http_client.get_http_client().stats()
+    host_stats = stats[re.sub("https?://", "", httpserver.url_for("")).strip("/")]
+    assert host_stats["requests"] == 5
+    assert host_stats["failures"] == 3
+    assert host_stats["rejected"] == 2
+    assert host_stats["circuit"] == "closed"
+
+
+def test_circuit_breaker_cancelled_trial():
+    client = mlrun.serving.http_client.RemoteHTTPClient(
+        failure_threshold=1, reset_timeout=0
+    )
+    send = unittest.mock.AsyncMock(side_effect=aiohttp.ClientError("refused"))
+    client._send = send
+    with pytest.raises(aiohttp.ClientError):
+        asyncio.run(client.request("GET", "http://remote-host/data"))
+    breaker = client._get_breaker("remote-host")
+    assert breaker.state == "half_open"
+
+    # a cancelled trial request lets the next request through as the trial
+    send.side_effect = asyncio.CancelledError()
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(client.request("GET", "http://remote-host/data"))
+    assert breaker.allow() == "half_open"
+
+
+class SlowFirstTester:
+    def __init__(self, delay):
+        self.requests = 0
+        self.delay = delay
+
+    def handler(self, request: Request):
+        self.requests += 1
+        if self.requests == 1:
+            time.sleep(self.delay)
+        return Response(f"response {self.requests}", status=200)
+
+
+@pytest.fixture
+def threaded_httpserver():
+    # serves requests concurrently (the slow request does not block the hedged one)
+    server = HTTPServer(threaded=True)
+    server.start()
+    yield server
+    server.clear()
+    server.stop()
+
+
+@pytest.mark.parametrize("engine", ["sync", "async"])
+def test_hedged_requests(threaded_httpserver, engine):
+    httpserver = threaded_httpserver
+    tester = SlowFirstTester(delay=2)
+    httpserver.expect_request("/data", method="POST").respond_with_handler(
+        tester.handler
+    )
+    url = httpserver.url_for("/data")
+    server = _new_server(url, engine, return_json=False, retries=0, hedge_after=0.2)
+
+    start = time.monotonic()
+    try:
+        resp = server.test(body=b"tst")
+    finally:
+        server.wait_for_completion()
+    # the hedged (second) request responds first
+    assert resp == b"response 2"
+    assert time.monotonic() - start < 2
+    host_stats = list(mlrun.serving.http_client.get_http_client().stats().values())[0]
+    assert host_stats["hedged"] == 1
+    assert host_stats["hedge_wins"] == 1
+
+
+def test_hedged_requests_cancelled(threaded_httpserver):
+    def slow_handler(request: Request):
+        time.sleep(1)
+        return Response("ok")
+
+    threaded_httpserver.expect_request("/data").respond_with_handler(slow_handler)
+    client = mlrun.serving.http_client.RemoteHTTPClient(hedge_after=0.1)
+
+    async def request():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                client.request("GET", threaded_httpserver.url_for("/data")), 0.3
+            )
+        # the cancellation of the request cancels the first and the hedged requests
+        await asyncio.sleep(0.1)
+        host_stats = list(client.stats().values())[0]
+        await client.release()
+        return host_stats
+
+    host_stats = asyncio.run(request())
+    assert host_stats["hedged"] == 1
+    assert host_stats["in_flight"] == 0
+
+
+def test_remote_steps_share_connection_pool(httpserver):
+    httpserver.expect_request("/data", method="POST").respond_with_data("ok")
+    url = httpserver.url_for("/data")
+    function = mlrun.new_function("test1", kind="serving")
+    flow = function.set_topology("flow", engine="async")
+    flow.to("$remote", "remote1", url=url, return_json=False).to(
+        "$remote", "remote2", url=url, return_json=False
+    ).respond()
+    server = function.to_mock_server()
+    try:
+        assert server.test(body=b"tst") == b"ok"
+        client = mlrun.serving.http_client.get_http_client()
+        # a single pool (of the flow event loop) used by both steps
+        assert [pool.users for pool in client._sessions.values()] == [2]
+    finally:
+        server.wait_for_completion()
+    # the pool is closed when the flow terminates
+    assert len(client._sessions) == 0
+
+
+def test_remote_client_metrics(httpserver):
+    mlrun.mlconf.serving.instrumentation.enabled = True
+    httpserver.expect_request("/data", method="POST").respond_with_data("ok")
+    server = _new_server(httpserver.url_for("/data"), "sync", return_json=False)
+    assert server.test(body=b"tst") == b"ok"
+
+    metrics = server.test("/serving-graph-metrics", method="GET", get_body=True).body
+    host = re.sub("https?://", "", httpserver.url_for("")).strip("/")
+    assert f'graph_remote_requests_total{{host="{host}"}} 1.0' in metrics
+    assert f'graph_remote_latency_seconds_count{{host="{host}"}} 1.0' in metrics
+    assert f'graph_remote_circuit_open{{host="{host}"}} 0.0' in metrics
@@ -15,14 +15,19 @@
 import json
 import os
 import pathlib
+import sys
 import time
+import unittest.mock
 
+import msgpack
+import numpy as np
 import pandas as pd
 import pytest
 from nuclio_sdk import Context as NuclioContext
 from sklearn.datasets import load_iris
 
 import mlrun
+import mlrun.serving.codecs
 from mlrun.runtimes import nuclio_init_hook
 from mlrun.runtimes.nuclio.serving import serving_subkind
 from mlrun.serving import V2ModelServer
@@ -439,6 +444,74 @@ def test_v2_infer():
     run_model("m3/versions/v2", 2000)
 
 
+def test_v2_infer_binary_tensors():
+    context = init_ctx()
+    inputs = np.array([[1.0, 2.0], [3.0, 4.0]], dtype="<f4")
+    header = json.dumps(
+        {
+            "inputs": [
+                {
+                    "name": "input_0",
+                    "shape": [2, 2],
+                    "datatype": "FP32",
+                    "parameters": {"binary_data_size": inputs.nbytes},
+                }
+            ]
+        }
+    ).encode()
+    event = MockEvent(
+        header + inputs.tobytes(),
+        content_type="application/octet-stream",
+        headers={"Inference-Header-Content-Length": str(len(header))},
+        path="/v2/models/m1/infer",
+    )
+    resp = context.mlrun_handler(context, event)
+    assert resp.status_code == 200, f"wrong model response {resp.body}"
+    assert resp.content_type == "application/octet-stream"
+
+    # the outputs are returned as raw tensors as well
+    header_length = int(resp.headers["Inference-Header-Content-Length"])
+    response_header = json.loads(resp.body[:header_length])
+    assert response_header["outputs"] == [
+        {
+            "name": "output_0",
+            "shape": [2],
+            "datatype": "FP32",
+            "parameters": {"binary_data_size": 8},
+        }
+    ]
+    outputs = np.frombuffer(resp.body[header_length:], dtype="<f4")
+    assert outputs.tolist() == [100.0, 200.0]
+
+
+def test_v2_infer_msgpack():
+    def new_event():
+        return MockEvent(
+            msgpack.packb({"inputs": [5]}),
+            content_type="application/msgpack",
+            path="/v2/models/m1/infer",
+        )
+
+    context = init_ctx()
+    resp = context.mlrun_handler(context, new_event())
+    assert resp.content_type == "application/msgpack"
+    assert msgpack.unpackb(resp.body)["outputs"] == 500
+
+    # responses the codec fails to encode fall back to json
+    with unittest.mock.patch.object(
+        mlrun.serving.codecs.MsgpackCodec, "encode", side_effect=TypeError("oops")
+    ):
+        resp = context.mlrun_handler(context, new_event())
+    assert resp.content_type == "application/json"
+    assert json.loads(resp.body)["outputs"] == 500
+
+    # requests of a codec whose package is not installed are rejected
+    with unittest.mock.patch.dict(sys.modules, {"msgpack": None}):
+        resp = context.mlrun_handler(context, new_event())
+    assert resp.status_code == 400
+    assert "msgpack is not installed" in resp.body
+
+
 def test_v2_stream_mode():
     # model and operation are specified inside the message body
     context = init_ctx()
@@ -622,6 +695,106 @@ def test_v2_mock():
     assert resp["outputs"] == 5 * 100, f"wrong health response {resp}"
 
 
+class SizedModel(V2ModelServer):
+    def load(self):
+        time.sleep(self.get_param("load_time", 0))
+        self.model = self.get_param("multiplier")
+        # model memory size (bytes)
+        self.model_size = 40 * 1024 * 1024
+
+    def predict(self, request):
+        return request["inputs"][0] * self.model
+
+
+class SerialPostInitModel(SizedModel):
+    post_inits = 0
+    concurrent_post_inits = 0
+
+    def post_init(self, mode="sync"):
+        SerialPostInitModel.post_inits += 1
+        SerialPostInitModel.concurrent_post_inits = max(
+            SerialPostInitModel.concurrent_post_inits, SerialPostInitModel.post_inits
+        )
+        time.sleep(0.05)
+        super().post_init(mode)
+        SerialPostInitModel.post_inits -= 1
+
+
+def test_router_parallel_init():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("router")
+    for index in range(4):
+        graph.add_route(
+            f"m{index}",
+            class_name=SerialPostInitModel,
+            model_path=".",
+            multiplier=index,
+            load_time=0.5,
+        )
+
+    SerialPostInitModel.concurrent_post_inits = 0
+    start = time.monotonic()
+    server = fn.to_mock_server(namespace=globals(), track_models=False)
+    # the models are loaded in parallel (not in sequence)
+    assert time.monotonic() - start < 1.5
+    assert all(route._object.ready for route in server.graph.routes.values())
+    assert server.test("/v2/models/m3/infer", testdata)["outputs"] == 15
+    # while the post init of the routes (which creates the model endpoint records) runs in sequence
+    assert SerialPostInitModel.concurrent_post_inits == 1
+
+
+def test_router_lazy_load():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ModelRouter(lazy_load=True, memory_budget=100),
+    )
+    for index in range(3):
+        graph.add_route(
+            f"m{index}", class_name=SizedModel, model_path=".", multiplier=index
+        )
+    server = fn.to_mock_server(namespace=globals(), track_models=False)
+    models = {name: route._object for name, route in server.graph.routes.items()}
+    assert not any(model.ready for model in models.values())
+
+    assert server.test("/v2/models/m1/infer", testdata)["outputs"] == 5
+    assert server.test("/v2/models/m2/infer", testdata)["outputs"] == 10
+    assert server.test("/v2/models/m1/infer", testdata)["outputs"] == 5
+    assert [name for name, model in models.items() if model.ready] == ["m1", "m2"]
+
+    # the least recently used model (m2) is evicted to fit the memory budget (100MB)
+    assert server.test("/v2/models/m0/infer", testdata)["outputs"] == 0
+    assert [name for name, model in models.items() if model.ready] == ["m0", "m1"]
+    assert models["m2"].model is None
+
+    # evicted models are loaded again on request
+    assert server.test("/v2/models/m2/infer", testdata)["outputs"] == 10
+    assert models["m2"].ready
+
+    # a model which is handling a request (m0) is not evicted, the next least recently used model is
+    models["m0"]._in_use += 1
+    assert server.test("/v2/models/m1/infer", testdata)["outputs"] == 5
+    models["m0"]._in_use -= 1
+    assert [name for name, model in models.items() if model.ready] == ["m0", "m1"]
+    assert models["m2"].model is None
+
+
+class FileModel(V2ModelServer):
+    def load(self):
+        model_file, _ = self.get_model()
+        self.model = model_file
+
+
+def test_model_size_from_model_files(tmp_path):
+    model_path = tmp_path / "model.pkl"
+    model_path.write_bytes(b"0" * 1000)
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("router")
+    graph.add_route("m", class_name=FileModel, model_path=str(model_path))
+    server = fn.to_mock_server(namespace=globals(), track_models=False)
+    assert server.graph.routes["m"]._object.model_size == 1000
+
+
 def test_function():
     fn = mlrun.new_function("tests", kind="serving")
     fn.set_topology("router")
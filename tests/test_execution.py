@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import time
 import unittest.mock
 
 import pytest
@@ -185,6 +186,112 @@ def test_is_logging_worker(host: str, is_logging_worker: bool):
     assert context.is_logging_worker() is is_logging_worker
 
 
+def test_context_buffers_run_updates():
+    mlrun.mlconf.run_updates_buffer.flush_interval = 3600
+    mlrun.mlconf.run_updates_buffer.max_pending_updates = 5
+    rundb = unittest.mock.Mock()
+    context = mlrun.MLClientCtx.from_dict(
+        _generate_run_dict(), rundb=rundb, autocommit=True
+    )
+    rundb.reset_mock()
+
+    for epoch in range(4):
+        context.log_result(f"epoch-{epoch}", epoch)
+    rundb.update_run.assert_not_called()
+
+    # reaching the maximum number of buffered updates writes them all in a single update
+    context.log_result("epoch-4", 4)
+    assert rundb.update_run.call_count == 1
+    assert rundb.update_run.call_args.args[0]["status.results"] == {
+        f"epoch-{epoch}": epoch for epoch in range(5)
+    }
+
+    # state changes are written immediately, together with the buffered updates
+    context.log_result("accuracy", 0.9)
+    context.set_state(error="some error")
+    assert rundb.update_run.call_count == 2
+    updates = rundb.update_run.call_args.args[0]
+    assert updates["status.state"] == "error"
+    assert updates["status.results"]["accuracy"] == 0.9
+
+    # nothing is left to write on commit but the commit itself
+    context.commit()
+    assert rundb.update_run.call_count == 3
+    assert context._pending_run_updates == 0
+
+
+def test_context_flushes_run_updates_after_interval():
+    mlrun.mlconf.run_updates_buffer.flush_interval = 0.2
+    rundb = unittest.mock.Mock()
+    context = mlrun.MLClientCtx.from_dict(
+        _generate_run_dict(), rundb=rundb, autocommit=True
+    )
+    rundb.reset_mock()
+
+    # the buffered updates are written on the caller's thread, by the first update after the flush interval
+    context.log_result("accuracy", 0.9)
+    time.sleep(0.3)
+    rundb.update_run.assert_not_called()
+    assert context in mlrun.execution._contexts_with_pending_run_updates
+    context.log_result("loss", 0.1)
+    rundb.update_run.assert_called_once()
+    assert rundb.update_run.call_args.args[0]["status.results"] == {
+        "accuracy": 0.9,
+        "loss": 0.1,
+    }
+    assert context._pending_run_updates == 0
+    assert context not in mlrun.execution._contexts_with_pending_run_updates
+
+
+def test_context_keeps_run_updates_on_flush_failure():
+    mlrun.mlconf.run_updates_buffer.flush_interval = 3600
+    rundb = unittest.mock.Mock()
+    context = mlrun.MLClientCtx.from_dict(
+        _generate_run_dict(), rundb=rundb, autocommit=True
+    )
+    rundb.reset_mock()
+    context.log_result("accuracy", 0.9)
+
+    # a failed write keeps the updates buffered
+    rundb.update_run.side_effect = RuntimeError("db is down")
+    with pytest.raises(RuntimeError):
+        context.commit()
+    assert context._pending_run_updates == 2
+    assert context in mlrun.execution._contexts_with_pending_run_updates
+
+    # and they are written at exit
+    rundb.update_run.side_effect = None
+    rundb.reset_mock()
+    mlrun.execution._flush_pending_run_updates()
+    rundb.update_run.assert_called_once()
+    assert rundb.update_run.call_args.args[0]["status.results"] == {"accuracy": 0.9}
+    assert context._pending_run_updates == 0
+    assert context not in mlrun.execution._contexts_with_pending_run_updates
+
+
+def test_context_commits_children_in_bulk(tmp_path):
+    rundb = unittest.mock.Mock()
+    run_dict = _generate_run_dict()
+    run_dict["spec"]["output_path"] = str(tmp_path)
+    context = mlrun.MLClientCtx.from_dict(run_dict, rundb=rundb, autocommit=True)
+    for index in range(3):
+        child = context.get_child_context(index=index)
+        child.log_result("accuracy", index)
+    rundb.reset_mock()
+
+    context.commit()
+
+    # all the children are written in a single request, and only the parent is written on its own
+    rundb.update_runs.assert_called_once()
+    runs_updates = rundb.update_runs.call_args.args[0]
+    assert [run_updates["iter"] for run_updates in runs_updates] == [1, 2, 3]
+    assert [
+        run_updates["updates"]["status.results"] for run_updates in runs_updates
+    ] == [{"accuracy": index} for index in range(3)]
+    assert rundb.update_runs.call_args.kwargs["project"] == "default"
+    assert {call.kwargs.get("iter") for call in rundb.update_run.call_args_list} == {0}
+
+
 def _generate_run_dict():
     return {
         "metadata": {